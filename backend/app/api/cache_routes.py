@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import Response
 
 from app.cache import (
     get_cache_stats,
-    load_precomputed_festival_year,
-    load_precomputed_panchanga,
+    load_precomputed_festival_year_encoded,
+    load_precomputed_panchanga_encoded,
     measure_hotset_latency,
 )
 
@@ -50,15 +51,15 @@ async def cache_lookup_panchanga(year: int, month: int, day: int):
         d = date(year, month, day)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail="Invalid date") from exc
-    payload = load_precomputed_panchanga(d)
-    if not payload:
+    body = load_precomputed_panchanga_encoded(d)
+    if not body:
         raise HTTPException(status_code=404, detail="Precomputed panchanga not found")
-    return payload
+    return Response(body, media_type="application/json")
 
 
 @router.get("/festivals/{year}")
 async def cache_lookup_festivals(year: int):
-    payload = load_precomputed_festival_year(year)
-    if not payload:
+    body = load_precomputed_festival_year_encoded(year)
+    if not body:
         raise HTTPException(status_code=404, detail="Precomputed festival year not found")
-    return payload
+    return Response(body, media_type="application/json")
@@ -2,13 +2,27 @@
 
 from __future__ import annotations
 
-from datetime import date
+from collections.abc import Iterator
+from datetime import date, timedelta
 from typing import Any
 
 from fastapi import Request
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
 
-from app.integrations import build_ical_feed, collect_feed_events
+from app.core.json_codec import dumps
+from app.integrations import (
+    collect_feed_events,
+    iter_feed_chunks,
+    iter_feed_events,
+    materialize_feed,
+    render_feed,
+)
+
+# Feeds spanning more years than this are streamed a year at a time instead of
+# being materialized, cached and tagged with an ETag.
+FEED_MATERIALIZE_MAX_YEARS = 3
+# NDJSON lines joined into one chunk of a streamed export.
+_EXPORT_BATCH = 64
 
 _PRESET_CONFIGS = (
     {
@@ -261,6 +275,14 @@ def build_catalog_response(
     }
 
 
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {value.strip().removeprefix("W/") for value in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
 def build_feed_response(
     *,
     request: Request,
@@ -272,35 +294,104 @@ def build_feed_response(
     filename: str,
     start_year: int | None = None,
     download: bool = False,
-) -> PlainTextResponse:
-    events = collect_feed_events(
+) -> Response:
+    disposition = "attachment" if download else "inline"
+    headers = {
+        "Content-Disposition": f'{disposition}; filename="{filename}"',
+        "Cache-Control": "public, max-age=900",
+        "X-Parva-Calendar-Name": calendar_name,
+    }
+    if years > FEED_MATERIALIZE_MAX_YEARS:
+        chunks = iter_feed_chunks(
+            calendar_name=calendar_name,
+            festival_ids=festivals,
+            category=category,
+            years=years,
+            start_year=start_year,
+            lang=lang,
+            description=f"{calendar_name} ({years} years)",
+            source_url=str(request.url),
+        )
+        return StreamingResponse(
+            chunks,
+            media_type="text/calendar; charset=utf-8",
+            headers=headers,
+        )
+
+    feed = materialize_feed(
         festival_ids=festivals,
         category=category,
         years=years,
         start_year=start_year,
         lang=lang,
     )
-    body = build_ical_feed(
+    rendered = render_feed(
+        feed,
         calendar_name=calendar_name,
-        events=events,
-        description=f"{calendar_name} ({len(events)} events)",
+        description=f"{calendar_name} ({len(feed.events)} events)",
         source_url=str(request.url),
     )
-    disposition = "attachment" if download else "inline"
+    headers["ETag"] = rendered.etag
+    if _etag_matches(request, rendered.etag):
+        return Response(status_code=304, headers=headers)
     return PlainTextResponse(
-        content=body,
+        content=rendered.body(),
         media_type="text/calendar; charset=utf-8",
-        headers={
-            "Content-Disposition": f'{disposition}; filename="{filename}"',
-            "Cache-Control": "public, max-age=900",
-            "X-Parva-Calendar-Name": calendar_name,
-        },
+        headers=headers,
+    )
+
+
+def _export_lines(events) -> Iterator[bytes]:
+    batch: list[bytes] = []
+    for event, _block in events:
+        batch.append(
+            dumps(
+                {
+                    "uid": event.uid,
+                    "summary": event.summary,
+                    "start_date": event.start_date.isoformat(),
+                    "end_date": event.end_date.isoformat(),
+                    "categories": event.categories,
+                    "location": event.location,
+                }
+            )
+            + b"\n"
+        )
+        if len(batch) >= _EXPORT_BATCH:
+            yield b"".join(batch)
+            batch = []
+    if batch:
+        yield b"".join(batch)
+
+
+def build_feed_export_response(
+    *,
+    festivals: list[str] | None,
+    category: str | None,
+    years: int,
+    lang: str,
+    start_year: int | None = None,
+) -> StreamingResponse:
+    """Feed events as newline-delimited JSON, one event per line, streamed."""
+    events = iter_feed_events(
+        festival_ids=festivals,
+        category=category,
+        years=years,
+        start_year=start_year,
+        lang=lang,
+    )
+    return StreamingResponse(
+        _export_lines(events),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "public, max-age=900"},
     )
 
 
 def build_preview_response(*, days: int, lang: str, years: int = 2) -> dict[str, Any]:
     start = date.today()
-    events = collect_feed_events(years=years, lang=lang)
+    # Only the years the window reaches, not the full ``years`` span.
+    window_years = (start + timedelta(days=days)).year - start.year + 1
+    events = collect_feed_events(years=min(years, window_years), start_year=start.year, lang=lang)
     window = [event for event in events if 0 <= (event.start_date - start).days <= days]
     return {
         "from": start.isoformat(),
@@ -6,9 +6,11 @@ from datetime import date
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
+from app.core.json_codec import dumps
 from app.explainability import create_reason_trace
-from app.services.timeline_service import build_festival_timeline
+from app.services.timeline_service import build_festival_timeline, iter_festival_timeline
 
 from ._personal_utils import base_meta_payload
 
@@ -86,3 +88,33 @@ async def festivals_timeline(
             advisory_scope="informational",
         ),
     }
+
+
+@router.get("/timeline/export.ndjson")
+async def festivals_timeline_export(
+    from_date: date = Query(..., alias="from", description="Start date YYYY-MM-DD"),
+    to_date: date = Query(..., alias="to", description="End date YYYY-MM-DD"),
+    quality_band: str = Query("computed", description="computed|provisional|inventory|all"),
+    category: Optional[str] = Query(None),
+    region: Optional[str] = Query(None),
+    search: Optional[str] = Query(None, description="Search by festival name/description"),
+    lang: str = Query("en", description="en|ne"),
+):
+    """Timeline items as newline-delimited JSON, streamed chronologically a year at a time."""
+    try:
+        items = iter_festival_timeline(
+            from_date=from_date,
+            to_date=to_date,
+            quality_band=quality_band,
+            category=category,
+            region=region,
+            search=search,
+            lang=lang,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    return StreamingResponse(
+        (dumps(item) + b"\n" for item in items),
+        media_type="application/x-ndjson",
+    )
@@ -8,6 +8,7 @@ from fastapi import APIRouter, Query, Request
 
 from app.api.feed_service import (
     build_catalog_response,
+    build_feed_export_response,
     build_feed_manifest,
     build_feed_response,
     build_preview_response,
@@ -146,6 +147,24 @@ async def custom_feed(
     )
 
 
+@router.get("/export.ndjson")
+async def integration_feed_export_ndjson(
+    festivals: Optional[str] = Query(None, description="Comma-separated festival ids"),
+    category: Optional[str] = Query(None, description="Festival category filter"),
+    years: int = Query(2, ge=1, le=10),
+    start_year: Optional[int] = Query(None, ge=1900, le=2300),
+    lang: str = Query("en", description="en or ne"),
+):
+    """Feed events as newline-delimited JSON, streamed in date order."""
+    return build_feed_export_response(
+        festivals=split_csv(festivals) or None,
+        category=category,
+        years=years,
+        lang=lang,
+        start_year=start_year,
+    )
+
+
 @router.get("/next")
 async def integration_feed_preview(
     days: int = Query(30, ge=1, le=365),
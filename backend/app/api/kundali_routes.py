@@ -9,6 +9,7 @@ from pydantic import BaseModel, Field
 
 from app.calendar.kundali import compute_kundali
 from app.explainability import create_reason_trace
+from app.infrastructure.compute_executor import run_compute
 
 from ._personal_utils import (
     CoordinateInput,
@@ -19,6 +20,7 @@ from ._personal_utils import (
 )
 
 router = APIRouter(prefix="/api/kundali", tags=["kundali"])
+COMPUTE_LANE = "kundali"
 
 
 class KundaliRequest(BaseModel):
@@ -226,12 +228,16 @@ async def kundali_endpoint(
     lon: Optional[str] = Query(None, description="Longitude"),
     tz: Optional[str] = Query("Asia/Kathmandu", description="IANA timezone"),
 ):
-    return _build_kundali_response(datetime_str=datetime_str, lat=lat, lon=lon, tz=tz)
+    return await run_compute(
+        COMPUTE_LANE, _build_kundali_response, datetime_str=datetime_str, lat=lat, lon=lon, tz=tz
+    )
 
 
 @router.post("")
 async def kundali_endpoint_post(payload: KundaliRequest):
-    return _build_kundali_response(
+    return await run_compute(
+        COMPUTE_LANE,
+        _build_kundali_response,
         datetime_str=payload.datetime,
         lat=payload.lat,
         lon=payload.lon,
@@ -246,12 +252,16 @@ async def lagna_endpoint(
     lon: Optional[str] = Query(None, description="Longitude"),
     tz: Optional[str] = Query("Asia/Kathmandu", description="IANA timezone"),
 ):
-    return _build_lagna_response(datetime_str=datetime_str, lat=lat, lon=lon, tz=tz)
+    return await run_compute(
+        COMPUTE_LANE, _build_lagna_response, datetime_str=datetime_str, lat=lat, lon=lon, tz=tz
+    )
 
 
 @router.post("/lagna")
 async def lagna_endpoint_post(payload: KundaliRequest):
-    return _build_lagna_response(
+    return await run_compute(
+        COMPUTE_LANE,
+        _build_lagna_response,
         datetime_str=payload.datetime,
         lat=payload.lat,
         lon=payload.lon,
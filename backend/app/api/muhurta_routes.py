@@ -8,6 +8,7 @@ from fastapi import APIRouter, Query
 from pydantic import BaseModel, Field
 
 from app.core.request_context import CoordinateInput
+from app.infrastructure.compute_executor import run_compute
 from app.services.muhurta_surface_service import (
     build_auspicious_muhurta_response,
     build_muhurta_for_day_response,
@@ -15,6 +16,7 @@ from app.services.muhurta_surface_service import (
 )
 
 router = APIRouter(prefix="/api/muhurta", tags=["muhurta"])
+COMPUTE_LANE = "muhurta"
 
 
 class MuhurtaDayRequest(BaseModel):
@@ -60,7 +62,9 @@ async def muhurta_for_day(
         None, description="Birth nakshatra name or number 1-27 (optional tara-bala)"
     ),
 ):
-    return build_muhurta_for_day_response(
+    return await run_compute(
+        COMPUTE_LANE,
+        build_muhurta_for_day_response,
         date_str=date_str,
         lat=lat,
         lon=lon,
@@ -71,7 +75,9 @@ async def muhurta_for_day(
 
 @router.post("")
 async def muhurta_for_day_post(payload: MuhurtaDayRequest):
-    return build_muhurta_for_day_response(
+    return await run_compute(
+        COMPUTE_LANE,
+        build_muhurta_for_day_response,
         date_str=payload.date,
         lat=payload.lat,
         lon=payload.lon,
@@ -87,12 +93,16 @@ async def rahu_kalam(
     lon: Optional[str] = Query(None, description="Longitude"),
     tz: Optional[str] = Query("Asia/Kathmandu", description="IANA timezone"),
 ):
-    return build_rahu_kalam_response(date_str=date_str, lat=lat, lon=lon, tz=tz)
+    return await run_compute(
+        COMPUTE_LANE, build_rahu_kalam_response, date_str=date_str, lat=lat, lon=lon, tz=tz
+    )
 
 
 @router.post("/rahu-kalam")
 async def rahu_kalam_post(payload: RahuKalamRequest):
-    return build_rahu_kalam_response(
+    return await run_compute(
+        COMPUTE_LANE,
+        build_rahu_kalam_response,
         date_str=payload.date,
         lat=payload.lat,
         lon=payload.lon,
@@ -114,7 +124,9 @@ async def auspicious_muhurta(
         "np-mainstream-v2", description="np-mainstream-v2|diaspora-practical-v2"
     ),
 ):
-    return build_auspicious_muhurta_response(
+    return await run_compute(
+        COMPUTE_LANE,
+        build_auspicious_muhurta_response,
         date_str=date_str,
         ceremony_type=ceremony_type,
         lat=lat,
@@ -127,7 +139,9 @@ async def auspicious_muhurta(
 
 @router.post("/auspicious")
 async def auspicious_muhurta_post(payload: AuspiciousMuhurtaRequest):
-    return build_auspicious_muhurta_response(
+    return await run_compute(
+        COMPUTE_LANE,
+        build_auspicious_muhurta_response,
         date_str=payload.date,
         ceremony_type=payload.type,
         lat=payload.lat,
@@ -8,6 +8,7 @@ from fastapi import APIRouter, Query
 from pydantic import BaseModel, Field
 
 from app.core.request_context import CoordinateInput
+from app.infrastructure.compute_executor import run_compute
 from app.services.personal_surface_service import (
     build_personal_context_response,
     build_personal_panchanga_response,
@@ -15,6 +16,7 @@ from app.services.personal_surface_service import (
 )
 
 router = APIRouter(prefix="/api/personal", tags=["personal"])
+COMPUTE_LANE = "personal"
 
 
 class PersonalPanchangaRequest(BaseModel):
@@ -25,6 +27,30 @@ class PersonalPanchangaRequest(BaseModel):
     risk_mode: str = Field("standard", description="standard|strict")
 
 
+def _build_proof_capsule(
+    surface: str,
+    build_response,
+    *,
+    date_str: str,
+    lat: CoordinateInput,
+    lon: CoordinateInput,
+    tz: Optional[str],
+    risk_mode: str,
+):
+    payload = build_response(
+        date_str=date_str,
+        lat=lat,
+        lon=lon,
+        tz=tz,
+        risk_mode=risk_mode,
+    )
+    return build_personal_proof_capsule(
+        surface=surface,
+        payload=payload,
+        request={"date": date_str, "lat": lat, "lon": lon, "tz": tz, "risk_mode": risk_mode},
+    )
+
+
 @router.get("/panchanga")
 async def personal_panchanga(
     date_str: str = Query(..., alias="date", description="Gregorian date in YYYY-MM-DD format"),
@@ -33,7 +59,9 @@ async def personal_panchanga(
     tz: Optional[str] = Query(None, description="IANA timezone, e.g. Asia/Kathmandu"),
     risk_mode: str = Query("standard", description="standard|strict"),
 ):
-    return build_personal_panchanga_response(
+    return await run_compute(
+        COMPUTE_LANE,
+        build_personal_panchanga_response,
         date_str=date_str,
         lat=lat,
         lon=lon,
@@ -44,7 +72,9 @@ async def personal_panchanga(
 
 @router.post("/panchanga")
 async def personal_panchanga_post(payload: PersonalPanchangaRequest):
-    return build_personal_panchanga_response(
+    return await run_compute(
+        COMPUTE_LANE,
+        build_personal_panchanga_response,
         date_str=payload.date,
         lat=payload.lat,
         lon=payload.lon,
@@ -61,40 +91,32 @@ async def personal_panchanga_proof_capsule(
     tz: Optional[str] = Query(None, description="IANA timezone, e.g. Asia/Kathmandu"),
     risk_mode: str = Query("strict", description="standard|strict"),
 ):
-    payload = build_personal_panchanga_response(
+    return await run_compute(
+        COMPUTE_LANE,
+        _build_proof_capsule,
+        "personal_panchanga",
+        build_personal_panchanga_response,
         date_str=date_str,
         lat=lat,
         lon=lon,
         tz=tz,
         risk_mode=risk_mode,
     )
-    return build_personal_proof_capsule(
-        surface="personal_panchanga",
-        payload=payload,
-        request={"date": date_str, "lat": lat, "lon": lon, "tz": tz, "risk_mode": risk_mode},
-    )
 
 
 @router.post("/panchanga/proof-capsule")
 async def personal_panchanga_proof_capsule_post(payload: PersonalPanchangaRequest):
-    response_payload = build_personal_panchanga_response(
+    return await run_compute(
+        COMPUTE_LANE,
+        _build_proof_capsule,
+        "personal_panchanga",
+        build_personal_panchanga_response,
         date_str=payload.date,
         lat=payload.lat,
         lon=payload.lon,
         tz=payload.tz,
         risk_mode=payload.risk_mode,
     )
-    return build_personal_proof_capsule(
-        surface="personal_panchanga",
-        payload=response_payload,
-        request={
-            "date": payload.date,
-            "lat": payload.lat,
-            "lon": payload.lon,
-            "tz": payload.tz,
-            "risk_mode": payload.risk_mode,
-        },
-    )
 
 
 @router.get("/context")
@@ -105,7 +127,9 @@ async def personal_context(
     tz: Optional[str] = Query(None, description="IANA timezone, e.g. Asia/Kathmandu"),
     risk_mode: str = Query("standard", description="standard|strict"),
 ):
-    return build_personal_context_response(
+    return await run_compute(
+        COMPUTE_LANE,
+        build_personal_context_response,
         date_str=date_str,
         lat=lat,
         lon=lon,
@@ -116,7 +140,9 @@ async def personal_context(
 
 @router.post("/context")
 async def personal_context_post(payload: PersonalPanchangaRequest):
-    return build_personal_context_response(
+    return await run_compute(
+        COMPUTE_LANE,
+        build_personal_context_response,
         date_str=payload.date,
         lat=payload.lat,
         lon=payload.lon,
@@ -133,37 +159,29 @@ async def personal_context_proof_capsule(
     tz: Optional[str] = Query(None, description="IANA timezone, e.g. Asia/Kathmandu"),
     risk_mode: str = Query("strict", description="standard|strict"),
 ):
-    payload = build_personal_context_response(
+    return await run_compute(
+        COMPUTE_LANE,
+        _build_proof_capsule,
+        "personal_context",
+        build_personal_context_response,
         date_str=date_str,
         lat=lat,
         lon=lon,
         tz=tz,
         risk_mode=risk_mode,
     )
-    return build_personal_proof_capsule(
-        surface="personal_context",
-        payload=payload,
-        request={"date": date_str, "lat": lat, "lon": lon, "tz": tz, "risk_mode": risk_mode},
-    )
 
 
 @router.post("/context/proof-capsule")
 async def personal_context_proof_capsule_post(payload: PersonalPanchangaRequest):
-    response_payload = build_personal_context_response(
+    return await run_compute(
+        COMPUTE_LANE,
+        _build_proof_capsule,
+        "personal_context",
+        build_personal_context_response,
         date_str=payload.date,
         lat=payload.lat,
         lon=payload.lon,
         tz=payload.tz,
         risk_mode=payload.risk_mode,
     )
-    return build_personal_proof_capsule(
-        surface="personal_context",
-        payload=response_payload,
-        request={
-            "date": payload.date,
-            "lat": payload.lat,
-            "lon": payload.lon,
-            "tz": payload.tz,
-            "risk_mode": payload.risk_mode,
-        },
-    )
@@ -11,21 +11,20 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, JSONResponse, RedirectResponse
 
 from app.bootstrap.access_control import find_unclassified_api_routes
-from app.bootstrap.middleware import (
-    ExperimentalEnvelopeMiddleware,
-    RequestSizeGuardMiddleware,
-    build_access_control_guard,
-    build_engine_headers,
-    build_experimental_version_gate,
-    build_rate_limit_guard,
-    build_request_context,
-)
+from app.bootstrap.middleware import ExperimentalEnvelopeMiddleware, RequestPipelineMiddleware
 from app.bootstrap.rate_limit import create_rate_limiter_backend
+from app.bootstrap.responses import json_response_class
 from app.bootstrap.router_registry import register_routers
 from app.bootstrap.settings import load_settings, validate_settings
 from app.cache.precomputed import get_cache_stats, prewarm_hot_set
+from app.core.json_codec import configure_default_json_encoder
 from app.engine.ephemeris_config import get_ephemeris_config
 from app.festivals.repository import validate_festival_catalog
+from app.infrastructure.compute_executor import (
+    ComputeExecutorConfig,
+    ComputeSaturatedError,
+    configure_compute_executor,
+)
 from app.policy import get_route_access_manifest
 
 PRODUCT_VERSION = "3.0.0"
@@ -164,36 +163,51 @@ def _install_middleware(app: FastAPI, settings, rate_limit_backend) -> None:
         allow_headers=["*"],
     )
 
-    app.middleware("http")(
-        build_engine_headers(
-            ephemeris_header_value=_ephemeris_header_value,
-            license_mode=settings.license_mode,
-            source_url=settings.source_url,
-            enable_experimental_api=settings.enable_experimental_api,
-        )
-    )
     app.add_middleware(
         ExperimentalEnvelopeMiddleware,
         enable_experimental_api=settings.enable_experimental_api,
     )
-    app.middleware("http")(
-        build_rate_limit_guard(settings=settings, backend=rate_limit_backend)
-    )
-    app.middleware("http")(build_access_control_guard(settings=settings))
-    app.middleware("http")(
-        build_experimental_version_gate(enable_experimental_api=settings.enable_experimental_api)
-    )
     app.add_middleware(
-        RequestSizeGuardMiddleware,
-        max_query_length=settings.max_query_length,
-        max_request_bytes=settings.max_request_bytes,
+        RequestPipelineMiddleware,
+        settings=settings,
+        rate_limit_backend=rate_limit_backend,
+        product_version=PRODUCT_VERSION,
+        ephemeris_header_value=_ephemeris_header_value,
     )
-    app.middleware("http")(
-        build_request_context(product_version=PRODUCT_VERSION, settings=settings)
+
+
+def _configure_compute_pool(settings) -> None:
+    configure_compute_executor(
+        ComputeExecutorConfig(
+            mode=settings.compute_executor,
+            max_workers=settings.compute_max_workers,
+            queue_limit=settings.compute_queue_limit,
+            lane_limit=settings.compute_lane_limit,
+            lane_limits=dict(settings.compute_lane_limits),
+        )
     )
 
 
 def _register_exception_handlers(app: FastAPI) -> None:
+    @app.exception_handler(ComputeSaturatedError)
+    async def compute_saturated_handler(request, exc: ComputeSaturatedError):
+        logger.warning(
+            "Shedding %s request_id=%s lane=%s reason=%s",
+            getattr(getattr(request, "url", None), "path", "unknown"),
+            getattr(request.state, "request_id", None),
+            exc.lane,
+            exc.reason,
+        )
+        return JSONResponse(
+            status_code=503,
+            headers={"Retry-After": str(exc.retry_after)},
+            content={
+                "detail": "Compute capacity exhausted, retry shortly",
+                "request_id": getattr(request.state, "request_id", None),
+                "version": PRODUCT_VERSION,
+            },
+        )
+
     @app.exception_handler(HTTPException)
     async def http_exception_handler(request, exc: HTTPException):
         return JSONResponse(
@@ -405,8 +419,11 @@ def create_app() -> FastAPI:
         title="Project Parva API",
         description="Nepal Festival Discovery System",
         version=PRODUCT_VERSION,
+        default_response_class=json_response_class(settings.json_encoder),
     )
     _initialize_app_state(app, settings, startup_checks)
+    configure_default_json_encoder(settings.json_encoder)
+    _configure_compute_pool(settings)
     _install_middleware(app, settings, rate_limit_backend)
     _register_exception_handlers(app)
     register_routers(
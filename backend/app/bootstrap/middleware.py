@@ -11,14 +11,19 @@ from typing import Any
 
 from fastapi import Request
 from fastapi.responses import JSONResponse, Response
-from starlette.datastructures import Headers, QueryParams
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders, QueryParams
+from starlette.routing import Match
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.bootstrap.access_control import authenticate_request, classify_request
 from app.bootstrap.rate_limit import RateLimiterBackend, RatePolicy
+from app.bootstrap.responses import RENDERED_JSON_SCOPE_KEY, TimedJSONResponse
 from app.bootstrap.settings import AppSettings
+from app.core.instrumentation import begin_request_profile, end_request_profile
 from app.core.meta_envelope import extract_meta, merge_meta_defaults
 from app.reliability.metrics import get_metrics_registry
+from app.reliability.profiler import finish_sampler, maybe_start_sampler
 
 logger = logging.getLogger("parva.request")
 security_logger = logging.getLogger("parva.security")
@@ -55,9 +60,31 @@ _ENVELOPE_PREFERENCE_ALIASES = {
 }
 
 
-def _append_link_header(response: Response, value: str) -> None:
-    existing = response.headers.get("Link")
-    response.headers["Link"] = f"{existing}, {value}" if existing else value
+UNMATCHED_ROUTE = "unmatched"
+
+
+def route_template(scope: Scope) -> str:
+    """Metrics label for a request: its route template, not the raw path.
+
+    FastAPI records the matched route in the scope once routing has run. For
+    requests answered before routing (throttled, rejected) or by plain
+    Starlette routes the router is asked directly. Paths no route accepts
+    share one label so scanners cannot mint new series.
+    """
+    template = getattr(scope.get("route"), "path_format", None)
+    if template:
+        return template
+    router = getattr(scope.get("app"), "router", None)
+    for route in getattr(router, "routes", ()):
+        match, _ = route.matches(scope)
+        if match != Match.NONE:
+            return getattr(route, "path_format", None) or UNMATCHED_ROUTE
+    return UNMATCHED_ROUTE
+
+
+def _append_link_header(headers: MutableHeaders, value: str) -> None:
+    existing = headers.get("Link")
+    headers["Link"] = f"{existing}, {value}" if existing else value
 
 
 def _append_vary_header(headers: dict[str, str], value: str) -> None:
@@ -110,16 +137,10 @@ class RequestSizeGuardMiddleware:
         self.max_query_length = max_query_length
         self.max_request_bytes = max_request_bytes
 
-    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
-        if scope["type"] != "http":
-            await self.app(scope, receive, send)
-            return
-
+    def rejection(self, scope: Scope) -> Response | None:
+        """Response for requests whose declared size is already out of bounds."""
         if len(scope.get("query_string", b"")) > self.max_query_length:
-            await JSONResponse(
-                status_code=414, content={"detail": "Query string too long"}
-            )(scope, receive, send)
-            return
+            return JSONResponse(status_code=414, content={"detail": "Query string too long"})
 
         headers = Headers(raw=scope.get("headers", []))
         content_length = headers.get("content-length")
@@ -127,23 +148,23 @@ class RequestSizeGuardMiddleware:
             try:
                 declared_length = int(content_length)
             except ValueError:
-                await JSONResponse(
+                return JSONResponse(
                     status_code=400, content={"detail": "Invalid content-length header"}
-                )(scope, receive, send)
-                return
+                )
 
             if declared_length < 0:
-                await JSONResponse(
+                return JSONResponse(
                     status_code=400, content={"detail": "Invalid content-length header"}
-                )(scope, receive, send)
-                return
+                )
 
             if declared_length > self.max_request_bytes:
-                await JSONResponse(
+                return JSONResponse(
                     status_code=413, content={"detail": "Request payload too large"}
-                )(scope, receive, send)
-                return
+                )
+        return None
 
+    async def forward(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run the wrapped app, aborting with 413 once the streamed body exceeds the limit."""
         streamed_bytes = 0
         response_started = False
 
@@ -174,6 +195,17 @@ class RequestSizeGuardMiddleware:
                 status_code=413, content={"detail": "Request payload too large"}
             )(scope, receive, send)
 
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        rejection = self.rejection(scope)
+        if rejection is not None:
+            await rejection(scope, receive, send)
+            return
+        await self.forward(scope, receive, send)
+
 
 def _client_ip(request: Request, settings: AppSettings) -> str:
     remote_host = request.client.host if request.client and request.client.host else ""
@@ -189,57 +221,6 @@ def _client_ip(request: Request, settings: AppSettings) -> str:
     return "unknown"
 
 
-def build_request_context(*, product_version: str, settings: AppSettings):
-    metrics = get_metrics_registry()
-
-    async def request_context(request: Request, call_next):
-        request_id = request.headers.get("x-request-id", "").strip() or uuid.uuid4().hex
-        request.state.request_id = request_id
-        request.state.client_ip = _client_ip(request, settings)
-        started = time.perf_counter()
-
-        try:
-            response = await call_next(request)
-        except Exception:
-            latency_ms = round((time.perf_counter() - started) * 1000.0, 2)
-            logger.error(
-                json.dumps(
-                    {
-                        "event": "request.error",
-                        "request_id": request_id,
-                        "path": request.url.path,
-                        "method": request.method,
-                        "latency_ms": latency_ms,
-                        "version": product_version,
-                    }
-                )
-            )
-            raise
-
-        latency_ms = round((time.perf_counter() - started) * 1000.0, 2)
-        metrics.record_request(request.url.path, response.status_code, latency_ms)
-        principal = getattr(request.state, "principal", None)
-        logger.info(
-            json.dumps(
-                {
-                    "event": "request.complete",
-                    "request_id": request_id,
-                    "path": request.url.path,
-                    "method": request.method,
-                    "status_code": response.status_code,
-                    "latency_ms": latency_ms,
-                    "principal": getattr(principal, "principal_id", None),
-                    "client_ip": request.state.client_ip,
-                    "version": product_version,
-                }
-            )
-        )
-        response.headers["X-Request-ID"] = request_id
-        return response
-
-    return request_context
-
-
 def _log_security_event(
     *,
     event: str,
@@ -264,15 +245,20 @@ def _log_security_event(
     )
 
 
-def build_access_control_guard(*, settings: AppSettings):
-    async def access_control(request: Request, call_next):
+class AccessControlGuard:
+    """Authenticates the caller and enforces the route access policy."""
+
+    def __init__(self, *, settings: AppSettings) -> None:
+        self.settings = settings
+
+    def check(self, request: Request) -> Response | None:
         requirement = classify_request(request.url.path, request.method)
         if requirement.policy_name == "unclassified_api":
             # Let genuinely missing API paths fall through to FastAPI's 404 instead of
             # converting them into auth failures. Startup validation already blocks
             # shipping real registered routes in this state.
             request.state.principal = None
-            return await call_next(request)
+            return None
         if not requirement.required:
             request.state.principal = None
             _log_security_event(
@@ -280,9 +266,9 @@ def build_access_control_guard(*, settings: AppSettings):
                 request=request,
                 requirement_name=requirement.policy_name,
             )
-            return await call_next(request)
+            return None
 
-        principal = authenticate_request(request, settings)
+        principal = authenticate_request(request, self.settings)
         if principal is None:
             reason = "credentials_missing"
             if request.headers.get("authorization") or request.headers.get("x-api-key"):
@@ -344,9 +330,7 @@ def build_access_control_guard(*, settings: AppSettings):
             requirement_name=requirement.policy_name,
             principal_id=principal.principal_id,
         )
-        return await call_next(request)
-
-    return access_control
+        return None
 
 
 def _rate_policy_for_request(path: str, principal_type: str | None) -> tuple[str, RatePolicy]:
@@ -389,12 +373,18 @@ def _should_rate_limit(path: str) -> bool:
     return path.startswith(_RATE_LIMITED_PREFIXES)
 
 
-def build_rate_limit_guard(*, settings: AppSettings, backend: RateLimiterBackend):
-    metrics = get_metrics_registry()
+class RateLimitGuard:
+    """Per-principal request budgets for API paths."""
+
+    def __init__(self, *, settings: AppSettings, backend: RateLimiterBackend) -> None:
+        self.settings = settings
+        self.backend = backend
+        self.metrics = get_metrics_registry()
 
-    async def rate_limit_guard(request: Request, call_next):
-        if not settings.rate_limit_enabled or not _should_rate_limit(request.url.path):
-            return await call_next(request)
+    def check(self, request: Request) -> tuple[Response | None, dict[str, str]]:
+        """Return a 429 response, or the rate-limit headers for the eventual response."""
+        if not self.settings.rate_limit_enabled or not _should_rate_limit(request.url.path):
+            return None, {}
 
         principal = getattr(request.state, "principal", None)
         principal_type = getattr(principal, "principal_type", None)
@@ -402,7 +392,7 @@ def build_rate_limit_guard(*, settings: AppSettings, backend: RateLimiterBackend
             getattr(principal, "principal_id", "") or getattr(request.state, "client_ip", "unknown")
         )
         bucket, policy = _rate_policy_for_request(request.url.path, principal_type)
-        decision = backend.check(
+        decision = self.backend.check(
             identifier=principal_id,
             bucket=bucket,
             policy=policy,
@@ -410,7 +400,7 @@ def build_rate_limit_guard(*, settings: AppSettings, backend: RateLimiterBackend
         )
 
         if not decision.allowed:
-            metrics.record_throttle(request.url.path)
+            self.metrics.record_throttle(route_template(request.scope))
             logger.warning(
                 json.dumps(
                     {
@@ -423,7 +413,7 @@ def build_rate_limit_guard(*, settings: AppSettings, backend: RateLimiterBackend
                     }
                 )
             )
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=429,
                 content={
                     "detail": "Rate limit exceeded",
@@ -435,20 +425,24 @@ def build_rate_limit_guard(*, settings: AppSettings, backend: RateLimiterBackend
                     "X-RateLimit-Remaining": "0",
                 },
             )
+            return response, {}
 
-        response = await call_next(request)
-        response.headers["X-RateLimit-Limit"] = str(policy.limit)
-        response.headers["X-RateLimit-Remaining"] = str(decision.remaining)
-        return response
+        return None, {
+            "X-RateLimit-Limit": str(policy.limit),
+            "X-RateLimit-Remaining": str(decision.remaining),
+        }
 
-    return rate_limit_guard
 
+class ExperimentalVersionGate:
+    """Hides experimental API tracks unless they are enabled."""
 
-def build_experimental_version_gate(*, enable_experimental_api: bool):
     blocked_prefixes = ("/v2/api/", "/v4/api/", "/v5/api/")
 
-    async def version_gate(request: Request, call_next):
-        if not enable_experimental_api and request.url.path.startswith(blocked_prefixes):
+    def __init__(self, *, enable_experimental_api: bool) -> None:
+        self.enable_experimental_api = enable_experimental_api
+
+    def check(self, path: str) -> Response | None:
+        if not self.enable_experimental_api and path.startswith(self.blocked_prefixes):
             return JSONResponse(
                 status_code=404,
                 content={
@@ -456,9 +450,7 @@ def build_experimental_version_gate(*, enable_experimental_api: bool):
                     "public_profile": "v3",
                 },
             )
-        return await call_next(request)
-
-    return version_gate
+        return None
 
 
 class ExperimentalEnvelopeMiddleware:
@@ -491,6 +483,52 @@ class ExperimentalEnvelopeMiddleware:
             }
         return {"data": payload, "meta": extract_meta(payload, track=track)}
 
+    def _envelope_headers(self, response_start: Message, *, track: str) -> dict[str, str]:
+        headers = _headers_without_content_length(list(response_start.get("headers", [])))
+        if track == "v3":
+            _append_vary_header(headers, _ENVELOPE_PREFERENCE_HEADER)
+            headers[_ENVELOPE_PREFERENCE_HEADER] = _ENVELOPE_PREFERENCE_VALUE
+        return headers
+
+    async def _send_spliced_response(
+        self,
+        *,
+        send: Send,
+        response_start: Message,
+        rendered: TimedJSONResponse,
+        track: str,
+    ) -> None:
+        """Envelope an already-encoded JSON body without decoding or re-encoding it.
+
+        The envelope is ``{"data":`` + original body + ``,"meta":`` + meta ``}``,
+        the same bytes a full re-serialisation would give. Only ``meta`` is
+        encoded here; the original body is forwarded as-is.
+        """
+        headers = self._envelope_headers(response_start, track=track)
+        payload = rendered.content
+        if isinstance(payload, dict) and "data" in payload and "meta" in payload:
+            # Already enveloped: the meta merge changes the body, so re-encode
+            # from the decoded content (still no parse).
+            chunks = [rendered.render(self._build_envelope(payload, track=track))]
+        else:
+            meta = rendered.render(extract_meta(payload, track=track))
+            chunks = [b'{"data":', rendered.body, b',"meta":' + meta + b"}"]
+
+        headers["content-length"] = str(sum(len(chunk) for chunk in chunks))
+        await send(
+            {
+                "type": "http.response.start",
+                "status": response_start["status"],
+                "headers": [
+                    (key.lower().encode("latin-1"), value.encode("latin-1"))
+                    for key, value in headers.items()
+                ],
+            }
+        )
+        last = len(chunks) - 1
+        for index, chunk in enumerate(chunks):
+            await send({"type": "http.response.body", "body": chunk, "more_body": index < last})
+
     async def _send_wrapped_response(
         self,
         *,
@@ -502,10 +540,7 @@ class ExperimentalEnvelopeMiddleware:
         track: str,
     ) -> None:
         raw_headers = response_start.get("headers", [])
-        headers = _headers_without_content_length(list(raw_headers))
-        if track == "v3":
-            _append_vary_header(headers, _ENVELOPE_PREFERENCE_HEADER)
-            headers[_ENVELOPE_PREFERENCE_HEADER] = _ENVELOPE_PREFERENCE_VALUE
+        headers = self._envelope_headers(response_start, track=track)
         media_type = Headers(raw=raw_headers).get("content-type")
 
         if not body:
@@ -562,6 +597,22 @@ class ExperimentalEnvelopeMiddleware:
                 return
 
             if message["type"] == "http.response.body" and should_wrap and response_start is not None:
+                rendered = scope.get(RENDERED_JSON_SCOPE_KEY)
+                if (
+                    not body_buffer
+                    and not message.get("more_body", False)
+                    and isinstance(rendered, TimedJSONResponse)
+                    and message.get("body") is rendered.body
+                ):
+                    await self._send_spliced_response(
+                        send=send,
+                        response_start=response_start,
+                        rendered=rendered,
+                        track=track,
+                    )
+                    return
+
+                # Any other JSON response: buffer, decode and re-encode.
                 body_buffer.extend(message.get("body", b""))
                 if message.get("more_body", False):
                     return
@@ -591,38 +642,208 @@ def _engine_track_for_path(path: str) -> str:
     return "v3"
 
 
-def build_engine_headers(
-    *,
-    ephemeris_header_value: Callable[[], str],
-    license_mode: str,
-    source_url: str | None,
-    enable_experimental_api: bool,
-):
-    async def add_engine_headers(request: Request, call_next):
-        response = await call_next(request)
-        response.headers["X-Parva-Ephemeris"] = ephemeris_header_value()
-        response.headers["X-Parva-License"] = license_mode
-        response.headers["X-Parva-Engine"] = _engine_track_for_path(request.url.path)
-
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["Referrer-Policy"] = "no-referrer"
-        if request.url.path.startswith(_PRIVATE_RESPONSE_PREFIXES):
-            response.headers["Cache-Control"] = "no-store"
-            response.headers["Pragma"] = "no-cache"
-
-        if source_url:
-            _append_link_header(response, f'<{source_url}>; rel="source"')
-
-        if request.url.path.startswith("/api/"):
-            response.headers["Deprecation"] = "true"
-            response.headers["Sunset"] = "Thu, 01 May 2027 00:00:00 GMT"
-            _append_link_header(response, '</v3/docs>; rel="successor-version"')
-
-        if not enable_experimental_api and request.url.path.startswith(("/v2/", "/v4/", "/v5/")):
+class EngineHeaders:
+    """Engine identification, security and deprecation headers for routed responses."""
+
+    def __init__(
+        self,
+        *,
+        ephemeris_header_value: Callable[[], str],
+        license_mode: str,
+        source_url: str | None,
+        enable_experimental_api: bool,
+    ) -> None:
+        self.ephemeris_header_value = ephemeris_header_value
+        self.license_mode = license_mode
+        self.source_url = source_url
+        self.enable_experimental_api = enable_experimental_api
+
+    def apply(self, path: str, headers: MutableHeaders) -> None:
+        headers["X-Parva-Ephemeris"] = self.ephemeris_header_value()
+        headers["X-Parva-License"] = self.license_mode
+        headers["X-Parva-Engine"] = _engine_track_for_path(path)
+
+        headers["X-Content-Type-Options"] = "nosniff"
+        headers["X-Frame-Options"] = "DENY"
+        headers["Referrer-Policy"] = "no-referrer"
+        if path.startswith(_PRIVATE_RESPONSE_PREFIXES):
+            headers["Cache-Control"] = "no-store"
+            headers["Pragma"] = "no-cache"
+
+        if self.source_url:
+            _append_link_header(headers, f'<{self.source_url}>; rel="source"')
+
+        if path.startswith("/api/"):
+            headers["Deprecation"] = "true"
+            headers["Sunset"] = "Thu, 01 May 2027 00:00:00 GMT"
+            _append_link_header(headers, '</v3/docs>; rel="successor-version"')
+
+        if not self.enable_experimental_api and path.startswith(("/v2/", "/v4/", "/v5/")):
             # Should not happen due to gate, but keep explicit.
-            response.headers["X-Parva-Experimental"] = "disabled"
+            headers["X-Parva-Experimental"] = "disabled"
+
+
+class RequestPipelineMiddleware:
+    """Request context, guards and engine headers as one pure-ASGI layer.
+
+    Replaces a stack of ``call_next`` middlewares, each of which cost a task hop
+    and a response-object round trip. Per request, in order:
+
+    1. request context: request id, client IP, per-request profile, timing and
+       the closing log line (wraps everything below);
+    2. size guard: query-string and body limits;
+    3. experimental version gate, access control and rate limiting, each of
+       which may answer the request itself;
+    4. the wrapped app, whose response gets the engine headers.
+
+    Responses produced by the guards skip the engine headers, as before.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        settings: AppSettings,
+        rate_limit_backend: RateLimiterBackend,
+        product_version: str,
+        ephemeris_header_value: Callable[[], str],
+    ) -> None:
+        self.app = app
+        self.settings = settings
+        self.product_version = product_version
+        self.metrics = get_metrics_registry()
+        self.size_guard = RequestSizeGuardMiddleware(
+            app,
+            max_query_length=settings.max_query_length,
+            max_request_bytes=settings.max_request_bytes,
+        )
+        self.version_gate = ExperimentalVersionGate(
+            enable_experimental_api=settings.enable_experimental_api
+        )
+        self.access_control = AccessControlGuard(settings=settings)
+        self.rate_limit = RateLimitGuard(settings=settings, backend=rate_limit_backend)
+        self.engine_headers = EngineHeaders(
+            ephemeris_header_value=ephemeris_header_value,
+            license_mode=settings.license_mode,
+            source_url=settings.source_url,
+            enable_experimental_api=settings.enable_experimental_api,
+        )
+
+    def _guard(self, request: Request) -> tuple[Response | None, dict[str, str]]:
+        response = self.version_gate.check(request.url.path)
+        if response is None:
+            response = self.access_control.check(request)
+        if response is None:
+            return self.rate_limit.check(request)
+        return response, {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        path = request.url.path
+        request_id = request.headers.get("x-request-id", "").strip() or uuid.uuid4().hex
+        request.state.request_id = request_id
+        request.state.client_ip = _client_ip(request, self.settings)
+        started = time.perf_counter()
+        profile, profile_token = begin_request_profile()
+        sampler = maybe_start_sampler(self.settings.profile_sample_rate)
 
-        return response
+        status_code = 500
+        routed = False
+        extra_headers: dict[str, str] = {}
 
-    return add_engine_headers
+        async def send_with_headers(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                if routed:
+                    for key, value in extra_headers.items():
+                        headers[key] = value
+                    self.engine_headers.apply(path, headers)
+                headers["X-Request-ID"] = request_id
+                if self.settings.server_timing_enabled:
+                    headers["Server-Timing"] = profile.server_timing()
+            await send(message)
+
+        try:
+            response = self.size_guard.rejection(scope)
+            if response is None:
+                response, extra_headers = self._guard(request)
+            if response is not None:
+                await response(scope, receive, send_with_headers)
+            else:
+                routed = True
+                await self.size_guard.forward(scope, receive, send_with_headers)
+        except Exception:
+            end_request_profile(profile_token)
+            if sampler is not None:
+                await run_in_threadpool(
+                    finish_sampler,
+                    sampler,
+                    output_dir=self.settings.profile_dir,
+                    request_id=request_id,
+                )
+            latency_ms = round((time.perf_counter() - started) * 1000.0, 2)
+            logger.error(
+                json.dumps(
+                    {
+                        "event": "request.error",
+                        "request_id": request_id,
+                        "path": path,
+                        "method": request.method,
+                        "latency_ms": latency_ms,
+                        "version": self.product_version,
+                    }
+                )
+            )
+            raise
+
+        end_request_profile(profile_token)
+        latency_ms = round((time.perf_counter() - started) * 1000.0, 2)
+        route = route_template(scope)
+        self.metrics.record_request(route, status_code, latency_ms)
+        self.metrics.record_request_profile(
+            route,
+            ephemeris_calls=profile.ephemeris_calls,
+            stages=profile.stages,
+        )
+        profile_path = None
+        if sampler is not None:
+            profile_path = await run_in_threadpool(
+                finish_sampler,
+                sampler,
+                output_dir=self.settings.profile_dir,
+                request_id=request_id,
+            )
+        if profile_path is not None:
+            logger.info(
+                json.dumps(
+                    {
+                        "event": "request.profiled",
+                        "request_id": request_id,
+                        "path": path,
+                        "latency_ms": latency_ms,
+                        "profile": str(profile_path),
+                    }
+                )
+            )
+        principal = getattr(request.state, "principal", None)
+        logger.info(
+            json.dumps(
+                {
+                    "event": "request.complete",
+                    "request_id": request_id,
+                    "path": path,
+                    "method": request.method,
+                    "status_code": status_code,
+                    "latency_ms": latency_ms,
+                    "principal": getattr(principal, "principal_id", None),
+                    "client_ip": request.state.client_ip,
+                    "version": self.product_version,
+                }
+            )
+        )
@@ -0,0 +1,53 @@
+"""Response classes installed by the app factory."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from starlette.types import Receive, Scope, Send
+
+from app.core.instrumentation import STAGE_SERIALIZE, stage
+from app.core.json_codec import (
+    JSON_ENCODER_ORJSON,
+    dumps_orjson,
+    dumps_stdlib,
+    resolve_json_encoder_name,
+)
+
+# Scope key under which a TimedJSONResponse leaves itself while it is sent.
+RENDERED_JSON_SCOPE_KEY = "parva.rendered_json"
+
+
+class TimedJSONResponse(JSONResponse):
+    """JSON response whose body encoding is reported as the ``serialize`` stage.
+
+    While it is sent, the response is also published in the ASGI scope under
+    ``RENDERED_JSON_SCOPE_KEY``. Outer middleware can then use the original
+    ``content`` and the encoded ``body`` without decoding the body again.
+    """
+
+    content: Any = None
+    encoder = staticmethod(dumps_stdlib)
+
+    def render(self, content: Any) -> bytes:
+        self.content = content
+        with stage(STAGE_SERIALIZE):
+            return self.encoder(content)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        scope[RENDERED_JSON_SCOPE_KEY] = self
+        await super().__call__(scope, receive, send)
+
+
+class FastJSONResponse(TimedJSONResponse):
+    """``TimedJSONResponse`` encoded with orjson."""
+
+    encoder = staticmethod(dumps_orjson)
+
+
+def json_response_class(encoder: str) -> type[TimedJSONResponse]:
+    """Default response class for the ``PARVA_JSON_ENCODER`` setting."""
+    if resolve_json_encoder_name(encoder) == JSON_ENCODER_ORJSON:
+        return FastJSONResponse
+    return TimedJSONResponse
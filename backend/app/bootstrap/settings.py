@@ -8,6 +8,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Final
 
+from app.core.json_codec import resolve_json_encoder_name
+
 PROJECT_ROOT = Path(__file__).resolve().parents[3]
 DEV_ENV_VALUES = {"dev", "development", "local", "test"}
 TEST_ENV_VALUES: Final[frozenset[str]] = frozenset({"test"})
@@ -59,6 +61,15 @@ class AppSettings:
     prewarm_hotset: bool = False
     precomputed_stale_hours: int = 24 * 30
     trusted_proxy_ips: frozenset[str] = field(default_factory=frozenset)
+    compute_executor: str = "thread"
+    compute_max_workers: int = 4
+    compute_queue_limit: int = 64
+    compute_lane_limit: int = 16
+    compute_lane_limits: dict[str, int] = field(default_factory=dict)
+    server_timing_enabled: bool = True
+    profile_sample_rate: float = 0.0
+    profile_dir: Path = PROJECT_ROOT / "backend" / "data" / "profiles"
+    json_encoder: str = "auto"
 
     @property
     def is_dev_environment(self) -> bool:
@@ -112,6 +123,23 @@ def _parse_csv_set(raw: str) -> frozenset[str]:
     return frozenset(token.strip() for token in raw.split(",") if token.strip())
 
 
+def _parse_lane_limits(raw: str) -> dict[str, int]:
+    limits: dict[str, int] = {}
+    for item in raw.split(","):
+        token = item.strip()
+        if not token:
+            continue
+        lane, sep, value = token.partition(":")
+        if not sep or not lane.strip():
+            raise ValueError("PARVA_COMPUTE_LANE_LIMITS entries must follow lane:limit format")
+        limits[lane.strip()] = int(value)
+    return limits
+
+
+def _default_compute_workers() -> int:
+    return min(4, os.cpu_count() or 1)
+
+
 def _parse_optional_text(value: str | None) -> str | None:
     if value is None:
         return None
@@ -170,6 +198,43 @@ def _validate_rate_limit_settings(settings: AppSettings) -> list[str]:
     return errors
 
 
+def _validate_compute_settings(settings: AppSettings) -> list[str]:
+    errors: list[str] = []
+    if settings.compute_executor.strip().lower() not in {"thread", "process"}:
+        errors.append("PARVA_COMPUTE_EXECUTOR must be either thread or process.")
+    if settings.compute_max_workers < 1:
+        errors.append("PARVA_COMPUTE_MAX_WORKERS must be at least 1.")
+    if settings.compute_queue_limit < settings.compute_max_workers:
+        errors.append("PARVA_COMPUTE_QUEUE_LIMIT must be at least PARVA_COMPUTE_MAX_WORKERS.")
+    lane_limits = [settings.compute_lane_limit, *settings.compute_lane_limits.values()]
+    if any(limit < 1 for limit in lane_limits):
+        errors.append("Compute lane limits must be at least 1.")
+    return errors
+
+
+def _validate_profiling_settings(settings: AppSettings) -> list[str]:
+    if 0.0 <= settings.profile_sample_rate <= 1.0:
+        return []
+    return ["PARVA_PROFILE_SAMPLE_RATE must be between 0 and 1."]
+
+
+def _validate_json_encoder_settings(settings: AppSettings) -> list[str]:
+    try:
+        resolve_json_encoder_name(settings.json_encoder)
+    except ValueError:
+        if settings.json_encoder.strip().lower() == "orjson":
+            return ["PARVA_JSON_ENCODER=orjson requires the 'orjson' package."]
+        return ["PARVA_JSON_ENCODER must be one of auto, orjson or stdlib."]
+    return []
+
+
+def _profile_dir_from_env() -> Path:
+    configured = os.getenv("PARVA_PROFILE_DIR", "").strip()
+    if configured:
+        return Path(configured).expanduser().resolve()
+    return PROJECT_ROOT / "backend" / "data" / "profiles"
+
+
 def _validate_frontend_settings(settings: AppSettings) -> list[str]:
     if not settings.serve_frontend or settings.environment.lower() != "production":
         return []
@@ -219,6 +284,17 @@ def load_settings() -> AppSettings:
         ),
         precomputed_stale_hours=int(os.getenv("PARVA_PRECOMPUTED_STALE_HOURS", str(24 * 30))),
         trusted_proxy_ips=_parse_csv_set(os.getenv("PARVA_TRUSTED_PROXY_IPS", "")),
+        compute_executor=(os.getenv("PARVA_COMPUTE_EXECUTOR", "thread").strip().lower() or "thread"),
+        compute_max_workers=int(
+            os.getenv("PARVA_COMPUTE_MAX_WORKERS", str(_default_compute_workers()))
+        ),
+        compute_queue_limit=int(os.getenv("PARVA_COMPUTE_QUEUE_LIMIT", "64")),
+        compute_lane_limit=int(os.getenv("PARVA_COMPUTE_LANE_LIMIT", "16")),
+        compute_lane_limits=_parse_lane_limits(os.getenv("PARVA_COMPUTE_LANE_LIMITS", "")),
+        server_timing_enabled=_parse_bool(os.getenv("PARVA_SERVER_TIMING"), default=True),
+        profile_sample_rate=float(os.getenv("PARVA_PROFILE_SAMPLE_RATE", "0") or 0.0),
+        profile_dir=_profile_dir_from_env(),
+        json_encoder=(os.getenv("PARVA_JSON_ENCODER", "auto").strip().lower() or "auto"),
     )
 
 
@@ -228,5 +304,8 @@ def validate_settings(settings: AppSettings) -> list[str]:
     errors.extend(_validate_source_url(settings))
     errors.extend(_validate_experimental_settings(settings))
     errors.extend(_validate_rate_limit_settings(settings))
+    errors.extend(_validate_compute_settings(settings))
+    errors.extend(_validate_profiling_settings(settings))
+    errors.extend(_validate_json_encoder_settings(settings))
     errors.extend(_validate_frontend_settings(settings))
     return errors
@@ -5,9 +5,11 @@ from .precomputed import (
     clear_precomputed_cache,
     get_cache_stats,
     load_precomputed_festival_year,
+    load_precomputed_festival_year_encoded,
     load_precomputed_festivals_between,
     load_precomputed_festivals_between_report,
     load_precomputed_panchanga,
+    load_precomputed_panchanga_encoded,
     measure_hotset_latency,
     prewarm_hot_set,
 )
@@ -17,6 +19,8 @@ __all__ = [
     "clear_precomputed_cache",
     "load_precomputed_panchanga",
     "load_precomputed_festival_year",
+    "load_precomputed_panchanga_encoded",
+    "load_precomputed_festival_year_encoded",
     "load_precomputed_festivals_between",
     "load_precomputed_festivals_between_report",
     "get_cache_stats",
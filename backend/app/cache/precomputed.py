@@ -32,6 +32,14 @@ def load_precomputed_festival_year(year: int) -> Optional[dict[str, Any]]:
     return get_precomputed_store().load_festival_year(year)
 
 
+def load_precomputed_panchanga_encoded(target_date: date) -> Optional[bytes]:
+    return get_precomputed_store().load_panchanga_encoded(target_date)
+
+
+def load_precomputed_festival_year_encoded(year: int) -> Optional[bytes]:
+    return get_precomputed_store().load_festival_year_encoded(year)
+
+
 def load_precomputed_festivals_between_report(
     start_date: date,
     end_date: date,
@@ -40,34 +48,15 @@ def load_precomputed_festivals_between_report(
     loaded_years: list[int] = []
     missing_years: list[int] = []
 
+    store = get_precomputed_store()
     for year in range(start_date.year, end_date.year + 1):
-        payload = load_precomputed_festival_year(year)
-        if not payload or not isinstance(payload.get("festivals"), list):
+        index = store.load_festival_year_index(year)
+        if index is None:
             missing_years.append(year)
             continue
 
         loaded_years.append(year)
-        for row in payload["festivals"]:
-            try:
-                festival_start = date.fromisoformat(str(row["start"]))
-                festival_end = date.fromisoformat(str(row["end"]))
-            except (KeyError, TypeError, ValueError):
-                continue
-
-            if festival_end < start_date or festival_start > end_date:
-                continue
-
-            rows.append(
-                {
-                    "festival_id": row["festival_id"],
-                    "start_date": festival_start,
-                    "end_date": festival_end,
-                    "year": year,
-                    "method": row.get("method", "precomputed"),
-                    "lunar_month": row.get("lunar_month"),
-                    "is_adhik_year": bool(row.get("is_adhik_year", False)),
-                }
-            )
+        rows.extend(dict(row) for row in index.overlapping(start_date, end_date))
 
     return {
         "rows": rows,
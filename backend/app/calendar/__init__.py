@@ -18,6 +18,7 @@ from .bikram_sambat import (
     get_bs_month_name_nepali,
     gregorian_to_bs,
     gregorian_to_bs_estimated,
+    gregorian_to_bs_many,
     gregorian_to_bs_official,
     is_valid_bs_date,
 )
@@ -112,6 +113,7 @@ __all__ = [
     "bs_to_gregorian",
     "gregorian_to_bs",
     "gregorian_to_bs_official",
+    "gregorian_to_bs_many",
     "gregorian_to_bs_estimated",
     "get_bs_month_name",
     "get_bs_month_name_nepali",
@@ -28,8 +28,11 @@ import json
 from datetime import date, datetime, timedelta
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, NamedTuple, Optional, Tuple
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Tuple
 
+import numpy as np
+
+from .bs_estimate_cache import get_bs_estimate_cache
 from .constants import (
     BS_CALENDAR_DATA,
     BS_MAX_YEAR,
@@ -38,7 +41,7 @@ from .constants import (
     BS_MONTH_NAMES_NEPALI,
     get_bs_year_data,
 )
-from .ephemeris.swiss_eph import calculate_sunrise
+from .ephemeris.solar_events import get_sunrise
 from .ephemeris.time_utils import to_nepal_time
 from .sankranti import find_mesh_sankranti, get_sankrantis_in_year
 
@@ -232,15 +235,12 @@ def bs_to_gregorian(year: int, month: int, day: int) -> date:
                 f"and day must be valid for that month."
             )
 
-        data = get_bs_year_data(year)
-        if data is None:
+        index = _BS_INDEX
+        year_start = index.year_start_ordinals.get(year)
+        if year_start is None:
             raise ValueError(f"BS year {year} not in lookup table")
 
-        month_lengths, year_start = data
-        days_from_year_start = day - 1
-        for m in range(month - 1):
-            days_from_year_start += month_lengths[m]
-        return year_start + timedelta(days=days_from_year_start)
+        return date.fromordinal(year_start + index.month_offsets[year][month - 1] + day - 1)
 
     return _bs_to_gregorian_estimated(year, month, day)
 
@@ -277,45 +277,14 @@ def _gregorian_to_bs_official(gregorian_date: date) -> tuple[int, int, int]:
         >>> gregorian_to_bs(date(2023, 12, 25))  # Christmas 2023
         (2080, 9, 10)
     """
-    # Find which BS year this falls in (official lookup)
-    bs_year = None
-    year_start = None
-
-    for year, (month_lengths, start_date) in sorted(BS_CALENDAR_DATA.items()):
-        # Calculate end of this BS year (exclusive - first day of next year)
-        year_end_exclusive = start_date + timedelta(days=sum(month_lengths))
-
-        # Use exclusive comparison for end to avoid overlap with next year
-        if start_date <= gregorian_date < year_end_exclusive:
-            bs_year = year
-            year_start = start_date
-            break
-
-    if bs_year is None:
-        # Check if it's before our range
-        min_start = BS_CALENDAR_DATA[BS_MIN_YEAR][1]
-        max_data = BS_CALENDAR_DATA[BS_MAX_YEAR]
-        max_end = max_data[1] + timedelta(days=sum(max_data[0]) - 1)
-
+    index = _BS_INDEX
+    position = gregorian_date.toordinal() - index.first_ordinal
+    if not 0 <= position < len(index.official):
         raise ValueError(
-            f"Date {gregorian_date} is outside supported range " f"({min_start} to {max_end})"
+            f"Date {gregorian_date} is outside supported range "
+            f"({index.first_date} to {index.last_date})"
         )
-
-    # Calculate days from start of BS year
-    days_from_year_start = (gregorian_date - year_start).days
-
-    # Find month and day
-    month_lengths = BS_CALENDAR_DATA[bs_year][0]
-    remaining_days = days_from_year_start
-
-    for month_idx, month_len in enumerate(month_lengths):
-        if remaining_days < month_len:
-            # Found the month
-            return (bs_year, month_idx + 1, remaining_days + 1)
-        remaining_days -= month_len
-
-    # Should not reach here if data is correct
-    raise ValueError(f"Failed to convert {gregorian_date} - data inconsistency")
+    return index.official[position]
 
 
 def gregorian_to_bs(gregorian_date: date) -> tuple[int, int, int]:
@@ -325,14 +294,60 @@ def gregorian_to_bs(gregorian_date: date) -> tuple[int, int, int]:
     Uses official lookup table for supported range. If out of range,
     falls back to sankranti-based estimated conversion.
     """
-    # Check explicit overrides first
+    # Overrides are folded into the resolved table inside the official range
+    index = _BS_INDEX
+    position = gregorian_date.toordinal() - index.first_ordinal
+    if 0 <= position < len(index.resolved):
+        return index.resolved[position]
+
     override = _get_bs_override_for_gregorian(gregorian_date)
     if override is not None:
         return override
-    try:
-        return _gregorian_to_bs_official(gregorian_date)
-    except ValueError:
-        return _gregorian_to_bs_estimated(gregorian_date)
+    return _gregorian_to_bs_estimated(gregorian_date)
+
+
+class BSDateArrays(NamedTuple):
+    """Bulk BS conversion result: parallel int32 arrays of years, months and days."""
+
+    years: np.ndarray
+    months: np.ndarray
+    days: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.years.shape[0])
+
+    def to_tuples(self) -> list[tuple[int, int, int]]:
+        return list(zip(self.years.tolist(), self.months.tolist(), self.days.tolist()))
+
+
+def gregorian_to_bs_many(gregorian_dates: Iterable[date]) -> BSDateArrays:
+    """
+    Convert many Gregorian dates to BS in one call.
+
+    Dates inside the official range are resolved with a single vectorized
+    gather over the ordinal index; anything outside falls back to
+    ``gregorian_to_bs`` per date. Results match ``gregorian_to_bs`` exactly,
+    overrides included.
+
+    Raises:
+        ValueError: If any date is outside the extended estimated range
+    """
+    index = _BS_INDEX
+    positions = (
+        np.fromiter((d.toordinal() for d in gregorian_dates), dtype=np.int64) - index.first_ordinal
+    )
+    inside = (positions >= 0) & (positions < len(index.resolved))
+
+    gathered = np.where(inside, positions, 0)
+    years = index.resolved_years[gathered]
+    months = index.resolved_months[gathered]
+    days = index.resolved_days[gathered]
+
+    for slot in np.flatnonzero(~inside).tolist():
+        gregorian = date.fromordinal(int(positions[slot]) + index.first_ordinal)
+        years[slot], months[slot], days[slot] = gregorian_to_bs(gregorian)
+
+    return BSDateArrays(years=years, months=months, days=days)
 
 
 def gregorian_to_bs_official(gregorian_date: date) -> tuple[int, int, int]:
@@ -342,7 +357,11 @@ def gregorian_to_bs_official(gregorian_date: date) -> tuple[int, int, int]:
     Raises:
         ValueError if date is outside the official range.
     """
-    # Check explicit overrides first
+    index = _BS_INDEX
+    position = gregorian_date.toordinal() - index.first_ordinal
+    if 0 <= position < len(index.resolved):
+        return index.resolved[position]
+
     override = _get_bs_override_for_gregorian(gregorian_date)
     if override is not None:
         return override
@@ -453,17 +472,13 @@ def _bs_to_gregorian_estimated(year: int, month: int, day: int) -> date:
             days_from_year_start += month_lengths[m]
         return year_start + timedelta(days=days_from_year_start)
 
-    month_starts = _get_bs_month_starts_estimated(year)
+    month_starts, year_end = _get_bs_year_layout_estimated(year)
     start_date = None
     next_start = None
     for idx, (m_num, d_start) in enumerate(month_starts):
         if m_num == month:
             start_date = d_start
-            next_start = (
-                month_starts[idx + 1][1]
-                if idx + 1 < len(month_starts)
-                else _get_mesh_sankranti_date(year - 57 + 1)
-            )
+            next_start = month_starts[idx + 1][1] if idx + 1 < len(month_starts) else year_end
             break
 
     if start_date is None:
@@ -510,12 +525,88 @@ def _get_bs_override_for_gregorian(gregorian_date: date) -> Optional[Tuple[int,
 
 
 def _get_gregorian_override_for_bs(year: int, month: int, day: int) -> Optional[date]:
-    data = _load_bs_overrides()
-    key = f"{year:04d}-{month:02d}-{day:02d}"
-    entry = data.get("bs_to_gregorian", {}).get(key)
-    if not entry:
-        return None
-    return date.fromisoformat(entry)
+    return _BS_INDEX.gregorian_overrides.get((year, month, day))
+
+
+# =============================================================================
+# OFFICIAL ORDINAL INDEX
+# =============================================================================
+
+
+class _BsOrdinalIndex(NamedTuple):
+    """
+    Day-ordinal lookup tables over the official BS range, built once at import.
+
+    ``official`` holds the raw table conversion for every Gregorian day from
+    the first official BS New Year onwards; ``resolved`` is the same table
+    with Gregorian->BS overrides folded in. ``month_offsets[year][m]`` is the
+    day offset of month ``m + 1`` from the start of ``year``.
+    """
+
+    first_ordinal: int
+    official: tuple[tuple[int, int, int], ...]
+    resolved: tuple[tuple[int, int, int], ...]
+    resolved_years: np.ndarray
+    resolved_months: np.ndarray
+    resolved_days: np.ndarray
+    year_start_ordinals: Dict[int, int]
+    month_offsets: Dict[int, tuple[int, ...]]
+    gregorian_overrides: Dict[tuple[int, int, int], date]
+
+    @property
+    def first_date(self) -> date:
+        return date.fromordinal(self.first_ordinal)
+
+    @property
+    def last_date(self) -> date:
+        return date.fromordinal(self.first_ordinal + len(self.official) - 1)
+
+
+def _build_bs_index() -> _BsOrdinalIndex:
+    year_start_ordinals: Dict[int, int] = {}
+    month_offsets: Dict[int, tuple[int, ...]] = {}
+    official: list[tuple[int, int, int]] = []
+    first_ordinal = BS_CALENDAR_DATA[BS_MIN_YEAR][1].toordinal()
+
+    for year in range(BS_MIN_YEAR, BS_MAX_YEAR + 1):
+        month_lengths, start_date = BS_CALENDAR_DATA[year]
+        if start_date.toordinal() != first_ordinal + len(official):
+            raise ValueError(f"BS lookup table is not contiguous at year {year}")
+        year_start_ordinals[year] = start_date.toordinal()
+
+        offsets = [0]
+        for month_idx, month_len in enumerate(month_lengths):
+            offsets.append(offsets[-1] + month_len)
+            official.extend((year, month_idx + 1, day) for day in range(1, month_len + 1))
+        month_offsets[year] = tuple(offsets)
+
+    overrides = _load_bs_overrides()
+    resolved = list(official)
+    for iso_date, entry in overrides["gregorian_to_bs"].items():
+        position = date.fromisoformat(iso_date).toordinal() - first_ordinal
+        if 0 <= position < len(resolved):
+            resolved[position] = (int(entry["year"]), int(entry["month"]), int(entry["day"]))
+
+    gregorian_overrides: Dict[tuple[int, int, int], date] = {}
+    for bs_key, iso_date in overrides["bs_to_gregorian"].items():
+        year, month, day = (int(part) for part in bs_key.split("-"))
+        gregorian_overrides[(year, month, day)] = date.fromisoformat(iso_date)
+
+    columns = np.array(resolved, dtype=np.int32).reshape(-1, 3)
+    return _BsOrdinalIndex(
+        first_ordinal=first_ordinal,
+        official=tuple(official),
+        resolved=tuple(resolved),
+        resolved_years=columns[:, 0].copy(),
+        resolved_months=columns[:, 1].copy(),
+        resolved_days=columns[:, 2].copy(),
+        year_start_ordinals=year_start_ordinals,
+        month_offsets=month_offsets,
+        gregorian_overrides=gregorian_overrides,
+    )
+
+
+_BS_INDEX = _build_bs_index()
 
 
 def _sankranti_start_date(sankranti_utc: datetime) -> date:
@@ -528,7 +619,7 @@ def _sankranti_start_date(sankranti_utc: datetime) -> date:
     """
     local = to_nepal_time(sankranti_utc)
     local_date = local.date()
-    sunrise_utc = calculate_sunrise(local_date)
+    sunrise_utc = get_sunrise(local_date)
     sunrise_local = to_nepal_time(sunrise_utc)
     if local <= sunrise_local:
         return local_date
@@ -539,23 +630,35 @@ def _get_mesh_sankranti_date(gregorian_year: int) -> date:
     """
     Get Mesh Sankranti date in Nepal time for a Gregorian year.
     """
+    cache = get_bs_estimate_cache()
+    cached = cache.get_mesh_sankranti(gregorian_year)
+    if cached is not None:
+        return cached[1]
+
     dt = find_mesh_sankranti(gregorian_year)
     if dt is None:
         raise ValueError(f"Mesh Sankranti not found for {gregorian_year}")
-    return _sankranti_start_date(dt)
+    start = _sankranti_start_date(dt)
+    cache.put_mesh_sankranti(gregorian_year, dt, start)
+    return start
 
 
-def _get_bs_month_starts_estimated(bs_year: int) -> list[tuple[int, date]]:
+def _get_bs_year_layout_estimated(bs_year: int) -> tuple[list[tuple[int, date]], date]:
     """
-    Build month start dates for a BS year using sankranti transitions.
+    Month starts and exclusive year end for an estimated BS year.
 
-    Returns:
-        List of (bs_month_number, start_date) tuples, sorted by start_date.
+    Layouts are read from the persistent estimate cache when present, so a
+    cold worker does not have to re-solve the year's sankrantis.
     """
     min_year, max_year = _estimated_bs_year_range()
     if bs_year < min_year or bs_year > max_year:
         raise ValueError(f"BS year {bs_year} is outside estimated range ({min_year}-{max_year})")
 
+    cache = get_bs_estimate_cache()
+    cached = cache.get_year_layout(bs_year)
+    if cached is not None:
+        return cached
+
     greg_year = bs_year - 57  # Mesh Sankranti for this BS year
     mesh_start = _get_mesh_sankranti_date(greg_year)
     mesh_next = _get_mesh_sankranti_date(greg_year + 1)
@@ -574,7 +677,18 @@ def _get_bs_month_starts_estimated(bs_year: int) -> list[tuple[int, date]]:
             f"Expected 12 sankranti starts for BS year {bs_year}, got {len(month_starts)}"
         )
 
-    return month_starts
+    cache.put_year_layout(bs_year, month_starts, mesh_next)
+    return month_starts, mesh_next
+
+
+def _get_bs_month_starts_estimated(bs_year: int) -> list[tuple[int, date]]:
+    """
+    Build month start dates for a BS year using sankranti transitions.
+
+    Returns:
+        List of (bs_month_number, start_date) tuples, sorted by start_date.
+    """
+    return _get_bs_year_layout_estimated(bs_year)[0]
 
 
 def _gregorian_to_bs_estimated(gregorian_date: date) -> tuple[int, int, int]:
@@ -602,15 +716,10 @@ def _gregorian_to_bs_estimated(gregorian_date: date) -> tuple[int, int, int]:
                         remaining_days -= month_len
 
     # Determine BS year based on Mesh Sankranti date
-    mesh_this = _get_mesh_sankranti_date(gregorian_date.year)
-    if gregorian_date >= mesh_this:
+    if gregorian_date >= _get_mesh_sankranti_date(gregorian_date.year):
         bs_year = gregorian_date.year + 57
-        start_mesh_year = gregorian_date.year
-        mesh_start = mesh_this
     else:
         bs_year = gregorian_date.year + 56
-        start_mesh_year = gregorian_date.year - 1
-        mesh_start = _get_mesh_sankranti_date(start_mesh_year)
 
     min_year, max_year = _estimated_bs_year_range()
     if bs_year < min_year or bs_year > max_year:
@@ -619,27 +728,11 @@ def _gregorian_to_bs_estimated(gregorian_date: date) -> tuple[int, int, int]:
             f"outside estimated range ({min_year}-{max_year})"
         )
 
-    mesh_next = _get_mesh_sankranti_date(start_mesh_year + 1)
-
-    # Build month starts for this BS year
-    sankrantis = get_sankrantis_in_year(start_mesh_year) + get_sankrantis_in_year(
-        start_mesh_year + 1
-    )
-    month_starts = []
-    for s in sankrantis:
-        d = _sankranti_start_date(s["datetime_utc"])
-        if mesh_start <= d < mesh_next:
-            month_starts.append((s["bs_month_number"], d))
-    month_starts.sort(key=lambda x: x[1])
-
-    if len(month_starts) != 12:
-        raise ValueError(
-            f"Expected 12 sankranti starts for BS year {bs_year}, got {len(month_starts)}"
-        )
+    month_starts, year_end = _get_bs_year_layout_estimated(bs_year)
 
     # Determine BS month and day
     for idx, (month_num, start_date) in enumerate(month_starts):
-        next_start = month_starts[idx + 1][1] if idx + 1 < len(month_starts) else mesh_next
+        next_start = month_starts[idx + 1][1] if idx + 1 < len(month_starts) else year_end
         if start_date <= gregorian_date < next_start:
             day = (gregorian_date - start_date).days + 1
             return (bs_year, month_num, day)
@@ -655,15 +748,12 @@ def get_bs_confidence(gregorian_date: date) -> str:
         "official" when the date is within the lookup table range,
         otherwise "estimated".
     """
-    # Overrides are treated as official corrections
-    if _get_bs_override_for_gregorian(gregorian_date) is not None:
+    position = gregorian_date.toordinal() - _BS_INDEX.first_ordinal
+    if 0 <= position < len(_BS_INDEX.official):
         return "official"
 
-    min_start = BS_CALENDAR_DATA[BS_MIN_YEAR][1]
-    max_data = BS_CALENDAR_DATA[BS_MAX_YEAR]
-    max_end = max_data[1] + timedelta(days=sum(max_data[0]) - 1)
-
-    if min_start <= gregorian_date <= max_end:
+    # Overrides are treated as official corrections
+    if _get_bs_override_for_gregorian(gregorian_date) is not None:
         return "official"
     return "estimated"
 
@@ -0,0 +1,213 @@
+"""
+Persistent cache for estimated-mode Bikram Sambat layouts.
+
+Outside the official lookup table every BS year is derived from sankranti
+instants, each of which costs a root solve on the Sun's longitude plus a
+sunrise calculation. The results never change for a given ephemeris
+configuration, so they are kept in a small JSON file per configuration and
+shared across restarts and workers.
+
+File layout (``bs_estimates_v<version>_<config>.json``)::
+
+    {
+      "version": 1,
+      "config": "moshier-lahiri-sidereal",
+      "mesh_sankranti": {"1950": ["1950-04-13T08:12:31+00:00", "1950-04-14"], ...},
+      "years": {"2010": {"month_starts": [[1, "1953-04-13"], ...],
+                         "year_end": "1954-04-13"}, ...}
+    }
+
+``year_end`` is the exclusive end of the BS year (next Baishakh 1). The
+in-memory maps are authoritative: new entries are written back at most once
+every ``FLUSH_INTERVAL_SECONDS``, on ``flush()``/``reset_bs_estimate_caches``
+and at interpreter exit, so a cold fill of many years does not rewrite the
+file once per entry. The file is rewritten atomically and re-read only when
+its mtime shows another worker wrote it; those entries are merged in, so
+entries are never lost, only recomputed.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import time
+from datetime import date, datetime
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.engine.ephemeris_config import get_ephemeris_config
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+DEFAULT_CACHE_DIR = PROJECT_ROOT / "output" / "cache"
+CACHE_DIR_ENV = "PARVA_BS_ESTIMATE_CACHE_DIR"
+CACHE_ENABLED_ENV = "PARVA_BS_ESTIMATE_CACHE_ENABLED"
+
+BS_ESTIMATE_CACHE_VERSION = 1
+FLUSH_INTERVAL_SECONDS = 5.0
+
+MonthStarts = List[Tuple[int, date]]
+
+
+class BsEstimateCache:
+    """Memory-first, disk-backed store for one ephemeris configuration."""
+
+    def __init__(self, path: Optional[Path], config_key: str) -> None:
+        self.path = path
+        self.config_key = config_key
+        self._lock = Lock()
+        self._mesh: Dict[str, List[str]] = {}
+        self._years: Dict[str, Dict[str, Any]] = {}
+        self._loaded = False
+        self._dirty = False
+        self._disk_mtime_ns: Optional[int] = None
+        self._last_flush = float("-inf")
+
+    def _disk_mtime(self) -> Optional[int]:
+        try:
+            return self.path.stat().st_mtime_ns if self.path is not None else None
+        except OSError:
+            return None
+
+    def _read_disk(self) -> tuple[Dict[str, List[str]], Dict[str, Dict[str, Any]]]:
+        self._disk_mtime_ns = self._disk_mtime()
+        if self.path is None or self._disk_mtime_ns is None:
+            return {}, {}
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}, {}
+        if (
+            payload.get("version") != BS_ESTIMATE_CACHE_VERSION
+            or payload.get("config") != self.config_key
+        ):
+            return {}, {}
+        return dict(payload.get("mesh_sankranti", {})), dict(payload.get("years", {}))
+
+    def _ensure_loaded_locked(self) -> None:
+        if not self._loaded:
+            self._mesh, self._years = self._read_disk()
+            self._loaded = True
+
+    def _persist_locked(self, *, force: bool = False) -> None:
+        if self.path is None or not self._dirty:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_flush < FLUSH_INTERVAL_SECONDS:
+            return
+        self._last_flush = now
+        if self._disk_mtime() != self._disk_mtime_ns:
+            # Another worker wrote the file since we last saw it.
+            disk_mesh, disk_years = self._read_disk()
+            disk_mesh.update(self._mesh)
+            disk_years.update(self._years)
+            self._mesh, self._years = disk_mesh, disk_years
+
+        payload = {
+            "version": BS_ESTIMATE_CACHE_VERSION,
+            "config": self.config_key,
+            "mesh_sankranti": dict(sorted(self._mesh.items(), key=lambda item: int(item[0]))),
+            "years": dict(sorted(self._years.items(), key=lambda item: int(item[0]))),
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+            self._disk_mtime_ns = self._disk_mtime()
+        except OSError:
+            # A read-only deployment still benefits from the in-memory copy.
+            pass
+        self._dirty = False
+
+    def flush(self) -> None:
+        """Write pending entries to disk now."""
+        with self._lock:
+            self._persist_locked(force=True)
+
+    def get_mesh_sankranti(self, gregorian_year: int) -> Optional[Tuple[datetime, date]]:
+        """Mesh Sankranti instant and the BS New Year date it starts."""
+        with self._lock:
+            self._ensure_loaded_locked()
+            entry = self._mesh.get(str(gregorian_year))
+        if not entry:
+            return None
+        return datetime.fromisoformat(entry[0]), date.fromisoformat(entry[1])
+
+    def put_mesh_sankranti(self, gregorian_year: int, instant: datetime, start: date) -> None:
+        with self._lock:
+            self._ensure_loaded_locked()
+            self._mesh[str(gregorian_year)] = [instant.isoformat(), start.isoformat()]
+            self._dirty = True
+            self._persist_locked()
+
+    def get_year_layout(self, bs_year: int) -> Optional[Tuple[MonthStarts, date]]:
+        with self._lock:
+            self._ensure_loaded_locked()
+            entry = self._years.get(str(bs_year))
+        if not entry:
+            return None
+        month_starts = [
+            (int(month), date.fromisoformat(start)) for month, start in entry["month_starts"]
+        ]
+        return month_starts, date.fromisoformat(entry["year_end"])
+
+    def put_year_layout(self, bs_year: int, month_starts: MonthStarts, year_end: date) -> None:
+        with self._lock:
+            self._ensure_loaded_locked()
+            self._years[str(bs_year)] = {
+                "month_starts": [[month, start.isoformat()] for month, start in month_starts],
+                "year_end": year_end.isoformat(),
+            }
+            self._dirty = True
+            self._persist_locked()
+
+    def clear_memory(self) -> None:
+        with self._lock:
+            self._mesh, self._years = {}, {}
+            self._loaded = False
+            self._dirty = False
+
+
+_caches: Dict[Tuple[Optional[str], str], BsEstimateCache] = {}
+_caches_lock = Lock()
+
+
+def _cache_path(config_key: str) -> Optional[Path]:
+    enabled = os.getenv(CACHE_ENABLED_ENV, "true").strip().lower()
+    if enabled in {"0", "false", "no", "off"}:
+        return None
+    configured = os.getenv(CACHE_DIR_ENV, "").strip()
+    cache_dir = Path(configured) if configured else DEFAULT_CACHE_DIR
+    return cache_dir / f"bs_estimates_v{BS_ESTIMATE_CACHE_VERSION}_{config_key}.json"
+
+
+def get_bs_estimate_cache() -> BsEstimateCache:
+    """Cache for the active ephemeris configuration (memory-only when disabled)."""
+    config_key = get_ephemeris_config().header_value
+    path = _cache_path(config_key)
+    key = (str(path) if path is not None else None, config_key)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = _caches[key] = BsEstimateCache(path, config_key)
+        return cache
+
+
+def flush_bs_estimate_caches() -> None:
+    """Persist pending entries of every cache (also run at interpreter exit)."""
+    with _caches_lock:
+        caches = list(_caches.values())
+    for cache in caches:
+        cache.flush()
+
+
+def reset_bs_estimate_caches() -> None:
+    """Persist pending entries, then drop in-memory state; the next lookup re-reads from disk."""
+    flush_bs_estimate_caches()
+    with _caches_lock:
+        _caches.clear()
+
+
+atexit.register(flush_bs_estimate_caches)
@@ -21,6 +21,9 @@ from json import JSONDecodeError
 from pathlib import Path
 from typing import Dict, List, Literal, Optional, Tuple
 
+from app.core.instrumentation import STAGE_FESTIVAL_RULE, stage
+from app.infrastructure.interval_index import DateIntervalIndex
+
 from .bikram_sambat import bs_to_gregorian
 from .bs_year import bs_solar_year_for_gregorian_year
 from .lunar_calendar import (
@@ -329,13 +332,14 @@ def _calculate_festival_v2_cached(
     source_hint: str | None,
     notes_hint: str | None,
 ) -> Optional[FestivalDate]:
-    return calculate_festival_date_v2(
-        festival_id,
-        year,
-        use_overrides=use_overrides,
-        source_hint=source_hint,
-        notes_hint=notes_hint,
-    )
+    with stage(STAGE_FESTIVAL_RULE):
+        return calculate_festival_date_v2(
+            festival_id,
+            year,
+            use_overrides=use_overrides,
+            source_hint=source_hint,
+            notes_hint=notes_hint,
+        )
 
 
 def list_festivals_v2() -> List[str]:
@@ -359,12 +363,59 @@ def _list_festivals_v2_cached() -> tuple[str, ...]:
     return tuple(sorted(ids))
 
 
+def has_festival_v2(festival_id: str) -> bool:
+    """Whether the V2 engine has a rule for ``festival_id``."""
+    return festival_id in _festival_ids_v2()
+
+
+@lru_cache(maxsize=1)
+def _festival_ids_v2() -> frozenset[str]:
+    return frozenset(_list_festivals_v2_cached())
+
+
 def get_festival_info_v2(festival_id: str) -> Optional[FestivalRuleV3]:
     """Get festival rule info."""
     rules = get_festival_rules_v3()
     return rules.get(festival_id)
 
 
+@lru_cache(maxsize=16)
+def _festival_year_index_v2(year: int) -> DateIntervalIndex[FestivalDate]:
+    """Every catalog festival computed for ``year``, indexed by date range."""
+    occurrences: List[FestivalDate] = []
+    for festival_id in list_festivals_v2():
+        try:
+            date_range = calculate_festival_v2(festival_id, year)
+        except (TypeError, ValueError, KeyError):
+            continue
+        if date_range:
+            occurrences.append(date_range)
+    return DateIntervalIndex(
+        occurrences,
+        start=lambda item: item.start_date,
+        end=lambda item: item.end_date,
+    )
+
+
+def prepare_festival_year_v2(year: int) -> int:
+    """
+    Compute and index every catalog festival for ``year`` ahead of lookups.
+
+    Batch callers run this inside an active year context so the whole year is
+    resolved against it; returns the number of occurrences indexed.
+    """
+    return len(_festival_year_index_v2(year))
+
+
+def get_year_festivals_v2(year: int, start_date: date, end_date: date) -> List[FestivalDate]:
+    """
+    Festivals computed for ``year`` whose range intersects ``[start_date, end_date]``.
+
+    Served from the year's interval index, ordered by start date.
+    """
+    return _festival_year_index_v2(year).overlapping(start_date, end_date)
+
+
 def get_upcoming_festivals_v2(from_date: date, days: int = 30) -> List[Tuple[str, FestivalDate]]:
     """
     Get all festivals occurring within a date range using V2 engine.
@@ -372,20 +423,9 @@ def get_upcoming_festivals_v2(from_date: date, days: int = 30) -> List[Tuple[str
     end_date = from_date + timedelta(days=days)
     results: List[Tuple[str, FestivalDate]] = []
 
-    years_to_check = {from_date.year, end_date.year}
-
-    for festival_id in list_festivals_v2():
-        for year in years_to_check:
-            try:
-                date_range = calculate_festival_v2(festival_id, year)
-                if (
-                    date_range
-                    and date_range.end_date >= from_date
-                    and date_range.start_date <= end_date
-                ):
-                    results.append((festival_id, date_range))
-            except (TypeError, ValueError, KeyError):
-                continue
+    for year in range(from_date.year, end_date.year + 1):
+        for date_range in get_year_festivals_v2(year, from_date, end_date):
+            results.append((date_range.festival_id, date_range))
 
     results.sort(key=lambda x: x[1].start_date)
 
@@ -405,17 +445,10 @@ def get_festivals_on_date_v2(target_date: date) -> List[Tuple[str, FestivalDate]
     """
     Get all festivals occurring on a specific date using V2 engine.
     """
-    results: List[Tuple[str, FestivalDate]] = []
-
-    for festival_id in list_festivals_v2():
-        try:
-            date_range = calculate_festival_v2(festival_id, target_date.year)
-            if date_range and date_range.overlaps(target_date):
-                results.append((festival_id, date_range))
-        except (TypeError, ValueError, KeyError):
-            continue
-
-    return results
+    return [
+        (date_range.festival_id, date_range)
+        for date_range in _festival_year_index_v2(target_date.year).covering(target_date)
+    ]
 
 
 def get_next_occurrence_v2(
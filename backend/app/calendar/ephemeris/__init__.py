@@ -20,10 +20,13 @@ from .positions import (
 )
 from .swiss_eph import (
     EphemerisError,
+    SunMoonBatch,
     get_ayanamsa,
     get_julian_day,
+    get_julian_days,
     get_moon_longitude,
     get_sun_longitude,
+    get_sun_moon_positions_batch,
     init_ephemeris,
 )
 from .time_utils import (
@@ -40,6 +43,9 @@ __all__ = [
     "get_sun_longitude",
     "get_moon_longitude",
     "get_ayanamsa",
+    "get_julian_days",
+    "get_sun_moon_positions_batch",
+    "SunMoonBatch",
     "EphemerisError",
     # Position calculations
     "get_tithi_angle",
@@ -0,0 +1,145 @@
+"""
+Chebyshev-interpolated Sun and Moon longitudes.
+
+Optional position backend (``EphemerisConfig.position_backend = "chebyshev"``,
+or ``PARVA_EPHEMERIS_BACKEND=chebyshev``). Time is cut into fixed windows
+aligned to whole Julian Days; the first query that lands in a window samples
+``swe.calc_ut`` at the window's Chebyshev nodes and keeps the interpolating
+polynomial of the unwrapped longitude. Every later query in that window is a
+few dozen float operations (Clenshaw recurrence) instead of a pyswisseph
+round-trip, and the derivative polynomial supplies the speed that the Newton
+boundary solvers use.
+
+Windows and degrees:
+
+- Sun: 16-day windows, 10 coefficients
+- Moon: 4-day windows, 12 coefficients
+
+Maximum error against direct pyswisseph (Moshier) calls, sampled over
+1900-2100 with ``tools/benchmark_chebyshev_ephemeris.py``: below 0.001
+arcsecond in longitude for both bodies and below 2e-4 deg/day in speed. That
+is three orders of magnitude inside Moshier's own ~1-3 arcsecond accuracy;
+at the Moon's ~13 deg/day it moves a tithi boundary by well under a
+millisecond.
+
+Fitted windows live in a bounded, lock-guarded LRU keyed by body, flags and
+ayanamsa, so sidereal and tropical requests (and different ayanamsas) never
+share a fit.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
+
+import numpy as np
+import swisseph as swe
+
+from app.core.instrumentation import count_ephemeris_calls
+
+from .session import sidereal_mode
+
+# body -> (window length in days, number of coefficients)
+_WINDOWS: Dict[int, Tuple[int, int]] = {
+    swe.SUN: (16, 10),
+    swe.MOON: (4, 12),
+}
+_MAX_SEGMENTS = 8192
+
+# (coefficients, derivative coefficients scaled to deg/day)
+_Segment = Tuple[Tuple[float, ...], Tuple[float, ...]]
+_Key = Tuple[int, int, int, int]
+
+_segments: "OrderedDict[_Key, _Segment]" = OrderedDict()
+_lock = threading.Lock()
+_hits = 0
+_fits = 0
+
+
+def _nodes(count: int) -> np.ndarray:
+    return np.cos(np.pi * (np.arange(count) + 0.5) / count)
+
+
+def _fit_matrix(count: int) -> np.ndarray:
+    """Maps samples at the Chebyshev nodes to interpolating coefficients."""
+    k = np.arange(count) + 0.5
+    matrix = (2.0 / count) * np.cos(np.pi * np.outer(np.arange(count), k) / count)
+    matrix[0] *= 0.5
+    return matrix
+
+
+_FIT_MATRICES = {count: _fit_matrix(count) for _, count in _WINDOWS.values()}
+_NODES = {count: _nodes(count) for _, count in _WINDOWS.values()}
+
+
+def _fit(body: int, index: int, flags: int, ayanamsa: int) -> _Segment:
+    span, count = _WINDOWS[body]
+    start = index * span
+    julian_days = start + (_NODES[count] + 1.0) * (span / 2.0)
+    count_ephemeris_calls("calc_ut", count)
+    with sidereal_mode(ayanamsa if flags & swe.FLG_SIDEREAL else None):
+        longitudes = np.array([swe.calc_ut(float(jd), body, flags)[0][0] for jd in julian_days])
+    # Nodes run from the window's end to its start; unwrap in time order so a
+    # 360 -> 0 crossing inside the window stays continuous.
+    longitudes = np.degrees(np.unwrap(np.radians(longitudes[::-1])))[::-1]
+    coefficients = _FIT_MATRICES[count] @ longitudes
+    derivative = np.polynomial.chebyshev.chebder(coefficients) * (2.0 / span)
+    return tuple(coefficients.tolist()), tuple(derivative.tolist())
+
+
+def _clenshaw(coefficients: Tuple[float, ...], x: float) -> float:
+    b1 = b2 = 0.0
+    x2 = 2.0 * x
+    for c in coefficients[:0:-1]:
+        b1, b2 = x2 * b1 - b2 + c, b1
+    return x * b1 - b2 + coefficients[0]
+
+
+def _segment(body: int, index: int, flags: int, ayanamsa: int) -> _Segment:
+    global _hits, _fits
+    key = (body, flags, ayanamsa, index)
+    with _lock:
+        segment = _segments.get(key)
+        if segment is not None:
+            _segments.move_to_end(key)
+            _hits += 1
+            return segment
+        _fits += 1
+    # Fitted outside the lock; a racing thread fits the same deterministic window.
+    segment = _fit(body, index, flags, ayanamsa)
+    with _lock:
+        _segments[key] = segment
+        while len(_segments) > _MAX_SEGMENTS:
+            _segments.popitem(last=False)
+    return segment
+
+
+def body_state(body: int, jd: float, flags: int, ayanamsa: int) -> Tuple[float, float]:
+    """Longitude (0-360) and speed (deg/day) of the Sun or Moon at ``jd`` (UT)."""
+    span, _ = _WINDOWS[body]
+    index = math.floor(jd / span)
+    coefficients, derivative = _segment(
+        body, index, flags, ayanamsa if flags & swe.FLG_SIDEREAL else 0
+    )
+    x = 2.0 * (jd - index * span) / span - 1.0
+    return _clenshaw(coefficients, x) % 360.0, _clenshaw(derivative, x)
+
+
+def clear_chebyshev_cache() -> None:
+    global _hits, _fits
+    with _lock:
+        _segments.clear()
+        _hits = 0
+        _fits = 0
+
+
+def chebyshev_cache_stats() -> Dict[str, Any]:
+    with _lock:
+        return {
+            "segments": len(_segments),
+            "max_segments": _MAX_SEGMENTS,
+            "hits": _hits,
+            "fits": _fits,
+        }
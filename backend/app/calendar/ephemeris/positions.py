@@ -229,9 +229,19 @@ def get_nakshatra(dt: datetime) -> Tuple[int, str, float]:
         >>> get_nakshatra(datetime(2026, 2, 6, 6, 0))
         (5, "Mrigashira", 0.65)
     """
-    moon_long = get_moon_longitude(dt)
+    return nakshatra_from_longitude(get_moon_longitude(dt))
 
-    # Calculate nakshatra
+
+def nakshatra_from_longitude(moon_long: float) -> Tuple[int, str, float]:
+    """
+    Nakshatra for an already-computed Moon sidereal longitude.
+
+    Args:
+        moon_long: Moon's sidereal longitude in degrees
+
+    Returns:
+        Tuple of (nakshatra_number 1-27, nakshatra_name, progress 0-1)
+    """
     nakshatra_float = moon_long / NAKSHATRA_SPAN
     nakshatra_num = int(nakshatra_float) + 1  # 1-indexed
 
@@ -287,7 +297,16 @@ def get_yoga(dt: datetime) -> Tuple[int, str, float]:
         (12, "Dhruva", 0.45)
     """
     sun_long, moon_long = get_sun_moon_positions(dt)
+    return yoga_from_longitudes(sun_long, moon_long)
 
+
+def yoga_from_longitudes(sun_long: float, moon_long: float) -> Tuple[int, str, float]:
+    """
+    Yoga for already-computed Sun and Moon sidereal longitudes.
+
+    Returns:
+        Tuple of (yoga_number 1-27, yoga_name, progress 0-1)
+    """
     # Sum of longitudes
     total_long = (sun_long + moon_long) % 360
 
@@ -324,8 +343,16 @@ def get_karana(dt: datetime) -> Tuple[int, str]:
     Returns:
         Tuple of (karana_number 1-60 per month, karana_name)
     """
-    elongation = get_tithi_angle(dt)
+    return karana_from_elongation(get_tithi_angle(dt))
+
 
+def karana_from_elongation(elongation: float) -> Tuple[int, str]:
+    """
+    Karana for an already-computed Moon-Sun elongation.
+
+    Returns:
+        Tuple of (karana_number 1-60 per month, karana_name)
+    """
     # There are 60 karanas in a lunar month (2 per tithi)
     karana_index = int(elongation / KARANA_SPAN)
 
@@ -448,10 +475,7 @@ def get_sun_rashi(dt: datetime) -> Tuple[int, str, str]:
     Returns:
         Tuple of (rashi 1-12, sanskrit_name, english_name)
     """
-    sun_long = get_sun_longitude(dt)
-    rashi_index = int(sun_long / 30)
-
-    return (rashi_index + 1, RASHI_NAMES[rashi_index], RASHI_ENGLISH[rashi_index])
+    return rashi_from_longitude(get_sun_longitude(dt))
 
 
 def get_moon_rashi(dt: datetime) -> Tuple[int, str, str]:
@@ -464,7 +488,16 @@ def get_moon_rashi(dt: datetime) -> Tuple[int, str, str]:
     Returns:
         Tuple of (rashi 1-12, sanskrit_name, english_name)
     """
-    moon_long = get_moon_longitude(dt)
-    rashi_index = int(moon_long / 30)
+    return rashi_from_longitude(get_moon_longitude(dt))
+
+
+def rashi_from_longitude(longitude: float) -> Tuple[int, str, str]:
+    """
+    Rashi (zodiac sign) for an already-computed sidereal longitude.
+
+    Returns:
+        Tuple of (rashi 1-12, sanskrit_name, english_name)
+    """
+    rashi_index = int(longitude / 30)
 
     return (rashi_index + 1, RASHI_NAMES[rashi_index], RASHI_ENGLISH[rashi_index])
@@ -0,0 +1,49 @@
+"""
+Per-call sidereal mode for Swiss Ephemeris.
+
+``swe.set_sid_mode`` writes Swiss Ephemeris state that sidereal
+``swe.calc_ut``/``swe.get_ayanamsa_ut`` calls read later. Where that state
+lives depends on how the C library was built:
+
+- with thread-local storage (the Linux wheels), every thread has its own
+  mode and a new thread starts in Fagan/Bradley, so an ayanamsa set once by
+  ``init_ephemeris`` on the main thread never reaches worker threads;
+- without it, the mode is process-global and a "set, then calculate" pair
+  on one thread can be split by another thread switching the ayanamsa.
+
+``sidereal_mode`` covers both: it applies the requested ayanamsa on every
+entry (well under a microsecond) and holds one process-wide lock until the
+enclosed calls finish. Tropical calculations do not read the mode and run
+without the lock. Process pools (``precompute_parallel``) get a private copy
+of this state per worker.
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+import swisseph as swe
+
+_lock = threading.RLock()
+
+
+@contextmanager
+def sidereal_mode(ayanamsa: Optional[int]) -> Iterator[None]:
+    """Hold ``ayanamsa`` as the active sidereal mode for the enclosed calls.
+
+    ``None`` means the enclosed calls are tropical; nothing is locked.
+    """
+    if ayanamsa is None:
+        yield
+        return
+    with _lock:
+        swe.set_sid_mode(ayanamsa)
+        yield
+
+
+def set_default_sidereal_mode(ayanamsa: int) -> None:
+    """Set the mode seen by code that calls pyswisseph outside a session."""
+    with _lock:
+        swe.set_sid_mode(ayanamsa)
@@ -0,0 +1,187 @@
+"""
+Shared sunrise/sunset table keyed by (quantized location, date).
+
+``swe.rise_trans`` is the most expensive single call on most request paths,
+and the same sunrise is asked for repeatedly: a panchanga, its udaya tithi,
+vriddhi/ksheepana checks (today and tomorrow), lunar-month searches and
+muhurta windows all want the same handful of events. Every caller goes
+through this module instead of ``calculate_sunrise``/``calculate_sunset``.
+
+Locations are rounded to ``LOCATION_DECIMALS`` places (about 11 m) and
+altitude to the metre; events are computed for the rounded location so a
+cached value and a fresh one are always identical. Keys also carry the
+active ephemeris configuration, so switching it never serves events
+computed under the previous one. The table is a bounded
+LRU (``PARVA_SOLAR_EVENT_CACHE_SIZE`` events, default 16384) guarded by a
+lock; ``fill_year`` warms a whole year for one location in a single pass.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, NamedTuple, Tuple
+
+from app.engine.ephemeris_config import get_ephemeris_config
+
+from .swiss_eph import (
+    ALT_KATHMANDU,
+    LAT_KATHMANDU,
+    LON_KATHMANDU,
+    calculate_sunrise,
+    calculate_sunset,
+)
+
+LOCATION_DECIMALS = 4
+SUNRISE = "rise"
+SUNSET = "set"
+
+_MAX_EVENTS = max(64, int(os.getenv("PARVA_SOLAR_EVENT_CACHE_SIZE", "16384")))
+
+Location = Tuple[float, float, float]
+_Key = Tuple[str, float, float, float, int, str]
+
+
+class SolarDay(NamedTuple):
+    """Sunrise, sunset and the following sunrise for one civil date (all UTC)."""
+
+    sunrise: datetime
+    sunset: datetime
+    next_sunrise: datetime
+
+
+_events: "OrderedDict[_Key, datetime]" = OrderedDict()
+_lock = threading.Lock()
+_hits = 0
+_misses = 0
+
+
+def quantize_location(
+    latitude: float = LAT_KATHMANDU,
+    longitude: float = LON_KATHMANDU,
+    altitude: float = ALT_KATHMANDU,
+) -> Location:
+    return (
+        round(float(latitude), LOCATION_DECIMALS),
+        round(float(longitude), LOCATION_DECIMALS),
+        float(round(altitude)),
+    )
+
+
+def _compute(location: Location, date_val: date, event: str) -> datetime:
+    lat, lon, alt = location
+    if event == SUNRISE:
+        return calculate_sunrise(date_val, lat, lon, alt)
+    return calculate_sunset(date_val, lat, lon, alt)
+
+
+def _store_locked(key: _Key, value: datetime) -> None:
+    _events[key] = value
+    _events.move_to_end(key)
+    while len(_events) > _MAX_EVENTS:
+        _events.popitem(last=False)
+
+
+def _event(location: Location, date_val: date, event: str) -> datetime:
+    global _hits, _misses
+    key = (get_ephemeris_config().header_value, *location, date_val.toordinal(), event)
+    with _lock:
+        cached = _events.get(key)
+        if cached is not None:
+            _events.move_to_end(key)
+            _hits += 1
+            return cached
+        _misses += 1
+    # Computed outside the lock; two threads racing on one key both get the
+    # same deterministic value.
+    value = _compute(location, date_val, event)
+    with _lock:
+        _store_locked(key, value)
+    return value
+
+
+def get_sunrise(
+    date_val: date,
+    latitude: float = LAT_KATHMANDU,
+    longitude: float = LON_KATHMANDU,
+    altitude: float = ALT_KATHMANDU,
+) -> datetime:
+    """Cached equivalent of ``calculate_sunrise`` (raises ``EphemerisError`` the same way)."""
+    return _event(quantize_location(latitude, longitude, altitude), date_val, SUNRISE)
+
+
+def get_sunset(
+    date_val: date,
+    latitude: float = LAT_KATHMANDU,
+    longitude: float = LON_KATHMANDU,
+    altitude: float = ALT_KATHMANDU,
+) -> datetime:
+    """Cached equivalent of ``calculate_sunset``."""
+    return _event(quantize_location(latitude, longitude, altitude), date_val, SUNSET)
+
+
+def get_solar_day(
+    date_val: date,
+    latitude: float = LAT_KATHMANDU,
+    longitude: float = LON_KATHMANDU,
+    altitude: float = ALT_KATHMANDU,
+) -> SolarDay:
+    location = quantize_location(latitude, longitude, altitude)
+    return SolarDay(
+        _event(location, date_val, SUNRISE),
+        _event(location, date_val, SUNSET),
+        _event(location, date_val + timedelta(days=1), SUNRISE),
+    )
+
+
+def fill_year(
+    year: int,
+    latitude: float = LAT_KATHMANDU,
+    longitude: float = LON_KATHMANDU,
+    altitude: float = ALT_KATHMANDU,
+) -> int:
+    """Compute every sunrise/sunset of ``year`` (plus the next Jan 1 sunrise).
+
+    Already-cached events are skipped. Returns the number of events computed.
+    """
+    config_key = get_ephemeris_config().header_value
+    location = quantize_location(latitude, longitude, altitude)
+    start = date(year, 1, 1)
+    days = (date(year + 1, 1, 1) - start).days
+    wanted = [(start + timedelta(days=offset), SUNRISE) for offset in range(days + 1)]
+    wanted += [(start + timedelta(days=offset), SUNSET) for offset in range(days)]
+
+    with _lock:
+        missing = [
+            (day, event)
+            for day, event in wanted
+            if (config_key, *location, day.toordinal(), event) not in _events
+        ]
+    computed = [
+        ((config_key, *location, day.toordinal(), event), _compute(location, day, event))
+        for day, event in missing
+    ]
+    with _lock:
+        for key, value in computed:
+            _store_locked(key, value)
+    return len(computed)
+
+
+def clear_solar_event_cache() -> None:
+    global _hits, _misses
+    with _lock:
+        _events.clear()
+        _hits = 0
+        _misses = 0
+
+
+def solar_event_cache_stats() -> Dict[str, Any]:
+    with _lock:
+        return {
+            "entries": len(_events),
+            "max_entries": _MAX_EVENTS,
+            "hits": _hits,
+            "misses": _misses,
+        }
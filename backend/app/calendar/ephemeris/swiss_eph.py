@@ -8,6 +8,8 @@ EPHEMERIS MODE:
 - NOT using external JPL DE431 files (would require swe.set_ephe_path())
 - Accuracy: ~1 arcsecond for planets, ~3 arcseconds for Moon
 - Sufficient for tithi/nakshatra calculations (12° increments)
+- Sun/Moon longitudes can optionally be interpolated from Chebyshev fits
+  (``position_backend="chebyshev"``, see chebyshev.py)
 
 AYANAMSA: Lahiri (Chitrapaksha) - Indian Government standard
 
@@ -15,11 +17,19 @@ Author: Project Parva
 Created: February 2026
 """
 
+import threading
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
-from typing import TYPE_CHECKING, Optional, Tuple
+from typing import TYPE_CHECKING, Iterable, Optional, Tuple
 
+import numpy as np
 import swisseph as swe
 
+from app.core.instrumentation import STAGE_SUNRISE, count_ephemeris_calls, stage
+
+from .chebyshev import body_state
+from .session import set_default_sidereal_mode, sidereal_mode
+
 if TYPE_CHECKING:
     from app.engine.ephemeris_config import EphemerisConfig
 
@@ -81,6 +91,7 @@ class TimezoneError(EphemerisError):
 # =============================================================================
 
 _initialized = False
+_init_lock = threading.Lock()
 
 
 def init_ephemeris(ayanamsa: int = AYANAMSA_LAHIRI) -> None:
@@ -97,8 +108,9 @@ def init_ephemeris(ayanamsa: int = AYANAMSA_LAHIRI) -> None:
     """
     global _initialized
 
-    # Set sidereal mode with Lahiri ayanamsa
-    swe.set_sid_mode(ayanamsa)
+    # Default sidereal mode for direct pyswisseph callers; the wrappers below
+    # apply the configured ayanamsa per call (see session.py).
+    set_default_sidereal_mode(ayanamsa)
 
     # Note: NOT setting swe.set_ephe_path() - using built-in Moshier
     # This is honest about what we're actually using
@@ -108,9 +120,10 @@ def init_ephemeris(ayanamsa: int = AYANAMSA_LAHIRI) -> None:
 
 def _ensure_initialized() -> None:
     """Ensure ephemeris is initialized before calculations."""
-    global _initialized
     if not _initialized:
-        init_ephemeris()
+        with _init_lock:
+            if not _initialized:
+                init_ephemeris()
 
 
 def get_ephemeris_info() -> dict:
@@ -124,6 +137,7 @@ def get_ephemeris_info() -> dict:
         "ayanamsa": cfg.ayanamsa,
         "coordinate_system": cfg.coordinate_system,
         "library": "pyswisseph",
+        "position_backend": cfg.position_backend,
         "notes": "Using built-in Swiss/Moshier ephemeris. For higher accuracy, configure JPL DE431.",
     }
 
@@ -184,7 +198,11 @@ def get_julian_day(dt: datetime) -> float:
     year = utc_dt.year
     month = utc_dt.month
     day = utc_dt.day
-    hour = utc_dt.hour + utc_dt.minute / 60.0 + utc_dt.second / 3600.0
+    hour = (
+        utc_dt.hour
+        + utc_dt.minute / 60.0
+        + (utc_dt.second + utc_dt.microsecond / 1_000_000) / 3600.0
+    )
 
     # Use Swiss Ephemeris Julian Day calculation
     jd = swe.julday(year, month, day, hour)
@@ -217,6 +235,12 @@ def julian_day_to_datetime(jd: float) -> datetime:
 # =============================================================================
 
 
+def _position_session(cfg: "EphemerisConfig", use_sidereal: bool):
+    """Sidereal-mode lock for direct calls; Chebyshev fits take it themselves."""
+    direct_sidereal = use_sidereal and cfg.position_backend == "direct"
+    return sidereal_mode(cfg.ayanamsa_code if direct_sidereal else None)
+
+
 def get_sun_longitude(
     dt: datetime,
     sidereal: Optional[bool] = None,
@@ -244,14 +268,17 @@ def get_sun_longitude(
 
     cfg = config or get_ephemeris_config()
     use_sidereal = sidereal if sidereal is not None else cfg.coordinate_system == "sidereal"
-    if use_sidereal:
-        swe.set_sid_mode(cfg.ayanamsa_code)
     flags = SIDEREAL_FLAGS if use_sidereal else TROPICAL_FLAGS
+    session = _position_session(cfg, use_sidereal)
 
     try:
-        result = swe.calc_ut(jd, SUN, flags)
-        longitude = result[0][0]  # First element is longitude
-        return longitude % 360
+        with session:
+            if cfg.position_backend == "chebyshev":
+                return body_state(SUN, jd, flags, cfg.ayanamsa_code)[0]
+            count_ephemeris_calls("calc_ut")
+            result = swe.calc_ut(jd, SUN, flags)
+            longitude = result[0][0]  # First element is longitude
+            return longitude % 360
     except Exception as e:
         raise EphemerisError(f"Failed to calculate Sun position: {e}")
 
@@ -279,14 +306,17 @@ def get_moon_longitude(
 
     cfg = config or get_ephemeris_config()
     use_sidereal = sidereal if sidereal is not None else cfg.coordinate_system == "sidereal"
-    if use_sidereal:
-        swe.set_sid_mode(cfg.ayanamsa_code)
     flags = SIDEREAL_FLAGS if use_sidereal else TROPICAL_FLAGS
+    session = _position_session(cfg, use_sidereal)
 
     try:
-        result = swe.calc_ut(jd, MOON, flags)
-        longitude = result[0][0]
-        return longitude % 360
+        with session:
+            if cfg.position_backend == "chebyshev":
+                return body_state(MOON, jd, flags, cfg.ayanamsa_code)[0]
+            count_ephemeris_calls("calc_ut")
+            result = swe.calc_ut(jd, MOON, flags)
+            longitude = result[0][0]
+            return longitude % 360
     except Exception as e:
         raise EphemerisError(f"Failed to calculate Moon position: {e}")
 
@@ -313,28 +343,213 @@ def get_sun_moon_positions(
 
     cfg = config or get_ephemeris_config()
     use_sidereal = sidereal if sidereal is not None else cfg.coordinate_system == "sidereal"
-    if use_sidereal:
-        swe.set_sid_mode(cfg.ayanamsa_code)
     flags = SIDEREAL_FLAGS if use_sidereal else TROPICAL_FLAGS
+    session = _position_session(cfg, use_sidereal)
 
     try:
-        sun_result = swe.calc_ut(jd, SUN, flags)
-        moon_result = swe.calc_ut(jd, MOON, flags)
+        with session:
+            if cfg.position_backend == "chebyshev":
+                return (
+                    body_state(SUN, jd, flags, cfg.ayanamsa_code)[0],
+                    body_state(MOON, jd, flags, cfg.ayanamsa_code)[0],
+                )
+            count_ephemeris_calls("calc_ut", 2)
+            sun_result = swe.calc_ut(jd, SUN, flags)
+            moon_result = swe.calc_ut(jd, MOON, flags)
+
+            sun_long = sun_result[0][0] % 360
+            moon_long = moon_result[0][0] % 360
+
+            return (sun_long, moon_long)
+    except Exception as e:
+        raise EphemerisError(f"Failed to calculate positions: {e}")
+
+
+def get_sun_moon_state(
+    jd: float,
+    sidereal: Optional[bool] = None,
+    config: Optional["EphemerisConfig"] = None,
+) -> Tuple[float, float, float, float]:
+    """
+    Get Sun and Moon longitudes together with their speeds at a Julian Day.
+
+    Both bodies are evaluated with ``FLG_SPEED`` so the derivatives come from
+    the ephemeris itself rather than a finite difference. Root finders use the
+    rates to take Newton steps towards panchanga boundaries.
 
-        sun_long = sun_result[0][0] % 360
-        moon_long = moon_result[0][0] % 360
+    Args:
+        jd: Julian Day (UT)
+        sidereal: If True, use sidereal longitudes (default: config)
+        config: Ephemeris configuration override
 
-        return (sun_long, moon_long)
+    Returns:
+        Tuple of (sun_longitude, sun_speed, moon_longitude, moon_speed) with
+        longitudes in degrees (0-360) and speeds in degrees/day
+    """
+    _ensure_initialized()
+
+    from app.engine.ephemeris_config import get_ephemeris_config
+
+    cfg = config or get_ephemeris_config()
+    use_sidereal = sidereal if sidereal is not None else cfg.coordinate_system == "sidereal"
+    flags = SIDEREAL_FLAGS if use_sidereal else TROPICAL_FLAGS
+    session = _position_session(cfg, use_sidereal)
+
+    try:
+        with session:
+            if cfg.position_backend == "chebyshev":
+                sun_long, sun_speed = body_state(SUN, jd, flags, cfg.ayanamsa_code)
+                moon_long, moon_speed = body_state(MOON, jd, flags, cfg.ayanamsa_code)
+                return (sun_long, sun_speed, moon_long, moon_speed)
+            count_ephemeris_calls("calc_ut", 2)
+            sun = swe.calc_ut(jd, SUN, flags)[0]
+            moon = swe.calc_ut(jd, MOON, flags)[0]
     except Exception as e:
         raise EphemerisError(f"Failed to calculate positions: {e}")
 
+    return (sun[0] % 360, sun[3], moon[0] % 360, moon[3])
+
+
+def get_elongation_and_speed(
+    jd: float,
+    sidereal: Optional[bool] = None,
+    config: Optional["EphemerisConfig"] = None,
+) -> Tuple[float, float]:
+    """
+    Get the Moon-Sun elongation and its rate at a Julian Day.
+
+    Returns:
+        Tuple of (elongation in degrees 0-360, elongation speed in degrees/day)
+    """
+    sun_long, sun_speed, moon_long, moon_speed = get_sun_moon_state(jd, sidereal, config)
+    return ((moon_long - sun_long) % 360, moon_speed - sun_speed)
+
+
+# =============================================================================
+# BATCH POSITIONS
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class SunMoonBatch:
+    """
+    Sun and Moon positions for many instants, as contiguous float64 arrays.
+
+    All arrays share the shape of ``julian_days``. Longitudes are in degrees
+    (0-360) and speeds in degrees per day, in the requested coordinate system.
+    """
+
+    julian_days: np.ndarray
+    sun_longitude: np.ndarray
+    sun_speed: np.ndarray
+    moon_longitude: np.ndarray
+    moon_speed: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.julian_days.shape[0])
+
+    @property
+    def elongation(self) -> np.ndarray:
+        """Moon-Sun elongation (tithi angle) in degrees, 0-360."""
+        return np.mod(self.moon_longitude - self.sun_longitude, 360.0)
+
+    @property
+    def elongation_speed(self) -> np.ndarray:
+        """Rate of change of the elongation in degrees per day."""
+        return self.moon_speed - self.sun_speed
+
+
+def get_julian_days(datetimes: Iterable[datetime]) -> np.ndarray:
+    """
+    Convert timezone-aware datetimes to a float64 array of Julian Days.
+
+    Uses the same ``swe.julday`` conversion as ``get_julian_day`` so batch and
+    scalar results agree bit-for-bit.
+
+    Raises:
+        TimezoneError: If any datetime is naive
+    """
+    return np.fromiter((get_julian_day(dt) for dt in datetimes), dtype=np.float64)
+
+
+def get_sun_moon_positions_batch(
+    julian_days: "np.ndarray | Iterable[float]",
+    sidereal: Optional[bool] = None,
+    config: Optional["EphemerisConfig"] = None,
+) -> SunMoonBatch:
+    """
+    Get Sun and Moon longitudes and speeds for many instants in one call.
+
+    The sidereal mode and flags are resolved once for the whole batch, and
+    results are written straight into preallocated arrays, so callers pay one
+    Python-level call instead of rebuilding datetimes per instant.
+
+    Args:
+        julian_days: 1-D array (or iterable) of Julian Days (UT)
+        sidereal: If True, return sidereal longitudes (default: config)
+        config: Ephemeris configuration override
+
+    Returns:
+        SunMoonBatch with contiguous float64 arrays
+
+    Example:
+        >>> batch = get_sun_moon_positions_batch(np.array([2461046.0, 2461047.0]))
+        >>> batch.moon_longitude.shape
+        (2,)
+    """
+    _ensure_initialized()
+
+    jds = np.ascontiguousarray(julian_days, dtype=np.float64).reshape(-1)
+    from app.engine.ephemeris_config import get_ephemeris_config
+
+    cfg = config or get_ephemeris_config()
+    use_sidereal = sidereal if sidereal is not None else cfg.coordinate_system == "sidereal"
+    flags = SIDEREAL_FLAGS if use_sidereal else TROPICAL_FLAGS
+    session = _position_session(cfg, use_sidereal)
+
+    count = jds.shape[0]
+    sun_longitude = np.empty(count, dtype=np.float64)
+    sun_speed = np.empty(count, dtype=np.float64)
+    moon_longitude = np.empty(count, dtype=np.float64)
+    moon_speed = np.empty(count, dtype=np.float64)
+
+    calc_ut = swe.calc_ut
+    try:
+        with session:
+            if cfg.position_backend == "chebyshev":
+                ayanamsa = cfg.ayanamsa_code
+                for index, jd in enumerate(jds.tolist()):
+                    sun_longitude[index], sun_speed[index] = body_state(SUN, jd, flags, ayanamsa)
+                    moon_longitude[index], moon_speed[index] = body_state(MOON, jd, flags, ayanamsa)
+            else:
+                count_ephemeris_calls("calc_ut", 2 * count)
+                for index, jd in enumerate(jds.tolist()):
+                    sun = calc_ut(jd, SUN, flags)[0]
+                    moon = calc_ut(jd, MOON, flags)[0]
+                    sun_longitude[index] = sun[0]
+                    sun_speed[index] = sun[3]
+                    moon_longitude[index] = moon[0]
+                    moon_speed[index] = moon[3]
+    except Exception as e:
+        raise EphemerisError(f"Failed to calculate batch positions: {e}")
+
+    np.mod(sun_longitude, 360.0, out=sun_longitude)
+    np.mod(moon_longitude, 360.0, out=moon_longitude)
+    return SunMoonBatch(
+        julian_days=jds,
+        sun_longitude=sun_longitude,
+        sun_speed=sun_speed,
+        moon_longitude=moon_longitude,
+        moon_speed=moon_speed,
+    )
+
 
 # =============================================================================
 # AYANAMSA
 # =============================================================================
 
 
-def get_ayanamsa(dt: datetime) -> float:
+def get_ayanamsa(dt: datetime, config: Optional["EphemerisConfig"] = None) -> float:
     """
     Get the ayanamsa value (precession correction) for a given date.
 
@@ -343,6 +558,7 @@ def get_ayanamsa(dt: datetime) -> float:
 
     Args:
         dt: Datetime with timezone
+        config: Ephemeris configuration override (selects the ayanamsa)
 
     Returns:
         Ayanamsa in degrees
@@ -350,9 +566,12 @@ def get_ayanamsa(dt: datetime) -> float:
     _ensure_initialized()
 
     jd = get_julian_day(dt)
+    from app.engine.ephemeris_config import get_ephemeris_config
 
+    cfg = config or get_ephemeris_config()
     try:
-        ayanamsa = swe.get_ayanamsa_ut(jd)
+        with sidereal_mode(cfg.ayanamsa_code):
+            ayanamsa = swe.get_ayanamsa_ut(jd)
         return ayanamsa
     except Exception as e:
         raise EphemerisError(f"Failed to get ayanamsa: {e}")
@@ -403,14 +622,16 @@ def calculate_sunrise(
         # The center-crossing time is useful for some astronomical work but reads
         # about a minute late for sunrise and a minute early for sunset.
         # geopos: (longitude, latitude, altitude)
-        result = swe.rise_trans(
-            jd_start,  # tjdut
-            SUN,  # body
-            swe.CALC_RISE,  # rsmi
-            (longitude, latitude, altitude),  # geopos
-            0.0,  # atpress (default)
-            0.0,  # attemp (default)
-        )
+        count_ephemeris_calls("rise_trans")
+        with stage(STAGE_SUNRISE):
+            result = swe.rise_trans(
+                jd_start,  # tjdut
+                SUN,  # body
+                swe.CALC_RISE,  # rsmi
+                (longitude, latitude, altitude),  # geopos
+                0.0,  # atpress (default)
+                0.0,  # attemp (default)
+            )
 
         # result is (res_flag, tret_tuple)
         # res_flag: 0 = found, -2 = circumpolar
@@ -458,14 +679,16 @@ def calculate_sunset(
     jd_start = swe.julday(date_val.year, date_val.month, date_val.day, 12.0)
 
     try:
-        result = swe.rise_trans(
-            jd_start,  # tjdut
-            SUN,  # body
-            swe.CALC_SET,  # rsmi
-            (longitude, latitude, altitude),  # geopos
-            0.0,  # atpress (default)
-            0.0,  # attemp (default)
-        )
+        count_ephemeris_calls("rise_trans")
+        with stage(STAGE_SUNRISE):
+            result = swe.rise_trans(
+                jd_start,  # tjdut
+                SUN,  # body
+                swe.CALC_SET,  # rsmi
+                (longitude, latitude, altitude),  # geopos
+                0.0,  # atpress (default)
+                0.0,  # attemp (default)
+            )
 
         if result[0] < 0:
             raise EphemerisError(
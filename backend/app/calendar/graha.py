@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any
+from typing import Any, Optional
 
 import swisseph as swe
 
+from app.calendar.ephemeris.session import sidereal_mode
 from app.calendar.ephemeris.swiss_eph import _ensure_initialized, get_julian_day
-from app.engine.ephemeris_config import get_ephemeris_config
+from app.core.instrumentation import count_ephemeris_calls
+from app.engine.ephemeris_config import EphemerisConfig, get_ephemeris_config
 
 RASHI_NAMES = [
     ("Mesha", "Aries"),
@@ -66,26 +68,33 @@ def _format_position(longitude: float, speed: float, *, graha_id: str) -> dict[s
     }
 
 
-def get_all_graha_positions(dt: datetime, *, sidereal: bool = True) -> dict[str, Any]:
+def get_all_graha_positions(
+    dt: datetime, *, sidereal: bool = True, config: Optional[EphemerisConfig] = None
+) -> dict[str, Any]:
     """Return 9 graha positions for the given datetime."""
     _ensure_initialized()
     jd = get_julian_day(dt)
-    cfg = get_ephemeris_config()
+    cfg = config or get_ephemeris_config()
 
     flags = swe.FLG_SPEED
     if sidereal:
-        swe.set_sid_mode(cfg.ayanamsa_code)
         flags |= swe.FLG_SIDEREAL
 
+    # One session for all bodies so every graha sees the same ayanamsa.
+    count_ephemeris_calls("calc_ut", len(PLANET_ORDER) + 1)
+    with sidereal_mode(cfg.ayanamsa_code if sidereal else None):
+        results = {
+            graha_id: swe.calc_ut(jd, body, flags) for graha_id, body in PLANET_ORDER.items()
+        }
+        node = swe.calc_ut(jd, swe.MEAN_NODE, flags)
+
     positions: dict[str, Any] = {}
 
-    for graha_id, swe_body in PLANET_ORDER.items():
-        result = swe.calc_ut(jd, swe_body, flags)
+    for graha_id, result in results.items():
         longitude = result[0][0] % 360
         speed = result[0][3]
         positions[graha_id] = _format_position(longitude, speed, graha_id=graha_id)
 
-    node = swe.calc_ut(jd, swe.MEAN_NODE, flags)
     rahu_long = node[0][0] % 360
     rahu_speed = node[0][3]
     positions["rahu"] = _format_position(rahu_long, rahu_speed, graha_id="rahu")
@@ -10,6 +10,7 @@ import swisseph as swe
 
 from app.calendar.ephemeris.swiss_eph import _ensure_initialized, get_ayanamsa, get_julian_day
 from app.calendar.graha import RASHI_NAMES, get_all_graha_positions
+from app.core.instrumentation import count_ephemeris_calls
 
 DASHA_SEQUENCE = ["ketu", "venus", "sun", "moon", "mars", "rahu", "jupiter", "saturn", "mercury"]
 DASHA_YEARS = {
@@ -101,6 +102,7 @@ def _lagna(dt: datetime, *, lat: float, lon: float) -> dict[str, Any]:
     utc_dt = dt.astimezone(ZoneInfo("UTC"))
     jd = get_julian_day(utc_dt)
 
+    count_ephemeris_calls("houses")
     cusps, ascmc = swe.houses(jd, lat, lon, b"W")
     tropical_asc = ascmc[0]
     sidereal_asc = (tropical_asc - get_ayanamsa(utc_dt)) % 360
@@ -8,15 +8,25 @@ Builds a properly-structured lunar calendar with:
 - Nija/Adhik distinction for festival calculation
 
 This is the CORRECT model for handling lunar festivals in Adhik years.
+
+Lunar years are slices of one shared ``LunarTimeline``: segments of linked
+new moons that are seeded where a query lands and grow forward on demand,
+with each month's Purnima, Adhik flag and Sankranti solved once and reused by
+every year (and every Amavasya->Amavasya boundary query) that touches that
+month.
 """
 
+import os
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
-from typing import Dict, List, Literal, Optional
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, TypeVar
 
 from .adhik_maas import find_amavasya, find_purnima, is_adhik_maas
 from .sankranti import BS_MONTH_NAMES, find_sankranti, get_sun_rashi_at_time
-from .tithi import find_next_tithi, get_udaya_tithi
+from .tithi import find_next_tithi, get_sunrise_tithi
 
 # =============================================================================
 # LUNAR MONTH DATA STRUCTURES
@@ -153,28 +163,47 @@ def lunar_month_boundaries(gregorian_year: int) -> List[tuple[datetime, datetime
     Returns:
         List of `(start_amavasya, end_amavasya)` tuples.
     """
-    # Start slightly before year to capture crossing boundaries.
-    cursor = datetime(gregorian_year - 1, 12, 1, tzinfo=timezone.utc)
-    boundaries: List[tuple[datetime, datetime]] = []
-
-    # Build up to 18 months to safely cover the year with adhik cases.
-    start = find_amavasya(cursor)
-    for _ in range(18):
-        if start is None:
-            break
-        # Search from +1 day so we always get the *next* amavasya boundary.
-        end = find_amavasya(start + timedelta(days=1))
-        if end is None:
-            break
-        # Keep months touching the requested year.
-        if start.year <= gregorian_year <= end.year:
-            boundaries.append((start, end))
-        # Month windows are contiguous by definition (end == next start).
-        start = end
-        if start.year > gregorian_year and len(boundaries) >= 12:
-            break
-
-    return boundaries
+    return _timeline.month_boundaries(gregorian_year)
+
+
+def _sankranti_in_month(
+    start_amavasya: datetime, end_amavasya: datetime, start_rashi: int, end_rashi: int
+) -> Optional[datetime]:
+    """
+    First sankranti (by rashi index) inside ``[start_amavasya, end_amavasya)``.
+
+    The Sun only moves forward, so the rashis entered during the month are
+    exactly those between the rashi at its start and at its end; only those
+    crossings are solved.
+    """
+    crossings = (end_rashi - start_rashi) % 12
+    for target_rashi in sorted((start_rashi + k) % 12 for k in range(1, crossings + 1)):
+        s = find_sankranti(target_rashi, start_amavasya, max_days=35)
+        if s and start_amavasya <= s < end_amavasya:
+            return s
+    return None
+
+
+def _make_lunar_month(
+    start_amavasya: datetime,
+    purnima: datetime,
+    end_amavasya: datetime,
+    start_rashi: int,
+    end_rashi: int,
+) -> LunarMonth:
+    sun_rashi = get_sun_rashi_at_time(purnima)
+    return LunarMonth(
+        start_amavasya=start_amavasya,
+        end_purnima=purnima,
+        end_amavasya=end_amavasya,
+        # Same naming as ``name_lunar_month``: Sun's rashi at this month's Purnima.
+        month_name=BS_MONTH_NAMES[sun_rashi],
+        month_index=(sun_rashi + 1) if sun_rashi < 12 else 1,
+        # Adhik Maas: no sankranti in the month (see ``is_adhik_maas``).
+        is_adhik=start_rashi == end_rashi,
+        sun_rashi_at_purnima=sun_rashi,
+        sankranti_date=_sankranti_in_month(start_amavasya, end_amavasya, start_rashi, end_rashi),
+    )
 
 
 def compute_lunar_month(start_amavasya: datetime, month_number: int = 0) -> LunarMonth:
@@ -198,31 +227,266 @@ def compute_lunar_month(start_amavasya: datetime, month_number: int = 0) -> Luna
     if next_amavasya is None:
         raise ValueError(f"Could not find Amavasya after {purnima}")
 
-    sun_rashi = get_sun_rashi_at_time(purnima)
-    month_name = name_lunar_month(start_amavasya, next_amavasya)
+    return _make_lunar_month(
+        start_amavasya,
+        purnima,
+        next_amavasya,
+        get_sun_rashi_at_time(start_amavasya),
+        get_sun_rashi_at_time(next_amavasya),
+    )
 
-    # Check for Adhik Maas (no sankranti in this month)
-    # Must pass both start and end of the lunar month
-    is_adhik = detect_adhik_maas(start_amavasya, next_amavasya)
 
-    # Find sankranti in this month (if any)
-    sankranti = None
-    for target_rashi in range(12):
-        s = find_sankranti(target_rashi, start_amavasya, max_days=35)
-        if s and start_amavasya <= s < next_amavasya:
-            sankranti = s
-            break
+# =============================================================================
+# SHARED LUNATION TIMELINE
+# =============================================================================
 
-    return LunarMonth(
-        start_amavasya=start_amavasya,
-        end_purnima=purnima,
-        end_amavasya=next_amavasya,
-        month_name=month_name,
-        month_index=(sun_rashi + 1) if sun_rashi < 12 else 1,
-        is_adhik=is_adhik,
-        sun_rashi_at_purnima=sun_rashi,
-        sankranti_date=sankranti,
-    )
+# A lunation is never shorter than ~29.27 days.
+_MIN_LUNATION = timedelta(days=29)
+# ~200 years of new moons; the end farthest from a new solve is dropped past it.
+_MAX_LUNATIONS = 2500
+# Solver tolerance is 0.5 s; independent solves of one boundary agree within it.
+_BOUNDARY_SLACK = timedelta(seconds=1)
+_T = TypeVar("_T")
+_MAX_LUNAR_YEARS = max(4, int(os.getenv("PARVA_LUNAR_YEAR_CACHE_SIZE", "64")))
+
+
+class LunarTimeline:
+    """
+    Known new moons with lazily computed month records.
+
+    New moons live in one sorted list, and consecutive lunations are linked as
+    they are discovered, so the list is a set of contiguous segments. Walking a
+    segment forward solves each Amavasya, Purnima and Sankranti exactly once,
+    so a sweep over consecutive years never repeats a month. A query that no
+    segment already answers seeds a new one with a single ``find_amavasya``
+    call instead of walking every lunation in between, so a distant year costs
+    the same whether or not another year is already cached. Event instants
+    agree with a fresh ``find_amavasya``/``find_purnima`` call to within the
+    solver tolerance (sub-second).
+
+    Solves run outside the lock. Callers that need the same new moon or month
+    wait for the solve already in flight; callers that need different ones
+    never wait on each other.
+    """
+
+    def __init__(self, max_lunations: int = _MAX_LUNATIONS) -> None:
+        self._max_lunations = max(3, max_lunations)
+        self._new_moons: List[datetime] = []
+        self._next: Dict[datetime, datetime] = {}
+        self._prev: Dict[datetime, datetime] = {}
+        self._months: Dict[datetime, LunarMonth] = {}
+        self._rashi: Dict[datetime, int] = {}
+        self._solves = {"amavasya": 0, "purnima": 0}
+        self._in_flight: Dict[Tuple[str, datetime], threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def _single_flight(
+        self,
+        key: Tuple[str, datetime],
+        lookup: Callable[[], Optional[_T]],
+        solve: Callable[[], _T],
+    ) -> _T:
+        """``lookup()`` under the lock; on a miss, one caller per key runs ``solve()``."""
+        while True:
+            with self._lock:
+                found = lookup()
+                if found is not None:
+                    return found
+                pending = self._in_flight.get(key)
+                if pending is None:
+                    pending = self._in_flight[key] = threading.Event()
+                    break
+            # Another caller is solving this key; if it fails, retry (and fail) here.
+            pending.wait()
+        try:
+            return solve()
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            pending.set()
+
+    # -- new moons (callers hold the lock for *_locked helpers) ------------
+
+    def _contains_locked(self, moment: datetime) -> bool:
+        index = bisect_left(self._new_moons, moment)
+        return index < len(self._new_moons) and self._new_moons[index] == moment
+
+    def _forget_locked(self, moment: datetime) -> None:
+        self._months.pop(moment, None)
+        self._rashi.pop(moment, None)
+        following = self._next.pop(moment, None)
+        if following is not None:
+            self._prev.pop(following, None)
+        preceding = self._prev.pop(moment, None)
+        if preceding is not None:
+            self._next.pop(preceding, None)
+
+    def _insert_locked(self, moment: datetime) -> datetime:
+        """Record a solved new moon; a repeat solve returns the instant already known."""
+        index = bisect_left(self._new_moons, moment)
+        # New moons are a lunation apart, so anything within a day is the same one.
+        for neighbour in self._new_moons[max(0, index - 1) : index + 1]:
+            if abs(neighbour - moment) < timedelta(days=1):
+                return neighbour
+        self._new_moons.insert(index, moment)
+        # Over the bound, drop whichever end of the list is farther from ``moment``.
+        while len(self._new_moons) > self._max_lunations:
+            first, last = self._new_moons[0], self._new_moons[-1]
+            self._forget_locked(self._new_moons.pop(0 if moment - first > last - moment else -1))
+        return moment
+
+    def _known_after_locked(self, moment: datetime) -> Optional[datetime]:
+        index = bisect_right(self._new_moons, moment)
+        if index == len(self._new_moons):
+            return None
+        candidate = self._new_moons[index]
+        # Less than a lunation away, or linked to a new moon at or before
+        # ``moment``: nothing unknown can lie in between.
+        if candidate - moment < _MIN_LUNATION:
+            return candidate
+        if index and self._next.get(self._new_moons[index - 1]) == candidate:
+            return candidate
+        return None
+
+    def new_moon_after(self, moment: datetime) -> datetime:
+        """First new moon strictly after ``moment`` (same contract as ``find_amavasya``)."""
+
+        def solve() -> datetime:
+            found = find_amavasya(moment)
+            if found is None:
+                raise ValueError(f"Could not find Amavasya after {moment}")
+            with self._lock:
+                self._solves["amavasya"] += 1
+                return self._insert_locked(found)
+
+        return self._single_flight(
+            ("after", moment), lambda: self._known_after_locked(moment), solve
+        )
+
+    def _next_new_moon(self, start_amavasya: datetime) -> datetime:
+        def solve() -> datetime:
+            # 25 days past a new moon is mid-Krishna paksha, before the next one.
+            found = find_amavasya(start_amavasya + timedelta(days=25))
+            if found is None:
+                raise ValueError(f"Could not find Amavasya after {start_amavasya}")
+            with self._lock:
+                self._solves["amavasya"] += 1
+                end_amavasya = self._insert_locked(found)
+                if self._contains_locked(start_amavasya):
+                    self._next[start_amavasya] = end_amavasya
+                    self._prev[end_amavasya] = start_amavasya
+            return end_amavasya
+
+        return self._single_flight(
+            ("next", start_amavasya), lambda: self._next.get(start_amavasya), solve
+        )
+
+    def _rashi_at(self, moment: datetime) -> int:
+        with self._lock:
+            rashi = self._rashi.get(moment)
+        if rashi is None:
+            rashi = get_sun_rashi_at_time(moment)
+            with self._lock:
+                if self._contains_locked(moment):
+                    self._rashi[moment] = rashi
+        return rashi
+
+    # -- months and years --------------------------------------------------
+
+    def month_starting(self, start_amavasya: datetime) -> LunarMonth:
+        """Month record for a new moon previously returned by ``new_moon_after``."""
+
+        def solve() -> LunarMonth:
+            end_amavasya = self._next_new_moon(start_amavasya)
+            purnima = find_purnima(start_amavasya + timedelta(days=2))
+            if purnima is None or purnima >= end_amavasya:
+                raise ValueError(f"Could not find Purnima after {start_amavasya}")
+            month = _make_lunar_month(
+                start_amavasya,
+                purnima,
+                end_amavasya,
+                self._rashi_at(start_amavasya),
+                self._rashi_at(end_amavasya),
+            )
+            with self._lock:
+                self._solves["purnima"] += 1
+                if self._contains_locked(start_amavasya):
+                    self._months[start_amavasya] = month
+            return month
+
+        return self._single_flight(
+            ("month", start_amavasya), lambda: self._months.get(start_amavasya), solve
+        )
+
+    def lunar_year(self, gregorian_year: int) -> LunarYear:
+        """Slice of the timeline equivalent to ``build_lunar_year``."""
+        # Start searching from around March (before Baishakh/Chaitra)
+        first_amavasya = self.new_moon_after(datetime(gregorian_year, 2, 15, tzinfo=timezone.utc))
+
+        # Build 13 months (to cover Adhik case)
+        months: List[LunarMonth] = []
+        current_amavasya = first_amavasya
+        for _ in range(14):  # 14 to ensure we cover a full year
+            try:
+                month = self.month_starting(current_amavasya)
+            except ValueError:
+                break
+            months.append(month)
+            current_amavasya = month.end_amavasya
+            # Stop if we've gone past the year
+            if current_amavasya.year > gregorian_year + 1:
+                break
+
+        adhik_name = next((m.month_name for m in months if m.is_adhik), None)
+        # Determine BS year (roughly Gregorian year + 57)
+        bs_year = gregorian_year + 56 if first_amavasya.month < 4 else gregorian_year + 57
+        return LunarYear(
+            gregorian_year=gregorian_year,
+            bs_year=bs_year,
+            months=months,
+            has_adhik=adhik_name is not None,
+            adhik_month_name=adhik_name,
+        )
+
+    def month_boundaries(self, gregorian_year: int) -> List[tuple[datetime, datetime]]:
+        """Slice of the timeline equivalent to ``lunar_month_boundaries``."""
+        # Start slightly before year to capture crossing boundaries.
+        start = self.new_moon_after(datetime(gregorian_year - 1, 12, 1, tzinfo=timezone.utc))
+        boundaries: List[tuple[datetime, datetime]] = []
+        for _ in range(18):
+            end = self._next_new_moon(start)
+            # Keep months touching the requested year.
+            if start.year <= gregorian_year <= end.year:
+                boundaries.append((start, end))
+            start = end
+            if start.year > gregorian_year and len(boundaries) >= 12:
+                break
+        return boundaries
+
+    def clear(self) -> None:
+        with self._lock:
+            self._new_moons.clear()
+            self._next.clear()
+            self._prev.clear()
+            self._months.clear()
+            self._rashi.clear()
+            for key in self._solves:
+                self._solves[key] = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "new_moons": len(self._new_moons),
+                "segments": sum(1 for moon in self._new_moons if moon not in self._prev),
+                "months": len(self._months),
+                "first_new_moon": self._new_moons[0].isoformat() if self._new_moons else None,
+                "last_new_moon": self._new_moons[-1].isoformat() if self._new_moons else None,
+                "max_lunations": self._max_lunations,
+                "solves": dict(self._solves),
+            }
+
+
+_timeline = LunarTimeline()
 
 
 def build_lunar_year(gregorian_year: int) -> LunarYear:
@@ -238,48 +502,12 @@ def build_lunar_year(gregorian_year: int) -> LunarYear:
     Returns:
         LunarYear with all months computed
     """
-    # Start searching from around March (before Baishakh/Chaitra)
-    search_start = datetime(gregorian_year, 2, 15, tzinfo=timezone.utc)
+    return _timeline.lunar_year(gregorian_year)
 
-    # Find the first Amavasya around late Chaitra (before new BS year)
-    first_amavasya = find_amavasya(search_start)
-    if first_amavasya is None:
-        raise ValueError(f"Could not find starting Amavasya for {gregorian_year}")
 
-    # Build 13 months (to cover Adhik case)
-    months: List[LunarMonth] = []
-    current_amavasya = first_amavasya
-
-    for i in range(14):  # 14 to ensure we cover a full year
-        try:
-            month = compute_lunar_month(current_amavasya, i)
-            months.append(month)
-            current_amavasya = month.end_amavasya
-
-            # Stop if we've gone past the year
-            if current_amavasya.year > gregorian_year + 1:
-                break
-        except ValueError:
-            break
-
-    # Check for Adhik month
-    has_adhik = any(m.is_adhik for m in months)
-    adhik_name = next((m.month_name for m in months if m.is_adhik), None)
-
-    # Determine BS year (roughly Gregorian year + 57)
-    bs_year = gregorian_year + 56 if first_amavasya.month < 4 else gregorian_year + 57
-
-    return LunarYear(
-        gregorian_year=gregorian_year,
-        bs_year=bs_year,
-        months=months,
-        has_adhik=has_adhik,
-        adhik_month_name=adhik_name,
-    )
-
-
-# Cache for computed lunar years
-_lunar_year_cache: Dict[int, LunarYear] = {}
+# Bounded LRU of assembled lunar years; the months themselves live on the timeline.
+_lunar_year_cache: "OrderedDict[int, LunarYear]" = OrderedDict()
+_lunar_year_lock = threading.Lock()
 
 
 def get_lunar_year(gregorian_year: int) -> LunarYear:
@@ -292,9 +520,30 @@ def get_lunar_year(gregorian_year: int) -> LunarYear:
     Returns:
         LunarYear for that year
     """
-    if gregorian_year not in _lunar_year_cache:
-        _lunar_year_cache[gregorian_year] = build_lunar_year(gregorian_year)
-    return _lunar_year_cache[gregorian_year]
+    with _lunar_year_lock:
+        cached = _lunar_year_cache.get(gregorian_year)
+        if cached is not None:
+            _lunar_year_cache.move_to_end(gregorian_year)
+            return cached
+    lunar_year = build_lunar_year(gregorian_year)
+    with _lunar_year_lock:
+        _lunar_year_cache[gregorian_year] = lunar_year
+        _lunar_year_cache.move_to_end(gregorian_year)
+        while len(_lunar_year_cache) > _MAX_LUNAR_YEARS:
+            _lunar_year_cache.popitem(last=False)
+    return lunar_year
+
+
+def clear_lunar_calendar_cache() -> None:
+    with _lunar_year_lock:
+        _lunar_year_cache.clear()
+    _timeline.clear()
+
+
+def lunar_calendar_cache_stats() -> Dict[str, Any]:
+    with _lunar_year_lock:
+        years = len(_lunar_year_cache)
+    return {"years": years, "max_years": _MAX_LUNAR_YEARS, "timeline": _timeline.stats()}
 
 
 # =============================================================================
@@ -388,14 +637,17 @@ def _boundary_tithi_date_in_month(month: LunarMonth, tithi: int, paksha: str) ->
 
     search_end = month.end_amavasya
     tithi_datetime = find_next_tithi(tithi, paksha, search_start, within_days=35)
+    # The tithi that opens a paksha starts at the boundary itself; its start is
+    # solved independently and may land a few microseconds before it.
+    earliest = search_start - _BOUNDARY_SLACK
 
     if tithi_datetime is None:
         return None
 
     if paksha == "krishna" and tithi == 15:
-        if not (search_start <= tithi_datetime <= month.end_amavasya + timedelta(hours=24)):
+        if not (earliest <= tithi_datetime <= month.end_amavasya + timedelta(hours=24)):
             return None
-    elif not (search_start <= tithi_datetime < search_end):
+    elif not (earliest <= tithi_datetime < search_end):
         return None
 
     return tithi_datetime.date()
@@ -410,11 +662,13 @@ def _search_tithi_in_month(
         return None
 
     # Use udaya tithi to get the exact festival date
-    # MUST find udaya match; no fallback to avoid off-by-one errors
+    # MUST find udaya match; no fallback to avoid off-by-one errors.
+    # Only tithi and paksha are compared, so skip the tithi end-time solve; the
+    # match is usually on the first or second probe, so probe lazily.
     for offset in range(5):  # Check 5 days to handle edge cases
         check_date = candidate_date + timedelta(days=offset - 1)  # Start 1 day before
         try:
-            udaya = get_udaya_tithi(check_date)
+            udaya = get_sunrise_tithi(check_date)
             if udaya["tithi"] == tithi and udaya["paksha"] == paksha:
                 return check_date
         except Exception:
@@ -6,7 +6,7 @@ from datetime import date, datetime, timedelta, timezone
 from typing import Any
 from zoneinfo import ZoneInfo
 
-from app.calendar.ephemeris.swiss_eph import calculate_sunrise, calculate_sunset
+from app.calendar.ephemeris.solar_events import get_solar_day
 from app.calendar.panchanga import get_panchanga
 
 NPT = timezone(timedelta(hours=5, minutes=45))
@@ -255,11 +255,10 @@ def _default_sun_times(
 ) -> tuple[datetime, datetime, datetime]:
     tz = _timezone(tz_name)
     try:
-        sunrise = calculate_sunrise(target_date, latitude=lat, longitude=lon).astimezone(tz)
-        sunset = calculate_sunset(target_date, latitude=lat, longitude=lon).astimezone(tz)
-        next_sunrise = calculate_sunrise(
-            target_date + timedelta(days=1), latitude=lat, longitude=lon
-        ).astimezone(tz)
+        events = get_solar_day(target_date, latitude=lat, longitude=lon)
+        sunrise = events.sunrise.astimezone(tz)
+        sunset = events.sunset.astimezone(tz)
+        next_sunrise = events.next_sunrise.astimezone(tz)
 
         # Ensure monotonic ordering even if timezone conversion crosses midnight boundaries.
         if sunset <= sunrise:
@@ -12,31 +12,31 @@ This module provides complete panchanga calculation for any date using
 Swiss Ephemeris for precise astronomical computations.
 """
 
-from datetime import date, timedelta
-from typing import Any, Dict
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Sequence
 
 from .ephemeris.positions import (
-    get_karana,
-    get_moon_rashi,
-    get_nakshatra,
     get_sun_moon_positions,
-    get_sun_rashi,
     get_vaara,
-    get_yoga,
+    karana_from_elongation,
+    nakshatra_from_longitude,
+    rashi_from_longitude,
+    yoga_from_longitudes,
 )
+from .ephemeris.solar_events import get_sunrise, get_sunset
 from .ephemeris.swiss_eph import (
     LAT_KATHMANDU,
     LON_KATHMANDU,
-    calculate_sunrise,
-    calculate_sunset,
     get_ephemeris_info,
+    get_julian_days,
+    get_sun_moon_positions_batch,
 )
 from .ephemeris.time_utils import (
     to_nepal_time,
 )
 from .tithi.tithi_boundaries import find_tithi_end
 from .tithi.tithi_core import (
-    calculate_tithi,
+    tithi_from_elongation,
 )
 
 # =============================================================================
@@ -77,33 +77,73 @@ def get_panchanga(
         'Panchami'
     """
     # Calculate sunrise
-    sunrise_utc = calculate_sunrise(date_val, latitude, longitude)
+    sunrise_utc = get_sunrise(date_val, latitude, longitude)
+    sunset_utc = get_sunset(date_val, latitude, longitude)
+
+    # One ephemeris evaluation at sunrise feeds every element below.
+    sun_long, moon_long = get_sun_moon_positions(sunrise_utc)
+    return _assemble_panchanga(date_val, sunrise_utc, sunset_utc, sun_long, moon_long)
+
+
+def get_panchanga_many(
+    dates: Sequence[date],
+    latitude: float = LAT_KATHMANDU,
+    longitude: float = LON_KATHMANDU,
+) -> List[Dict[str, Any]]:
+    """
+    Calculate panchanga for many dates, batching the sunrise positions.
+
+    Sunrise/sunset are still solved per day, but Sun and Moon positions at
+    every sunrise come from a single ``get_sun_moon_positions_batch`` call.
+    Results are identical to calling ``get_panchanga`` for each date.
+
+    Args:
+        dates: Dates to calculate (any order; output follows input order)
+        latitude: Location latitude (default: Kathmandu)
+        longitude: Location longitude (default: Kathmandu)
+
+    Returns:
+        List of panchanga dictionaries, one per input date
+    """
+    sunrises = [get_sunrise(d, latitude, longitude) for d in dates]
+    sunsets = [get_sunset(d, latitude, longitude) for d in dates]
+    positions = get_sun_moon_positions_batch(get_julian_days(sunrises))
+    sun_longs = positions.sun_longitude.tolist()
+    moon_longs = positions.moon_longitude.tolist()
+
+    return [
+        _assemble_panchanga(d, sunrise, sunset, sun_long, moon_long)
+        for d, sunrise, sunset, sun_long, moon_long in zip(
+            dates, sunrises, sunsets, sun_longs, moon_longs
+        )
+    ]
+
+
+def _assemble_panchanga(
+    date_val: date,
+    sunrise_utc: datetime,
+    sunset_utc: datetime,
+    sun_long: float,
+    moon_long: float,
+) -> Dict[str, Any]:
     sunrise_nepal = to_nepal_time(sunrise_utc)
-    sunset_utc = calculate_sunset(date_val, latitude, longitude)
     sunset_nepal = to_nepal_time(sunset_utc)
+    elongation = (moon_long - sun_long) % 360
 
     # Get tithi at sunrise (udaya tithi)
-    tithi_info = calculate_tithi(sunrise_utc)
+    tithi_info = tithi_from_elongation(elongation)
     tithi_end = find_tithi_end(sunrise_utc)
 
-    # Get nakshatra
-    nakshatra_num, nakshatra_name, nakshatra_progress = get_nakshatra(sunrise_utc)
-
-    # Get yoga
-    yoga_num, yoga_name, yoga_progress = get_yoga(sunrise_utc)
-
-    # Get karana
-    karana_num, karana_name = get_karana(sunrise_utc)
+    nakshatra_num, nakshatra_name, nakshatra_progress = nakshatra_from_longitude(moon_long)
+    yoga_num, yoga_name, yoga_progress = yoga_from_longitudes(sun_long, moon_long)
+    karana_num, karana_name = karana_from_elongation(elongation)
 
     # Get vaara (weekday)
     vaara_num, vaara_sanskrit, vaara_english = get_vaara(sunrise_utc)
 
     # Get rashis (zodiac signs)
-    sun_rashi_num, sun_rashi_sanskrit, sun_rashi_english = get_sun_rashi(sunrise_utc)
-    moon_rashi_num, moon_rashi_sanskrit, moon_rashi_english = get_moon_rashi(sunrise_utc)
-
-    # Get raw positions
-    sun_long, moon_long = get_sun_moon_positions(sunrise_utc)
+    sun_rashi_num, sun_rashi_sanskrit, sun_rashi_english = rashi_from_longitude(sun_long)
+    moon_rashi_num, moon_rashi_sanskrit, moon_rashi_english = rashi_from_longitude(moon_long)
 
     return {
         "date": date_val.isoformat(),
@@ -204,7 +244,7 @@ def get_panchanga_range(start_date: date, days: int = 7) -> list:
     Returns:
         List of panchanga dictionaries
     """
-    return [get_panchanga(start_date + timedelta(days=i)) for i in range(days)]
+    return get_panchanga_many([start_date + timedelta(days=i) for i in range(days)])
 
 
 # =============================================================================
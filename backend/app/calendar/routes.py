@@ -11,6 +11,7 @@ from typing import Optional
 from fastapi import APIRouter, Query
 from pydantic import BaseModel
 
+from app.infrastructure.compute_executor import run_compute
 from app.policy import get_policy_metadata
 from app.services.calendar_conversion_service import (
     build_bs_to_gregorian_payload,
@@ -32,6 +33,7 @@ from app.services.calendar_surface_service import (
 )
 
 router = APIRouter(prefix="/api/calendar", tags=["calendar"])
+COMPUTE_LANE = "calendar"
 
 
 class BSDate(BaseModel):
@@ -106,6 +108,45 @@ def _build_conversion_payload(gregorian_date: date) -> dict:
     return build_conversion_payload(gregorian_date)
 
 
+def _build_today_proof_capsule(risk_mode: str) -> dict:
+    payload = build_today_payload(risk_mode=risk_mode)
+    return build_calendar_proof_capsule(
+        surface="today",
+        payload=payload,
+        request={"risk_mode": risk_mode},
+    )
+
+
+def _build_tithi_proof_capsule(
+    target_date: date, *, latitude: float, longitude: float, risk_mode: str
+) -> dict:
+    payload = build_tithi_detail_payload(
+        target_date,
+        latitude=latitude,
+        longitude=longitude,
+        risk_mode=risk_mode,
+    )
+    return build_calendar_proof_capsule(
+        surface="tithi",
+        payload=payload,
+        request={
+            "date": target_date.isoformat(),
+            "latitude": latitude,
+            "longitude": longitude,
+            "risk_mode": risk_mode,
+        },
+    )
+
+
+def _build_panchanga_proof_capsule(target_date: date, *, risk_mode: str) -> dict:
+    payload = build_panchanga_payload(target_date, risk_mode=risk_mode)
+    return build_calendar_proof_capsule(
+        surface="panchanga",
+        payload=payload,
+        request={"date": target_date.isoformat(), "risk_mode": risk_mode},
+    )
+
+
 @router.get("/convert", response_model=ConversionResult)
 async def convert_date(
     date_str: str = Query(
@@ -121,7 +162,7 @@ async def convert_date(
     Returns complete calendar information for the given date.
     """
     gregorian_date = _parse_iso_date(date_str)
-    return _build_conversion_payload(gregorian_date)
+    return await run_compute(COMPUTE_LANE, _build_conversion_payload, gregorian_date)
 
 
 @router.get("/convert/compare")
@@ -139,7 +180,7 @@ async def compare_convert(
     Returns both conversions when available.
     """
     gregorian_date = _parse_iso_date(date_str)
-    return build_compare_conversion_payload(gregorian_date)
+    return await run_compute(COMPUTE_LANE, build_compare_conversion_payload, gregorian_date)
 
 
 @router.get("/dual-month")
@@ -152,7 +193,7 @@ async def get_dual_month(
 
     Supports a dynamic ±200 year browsing window around the current Gregorian year.
     """
-    return build_dual_month_payload(year, month)
+    return await run_compute(COMPUTE_LANE, build_dual_month_payload, year, month)
 
 
 @router.post("/bs-to-gregorian")
@@ -175,19 +216,14 @@ async def get_today(
     Get calendar information for today.
     Uses udaya tithi (official sunrise-based) for accuracy.
     """
-    return build_today_payload(risk_mode=risk_mode)
+    return await run_compute(COMPUTE_LANE, build_today_payload, risk_mode=risk_mode)
 
 
 @router.get("/today/proof-capsule")
 async def get_today_proof_capsule(
     risk_mode: str = Query("strict", description="standard|strict"),
 ):
-    payload = build_today_payload(risk_mode=risk_mode)
-    return build_calendar_proof_capsule(
-        surface="today",
-        payload=payload,
-        request={"risk_mode": risk_mode},
-    )
+    return await run_compute(COMPUTE_LANE, _build_today_proof_capsule, risk_mode)
 
 
 @router.get("/tithi")
@@ -206,7 +242,9 @@ async def get_tithi_endpoint(
     Get tithi details for a date/location with method metadata.
     """
     target_date = _parse_iso_date(date_str)
-    return build_tithi_detail_payload(
+    return await run_compute(
+        COMPUTE_LANE,
+        build_tithi_detail_payload,
         target_date,
         latitude=latitude,
         longitude=longitude,
@@ -226,22 +264,14 @@ async def get_tithi_proof_capsule(
     risk_mode: str = Query("strict", description="standard|strict"),
 ):
     target_date = _parse_iso_date(date_str)
-    payload = build_tithi_detail_payload(
+    return await run_compute(
+        COMPUTE_LANE,
+        _build_tithi_proof_capsule,
         target_date,
         latitude=latitude,
         longitude=longitude,
         risk_mode=risk_mode,
     )
-    return build_calendar_proof_capsule(
-        surface="tithi",
-        payload=payload,
-        request={
-            "date": target_date.isoformat(),
-            "latitude": latitude,
-            "longitude": longitude,
-            "risk_mode": risk_mode,
-        },
-    )
 
 
 # =============================================================================
@@ -265,7 +295,9 @@ async def get_panchanga_endpoint(
     Includes: Tithi, Nakshatra, Yoga, Karana, Vaara (weekday).
     """
     target_date = _parse_iso_date(date_str) if date_str else datetime.now().date()
-    return build_panchanga_payload(target_date, risk_mode=risk_mode)
+    return await run_compute(
+        COMPUTE_LANE, build_panchanga_payload, target_date, risk_mode=risk_mode
+    )
 
 
 @router.get("/panchanga/proof-capsule")
@@ -278,11 +310,8 @@ async def get_panchanga_proof_capsule(
     risk_mode: str = Query("strict", description="standard|strict"),
 ):
     target_date = _parse_iso_date(date_str)
-    payload = build_panchanga_payload(target_date, risk_mode=risk_mode)
-    return build_calendar_proof_capsule(
-        surface="panchanga",
-        payload=payload,
-        request={"date": target_date.isoformat(), "risk_mode": risk_mode},
+    return await run_compute(
+        COMPUTE_LANE, _build_panchanga_proof_capsule, target_date, risk_mode=risk_mode
     )
 
 
@@ -295,7 +324,7 @@ async def get_panchanga_range_endpoint(
     Get panchanga for a range of dates.
     """
     start = _parse_iso_date(start_date)
-    return build_panchanga_range_payload(start, days)
+    return await run_compute(COMPUTE_LANE, build_panchanga_range_payload, start, days)
 
 
 # =============================================================================
@@ -317,7 +346,7 @@ async def calculate_festival_endpoint(
     from app.calendar.calculator_v2 import calculate_festival_v2, get_festival_info_v2
     
     # Try V2 calculator first (lunar month model)
-    result = calculate_festival_v2(festival_id, year)
+    result = await run_compute(COMPUTE_LANE, calculate_festival_v2, festival_id, year)
     
     if result is None:
         # Check if festival exists but couldn't be calculated
@@ -353,7 +382,9 @@ async def get_upcoming_festivals_endpoint(
     Get all festivals occurring within the next N days.
     Uses V2 calculator with correct lunar month model.
     """
-    return build_upcoming_festivals_payload(days, today=date.today())
+    return await run_compute(
+        COMPUTE_LANE, build_upcoming_festivals_payload, days, today=date.today()
+    )
 
 
 @router.get("/sankranti/{year}")
@@ -363,7 +394,7 @@ async def get_sankrantis_endpoint(year: int):
     """
     from app.calendar.sankranti import get_sankrantis_in_year
     
-    sankrantis = get_sankrantis_in_year(year)
+    sankrantis = await run_compute(COMPUTE_LANE, get_sankrantis_in_year, year)
     
     return {
         "year": year,
@@ -36,8 +36,11 @@ from .tithi_udaya import (
     detect_ksheepana,
     detect_vriddhi,
     get_official_tithi,
+    get_sunrise_tithi,
+    get_sunrise_tithis,
     get_tithi_for_date,
     get_udaya_tithi,
+    use_sunrise_tithis,
 )
 
 # =============================================================================
@@ -211,6 +214,9 @@ __all__ = [
     "get_tithi_duration",
     # Udaya
     "get_udaya_tithi",
+    "get_sunrise_tithi",
+    "get_sunrise_tithis",
+    "use_sunrise_tithis",
     "get_tithi_for_date",
     "get_official_tithi",
     "calculate_tithi_at_sunrise",
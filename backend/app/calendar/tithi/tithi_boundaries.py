@@ -1,8 +1,16 @@
 """
 Tithi Boundary Finding for Project Parva v2.0
 
-Uses Brent's method (scipy or custom implementation) to find
-exact tithi transitions with high precision.
+Finds exact tithi transitions with a speed-aware Newton solver: Swiss
+Ephemeris returns the Sun and Moon speeds alongside their longitudes, so each
+evaluation gives both the elongation and its rate. Starting from that slope a
+boundary typically converges in 2-3 evaluations to sub-second precision,
+against ~12 for a 60-second bisection. Bisection remains as a fallback when a
+Newton step leaves the search window.
+
+When a precomputed transition index (see ``app.calendar.transition_index``)
+covers the requested instants, lookups are answered by binary search and no
+ephemeris call is made at all.
 
 A tithi boundary occurs when elongation = n × 12° (where n = 0, 1, 2, ... 29)
 """
@@ -10,52 +18,87 @@ A tithi boundary occurs when elongation = n × 12° (where n = 0, 1, 2, ... 29)
 from datetime import date, datetime, timedelta, timezone
 from typing import List, Optional, Tuple
 
+from app.core.instrumentation import STAGE_TITHI, stage
+
 from ..ephemeris.positions import get_tithi_angle
+from ..ephemeris.swiss_eph import get_elongation_and_speed, get_julian_day
+from ..transition_index import get_transition_index
 from .tithi_core import TITHI_SPAN, calculate_tithi
 
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+# Default precision of a boundary search. Newton converges quadratically, so
+# tightening this costs at most one extra ephemeris evaluation.
+DEFAULT_TOLERANCE_SECONDS = 0.5
+
+# Search window on either side of the reference instant. The longest tithi is
+# just under 27 hours.
+SEARCH_WINDOW = timedelta(hours=30)
+
+# Boundaries are returned this far past the computed root so the instant
+# always falls in the later tithi, as the bisection contract guaranteed.
+_BOUNDARY_GUARD = timedelta(milliseconds=1)
+
+_SECONDS_PER_DAY = 86400.0
+
+
 # =============================================================================
 # BOUNDARY FINDING
 # =============================================================================
 
 
-def find_tithi_end(dt: datetime, max_iterations: int = 50, tolerance_seconds: int = 60) -> datetime:
+def _newton_tithi_boundary(
+    dt: datetime, *, forward: bool, max_iterations: int, tolerance_seconds: float
+) -> Optional[datetime]:
     """
-    Find when the current tithi ends using binary search.
+    Solve for the tithi boundary after (``forward``) or before ``dt``.
 
-    Args:
-        dt: Starting datetime
-        max_iterations: Maximum search iterations
-        tolerance_seconds: Precision in seconds
+    Returns None when a step leaves the search window or the iteration budget
+    runs out; callers then fall back to bisection.
+    """
+    jd0 = get_julian_day(dt)
+    elongation, speed = get_elongation_and_speed(jd0)
+    current_tithi = int(elongation / TITHI_SPAN)
+    target = (current_tithi + 1 if forward else current_tithi) * TITHI_SPAN
 
-    Returns:
-        Datetime when current tithi ends (next tithi begins)
+    window_days = SEARCH_WINDOW.total_seconds() / _SECONDS_PER_DAY
+    low, high = (0.0, window_days) if forward else (-window_days, 0.0)
+    tolerance_days = tolerance_seconds / _SECONDS_PER_DAY
 
-    Note:
-        A tithi typically lasts about 19-26 hours (mean ~23.6 hours).
-    """
-    # Get current tithi
-    current_elongation = get_tithi_angle(dt)
-    current_tithi = int(current_elongation / TITHI_SPAN)
+    offset = 0.0
+    for _ in range(max_iterations):
+        if speed <= 0:
+            return None
+        # Signed angular distance to the target, wrapped into [-180, 180).
+        delta = (target - elongation + 180.0) % 360.0 - 180.0
+        step = delta / speed
+        offset += step
+        if not low <= offset <= high:
+            return None
+        if abs(step) < tolerance_days:
+            return dt + timedelta(days=offset) + _BOUNDARY_GUARD
+        elongation, speed = get_elongation_and_speed(jd0 + offset)
 
-    # The next tithi boundary is at (current_tithi + 1) * 12 degrees
-    ((current_tithi + 1) * TITHI_SPAN) % 360
+    return None
 
-    # Binary search window
-    # Search up to 30 hours ahead to safely cover slow boundaries.
-    start_dt = dt
-    end_dt = dt + timedelta(hours=30)
 
+def _bisect_tithi_end(dt: datetime, max_iterations: int, tolerance_seconds: float) -> datetime:
+    """Bisection search for the end of the tithi containing ``dt``."""
+    current_tithi = int(get_tithi_angle(dt) / TITHI_SPAN)
+
+    start_dt = dt
+    end_dt = dt + SEARCH_WINDOW
     tolerance = timedelta(seconds=tolerance_seconds)
 
     for _ in range(max_iterations):
-        mid_dt = start_dt + (end_dt - start_dt) / 2
-        mid_elongation = get_tithi_angle(mid_dt)
-        mid_tithi = int(mid_elongation / TITHI_SPAN)
-
         if end_dt - start_dt < tolerance:
             return end_dt
 
-        # Check if we've crossed the boundary
+        mid_dt = start_dt + (end_dt - start_dt) / 2
+        mid_tithi = int(get_tithi_angle(mid_dt) / TITHI_SPAN)
+
         if mid_tithi == current_tithi:
             # Haven't reached boundary yet
             start_dt = mid_dt
@@ -66,38 +109,21 @@ def find_tithi_end(dt: datetime, max_iterations: int = 50, tolerance_seconds: in
     return end_dt
 
 
-def find_tithi_start(
-    dt: datetime, max_iterations: int = 50, tolerance_seconds: int = 60
-) -> datetime:
-    """
-    Find when the current tithi started.
-
-    Args:
-        dt: Reference datetime
-        max_iterations: Maximum search iterations
-        tolerance_seconds: Precision in seconds
-
-    Returns:
-        Datetime when current tithi started
-    """
-    # Get current tithi
-    current_elongation = get_tithi_angle(dt)
-    current_tithi = int(current_elongation / TITHI_SPAN)
+def _bisect_tithi_start(dt: datetime, max_iterations: int, tolerance_seconds: float) -> datetime:
+    """Bisection search for the start of the tithi containing ``dt``."""
+    current_tithi = int(get_tithi_angle(dt) / TITHI_SPAN)
 
-    # Binary search window (look back up to 30 hours)
-    start_dt = dt - timedelta(hours=30)
+    start_dt = dt - SEARCH_WINDOW
     end_dt = dt
-
     tolerance = timedelta(seconds=tolerance_seconds)
 
     for _ in range(max_iterations):
-        mid_dt = start_dt + (end_dt - start_dt) / 2
-        mid_elongation = get_tithi_angle(mid_dt)
-        mid_tithi = int(mid_elongation / TITHI_SPAN)
-
         if end_dt - start_dt < tolerance:
             return end_dt
 
+        mid_dt = start_dt + (end_dt - start_dt) / 2
+        mid_tithi = int(get_tithi_angle(mid_dt) / TITHI_SPAN)
+
         if mid_tithi == current_tithi:
             # Still in current tithi, go further back
             end_dt = mid_dt
@@ -108,6 +134,80 @@ def find_tithi_start(
     return end_dt
 
 
+def _indexed_tithi_bounds(
+    dt: datetime, tolerance_seconds: float
+) -> Optional[Tuple[datetime, datetime]]:
+    """Tithi window from the transition index, if it covers ``dt`` precisely enough."""
+    index = get_transition_index()
+    if index is None or index.tolerance_seconds > tolerance_seconds:
+        return None
+    return index.segment_bounds("tithi", dt)
+
+
+def find_tithi_end(
+    dt: datetime,
+    max_iterations: int = 50,
+    tolerance_seconds: float = DEFAULT_TOLERANCE_SECONDS,
+) -> datetime:
+    """
+    Find when the current tithi ends.
+
+    Args:
+        dt: Starting datetime
+        max_iterations: Maximum search iterations
+        tolerance_seconds: Precision in seconds (sub-second values are fine)
+
+    Returns:
+        Datetime when current tithi ends (next tithi begins). The result is
+        never earlier than the true boundary, so it already lies in the next
+        tithi.
+
+    Note:
+        A tithi typically lasts about 19-26 hours (mean ~23.6 hours).
+    """
+    indexed = _indexed_tithi_bounds(dt, tolerance_seconds)
+    if indexed is not None:
+        return indexed[1]
+
+    with stage(STAGE_TITHI):
+        boundary = _newton_tithi_boundary(
+            dt, forward=True, max_iterations=max_iterations, tolerance_seconds=tolerance_seconds
+        )
+        if boundary is not None:
+            return boundary
+        return _bisect_tithi_end(dt, max_iterations, tolerance_seconds)
+
+
+def find_tithi_start(
+    dt: datetime,
+    max_iterations: int = 50,
+    tolerance_seconds: float = DEFAULT_TOLERANCE_SECONDS,
+) -> datetime:
+    """
+    Find when the current tithi started.
+
+    Args:
+        dt: Reference datetime
+        max_iterations: Maximum search iterations
+        tolerance_seconds: Precision in seconds (sub-second values are fine)
+
+    Returns:
+        Datetime when current tithi started. The result is never earlier than
+        the true boundary, so it lies inside the current tithi.
+    """
+    indexed = _indexed_tithi_bounds(dt, tolerance_seconds)
+    if indexed is not None:
+        return indexed[0]
+
+    with stage(STAGE_TITHI):
+        boundary = _newton_tithi_boundary(
+            dt, forward=False, max_iterations=max_iterations, tolerance_seconds=tolerance_seconds
+        )
+        if boundary is not None:
+            return boundary
+        return _bisect_tithi_start(dt, max_iterations, tolerance_seconds)
+
+
 def get_tithi_window(dt: datetime) -> Tuple[datetime, datetime]:
     """
     Get the start and end times of the tithi containing dt.
@@ -165,9 +265,20 @@ def find_next_tithi(
     else:
         target_absolute = target_tithi
 
+    end_dt = after + timedelta(days=within_days)
+
+    index = get_transition_index()
+    if index is not None and index.covers(after, end_dt):
+        target_segment = target_absolute - 1
+        if index.value_at("tithi", after) == target_segment:
+            bounds = index.segment_bounds("tithi", after)
+            if bounds is not None:
+                return bounds[0]
+        else:
+            return index.next_transition("tithi", target_segment, after, end_dt)
+
     # Walk forward day by day
     search_dt = after
-    end_dt = after + timedelta(days=within_days)
 
     while search_dt < end_dt:
         info = calculate_tithi(search_dt)
@@ -237,6 +348,18 @@ def get_tithis_in_range(
     Returns:
         List of (tithi_number, paksha, start_time, end_time)
     """
+    index = get_transition_index()
+    if index is not None and index.covers(start, end):
+        bounds = index.segment_bounds("tithi", start)
+        if bounds is not None:
+            return _tithis_from_transitions(
+                bounds[0],
+                index.value_at("tithi", start),
+                index.transitions_between("tithi", start, end),
+                start,
+                end,
+            )
+
     result = []
 
     current = start
@@ -256,6 +379,25 @@ def get_tithis_in_range(
     return result
 
 
+def _tithis_from_transitions(
+    first_start: datetime,
+    first_segment: int,
+    transitions: List[Tuple[datetime, int]],
+    start: datetime,
+    end: datetime,
+) -> List[Tuple[int, str, datetime, datetime]]:
+    """Shape indexed transitions like ``get_tithis_in_range`` results."""
+    edges = [(first_start, first_segment)] + [edge for edge in transitions if edge[0] < end]
+    result = []
+    for position, (tithi_start, segment) in enumerate(edges):
+        tithi_end = edges[position + 1][0] if position + 1 < len(edges) else end
+        number = segment + 1
+        paksha = "shukla" if number <= 15 else "krishna"
+        display = number if number <= 15 else number - 15
+        result.append((display, paksha, max(tithi_start, start), min(tithi_end, end)))
+    return result
+
+
 # =============================================================================
 # TITHI DURATION
 # =============================================================================
@@ -22,10 +22,10 @@ from ..ephemeris.positions import (
     get_tithi_number,
     get_tithi_progress,
 )
+from ..ephemeris.solar_events import get_sunrise
 from ..ephemeris.swiss_eph import (
     LAT_KATHMANDU,
     LON_KATHMANDU,
-    calculate_sunrise,
 )
 
 # =============================================================================
@@ -98,7 +98,16 @@ def calculate_tithi(dt) -> Dict[str, Any]:
         # Add UTC timezone if missing
         dt = dt.replace(tzinfo=tz.utc)
 
-    elongation = get_tithi_angle(dt)
+    return tithi_from_elongation(get_tithi_angle(dt))
+
+
+def tithi_from_elongation(elongation: float) -> Dict[str, Any]:
+    """
+    Build the ``calculate_tithi`` payload from an already-computed elongation.
+
+    Lets batch callers (range panchanga, precompute) derive tithi details from
+    ``get_sun_moon_positions_batch`` output without another ephemeris call.
+    """
     tithi_num = get_tithi_number(elongation)
     paksha = get_paksha(tithi_num)
     display_num = get_display_tithi(tithi_num)
@@ -130,7 +139,7 @@ def calculate_tithi_at_sunrise(
 
     Computes sunrise for the date/location and returns tithi at that moment.
     """
-    sunrise_utc = calculate_sunrise(date_val, latitude, longitude)
+    sunrise_utc = get_sunrise(date_val, latitude, longitude)
     return calculate_tithi(sunrise_utc)
 
 
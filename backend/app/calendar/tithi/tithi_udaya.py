@@ -10,13 +10,21 @@ In Hindu tradition, the day begins at sunrise (not midnight), so:
 - If a tithi spans sunrise, it "belongs" to that day
 """
 
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import date, timedelta
-from typing import Any, Dict, Optional
-
-from ..ephemeris.swiss_eph import LAT_KATHMANDU, LON_KATHMANDU, calculate_sunrise
+from typing import Any, Dict, Iterator, List, Mapping, Optional
+
+from ..ephemeris.solar_events import get_sunrise
+from ..ephemeris.swiss_eph import (
+    LAT_KATHMANDU,
+    LON_KATHMANDU,
+    get_julian_days,
+    get_sun_moon_positions_batch,
+)
 from ..ephemeris.time_utils import to_nepal_time
 from .tithi_boundaries import find_tithi_end, get_tithi_window
-from .tithi_core import calculate_tithi
+from .tithi_core import calculate_tithi, tithi_from_elongation
 
 # =============================================================================
 # UDAYA TITHI CALCULATION
@@ -99,7 +107,7 @@ def calculate_tithi_at_sunrise(
     Returns:
         Dict containing tithi fields from `calculate_tithi()` plus sunrise metadata.
     """
-    sunrise_utc = calculate_sunrise(date_val, latitude, longitude)
+    sunrise_utc = get_sunrise(date_val, latitude, longitude)
     sunrise_nepal = to_nepal_time(sunrise_utc)
     tithi_info = calculate_tithi(sunrise_utc)
     return {
@@ -109,6 +117,91 @@ def calculate_tithi_at_sunrise(
     }
 
 
+def _sunrise_tithi_fields(tithi_info: Dict[str, Any], sunrise_utc) -> Dict[str, Any]:
+    return {
+        "tithi": tithi_info["display_number"],
+        "tithi_absolute": tithi_info["number"],
+        "paksha": tithi_info["paksha"],
+        "name": tithi_info["name"],
+        "progress": tithi_info["progress"],
+        "elongation": tithi_info["elongation"],
+        "sunrise": sunrise_utc,
+        "method": "udaya_tithi",
+    }
+
+
+# Kathmandu sunrise tithis computed ahead of time by a batch caller.
+_preloaded_sunrise_tithis: ContextVar[Optional[Mapping[date, Dict[str, Any]]]] = ContextVar(
+    "parva_preloaded_sunrise_tithis", default=None
+)
+
+
+@contextmanager
+def use_sunrise_tithis(table: Mapping[date, Dict[str, Any]]) -> Iterator[None]:
+    """Answer ``get_sunrise_tithi`` for Kathmandu from ``table`` within this block."""
+    token = _preloaded_sunrise_tithis.set(table)
+    try:
+        yield
+    finally:
+        _preloaded_sunrise_tithis.reset(token)
+
+
+def get_sunrise_tithi(
+    date_val: date, latitude: float = LAT_KATHMANDU, longitude: float = LON_KATHMANDU
+) -> Dict[str, Any]:
+    """
+    Udaya tithi without the end-time solve.
+
+    Returns the same tithi/paksha/progress fields as ``get_udaya_tithi`` but
+    skips ``find_tithi_end`` (and the local sunrise), for callers that only
+    compare the tithi number and paksha.
+    """
+    table = _preloaded_sunrise_tithis.get()
+    if table is not None and latitude == LAT_KATHMANDU and longitude == LON_KATHMANDU:
+        row = table.get(date_val)
+        if row is not None:
+            return dict(row)
+    sunrise_utc = get_sunrise(date_val, latitude, longitude)
+    return _sunrise_tithi_fields(calculate_tithi(sunrise_utc), sunrise_utc)
+
+
+def get_sunrise_tithis(
+    start_date: date,
+    days: int,
+    latitude: float = LAT_KATHMANDU,
+    longitude: float = LON_KATHMANDU,
+) -> List[Dict[str, Any]]:
+    """
+    ``get_sunrise_tithi`` for ``days`` consecutive dates starting at ``start_date``.
+
+    Sunrises come from the shared solar-event table and Sun/Moon positions at
+    all of them from one batched ephemeris call.
+    """
+    dates = [start_date + timedelta(days=offset) for offset in range(max(0, days))]
+    if not dates:
+        return []
+    sunrises = [get_sunrise(d, latitude, longitude) for d in dates]
+    positions = get_sun_moon_positions_batch(get_julian_days(sunrises))
+    return [
+        _sunrise_tithi_fields(tithi_from_elongation((moon_long - sun_long) % 360), sunrise)
+        for sunrise, sun_long, moon_long in zip(
+            sunrises,
+            positions.sun_longitude.tolist(),
+            positions.moon_longitude.tolist(),
+        )
+    ]
+
+
+def is_vriddhi_pair(today: Dict[str, Any], tomorrow: Dict[str, Any]) -> bool:
+    """Same absolute tithi at two consecutive sunrises."""
+    return today["tithi_absolute"] == tomorrow["tithi_absolute"]
+
+
+def is_ksheepana_pair(today: Dict[str, Any], tomorrow: Dict[str, Any]) -> bool:
+    """Sunrise-to-sunrise jump of two tithis (one skipped in between)."""
+    return (tomorrow["tithi_absolute"] - today["tithi_absolute"]) % 30 == 2
+
+
 def detect_vriddhi(
     date_val: date, latitude: float = LAT_KATHMANDU, longitude: float = LON_KATHMANDU
 ) -> bool:
@@ -117,9 +210,8 @@ def detect_vriddhi(
 
     Vriddhi means the same absolute tithi prevails at two consecutive sunrises.
     """
-    today = calculate_tithi_at_sunrise(date_val, latitude, longitude)
-    tomorrow = calculate_tithi_at_sunrise(date_val + timedelta(days=1), latitude, longitude)
-    return today["number"] == tomorrow["number"]
+    today, tomorrow = get_sunrise_tithis(date_val, 2, latitude, longitude)
+    return is_vriddhi_pair(today, tomorrow)
 
 
 def detect_ksheepana(
@@ -131,10 +223,8 @@ def detect_ksheepana(
     Ksheepana occurs when sunrise-to-sunrise tithi jump is 2, meaning one tithi
     started and ended between the two sunrises.
     """
-    today = calculate_tithi_at_sunrise(date_val, latitude, longitude)
-    tomorrow = calculate_tithi_at_sunrise(date_val + timedelta(days=1), latitude, longitude)
-    delta = (tomorrow["number"] - today["number"]) % 30
-    return delta == 2
+    today, tomorrow = get_sunrise_tithis(date_val, 2, latitude, longitude)
+    return is_ksheepana_pair(today, tomorrow)
 
 
 def get_tithi_for_date(date_val: date) -> Dict[str, Any]:
@@ -215,7 +305,7 @@ def is_festival_tithi(date_val: date, target_tithi: int, target_paksha: str) ->
         >>> is_festival_tithi(date(2026, 10, 2), 10, "shukla")  # Dashami check
         True
     """
-    udaya = get_udaya_tithi(date_val)
+    udaya = get_sunrise_tithi(date_val)
 
     return udaya["tithi"] == target_tithi and udaya["paksha"] == target_paksha
 
@@ -243,11 +333,10 @@ def find_festival_date(
     search_start = date(year, month, 1) - timedelta(days=5)
     search_end = date(year, month, 1) + timedelta(days=35)
 
-    current_date = search_start
-    while current_date <= search_end:
-        if is_festival_tithi(current_date, target_tithi, target_paksha):
-            return current_date
-        current_date += timedelta(days=1)
+    window = get_sunrise_tithis(search_start, (search_end - search_start).days + 1)
+    for offset, udaya in enumerate(window):
+        if udaya["tithi"] == target_tithi and udaya["paksha"] == target_paksha:
+            return search_start + timedelta(days=offset)
 
     return None
 
@@ -0,0 +1,404 @@
+"""
+Precomputed tithi/nakshatra/yoga/karana transition index.
+
+Panchanga, tithi range walks and the lunar-month search keep asking the same
+questions ("which tithi is in force at T", "when does the next Ekadashi
+begin"). Every transition instant over a span of years is computed once and
+written to a compact ``.npz`` file; lookups then become binary searches over
+sorted Julian Day arrays instead of ephemeris calls.
+
+File layout (numpy ``.npz``, no pickled objects):
+
+- ``meta``: JSON string with version, span, ephemeris config and tolerance
+- ``<kind>_jd``: float64, sorted Julian Days (UT) at which a segment begins
+- ``<kind>_value``: int16, 0-based segment entered at that instant
+  (tithi 0-29, karana 0-59, nakshatra 0-26, yoga 0-26)
+
+Transition instants carry the same 1 ms bias as the live tithi solver, so an
+indexed instant already lies in the segment it opens. Callers must fall back
+to live ephemeris whenever ``TransitionIndex.covers`` is False.
+
+Batch computations can also build a short-lived index in memory
+(``build_transition_index``) and make it the active one for the current
+context with ``use_transition_index``; it takes precedence over the file.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from app.engine.ephemeris_config import EphemerisConfig, get_ephemeris_config
+
+from .ephemeris.swiss_eph import get_julian_day, get_sun_moon_state
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+INDEX_FILENAME = "transition_index.npz"
+DEFAULT_INDEX_PATH = PROJECT_ROOT / "output" / "precomputed" / INDEX_FILENAME
+INDEX_PATH_ENV = "PARVA_TRANSITION_INDEX_PATH"
+
+TRANSITION_INDEX_VERSION = 1
+DEFAULT_TOLERANCE_SECONDS = 0.5
+
+_SECONDS_PER_DAY = 86400.0
+_JD_UNIX_EPOCH = 2440587.5
+_BOUNDARY_GUARD_DAYS = 0.001 / _SECONDS_PER_DAY
+_MAX_NEWTON_STEPS = 20
+
+SunMoonState = Tuple[float, float, float, float]
+
+
+# =============================================================================
+# TRANSITION KINDS
+# =============================================================================
+
+
+def _elongation(state: SunMoonState) -> Tuple[float, float]:
+    sun_long, sun_speed, moon_long, moon_speed = state
+    return ((moon_long - sun_long) % 360, moon_speed - sun_speed)
+
+
+def _moon_longitude(state: SunMoonState) -> Tuple[float, float]:
+    return (state[2], state[3])
+
+
+def _yoga_angle(state: SunMoonState) -> Tuple[float, float]:
+    sun_long, sun_speed, moon_long, moon_speed = state
+    return ((sun_long + moon_long) % 360, sun_speed + moon_speed)
+
+
+@dataclass(frozen=True)
+class TransitionKind:
+    """A panchanga element that advances through equal angular segments."""
+
+    name: str
+    segments: int
+    angle: Callable[[SunMoonState], Tuple[float, float]]
+
+    @property
+    def span(self) -> float:
+        return 360.0 / self.segments
+
+    def segment_of(self, angle: float) -> int:
+        return int(angle / self.span) % self.segments
+
+
+TRANSITION_KINDS: Dict[str, TransitionKind] = {
+    "tithi": TransitionKind("tithi", 30, _elongation),
+    "karana": TransitionKind("karana", 60, _elongation),
+    "nakshatra": TransitionKind("nakshatra", 27, _moon_longitude),
+    "yoga": TransitionKind("yoga", 27, _yoga_angle),
+}
+
+
+# =============================================================================
+# TIME CONVERSION
+# =============================================================================
+
+
+def julian_day_to_datetime_exact(jd: float) -> datetime:
+    """Julian Day (UT) to an aware UTC datetime, keeping microseconds."""
+    return datetime(1970, 1, 1, tzinfo=timezone.utc) + timedelta(
+        seconds=(jd - _JD_UNIX_EPOCH) * _SECONDS_PER_DAY
+    )
+
+
+# =============================================================================
+# GENERATION
+# =============================================================================
+
+
+def _next_boundary(
+    kind: TransitionKind,
+    jd: float,
+    angle: float,
+    rate: float,
+    target: float,
+    tolerance_days: float,
+    config: EphemerisConfig,
+) -> float:
+    """Newton-solve for the instant after ``jd`` at which ``kind`` reaches ``target``."""
+    offset = 0.0
+    for _ in range(_MAX_NEWTON_STEPS):
+        delta = (target - angle + 180.0) % 360.0 - 180.0
+        step = delta / rate
+        offset += step
+        if abs(step) < tolerance_days:
+            return jd + offset + _BOUNDARY_GUARD_DAYS
+        angle, rate = kind.angle(get_sun_moon_state(jd + offset, config=config))
+    raise RuntimeError(f"{kind.name} boundary did not converge near JD {jd:.6f}")
+
+
+def compute_transitions(
+    kind_name: str,
+    start_jd: float,
+    end_jd: float,
+    *,
+    config: Optional[EphemerisConfig] = None,
+    tolerance_seconds: float = DEFAULT_TOLERANCE_SECONDS,
+) -> Tuple[int, np.ndarray, np.ndarray]:
+    """
+    Compute every transition of one element within ``[start_jd, end_jd)``.
+
+    Returns:
+        Tuple of (segment in force at ``start_jd``, transition Julian Days,
+        segment entered at each transition)
+    """
+    kind = TRANSITION_KINDS[kind_name]
+    cfg = config or get_ephemeris_config()
+    tolerance_days = tolerance_seconds / _SECONDS_PER_DAY
+
+    angle, rate = kind.angle(get_sun_moon_state(start_jd, config=cfg))
+    initial = segment = kind.segment_of(angle)
+    jds: List[float] = []
+    values: List[int] = []
+
+    jd = start_jd
+    while True:
+        # Track the segment explicitly instead of re-deriving it from the angle
+        # at a boundary, where rounding could place it on either side.
+        target = (segment + 1) * kind.span
+        jd = _next_boundary(kind, jd, angle, rate, target, tolerance_days, cfg)
+        if jd >= end_jd:
+            break
+        segment = (segment + 1) % kind.segments
+        jds.append(jd)
+        values.append(segment)
+        angle, rate = kind.angle(get_sun_moon_state(jd, config=cfg))
+
+    return initial, np.asarray(jds, dtype=np.float64), np.asarray(values, dtype=np.int16)
+
+
+def write_transition_index(
+    path: Path,
+    start_year: int,
+    end_year: int,
+    *,
+    config: Optional[EphemerisConfig] = None,
+    tolerance_seconds: float = DEFAULT_TOLERANCE_SECONDS,
+) -> Path:
+    """
+    Generate the transition index for Gregorian years ``start_year..end_year``.
+
+    The file is written next to its destination and moved into place, so a
+    running server never reads a half-written index.
+    """
+    cfg = config or get_ephemeris_config()
+    start_jd = get_julian_day(datetime(start_year, 1, 1, tzinfo=timezone.utc))
+    end_jd = get_julian_day(datetime(end_year + 1, 1, 1, tzinfo=timezone.utc))
+
+    arrays: Dict[str, np.ndarray] = {}
+    initial: Dict[str, int] = {}
+    for name in TRANSITION_KINDS:
+        initial[name], arrays[f"{name}_jd"], arrays[f"{name}_value"] = compute_transitions(
+            name, start_jd, end_jd, config=cfg, tolerance_seconds=tolerance_seconds
+        )
+
+    meta = {
+        "version": TRANSITION_INDEX_VERSION,
+        "start_year": start_year,
+        "end_year": end_year,
+        "start_jd": start_jd,
+        "end_jd": end_jd,
+        "config": cfg.header_value,
+        "tolerance_seconds": tolerance_seconds,
+        "initial": initial,
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with tmp_path.open("wb") as handle:
+        np.savez(handle, meta=np.array(json.dumps(meta)), **arrays)
+    os.replace(tmp_path, path)
+    return path
+
+
+# =============================================================================
+# LOOKUP
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class TransitionIndex:
+    """Sorted transition arrays for one ephemeris configuration and year span."""
+
+    start_jd: float
+    end_jd: float
+    config_key: str
+    tolerance_seconds: float
+    initial: Mapping[str, int]
+    jds: Mapping[str, np.ndarray]
+    values: Mapping[str, np.ndarray]
+
+    def covers(self, start: datetime, end: Optional[datetime] = None) -> bool:
+        """True when ``[start, end]`` lies entirely inside the indexed span."""
+        start_jd = get_julian_day(start)
+        end_jd = get_julian_day(end) if end is not None else start_jd
+        return self.start_jd <= start_jd and end_jd < self.end_jd
+
+    def _position(self, kind: str, jd: float) -> int:
+        # Index of the last transition at or before jd (-1 before the first).
+        return int(np.searchsorted(self.jds[kind], jd, side="right")) - 1
+
+    def value_at(self, kind: str, dt: datetime) -> Optional[int]:
+        """0-based segment of ``kind`` in force at ``dt``, or None outside the span."""
+        if not self.covers(dt):
+            return None
+        position = self._position(kind, get_julian_day(dt))
+        if position < 0:
+            return self.initial[kind]
+        return int(self.values[kind][position])
+
+    def segment_bounds(self, kind: str, dt: datetime) -> Optional[Tuple[datetime, datetime]]:
+        """
+        Start and end of the segment containing ``dt``.
+
+        Returns None when either edge falls outside the indexed span.
+        """
+        if not self.covers(dt):
+            return None
+        jds = self.jds[kind]
+        position = self._position(kind, get_julian_day(dt))
+        if position < 0 or position + 1 >= len(jds):
+            return None
+        return (
+            julian_day_to_datetime_exact(float(jds[position])),
+            julian_day_to_datetime_exact(float(jds[position + 1])),
+        )
+
+    def transitions_between(
+        self, kind: str, start: datetime, end: datetime
+    ) -> List[Tuple[datetime, int]]:
+        """All ``(instant, segment entered)`` transitions within ``(start, end]``."""
+        jds = self.jds[kind]
+        lo = int(np.searchsorted(jds, get_julian_day(start), side="right"))
+        hi = int(np.searchsorted(jds, get_julian_day(end), side="right"))
+        return [
+            (julian_day_to_datetime_exact(float(jd)), int(value))
+            for jd, value in zip(jds[lo:hi], self.values[kind][lo:hi])
+        ]
+
+    def next_transition(
+        self, kind: str, value: int, after: datetime, before: datetime
+    ) -> Optional[datetime]:
+        """First instant in ``(after, before)`` at which segment ``value`` begins."""
+        jds = self.jds[kind]
+        lo = int(np.searchsorted(jds, get_julian_day(after), side="right"))
+        hi = int(np.searchsorted(jds, get_julian_day(before), side="left"))
+        matches = np.flatnonzero(self.values[kind][lo:hi] == value)
+        if matches.size == 0:
+            return None
+        return julian_day_to_datetime_exact(float(jds[lo + int(matches[0])]))
+
+
+@lru_cache(maxsize=4)
+def _load_index_cached(path_str: str, mtime_ns: int) -> Optional[TransitionIndex]:
+    del mtime_ns
+    try:
+        with np.load(path_str, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            if meta.get("version") != TRANSITION_INDEX_VERSION:
+                return None
+            jds = {name: data[f"{name}_jd"] for name in TRANSITION_KINDS}
+            values = {name: data[f"{name}_value"] for name in TRANSITION_KINDS}
+    except (OSError, KeyError, ValueError):
+        return None
+
+    return TransitionIndex(
+        start_jd=float(meta["start_jd"]),
+        end_jd=float(meta["end_jd"]),
+        config_key=str(meta["config"]),
+        tolerance_seconds=float(meta["tolerance_seconds"]),
+        initial={name: int(meta["initial"][name]) for name in TRANSITION_KINDS},
+        jds=jds,
+        values=values,
+    )
+
+
+def build_transition_index(
+    start_jd: float,
+    end_jd: float,
+    *,
+    kinds: Iterable[str] = tuple(TRANSITION_KINDS),
+    config: Optional[EphemerisConfig] = None,
+    tolerance_seconds: float = DEFAULT_TOLERANCE_SECONDS,
+) -> TransitionIndex:
+    """
+    Compute an in-memory index for ``[start_jd, end_jd)``.
+
+    Only the requested ``kinds`` are computed; the index then answers lookups
+    for those kinds only, so activate a partial index solely around code that
+    asks for them.
+    """
+    cfg = config or get_ephemeris_config()
+    initial: Dict[str, int] = {}
+    jds: Dict[str, np.ndarray] = {}
+    values: Dict[str, np.ndarray] = {}
+    for name in kinds:
+        initial[name], jds[name], values[name] = compute_transitions(
+            name, start_jd, end_jd, config=cfg, tolerance_seconds=tolerance_seconds
+        )
+    return TransitionIndex(
+        start_jd=start_jd,
+        end_jd=end_jd,
+        config_key=cfg.header_value,
+        tolerance_seconds=tolerance_seconds,
+        initial=initial,
+        jds=jds,
+        values=values,
+    )
+
+
+_active_index: ContextVar[Optional[TransitionIndex]] = ContextVar(
+    "parva_active_transition_index", default=None
+)
+
+
+@contextmanager
+def use_transition_index(index: TransitionIndex) -> Iterator[TransitionIndex]:
+    """Make ``index`` the one ``get_transition_index`` returns within this block."""
+    token = _active_index.set(index)
+    try:
+        yield index
+    finally:
+        _active_index.reset(token)
+
+
+def resolve_index_path() -> Path:
+    configured = os.getenv(INDEX_PATH_ENV, "").strip()
+    return Path(configured) if configured else DEFAULT_INDEX_PATH
+
+
+def load_transition_index(path: Optional[Path] = None) -> Optional[TransitionIndex]:
+    """Load an index file, re-reading it when its mtime changes. None if absent or invalid."""
+    index_path = Path(path) if path is not None else resolve_index_path()
+    try:
+        stat = index_path.stat()
+    except OSError:
+        return None
+    return _load_index_cached(str(index_path), stat.st_mtime_ns)
+
+
+def get_transition_index() -> Optional[TransitionIndex]:
+    """The active or configured index, if one exists and matches the ephemeris config."""
+    index = _active_index.get()
+    if index is None:
+        index = load_transition_index()
+    if index is None or index.config_key != get_ephemeris_config().header_value:
+        return None
+    return index
+
+
+def clear_transition_index_cache() -> None:
+    _load_index_cached.cache_clear()
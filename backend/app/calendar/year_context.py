@@ -0,0 +1,125 @@
+"""
+Shared astronomical context for evaluating a whole festival year at once.
+
+Resolving every catalog rule for one Gregorian year asks the same questions
+hundreds of times: the lunar years either side of it, where each tithi
+begins inside those lunar months, and which tithi is in force at each
+sunrise. Asked one rule at a time, every lunar-month search walks the
+ephemeris again.
+
+``YearContext`` answers them once for the span the rules can reach, from
+the first month of the previous lunar year to a month past the end of the
+current one:
+
+- the two lunar years, built through the shared lunar timeline cache;
+- an in-memory tithi transition index over the span (or the precomputed
+  index when it already covers it), so tithi searches become binary searches;
+- the Kathmandu sunrise tithi of every day in the span, from one batched
+  ephemeris call.
+
+While ``YearContext.activate()`` is in effect, ``find_next_tithi``,
+``find_tithi_start``/``find_tithi_end`` and ``get_sunrise_tithi`` read from
+the context and fall back to live ephemeris outside its span, so results are
+the same as without it. Activation is scoped with context variables and does
+not leak across threads or requests.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Dict, Iterator, Mapping, Tuple
+
+from app.engine.ephemeris_config import get_ephemeris_config
+
+from .ephemeris.swiss_eph import get_julian_day
+from .lunar_calendar import LunarYear, get_lunar_year
+from .tithi.tithi_udaya import get_sunrise_tithis, use_sunrise_tithis
+from .transition_index import (
+    TransitionIndex,
+    build_transition_index,
+    get_transition_index,
+    use_transition_index,
+)
+
+# Lunar-month searches start up to two days before a month opens and look
+# up to 35 days past its Purnima; anything outside the span is solved live.
+_LEAD_DAYS = 2
+_TAIL_DAYS = 40
+
+
+@dataclass(frozen=True)
+class YearContext:
+    """Astronomical facts shared by every rule evaluated for ``year``."""
+
+    year: int
+    start: date
+    end: date  # exclusive
+    lunar_years: Tuple[LunarYear, LunarYear]
+    tithi_index: TransitionIndex
+    sunrise_tithis: Mapping[date, Dict[str, Any]]
+
+    @contextmanager
+    def activate(self) -> Iterator["YearContext"]:
+        """Route tithi searches and sunrise tithis through this context."""
+        with use_transition_index(self.tithi_index), use_sunrise_tithis(self.sunrise_tithis):
+            yield self
+
+
+def _utc_midnight(day: date) -> datetime:
+    return datetime.combine(day, datetime.min.time()).replace(tzinfo=timezone.utc)
+
+
+@lru_cache(maxsize=4)
+def _build_year_context(year: int, config_key: str) -> YearContext:
+    del config_key
+    lunar_years = (get_lunar_year(year - 1), get_lunar_year(year))
+    start = lunar_years[0].months[0].start_amavasya.date() - timedelta(days=_LEAD_DAYS)
+    end = lunar_years[1].months[-1].end_amavasya.date() + timedelta(days=_TAIL_DAYS)
+
+    start_dt, end_dt = _utc_midnight(start), _utc_midnight(end)
+    index = get_transition_index()
+    if index is None or not index.covers(start_dt, end_dt - timedelta(microseconds=1)):
+        index = build_transition_index(
+            get_julian_day(start_dt), get_julian_day(end_dt), kinds=("tithi",)
+        )
+
+    days = (end - start).days
+    sunrise_tithis = {
+        start + timedelta(days=offset): row
+        for offset, row in enumerate(get_sunrise_tithis(start, days))
+    }
+    return YearContext(
+        year=year,
+        start=start,
+        end=end,
+        lunar_years=lunar_years,
+        tithi_index=index,
+        sunrise_tithis=sunrise_tithis,
+    )
+
+
+def build_year_context(year: int) -> YearContext:
+    """Context for ``year`` under the active ephemeris config (cached per year)."""
+    return _build_year_context(year, get_ephemeris_config().header_value)
+
+
+@contextmanager
+def year_context(year: int) -> Iterator[YearContext]:
+    """Build (or reuse) the context for ``year`` and activate it."""
+    with build_year_context(year).activate() as context:
+        yield context
+
+
+def clear_year_context_cache() -> None:
+    _build_year_context.cache_clear()
+
+
+__all__ = [
+    "YearContext",
+    "build_year_context",
+    "clear_year_context_cache",
+    "year_context",
+]
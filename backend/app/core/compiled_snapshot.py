@@ -0,0 +1,119 @@
+"""Hash-keyed pickle snapshots of compiled catalogs.
+
+Parsing and validating a JSON catalog on every worker start costs more than
+reading back the objects it produced. A snapshot stores those objects with a
+fingerprint of everything they were derived from (source files, the modules
+that validate them, library versions). It is used only while the fingerprint
+still matches, so editing any listed input invalidates it.
+
+File layout: two consecutive pickles, a header
+``{"version": 1, "kind": ..., "fingerprint": ...}`` followed by the payload,
+so a stale snapshot is rejected without unpickling the payload. Files are
+written atomically (tmp file + ``os.replace``); a read-only disk only means
+every start validates again.
+
+Snapshots are pickles and are trusted like code: keep the directory writable
+only by the service. ``PARVA_CATALOG_SNAPSHOT_DIR`` and
+``PARVA_CATALOG_SNAPSHOT_ENABLED`` control the location.
+
+This module stays free of framework imports so the storage layer can use it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+DEFAULT_SNAPSHOT_DIR = PROJECT_ROOT / "output" / "cache"
+SNAPSHOT_DIR_ENV = "PARVA_CATALOG_SNAPSHOT_DIR"
+SNAPSHOT_ENABLED_ENV = "PARVA_CATALOG_SNAPSHOT_ENABLED"
+
+SNAPSHOT_VERSION = 1
+
+
+def snapshot_path(kind: str, source: Path) -> Optional[Path]:
+    """Snapshot file for ``kind`` built from ``source``; ``None`` when disabled.
+
+    The name carries a digest of the source path so catalogs loaded from
+    different locations (tests, alternate data dirs) do not evict each other.
+    """
+    enabled = os.getenv(SNAPSHOT_ENABLED_ENV, "true").strip().lower()
+    if enabled in {"0", "false", "no", "off"}:
+        return None
+    configured = os.getenv(SNAPSHOT_DIR_ENV, "").strip()
+    snapshot_dir = Path(configured) if configured else DEFAULT_SNAPSHOT_DIR
+    location = hashlib.sha1(str(Path(source).resolve()).encode("utf-8")).hexdigest()[:12]
+    return snapshot_dir / f"{kind}_v{SNAPSHOT_VERSION}_{location}.snapshot.pickle"
+
+
+def _file_digest(path: Path) -> bytes:
+    try:
+        return hashlib.sha256(path.read_bytes()).digest()
+    except OSError:
+        return b"missing"
+
+
+def source_fingerprint(paths: Iterable[Path], *, extra: Iterable[str] = ()) -> str:
+    """Digest over the content of ``paths`` (directories: every file below them).
+
+    Bytecode caches are skipped: they change whenever a module is compiled,
+    not when its source does.
+    """
+    digest = hashlib.sha256()
+    for path in sorted({Path(path) for path in paths}):
+        if path.is_dir():
+            files = sorted(
+                p for p in path.rglob("*") if p.is_file() and "__pycache__" not in p.parts
+            )
+        else:
+            files = [path]
+        for file in files:
+            digest.update(file.as_posix().encode("utf-8") + b"\0")
+            digest.update(_file_digest(file))
+    for value in extra:
+        digest.update(b"\0" + value.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def load_snapshot(path: Path, kind: str, fingerprint: str) -> Any | None:
+    """Payload of a snapshot built from the same inputs, otherwise ``None``."""
+    try:
+        with path.open("rb") as handle:
+            header = pickle.load(handle)
+            if header != {"version": SNAPSHOT_VERSION, "kind": kind, "fingerprint": fingerprint}:
+                return None
+            return pickle.load(handle)
+    except Exception:
+        # Missing, truncated or written by other code: rebuild from source.
+        return None
+
+
+def write_snapshot(path: Path, kind: str, fingerprint: str, payload: Any) -> bool:
+    header = {"version": SNAPSHOT_VERSION, "kind": kind, "fingerprint": fingerprint}
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_path.open("wb") as handle:
+            pickle.dump(header, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(payload, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        return False
+    return True
+
+
+__all__ = [
+    "SNAPSHOT_DIR_ENV",
+    "SNAPSHOT_ENABLED_ENV",
+    "SNAPSHOT_VERSION",
+    "load_snapshot",
+    "snapshot_path",
+    "source_fingerprint",
+    "write_snapshot",
+]
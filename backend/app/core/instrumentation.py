@@ -0,0 +1,167 @@
+"""Per-request ephemeris call accounting and stage timing.
+
+The request-context middleware opens a ``RequestProfile`` for every HTTP
+request and publishes it through a context variable. Calendar code reports
+into whichever profile is current:
+
+- ``count_ephemeris_calls("calc_ut")`` next to each pyswisseph call site;
+- ``with stage(STAGE_TITHI): ...`` around named units of work.
+
+Compute-pool threads run in a copy of the request context, so work moved off
+the event loop still lands in the request's profile. Outside a request (CLI
+tools, precompute jobs, tests) there is no profile and both helpers cost a
+single context-variable lookup.
+
+This module stays free of framework imports so the ephemeris layer can use it.
+"""
+
+from __future__ import annotations
+
+import time
+from contextvars import ContextVar, Token
+from threading import get_ident
+from typing import Optional
+
+STAGE_SUNRISE = "sunrise"
+STAGE_TITHI = "tithi"
+STAGE_FESTIVAL_RULE = "festival-rule"
+STAGE_SERIALIZE = "serialize"
+
+
+class _ThreadTally:
+    __slots__ = ("calls", "stages", "active")
+
+    def __init__(self) -> None:
+        self.calls: dict[str, int] = {}
+        # stage -> [total milliseconds, number of outermost spans]
+        self.stages: dict[str, list[float]] = {}
+        self.active: dict[str, int] = {}
+
+
+class RequestProfile:
+    """Ephemeris call counts and stage timings collected for one request.
+
+    Each thread working on the request writes to its own tally, so recording
+    needs no lock; the tallies are merged when the profile is read. Stage time
+    from threads that ran in parallel is summed.
+    """
+
+    __slots__ = ("started", "_tallies")
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self._tallies: dict[int, _ThreadTally] = {}
+
+    def _tally(self) -> _ThreadTally:
+        thread_id = get_ident()
+        tally = self._tallies.get(thread_id)
+        if tally is None:
+            tally = self._tallies.setdefault(thread_id, _ThreadTally())
+        return tally
+
+    def add_calls(self, name: str, calls: int) -> None:
+        counts = self._tally().calls
+        counts[name] = counts.get(name, 0) + calls
+
+    @property
+    def ephemeris_calls(self) -> dict[str, int]:
+        merged: dict[str, int] = {}
+        for tally in list(self._tallies.values()):
+            for name, calls in list(tally.calls.items()):
+                merged[name] = merged.get(name, 0) + calls
+        return merged
+
+    @property
+    def stages(self) -> dict[str, tuple[float, int]]:
+        """Stage name -> (total milliseconds, number of timed spans)."""
+        merged: dict[str, tuple[float, int]] = {}
+        for tally in list(self._tallies.values()):
+            for name, (total_ms, spans) in list(tally.stages.items()):
+                previous_ms, previous_spans = merged.get(name, (0.0, 0))
+                merged[name] = (previous_ms + total_ms, previous_spans + int(spans))
+        return merged
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000.0
+
+    def server_timing(self) -> str:
+        """Render the profile as a ``Server-Timing`` header value."""
+        entries = [f"total;dur={self.elapsed_ms():.2f}"]
+        entries.extend(f"{name};dur={total_ms:.2f}" for name, (total_ms, _) in self.stages.items())
+        entries.extend(
+            f'swe-{name.replace("_", "-")};desc="{calls}"'
+            for name, calls in sorted(self.ephemeris_calls.items())
+        )
+        return ", ".join(entries)
+
+
+_current: ContextVar[Optional[RequestProfile]] = ContextVar("parva_request_profile", default=None)
+
+
+def begin_request_profile() -> tuple[RequestProfile, Token]:
+    profile = RequestProfile()
+    return profile, _current.set(profile)
+
+
+def end_request_profile(token: Token) -> None:
+    _current.reset(token)
+
+
+def current_request_profile() -> Optional[RequestProfile]:
+    return _current.get()
+
+
+def count_ephemeris_calls(name: str, calls: int = 1) -> None:
+    """Attribute ``calls`` pyswisseph ``name`` calls to the current request."""
+    profile = _current.get()
+    if profile is not None:
+        profile.add_calls(name, calls)
+
+
+class stage:
+    """Time the enclosed block as ``name`` in the current request's profile.
+
+    Only the outermost span of a stage on each thread is timed, so a tithi
+    solve that calls another tithi solve is not counted twice.
+    """
+
+    __slots__ = ("name", "_tally", "_started")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._tally: Optional[_ThreadTally] = None
+        self._started: Optional[float] = None
+
+    def __enter__(self) -> "stage":
+        profile = _current.get()
+        if profile is not None:
+            tally = self._tally = profile._tally()
+            depth = tally.active.get(self.name, 0)
+            tally.active[self.name] = depth + 1
+            if depth == 0:
+                self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        tally = self._tally
+        if tally is None:
+            return
+        tally.active[self.name] -= 1
+        if self._started is not None:
+            totals = tally.stages.setdefault(self.name, [0.0, 0])
+            totals[0] += (time.perf_counter() - self._started) * 1000.0
+            totals[1] += 1
+
+
+__all__ = [
+    "STAGE_FESTIVAL_RULE",
+    "STAGE_SERIALIZE",
+    "STAGE_SUNRISE",
+    "STAGE_TITHI",
+    "RequestProfile",
+    "begin_request_profile",
+    "count_ephemeris_calls",
+    "current_request_profile",
+    "end_request_profile",
+    "stage",
+]
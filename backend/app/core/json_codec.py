@@ -0,0 +1,121 @@
+"""JSON encoders for response bodies and pre-encoded artifacts.
+
+Two interchangeable encoders produce compact UTF-8 JSON bytes:
+
+- ``orjson``: used when the optional ``orjson`` package is installed; it
+  encodes typical API payloads several times faster than the standard library;
+- ``stdlib``: ``json.dumps`` with the same settings Starlette's
+  ``JSONResponse`` uses.
+
+``PARVA_JSON_ENCODER`` selects one (``auto`` picks ``orjson`` when available).
+The app installs the same choice as the default for ``dumps`` at start-up
+(``configure_default_json_encoder``), so pre-encoded artifacts and streamed
+exports use the encoder the responses use.
+Values orjson cannot represent (integers beyond 64 bits, unknown types) are
+retried with the standard library, so switching encoders never turns a
+response into an error. Unlike ``json.dumps(allow_nan=False)``, orjson writes
+NaN and infinities as ``null``.
+
+This module stays free of framework imports so the storage layer can use it.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the optional package
+    orjson = None  # type: ignore[assignment]
+
+JSON_ENCODER_AUTO = "auto"
+JSON_ENCODER_ORJSON = "orjson"
+JSON_ENCODER_STDLIB = "stdlib"
+JSON_ENCODER_CHOICES = (JSON_ENCODER_AUTO, JSON_ENCODER_ORJSON, JSON_ENCODER_STDLIB)
+
+JSONEncoder = Callable[[Any], bytes]
+
+
+def dumps_stdlib(content: Any) -> bytes:
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps_orjson(content: Any) -> bytes:
+        try:
+            return orjson.dumps(content, option=_ORJSON_OPTIONS)
+        except TypeError:
+            return dumps_stdlib(content)
+
+else:  # pragma: no cover - exercised only without the optional package
+    dumps_orjson = dumps_stdlib
+
+
+def orjson_available() -> bool:
+    return orjson is not None
+
+
+def resolve_json_encoder_name(name: str = JSON_ENCODER_AUTO) -> str:
+    """Concrete encoder behind ``name``; raises ``ValueError`` if unusable."""
+    normalized = (name or JSON_ENCODER_AUTO).strip().lower()
+    if normalized == JSON_ENCODER_AUTO:
+        return JSON_ENCODER_ORJSON if orjson is not None else JSON_ENCODER_STDLIB
+    if normalized == JSON_ENCODER_ORJSON and orjson is None:
+        raise ValueError("The orjson JSON encoder requires the optional 'orjson' package.")
+    if normalized not in JSON_ENCODER_CHOICES:
+        raise ValueError(f"Unknown JSON encoder: {name}")
+    return normalized
+
+
+def get_json_encoder(name: str = JSON_ENCODER_AUTO) -> JSONEncoder:
+    if resolve_json_encoder_name(name) == JSON_ENCODER_ORJSON:
+        return dumps_orjson
+    return dumps_stdlib
+
+
+_default_encoder_name = resolve_json_encoder_name()
+_default_encoder: JSONEncoder = get_json_encoder(_default_encoder_name)
+
+
+def configure_default_json_encoder(name: str) -> str:
+    """Make ``name`` the encoder behind ``dumps``; returns the concrete encoder."""
+    global _default_encoder_name, _default_encoder
+    resolved = resolve_json_encoder_name(name)
+    _default_encoder_name, _default_encoder = resolved, get_json_encoder(resolved)
+    return resolved
+
+
+def default_json_encoder_name() -> str:
+    return _default_encoder_name
+
+
+def dumps(content: Any) -> bytes:
+    """Encode with the configured default encoder (pre-encoded artifacts, exports)."""
+    return _default_encoder(content)
+
+
+__all__ = [
+    "JSON_ENCODER_AUTO",
+    "JSON_ENCODER_CHOICES",
+    "JSON_ENCODER_ORJSON",
+    "JSON_ENCODER_STDLIB",
+    "JSONEncoder",
+    "configure_default_json_encoder",
+    "default_json_encoder_name",
+    "dumps",
+    "dumps_orjson",
+    "dumps_stdlib",
+    "get_json_encoder",
+    "orjson_available",
+    "resolve_json_encoder_name",
+]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from typing import Literal
 
@@ -10,6 +11,9 @@ import swisseph as swe
 Ayanamsa = Literal["lahiri", "raman", "kp"]
 CoordinateSystem = Literal["sidereal", "tropical"]
 EphemerisMode = Literal["moshier", "swiss"]
+# How Sun/Moon longitudes are evaluated: one pyswisseph call per instant, or
+# Chebyshev interpolation over fitted windows (see calendar/ephemeris/chebyshev.py).
+PositionBackend = Literal["direct", "chebyshev"]
 
 _AYANAMSA_MAP: dict[Ayanamsa, int] = {
     "lahiri": swe.SIDM_LAHIRI,
@@ -28,6 +32,7 @@ class EphemerisConfig:
     ayanamsa: Ayanamsa = "lahiri"
     coordinate_system: CoordinateSystem = "sidereal"
     ephemeris_mode: EphemerisMode = "moshier"
+    position_backend: PositionBackend = "direct"
 
     @property
     def ayanamsa_code(self) -> int:
@@ -35,10 +40,18 @@ class EphemerisConfig:
 
     @property
     def header_value(self) -> str:
-        return f"{self.ephemeris_mode}-{self.ayanamsa}-{self.coordinate_system}"
+        value = f"{self.ephemeris_mode}-{self.ayanamsa}-{self.coordinate_system}"
+        if self.position_backend != "direct":
+            value = f"{value}+{self.position_backend}"
+        return value
 
 
-_ACTIVE_CONFIG = EphemerisConfig()
+def _position_backend_from_env() -> PositionBackend:
+    value = os.getenv("PARVA_EPHEMERIS_BACKEND", "direct").strip().lower()
+    return "chebyshev" if value == "chebyshev" else "direct"
+
+
+_ACTIVE_CONFIG = EphemerisConfig(position_backend=_position_backend_from_env())
 
 
 def get_ephemeris_config() -> EphemerisConfig:
@@ -50,6 +63,9 @@ def set_ephemeris_config(config: EphemerisConfig) -> EphemerisConfig:
     """Set active ephemeris configuration and return the new value."""
     global _ACTIVE_CONFIG
     _ACTIVE_CONFIG = config
-    # Keep Swiss Ephemeris in sync for sidereal calculations.
-    swe.set_sid_mode(config.ayanamsa_code)
+    # Default for direct pyswisseph callers; app calculations apply the
+    # configured ayanamsa per call under the ephemeris session lock.
+    from app.calendar.ephemeris.session import set_default_sidereal_mode
+
+    set_default_sidereal_mode(config.ayanamsa_code)
     return _ACTIVE_CONFIG
@@ -8,16 +8,26 @@ Handles loading, caching, and querying festival data from JSON files.
 from __future__ import annotations
 
 import json
+import sys
 from datetime import date
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import pydantic
+
 from ..calendar import (
     get_bs_month_name,
     gregorian_to_bs,
 )
 from ..calendar.overrides import get_festival_override_info
+from ..core.compiled_snapshot import (
+    load_snapshot,
+    snapshot_path,
+    source_fingerprint,
+    write_snapshot,
+)
 from ..rules import get_rule_service
+from . import models, validation
 from .models import (
     AuthorityCandidate,
     Festival,
@@ -48,6 +58,31 @@ def _calibration_status(method: str) -> str:
 
 # Path to festival data files
 DATA_DIR = Path(__file__).parent.parent.parent.parent / "data" / "festivals"
+FESTIVAL_SNAPSHOT_KIND = "festivals"
+
+
+def _read_festival_catalog(festivals_file: Path) -> Dict[str, Festival]:
+    with open(festivals_file, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    festival_rows = data.get("festivals", [])
+    errors = validate_festival_catalog_rows(festival_rows)
+    if errors:
+        raise ValueError("; ".join(errors))
+
+    festivals: Dict[str, Festival] = {}
+    for festival_data in festival_rows:
+        festival = Festival(**festival_data)
+        festivals[festival.id] = festival
+    return festivals
+
+
+def _festival_catalog_fingerprint(festivals_file: Path) -> str:
+    runtime = (f"python-{sys.version_info.major}.{sys.version_info.minor}", pydantic.VERSION)
+    return source_fingerprint(
+        [festivals_file, Path(models.__file__), Path(validation.__file__)],
+        extra=runtime,
+    )
 
 
 def _to_bs_struct(g_date: date) -> dict:
@@ -163,20 +198,22 @@ class FestivalRepository:
                 return
             raise FileNotFoundError(f"Festival catalog missing: {festivals_file}")
 
-        try:
-            with open(festivals_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            festival_rows = data.get("festivals", [])
-            errors = validate_festival_catalog_rows(festival_rows)
-            if errors:
-                raise ValueError("; ".join(errors))
-
-            for festival_data in festival_rows:
-                festival = Festival(**festival_data)
-                self._festivals[festival.id] = festival
+        # Validated rows are reused from a compiled snapshot while the file is unchanged.
+        snapshot = snapshot_path(FESTIVAL_SNAPSHOT_KIND, festivals_file)
+        fingerprint = ""
+        if snapshot is not None:
+            fingerprint = _festival_catalog_fingerprint(festivals_file)
+            compiled = load_snapshot(snapshot, FESTIVAL_SNAPSHOT_KIND, fingerprint)
+            if isinstance(compiled, dict):
+                self._festivals = compiled
+                self._loaded = True
+                return
 
+        try:
+            self._festivals.update(_read_festival_catalog(festivals_file))
             self._loaded = True
+            if snapshot is not None:
+                write_snapshot(snapshot, FESTIVAL_SNAPSHOT_KIND, fingerprint, self._festivals)
         except (json.JSONDecodeError, FileNotFoundError, ValueError):
             if self.allow_builtin_fallback:
                 self._load_builtin_festivals()
@@ -560,7 +597,7 @@ class FestivalRepository:
         authority_mode: str = "public_default",
     ) -> tuple[Optional[FestivalDates], FestivalDateAvailability]:
         """Get calculated dates plus truthful resolution metadata."""
-        if festival_id not in self._rule_service.list_ids():
+        if not self._rule_service.has_rule(festival_id):
             return None, FestivalDateAvailability(
                 status="missing_rule",
                 note="No computed rule is published for this festival yet, so live dates cannot be resolved.",
@@ -686,6 +723,20 @@ def validate_festival_catalog(data_dir: Optional[Path] = None) -> dict[str, Any]
     }
 
 
+def compile_festival_snapshot(data_dir: Optional[Path] = None) -> Optional[Path]:
+    """Validate ``festivals.json`` and write its compiled snapshot."""
+    data_dir = data_dir or DATA_DIR
+    festivals_file = data_dir / "festivals.json"
+    snapshot = snapshot_path(FESTIVAL_SNAPSHOT_KIND, festivals_file)
+    if snapshot is None:
+        return None
+    festivals = _read_festival_catalog(festivals_file)
+    fingerprint = _festival_catalog_fingerprint(festivals_file)
+    if not write_snapshot(snapshot, FESTIVAL_SNAPSHOT_KIND, fingerprint, festivals):
+        return None
+    return snapshot
+
+
 def get_repository() -> FestivalRepository:
     """Get or create the global repository instance."""
     global _repository
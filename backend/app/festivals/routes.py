@@ -13,6 +13,7 @@ from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Query
 
 from ..calendar.overrides import get_festival_override_info
+from ..infrastructure.compute_executor import run_compute
 from ..rules import get_rule_service
 from ..rules.catalog_v4 import (
     get_rule_v4,
@@ -51,6 +52,7 @@ from .use_cases import (
 
 router = APIRouter(prefix="/api/festivals", tags=["festivals"])
 rule_service = get_rule_service()
+COMPUTE_LANE = "festivals"
 
 @router.get("", response_model=FestivalListResponse)
 async def list_festivals(
@@ -110,7 +112,7 @@ async def get_dispute_atlas(
     limit: int = Query(18, ge=1, le=100, description="Maximum number of dispute/risk rows"),
 ):
     """Return authority conflicts and risk-ranked festival-year rows for truth/dispute surfaces."""
-    return dispute_atlas_payload(year=year, limit=limit)
+    return await run_compute(COMPUTE_LANE, dispute_atlas_payload, year=year, limit=limit)
 
 
 @router.get("/upcoming", response_model=UpcomingFestivalsResponse)
@@ -125,7 +127,9 @@ async def get_upcoming(
 
     Returns festivals sorted by start date.
     """
-    return upcoming_festivals_payload(
+    return await run_compute(
+        COMPUTE_LANE,
+        upcoming_festivals_payload,
         days=days,
         from_date=from_date,
         quality_band=quality_band,
@@ -143,7 +147,9 @@ async def festivals_on_date(
 
     Includes multi-day festivals that overlap with this date.
     """
-    return festivals_on_date_payload(target_date=target_date, profile=profile)
+    return await run_compute(
+        COMPUTE_LANE, festivals_on_date_payload, target_date=target_date, profile=profile
+    )
 
 
 @router.get("/calendar/{year}/{month}", response_model=FestivalCalendarResponse)
@@ -157,7 +163,9 @@ async def get_calendar_month(
 
     Returns each day of the month with any festivals on that day.
     """
-    return calendar_month_payload(year=year, month=month, profile=profile)
+    return await run_compute(
+        COMPUTE_LANE, calendar_month_payload, year=year, month=month, profile=profile
+    )
 
 
 @router.get("/{festival_id}", response_model=FestivalDetailResponse)
@@ -177,7 +185,9 @@ async def get_festival(
     Includes full content (mythology, rituals) and calculated dates.
     """
     authority_mode = validate_authority_mode(authority_mode)
-    return festival_detail_payload(
+    return await run_compute(
+        COMPUTE_LANE,
+        festival_detail_payload,
         festival_id=festival_id,
         year=year,
         profile=profile,
@@ -200,8 +210,27 @@ async def explain_festival_date(
     """
     Explain why a festival resolves to a specific date in the selected year.
     """
-    repo = get_repository()
     authority_mode = validate_authority_mode(authority_mode)
+    return await run_compute(
+        COMPUTE_LANE,
+        _explain_festival_date,
+        festival_id,
+        year=year,
+        profile=profile,
+        authority_mode=authority_mode,
+        risk_mode=risk_mode,
+    )
+
+
+def _explain_festival_date(
+    festival_id: str,
+    *,
+    year: Optional[int],
+    profile: Optional[str],
+    authority_mode: str,
+    risk_mode: str,
+) -> FestivalExplainResponse:
+    repo = get_repository()
     festival = repo.get_by_id(festival_id)
     if not festival:
         raise HTTPException(status_code=404, detail=f"Festival '{festival_id}' not found")
@@ -240,8 +269,25 @@ async def get_festival_proof_capsule(
     risk_mode: str = Query("strict", description="standard|strict"),
 ):
     """Return a portable proof capsule for one festival-year resolution."""
-    repo = get_repository()
     authority_mode = validate_authority_mode(authority_mode)
+    return await run_compute(
+        COMPUTE_LANE,
+        _festival_proof_capsule,
+        festival_id,
+        year=year,
+        authority_mode=authority_mode,
+        risk_mode=risk_mode,
+    )
+
+
+def _festival_proof_capsule(
+    festival_id: str,
+    *,
+    year: int,
+    authority_mode: str,
+    risk_mode: str,
+) -> FestivalProofCapsuleResponse:
+    repo = get_repository()
     festival = repo.get_by_id(festival_id)
     if not festival:
         raise HTTPException(status_code=404, detail=f"Festival '{festival_id}' not found")
@@ -320,6 +366,23 @@ async def get_festival_dates(
 
     Useful for planning and historical reference.
     """
+    return await run_compute(
+        COMPUTE_LANE,
+        _festival_dates,
+        festival_id,
+        years=years,
+        start_year=start_year,
+        profile=profile,
+    )
+
+
+def _festival_dates(
+    festival_id: str,
+    *,
+    years: int,
+    start_year: Optional[int],
+    profile: Optional[str],
+) -> List[FestivalDates]:
     repo = get_repository()
 
     festival = repo.get_by_id(festival_id)
@@ -359,7 +422,7 @@ async def get_festival_variants(
     if not festival:
         raise HTTPException(status_code=404, detail=f"Festival '{festival_id}' not found")
 
-    variants = calculate_with_variants(festival_id, year)
+    variants = await run_compute(COMPUTE_LANE, calculate_with_variants, festival_id, year)
     variants = filter_variants_by_profile(variants, profile)
     if not variants:
         raise HTTPException(
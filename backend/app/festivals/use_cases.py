@@ -7,7 +7,12 @@ from typing import Optional
 
 from fastapi import HTTPException
 
-from ..calendar import calculate_tithi, get_bs_month_name, gregorian_to_bs
+from ..calendar import (
+    calculate_tithi,
+    get_bs_month_name,
+    gregorian_to_bs,
+    gregorian_to_bs_many,
+)
 from ..calendar.overrides import get_festival_override_info
 from ..core.request_context import derive_support_tier
 from ..rules import get_rule_service
@@ -374,6 +379,12 @@ def calendar_month_payload(*, year: int, month: int, profile: Optional[str]) ->
                 )
                 cursor += timedelta(days=1)
 
+    month_days = [first_day + timedelta(days=offset) for offset in range(last_day.day)]
+    try:
+        bs_dates = dict(zip(month_days, gregorian_to_bs_many(month_days).to_tuples()))
+    except ValueError:
+        bs_dates = {}
+
     days = []
     current = first_day
     while current <= last_day:
@@ -388,7 +399,7 @@ def calendar_month_payload(*, year: int, month: int, profile: Optional[str]) ->
             tithi_info = calculate_tithi(current)
             tithi = tithi_info.get("display_number")
             paksha = tithi_info.get("paksha")
-            _bs_year, bs_month, bs_day = gregorian_to_bs(current)
+            _bs_year, bs_month, bs_day = bs_dates.get(current) or gregorian_to_bs(current)
             bs_str = f"{bs_day} {get_bs_month_name(bs_month)}"
         except (ValueError, TypeError):
             tithi = None
@@ -0,0 +1,232 @@
+"""Bounded worker pool for CPU-bound ephemeris work called from async routes.
+
+Route handlers are ``async def`` but most of them end up in blocking pyswisseph
+code. ``run_compute`` moves that work onto a shared thread or process pool so a
+slow panchanga/kundali request no longer stalls the event loop for every other
+client. Admission is bounded twice: per lane (roughly one lane per route family)
+and globally. When either bound is hit the call is shed with
+``ComputeSaturatedError`` instead of queueing without limit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import os
+import pickle
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Callable, Mapping, Optional, TypeVar
+
+from app.reliability.metrics import MetricsRegistry, get_metrics_registry
+
+T = TypeVar("T")
+
+COMPUTE_EXECUTOR_MODES = frozenset({"thread", "process"})
+DEFAULT_LANE = "default"
+
+
+class ComputeSaturatedError(RuntimeError):
+    """Raised when the compute pool refuses new work because a queue bound was hit."""
+
+    def __init__(self, lane: str, *, reason: str, retry_after: int = 1) -> None:
+        super().__init__(f"Compute lane '{lane}' saturated ({reason})")
+        self.lane = lane
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class ComputeExecutorConfig:
+    mode: str = "thread"
+    max_workers: int = field(default_factory=lambda: min(4, os.cpu_count() or 1))
+    queue_limit: int = 64
+    lane_limit: int = 16
+    lane_limits: Mapping[str, int] = field(default_factory=dict)
+
+    def limit_for(self, lane: str) -> int:
+        return max(1, int(self.lane_limits.get(lane, self.lane_limit)))
+
+
+class _RemoteException:
+    """Pickle-safe carrier for exceptions raised inside worker processes.
+
+    Framework exceptions (for example ``HTTPException``) do not round-trip through
+    pickle because their ``__init__`` takes keyword-only state. Rebuilding from the
+    class and instance ``__dict__`` keeps status codes and details intact.
+    """
+
+    def __init__(self, exc: BaseException) -> None:
+        self.exc_type = type(exc)
+        self.args = exc.args
+        self.state = dict(vars(exc))
+
+    def rebuild(self) -> BaseException:
+        exc = self.exc_type.__new__(self.exc_type)
+        exc.args = self.args
+        exc.__dict__.update(self.state)
+        return exc
+
+
+def _invoke_in_worker(fn: Callable[..., T], args: tuple, kwargs: dict[str, Any]) -> Any:
+    try:
+        return fn(*args, **kwargs)
+    except Exception as exc:
+        try:
+            carrier = _RemoteException(exc)
+            pickle.dumps(carrier)
+        except Exception:
+            return _RemoteException(RuntimeError(f"{type(exc).__name__}: {exc}"))
+        return carrier
+
+
+class ComputeExecutor:
+    """Shared executor with per-lane and global admission control."""
+
+    def __init__(
+        self,
+        config: ComputeExecutorConfig | None = None,
+        *,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        self.config = config or ComputeExecutorConfig()
+        if self.config.mode not in COMPUTE_EXECUTOR_MODES:
+            raise ValueError(
+                f"Compute executor mode must be one of: {', '.join(sorted(COMPUTE_EXECUTOR_MODES))}."
+            )
+        self._metrics = metrics or get_metrics_registry()
+        self._lock = Lock()
+        self._executor: Executor | None = None
+        self._in_flight: dict[str, int] = {}
+        self._total_in_flight = 0
+
+    @property
+    def mode(self) -> str:
+        return self.config.mode
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.config.mode == "process":
+                    self._executor = ProcessPoolExecutor(max_workers=self.config.max_workers)
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.config.max_workers,
+                        thread_name_prefix="parva-compute",
+                    )
+            return self._executor
+
+    def _queue_depth_locked(self) -> int:
+        return max(0, self._total_in_flight - self.config.max_workers)
+
+    def _admit(self, lane: str) -> None:
+        with self._lock:
+            lane_in_flight = self._in_flight.get(lane, 0)
+            if lane_in_flight >= self.config.limit_for(lane):
+                reason = "lane_limit"
+            elif self._total_in_flight >= self.config.queue_limit:
+                reason = "queue_limit"
+            else:
+                reason = None
+                self._in_flight[lane] = lane_in_flight + 1
+                self._total_in_flight += 1
+            in_flight = self._in_flight.get(lane, 0)
+            queue_depth = self._queue_depth_locked()
+
+        self._metrics.record_compute_admission(
+            lane,
+            accepted=reason is None,
+            in_flight=in_flight,
+            queue_depth=queue_depth,
+        )
+        if reason is not None:
+            raise ComputeSaturatedError(lane, reason=reason)
+
+    def _release(self, lane: str) -> None:
+        with self._lock:
+            self._in_flight[lane] = max(0, self._in_flight.get(lane, 0) - 1)
+            self._total_in_flight = max(0, self._total_in_flight - 1)
+            in_flight = self._in_flight[lane]
+            queue_depth = self._queue_depth_locked()
+        self._metrics.record_compute_depth(lane, in_flight=in_flight, queue_depth=queue_depth)
+
+    def _submit(self, lane: str, fn: Callable[..., Any], *args: Any) -> Future:
+        """Submit admitted work; the lane slot is held until the work itself finishes.
+
+        The slot is released from the future's done-callback rather than by the
+        awaiting coroutine: a cancelled request (client disconnect) stops
+        waiting, but a task already running keeps its worker busy and must keep
+        counting against the lane and queue limits.
+        """
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BaseException:
+            self._release(lane)
+            raise
+        future.add_done_callback(lambda _future: self._release(lane))
+        return future
+
+    async def run(self, lane: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        self._admit(lane)
+        if self.config.mode == "process":
+            future = self._submit(lane, _invoke_in_worker, fn, args, kwargs)
+            result = await asyncio.wrap_future(future)
+            if isinstance(result, _RemoteException):
+                raise result.rebuild()
+            return result
+
+        # Thread workers run inside a copy of the caller's context so request
+        # scoped contextvars stay visible to the computation.
+        context = contextvars.copy_context()
+        call = functools.partial(context.run, fn, *args, **kwargs)
+        return await asyncio.wrap_future(self._submit(lane, call))
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "mode": self.config.mode,
+                "max_workers": self.config.max_workers,
+                "queue_limit": self.config.queue_limit,
+                "in_flight": self._total_in_flight,
+                "queue_depth": self._queue_depth_locked(),
+                "lanes": {
+                    lane: {"in_flight": count, "limit": self.config.limit_for(lane)}
+                    for lane, count in sorted(self._in_flight.items())
+                },
+            }
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+_executor: Optional[ComputeExecutor] = None
+_executor_lock = Lock()
+
+
+def configure_compute_executor(config: ComputeExecutorConfig) -> ComputeExecutor:
+    """Install the process-wide compute executor, replacing any previous one."""
+    global _executor
+    replacement = ComputeExecutor(config)
+    with _executor_lock:
+        previous, _executor = _executor, replacement
+    if previous is not None:
+        previous.shutdown(wait=False)
+    return replacement
+
+
+def get_compute_executor() -> ComputeExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ComputeExecutor()
+        return _executor
+
+
+async def run_compute(lane: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run ``fn`` on the shared compute pool under the given admission lane."""
+    return await get_compute_executor().run(lane, fn, *args, **kwargs)
@@ -0,0 +1,56 @@
+"""Static interval index over date ranges (festival occurrences)."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Callable, Generic, Iterable, TypeVar
+
+T = TypeVar("T")
+
+
+class DateIntervalIndex(Generic[T]):
+    """Items with inclusive ``[start, end]`` dates, queryable by overlap.
+
+    Items are sorted by start ordinal. ``_max_end[i]`` is the largest end among
+    the first ``i + 1`` items; because it never decreases, a bisect on it finds
+    the first item that could still be running at the query start. An overlap
+    query is therefore two bisects plus a scan of the candidates between them,
+    O(log n + k) for the short, rarely-nested ranges festivals have.
+    """
+
+    __slots__ = ("_items", "_starts", "_ends", "_max_end")
+
+    def __init__(
+        self,
+        items: Iterable[T],
+        *,
+        start: Callable[[T], date],
+        end: Callable[[T], date],
+    ) -> None:
+        keyed = sorted(
+            ((start(item).toordinal(), end(item).toordinal(), item) for item in items),
+            key=lambda entry: entry[0],
+        )
+        self._items: list[T] = [item for _, _, item in keyed]
+        self._starts: list[int] = [entry[0] for entry in keyed]
+        self._ends: list[int] = [entry[1] for entry in keyed]
+        self._max_end: list[int] = []
+        running = None
+        for value in self._ends:
+            running = value if running is None or value > running else running
+            self._max_end.append(running)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def overlapping(self, start: date, end: date) -> list[T]:
+        """Items whose range intersects ``[start, end]``, ordered by start date."""
+        lo_ordinal, hi_ordinal = start.toordinal(), end.toordinal()
+        lo = bisect_left(self._max_end, lo_ordinal)
+        hi = bisect_right(self._starts, hi_ordinal)
+        ends = self._ends
+        return [self._items[i] for i in range(lo, hi) if ends[i] >= lo_ordinal]
+
+    def covering(self, target: date) -> list[T]:
+        return self.overlapping(target, target)
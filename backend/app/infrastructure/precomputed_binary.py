@@ -0,0 +1,224 @@
+"""Memory-mapped binary container for precomputed yearly artifacts.
+
+A ``*.bin`` file sits next to its JSON source (``panchanga_2026.json`` ->
+``panchanga_2026.bin``) and holds the same rows, but laid out so a reader can
+``mmap`` the file and decode one row without parsing the rest of the year::
+
+    header   magic, version, kind, year, first_ordinal, record_count,
+             meta_length, sha256 of everything after the header
+    meta     compact JSON: top-level fields of the source payload plus the
+             size/mtime of the JSON it was converted from
+    table    record_count fixed-width (offset, length) pairs
+    data     one compact JSON document per record
+
+Panchanga records are indexed by ``date.toordinal() - first_ordinal`` (one slot
+per day of the year, empty slots have length 0). Festival records are the
+rows of the ``festivals`` list in order.
+
+The checksum is verified once when a file is opened; after that every lookup
+is a table read plus ``json.loads`` of a single row.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+from datetime import date
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+BINARY_MAGIC = b"PRVB"
+BINARY_VERSION = 1
+BINARY_SUFFIX = ".bin"
+
+KIND_PANCHANGA = 1
+KIND_FESTIVALS = 2
+_KIND_NAMES = {KIND_PANCHANGA: "panchanga", KIND_FESTIVALS: "festivals"}
+_ROW_FIELDS = {KIND_PANCHANGA: "dates", KIND_FESTIVALS: "festivals"}
+
+_HEADER = struct.Struct("<4sHHiiII32s")
+_SLOT = struct.Struct("<II")
+
+
+class BinaryArtifactError(ValueError):
+    """Raised when a binary artifact is truncated, mislabelled or fails its checksum."""
+
+
+def binary_path_for(json_path: Path) -> Path:
+    return json_path.with_suffix(BINARY_SUFFIX)
+
+
+def _encode(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def write_binary_artifact(
+    path: Path,
+    *,
+    kind: int,
+    year: int,
+    first_ordinal: int,
+    records: Iterable[Optional[bytes]],
+    meta: dict[str, Any],
+) -> Path:
+    """Write a container atomically. ``None`` records become empty slots."""
+    if kind not in _KIND_NAMES:
+        raise ValueError(f"Unknown binary artifact kind: {kind}")
+
+    meta_bytes = _encode(meta)
+    slots = bytearray()
+    data = bytearray()
+    count = 0
+    for record in records:
+        if record:
+            slots += _SLOT.pack(len(data), len(record))
+            data += record
+        else:
+            slots += _SLOT.pack(0, 0)
+        count += 1
+
+    body = meta_bytes + bytes(slots) + bytes(data)
+    header = _HEADER.pack(
+        BINARY_MAGIC,
+        BINARY_VERSION,
+        kind,
+        year,
+        first_ordinal,
+        count,
+        len(meta_bytes),
+        hashlib.sha256(body).digest(),
+    )
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as handle:
+        handle.write(header)
+        handle.write(body)
+    os.replace(tmp_path, path)
+    return path
+
+
+def convert_json_artifact(json_path: Path, out_path: Optional[Path] = None) -> Path:
+    """Convert a ``panchanga_*.json`` or ``festivals_*.json`` artifact to binary."""
+    stat = json_path.stat()
+    payload = json.loads(json_path.read_text(encoding="utf-8"))
+    if json_path.name.startswith("panchanga_"):
+        kind = KIND_PANCHANGA
+    elif json_path.name.startswith("festivals_"):
+        kind = KIND_FESTIVALS
+    else:
+        raise ValueError(f"Not a precomputed yearly artifact: {json_path.name}")
+
+    year = int(payload.get("year") or json_path.stem.rsplit("_", 1)[-1])
+    row_field = _ROW_FIELDS[kind]
+    meta = {key: value for key, value in payload.items() if key != row_field}
+    meta["source"] = {"name": json_path.name, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    if kind == KIND_PANCHANGA:
+        first_ordinal = date(year, 1, 1).toordinal()
+        day_count = date(year + 1, 1, 1).toordinal() - first_ordinal
+        rows = payload.get(row_field, {})
+        records: list[Optional[bytes]] = [None] * day_count
+        for iso, row in rows.items():
+            slot = date.fromisoformat(iso).toordinal() - first_ordinal
+            if not 0 <= slot < day_count:
+                raise ValueError(f"{json_path.name}: {iso} is outside {year}")
+            records[slot] = _encode(row)
+    else:
+        first_ordinal = 0
+        records = [_encode(row) for row in payload.get(row_field, [])]
+
+    return write_binary_artifact(
+        out_path or binary_path_for(json_path),
+        kind=kind,
+        year=year,
+        first_ordinal=first_ordinal,
+        records=records,
+        meta=meta,
+    )
+
+
+class BinaryArtifact:
+    """Read-only view over one mapped container."""
+
+    def __init__(self, path: Path, *, verify: bool = True) -> None:
+        self.path = path
+        with open(path, "rb") as handle:
+            try:
+                self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as exc:  # empty file
+                raise BinaryArtifactError(f"Empty binary artifact: {path.name}") from exc
+        self._view = memoryview(self._map)
+
+        if len(self._map) < _HEADER.size:
+            raise BinaryArtifactError(f"Truncated binary artifact: {path.name}")
+        (
+            magic,
+            version,
+            self.kind,
+            self.year,
+            self.first_ordinal,
+            self.record_count,
+            meta_length,
+            checksum,
+        ) = _HEADER.unpack_from(self._map, 0)
+        if magic != BINARY_MAGIC or version != BINARY_VERSION:
+            raise BinaryArtifactError(f"Unsupported binary artifact format: {path.name}")
+        if self.kind not in _KIND_NAMES:
+            raise BinaryArtifactError(f"Unknown binary artifact kind in {path.name}")
+
+        self._table_offset = _HEADER.size + meta_length
+        self._data_offset = self._table_offset + self.record_count * _SLOT.size
+        if self._data_offset > len(self._map):
+            raise BinaryArtifactError(f"Truncated binary artifact: {path.name}")
+        if verify and hashlib.sha256(self._view[_HEADER.size :]).digest() != checksum:
+            raise BinaryArtifactError(f"Checksum mismatch in binary artifact: {path.name}")
+
+        self.meta: dict[str, Any] = json.loads(bytes(self._view[_HEADER.size : self._table_offset]))
+
+    @property
+    def kind_name(self) -> str:
+        return _KIND_NAMES[self.kind]
+
+    def is_current_for(self, json_path: Path) -> bool:
+        """True unless ``json_path`` exists and differs from the file converted."""
+        try:
+            stat = json_path.stat()
+        except OSError:
+            return True
+        source = self.meta.get("source") or {}
+        return source.get("size") == stat.st_size and source.get("mtime_ns") == stat.st_mtime_ns
+
+    def record(self, index: int) -> Optional[Any]:
+        if not 0 <= index < self.record_count:
+            return None
+        offset, length = _SLOT.unpack_from(self._map, self._table_offset + index * _SLOT.size)
+        if not length:
+            return None
+        start = self._data_offset + offset
+        return json.loads(bytes(self._view[start : start + length]))
+
+    def record_for_date(self, target_date: date) -> Optional[Any]:
+        return self.record(target_date.toordinal() - self.first_ordinal)
+
+    def records(self) -> Iterator[Any]:
+        for index in range(self.record_count):
+            row = self.record(index)
+            if row is not None:
+                yield row
+
+    def to_payload(self) -> dict[str, Any]:
+        """Rebuild the JSON-shaped payload the artifact was converted from."""
+        payload = {key: value for key, value in self.meta.items() if key != "source"}
+        if self.kind == KIND_PANCHANGA:
+            payload["dates"] = {
+                date.fromordinal(self.first_ordinal + index).isoformat(): row
+                for index in range(self.record_count)
+                if (row := self.record(index)) is not None
+            }
+        else:
+            payload["festivals"] = list(self.records())
+        return payload
@@ -3,15 +3,27 @@
 from __future__ import annotations
 
 import json
+import logging
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, datetime, timezone
 from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Optional
 
+from app.core.json_codec import default_json_encoder_name, get_json_encoder
+from app.infrastructure.interval_index import DateIntervalIndex
+from app.infrastructure.precomputed_binary import (
+    BINARY_SUFFIX,
+    BinaryArtifact,
+    BinaryArtifactError,
+    binary_path_for,
+)
 from app.reliability.metrics import MetricsRegistry
 
+logger = logging.getLogger(__name__)
+
 
 class PrecomputedArtifactCorruptionError(RuntimeError):
     """Raised when a precomputed artifact exists but cannot be parsed safely."""
@@ -33,13 +45,136 @@ def _load_json_blob_cached(path_str: str, mtime_ns: int) -> dict[str, Any]:
         ) from exc
 
 
+@lru_cache(maxsize=32)
+def _open_binary_cached(path_str: str, mtime_ns: int) -> BinaryArtifact:
+    del mtime_ns
+    return BinaryArtifact(Path(path_str))
+
+
+@lru_cache(maxsize=2048)
+def _load_binary_row_cached(path_str: str, mtime_ns: int, target_date: date) -> Any:
+    return _open_binary_cached(path_str, mtime_ns).record_for_date(target_date)
+
+
+@lru_cache(maxsize=32)
+def _load_binary_payload_cached(path_str: str, mtime_ns: int) -> dict[str, Any]:
+    return _open_binary_cached(path_str, mtime_ns).to_payload()
+
+
+def _load_artifact_cached(path_str: str, mtime_ns: int) -> dict[str, Any]:
+    if path_str.endswith(BINARY_SUFFIX):
+        return _load_binary_payload_cached(path_str, mtime_ns)
+    return _load_json_blob_cached(path_str, mtime_ns)
+
+
+def _panchanga_row(path_str: str, mtime_ns: int, target_date: date) -> Optional[dict[str, Any]]:
+    if path_str.endswith(BINARY_SUFFIX):
+        return _load_binary_row_cached(path_str, mtime_ns, target_date)
+    payload = _load_json_blob_cached(path_str, mtime_ns)
+    return payload.get("dates", {}).get(target_date.isoformat()) if payload else None
+
+
+# Pre-encoded response bodies. Artifacts are immutable for a given (path,
+# mtime), so each row or year is encoded once per encoder and served as bytes
+# afterwards.
+@lru_cache(maxsize=2048)
+def _encoded_panchanga_row_cached(
+    path_str: str, mtime_ns: int, target_date: date, encoder: str
+) -> Optional[bytes]:
+    row = _panchanga_row(path_str, mtime_ns, target_date)
+    return get_json_encoder(encoder)(row) if row else None
+
+
+@lru_cache(maxsize=32)
+def _encoded_artifact_cached(path_str: str, mtime_ns: int, encoder: str) -> Optional[bytes]:
+    payload = _load_artifact_cached(path_str, mtime_ns)
+    return get_json_encoder(encoder)(payload) if payload else None
+
+
+@lru_cache(maxsize=32)
+def _festival_index_cached(
+    path_str: str, mtime_ns: int, year: int
+) -> Optional[DateIntervalIndex[dict[str, Any]]]:
+    """Interval index over one festival year, rebuilt whenever the artifact changes."""
+    payload = _load_artifact_cached(path_str, mtime_ns)
+    festivals = payload.get("festivals") if isinstance(payload, dict) else None
+    if not isinstance(festivals, list):
+        return None
+
+    rows: list[dict[str, Any]] = []
+    for row in festivals:
+        try:
+            festival_start = date.fromisoformat(str(row["start"]))
+            festival_end = date.fromisoformat(str(row["end"]))
+            festival_id = row["festival_id"]
+        except (KeyError, TypeError, ValueError):
+            continue
+        rows.append(
+            {
+                "festival_id": festival_id,
+                "start_date": festival_start,
+                "end_date": festival_end,
+                "year": year,
+                "method": row.get("method", "precomputed"),
+                "lunar_month": row.get("lunar_month"),
+                "is_adhik_year": bool(row.get("is_adhik_year", False)),
+            }
+        )
+    return DateIntervalIndex(rows, start=itemgetter("start_date"), end=itemgetter("end_date"))
+
+
+# (path, mtime_ns) of binaries that failed validation, so a bad file is hashed
+# once rather than on every lookup before falling back to JSON.
+_rejected_binaries: set[tuple[str, int]] = set()
+
+
 @dataclass
 class FilePrecomputedArtifactStore:
     precompute_dir: Path
     metrics: MetricsRegistry
+    use_binary: bool = True
+    # Encoder of pre-encoded bodies: the app-wide default, which the app sets
+    # to its response encoder at start-up.
+    json_encoder: str = field(default_factory=default_json_encoder_name)
 
     def clear(self) -> None:
         _load_json_blob_cached.cache_clear()
+        _open_binary_cached.cache_clear()
+        _load_binary_row_cached.cache_clear()
+        _load_binary_payload_cached.cache_clear()
+        _festival_index_cached.cache_clear()
+        _encoded_panchanga_row_cached.cache_clear()
+        _encoded_artifact_cached.cache_clear()
+        _rejected_binaries.clear()
+
+    def _binary_key(self, json_path: Path) -> Optional[tuple[str, int]]:
+        """Cache key of a valid, up-to-date binary twin of ``json_path`` (or None).
+
+        A binary that is stale relative to its JSON source, or corrupt while the
+        JSON is still present, is skipped so callers fall back to JSON. A corrupt
+        binary with no JSON to fall back to is reported like a corrupt JSON file.
+        """
+        if not self.use_binary:
+            return None
+        path = binary_path_for(json_path)
+        try:
+            key = (str(path), path.stat().st_mtime_ns)
+        except OSError:
+            return None
+        if key in _rejected_binaries:
+            artifact = None
+        else:
+            try:
+                artifact = _open_binary_cached(*key)
+            except (BinaryArtifactError, OSError) as exc:
+                _rejected_binaries.add(key)
+                logger.warning("Ignoring precomputed binary artifact %s: %s", path.name, exc)
+                artifact = None
+        if artifact is None:
+            if json_path.exists():
+                return None
+            raise PrecomputedArtifactCorruptionError(f"Malformed precomputed artifact: {path.name}")
+        return key if artifact.is_current_for(json_path) else None
 
     def _read_json(self, path: Path) -> Optional[dict[str, Any]]:
         if not path.exists():
@@ -50,22 +185,69 @@ class FilePrecomputedArtifactStore:
             return None
         return _load_json_blob_cached(str(path), stat.st_mtime_ns)
 
-    def load_panchanga(self, target_date: date) -> Optional[dict[str, Any]]:
+    def _panchanga_key(self, target_date: date) -> Optional[tuple[str, int]]:
         year_file = self.precompute_dir / f"panchanga_{target_date.year}.json"
-        payload = self._read_json(year_file)
-        if not payload:
-            self.metrics.record_cache_lookup("panchanga", False)
+        binary_key = self._binary_key(year_file)
+        if binary_key is not None:
+            return binary_key
+        if not year_file.exists():
+            return None
+        try:
+            return str(year_file), year_file.stat().st_mtime_ns
+        except OSError:
             return None
-        row = payload.get("dates", {}).get(target_date.isoformat())
+
+    def load_panchanga(self, target_date: date) -> Optional[dict[str, Any]]:
+        key = self._panchanga_key(target_date)
+        row = _panchanga_row(*key, target_date) if key is not None else None
         self.metrics.record_cache_lookup("panchanga", row is not None)
         return row
 
-    def load_festival_year(self, year: int) -> Optional[dict[str, Any]]:
+    def load_panchanga_encoded(self, target_date: date) -> Optional[bytes]:
+        """``load_panchanga`` as ready-to-send JSON bytes."""
+        key = self._panchanga_key(target_date)
+        body = (
+            _encoded_panchanga_row_cached(*key, target_date, self.json_encoder)
+            if key is not None
+            else None
+        )
+        self.metrics.record_cache_lookup("panchanga", body is not None)
+        return body
+
+    def _festival_year_key(self, year: int) -> Optional[tuple[str, int]]:
         path = self.precompute_dir / f"festivals_{year}.json"
-        payload = self._read_json(path)
+        binary_key = self._binary_key(path)
+        if binary_key is not None:
+            return binary_key
+        try:
+            return str(path), path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def load_festival_year(self, year: int) -> Optional[dict[str, Any]]:
+        key = self._festival_year_key(year)
+        payload = _load_artifact_cached(*key) if key is not None else None
         self.metrics.record_cache_lookup("festival_year", payload is not None)
         return payload
 
+    def load_festival_year_encoded(self, year: int) -> Optional[bytes]:
+        """``load_festival_year`` as ready-to-send JSON bytes."""
+        key = self._festival_year_key(year)
+        body = _encoded_artifact_cached(*key, self.json_encoder) if key is not None else None
+        self.metrics.record_cache_lookup("festival_year", body is not None)
+        return body
+
+    def load_festival_year_index(self, year: int) -> Optional[DateIntervalIndex[dict[str, Any]]]:
+        """Normalized rows of one festival year, indexed for overlap queries.
+
+        Rows carry parsed ``start_date``/``end_date`` plus ``year``; the index is
+        shared between callers, so treat the rows as read-only.
+        """
+        key = self._festival_year_key(year)
+        index = _festival_index_cached(*key, year) if key is not None else None
+        self.metrics.record_cache_lookup("festival_year", index is not None)
+        return index
+
     def get_stats(self) -> dict[str, Any]:
         self.precompute_dir.mkdir(parents=True, exist_ok=True)
         files = sorted(self.precompute_dir.glob("*.json"))
@@ -76,10 +258,14 @@ class FilePrecomputedArtifactStore:
         oldest_modified = min(modified_times) if modified_times else None
         panchanga_files = [f for f in files if f.name.startswith("panchanga_")]
         festival_files = [f for f in files if f.name.startswith("festivals_")]
+        binary_files = sorted(self.precompute_dir.glob(f"*{BINARY_SUFFIX}"))
+        binary_names = {f.name for f in binary_files}
         return {
             "directory": str(self.precompute_dir),
             "file_count": len(files),
             "total_bytes": total_bytes,
+            "binary_file_count": len(binary_files),
+            "binary_enabled": self.use_binary,
             "freshness": {
                 "newest_modified": newest_modified,
                 "oldest_modified": oldest_modified,
@@ -90,10 +276,16 @@ class FilePrecomputedArtifactStore:
                 "panchanga": {
                     "file_count": len(panchanga_files),
                     "available": bool(panchanga_files),
+                    "binary_file_count": sum(
+                        binary_path_for(f).name in binary_names for f in panchanga_files
+                    ),
                 },
                 "festivals": {
                     "file_count": len(festival_files),
                     "available": bool(festival_files),
+                    "binary_file_count": sum(
+                        binary_path_for(f).name in binary_names for f in festival_files
+                    ),
                 },
             },
             "files": [
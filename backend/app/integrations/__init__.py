@@ -1,8 +1,23 @@
 """Integration services."""
 
-from .ical import build_ical_feed, collect_feed_events
+from .ical import (
+    build_ical_feed,
+    clear_feed_cache,
+    collect_feed_events,
+    feed_cache_stats,
+    iter_feed_chunks,
+    iter_feed_events,
+    materialize_feed,
+    render_feed,
+)
 
 __all__ = [
     "build_ical_feed",
+    "clear_feed_cache",
     "collect_feed_events",
+    "feed_cache_stats",
+    "iter_feed_chunks",
+    "iter_feed_events",
+    "materialize_feed",
+    "render_feed",
 ]
@@ -1,13 +1,41 @@
-"""iCal feed generation utilities."""
+"""iCal feed generation utilities.
+
+Feeds are assembled from materialized parts so that polling calendar clients
+cost next to nothing:
+
+- each (festival, year, language) is resolved and rendered to its VEVENT
+  block once;
+- each filter set (festival ids or category, year window, language) keeps the
+  sorted events and their concatenated blocks;
+- ``render_feed`` adds the calendar header and a strong ETag derived from
+  the header and the blocks' digest, so a matching ``If-None-Match`` can be
+  answered without building the body.
+
+Both caches are bounded LRUs and are dropped when the festival repository
+instance changes. ``DTSTAMP`` is the time a block was materialized, which
+keeps bodies and ETags stable between requests.
+
+Long spans are streamed instead: ``iter_feed_events`` resolves one year at a
+time, so a streamed feed holds about a year of events however many years it
+covers.
+"""
 
 from __future__ import annotations
 
+import hashlib
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
-from typing import Iterable, Sequence
+from typing import Any, Iterable, Iterator, Optional, Sequence
 
 from app.festivals.repository import get_repository
 
+_MAX_EVENT_BLOCKS = 8192
+_MAX_FEEDS = 128
+# VEVENT blocks joined into one chunk of a streamed feed.
+_STREAM_BATCH = 64
+
 
 @dataclass
 class FeedEvent:
@@ -37,8 +65,12 @@ def _as_yyyymmdd(value: date) -> str:
     return value.strftime("%Y%m%d")
 
 
+def _dtstamp(value: datetime) -> str:
+    return value.strftime("%Y%m%dT%H%M%SZ")
+
+
 def _event_lines(event: FeedEvent, *, now_utc: datetime) -> list[str]:
-    dtstamp = now_utc.strftime("%Y%m%dT%H%M%SZ")
+    dtstamp = _dtstamp(now_utc)
     # All-day events use non-inclusive DTEND.
     dtend = event.end_date + timedelta(days=1)
 
@@ -73,70 +105,282 @@ def _festival_location_name(festival) -> str | None:
     return first.name
 
 
-def collect_feed_events(
+def _feed_language(lang: str) -> str:
+    return "ne" if lang.lower() == "ne" else "en"
+
+
+def _build_event(repo, festival, year: int, lang: str) -> Optional[FeedEvent]:
+    dates = repo.get_dates(festival.id, year)
+    if not dates:
+        return None
+
+    summary = _resolve_language_name(festival, lang)
+    desc = festival.tagline or festival.description
+    if festival.description and festival.description not in desc:
+        desc = f"{desc}\n\n{festival.description}"
+
+    return FeedEvent(
+        uid=f"{festival.id}-{dates.start_date.isoformat()}@projectparva.local",
+        summary=summary,
+        description=desc,
+        start_date=dates.start_date,
+        end_date=dates.end_date,
+        categories=festival.category,
+        location=_festival_location_name(festival),
+        language=lang,
+    )
+
+
+@dataclass(frozen=True)
+class MaterializedFeed:
+    """Sorted events of one filter set with their pre-rendered VEVENT blocks."""
+
+    events: tuple[FeedEvent, ...]
+    body: bytes
+    digest: str
+
+
+_EventKey = tuple[str, int, str]
+_FeedKey = tuple[Optional[tuple[str, ...]], Optional[str], int, int, str]
+
+_event_blocks: "OrderedDict[_EventKey, Optional[tuple[FeedEvent, bytes]]]" = OrderedDict()
+_feeds: "OrderedDict[_FeedKey, MaterializedFeed]" = OrderedDict()
+_lock = threading.Lock()
+_owner: Any = None
+_stats = {"event_hits": 0, "event_builds": 0, "feed_hits": 0, "feed_builds": 0}
+
+
+def _check_owner(repo) -> None:
+    """Drop everything materialized for a previous repository instance (caller holds the lock)."""
+    global _owner
+    if _owner is not repo:
+        _event_blocks.clear()
+        _feeds.clear()
+        _owner = repo
+
+
+def _select_festivals(repo, festival_ids: Sequence[str] | None, category: str | None) -> list:
+    if festival_ids:
+        festivals = [repo.get_by_id(fid) for fid in festival_ids]
+        return [f for f in festivals if f is not None]
+    if category:
+        return repo.get_by_category(category)
+    return repo.get_all()
+
+
+def _entry_order(entry: tuple[FeedEvent, bytes]) -> tuple[date, str]:
+    return entry[0].start_date, entry[0].summary
+
+
+def _event_block(repo, festival, year: int, lang: str) -> Optional[tuple[FeedEvent, bytes]]:
+    key = (festival.id, year, lang)
+    with _lock:
+        _check_owner(repo)
+        if key in _event_blocks:
+            _event_blocks.move_to_end(key)
+            _stats["event_hits"] += 1
+            return _event_blocks[key]
+        _stats["event_builds"] += 1
+
+    event = _build_event(repo, festival, year, lang)
+    entry = None
+    if event is not None:
+        lines = _event_lines(event, now_utc=datetime.now(timezone.utc))
+        entry = (event, ("\r\n".join(lines) + "\r\n").encode("utf-8"))
+    with _lock:
+        _event_blocks[key] = entry
+        while len(_event_blocks) > _MAX_EVENT_BLOCKS:
+            _event_blocks.popitem(last=False)
+    return entry
+
+
+def materialize_feed(
     *,
     festival_ids: Sequence[str] | None = None,
     category: str | None = None,
     years: int = 2,
     start_year: int | None = None,
     lang: str = "en",
-) -> list[FeedEvent]:
-    """Collect event objects for iCal feed generation."""
+) -> MaterializedFeed:
+    """Events and VEVENT blocks for one filter set, built from cached per-year blocks."""
     repo = get_repository()
+    language = _feed_language(lang)
+    begin_year = start_year or date.today().year
+    end_year = begin_year + max(years, 1)
+    ids = tuple(festival_ids) if festival_ids else None
+    key: _FeedKey = (ids, None if ids else category, begin_year, end_year, language)
 
-    if festival_ids:
-        festivals = [repo.get_by_id(fid) for fid in festival_ids]
-        festivals = [f for f in festivals if f is not None]
-    elif category:
-        festivals = repo.get_by_category(category)
-    else:
-        festivals = repo.get_all()
+    with _lock:
+        _check_owner(repo)
+        feed = _feeds.get(key)
+        if feed is not None:
+            _feeds.move_to_end(key)
+            _stats["feed_hits"] += 1
+            return feed
+        _stats["feed_builds"] += 1
 
+    festivals = _select_festivals(repo, ids, category)
+    entries = [
+        entry
+        for festival in festivals
+        for year in range(begin_year, end_year)
+        if (entry := _event_block(repo, festival, year, language)) is not None
+    ]
+    entries.sort(key=_entry_order)
+    # Resolvers can return the previous year's occurrence for a year; keep one copy.
+    unique: dict[str, tuple[FeedEvent, bytes]] = {}
+    for entry in entries:
+        unique.setdefault(entry[0].uid, entry)
+    entries = list(unique.values())
+    body = b"".join(block for _, block in entries)
+    feed = MaterializedFeed(
+        events=tuple(event for event, _ in entries),
+        body=body,
+        digest=hashlib.sha256(body).hexdigest(),
+    )
+    with _lock:
+        _feeds[key] = feed
+        while len(_feeds) > _MAX_FEEDS:
+            _feeds.popitem(last=False)
+    return feed
+
+
+def iter_feed_events(
+    *,
+    festival_ids: Sequence[str] | None = None,
+    category: str | None = None,
+    years: int = 2,
+    start_year: int | None = None,
+    lang: str = "en",
+) -> Iterator[tuple[FeedEvent, bytes]]:
+    """Events and VEVENT blocks of a filter set in date order, one year at a time.
+
+    Occurrences resolved for a year that start after it are held back until
+    the next year is merged in. Only the UIDs of the last two years are kept,
+    to drop occurrences a resolver repeats from the previous year.
+    """
+    repo = get_repository()
+    language = _feed_language(lang)
     begin_year = start_year or date.today().year
     end_year = begin_year + max(years, 1)
+    festivals = _select_festivals(repo, festival_ids, category)
 
-    events: list[FeedEvent] = []
-
-    for festival in festivals:
-        for year in range(begin_year, end_year):
-            dates = repo.get_dates(festival.id, year)
-            if not dates:
+    pending: list[tuple[FeedEvent, bytes]] = []
+    previous_uids: set[str] = set()
+    for year in range(begin_year, end_year):
+        current_uids: set[str] = set()
+        for festival in festivals:
+            entry = _event_block(repo, festival, year, language)
+            if entry is None:
                 continue
-
-            summary = _resolve_language_name(festival, lang)
-            desc = festival.tagline or festival.description
-            if festival.description and festival.description not in desc:
-                desc = f"{desc}\n\n{festival.description}"
-
-            events.append(
-                FeedEvent(
-                    uid=f"{festival.id}-{dates.start_date.isoformat()}@projectparva.local",
-                    summary=summary,
-                    description=desc,
-                    start_date=dates.start_date,
-                    end_date=dates.end_date,
-                    categories=festival.category,
-                    location=_festival_location_name(festival),
-                    language="ne" if lang.lower() == "ne" else "en",
-                )
+            uid = entry[0].uid
+            if uid in previous_uids or uid in current_uids:
+                continue
+            current_uids.add(uid)
+            pending.append(entry)
+        pending.sort(key=_entry_order)
+        if year + 1 < end_year:
+            cutoff = date(year + 1, 1, 1)
+            split = next(
+                (index for index, (event, _) in enumerate(pending) if event.start_date >= cutoff),
+                len(pending),
             )
-
-    events.sort(key=lambda e: (e.start_date, e.summary))
-    return events
+            ready, pending = pending[:split], pending[split:]
+        else:
+            ready, pending = pending, []
+        previous_uids = current_uids
+        yield from ready
 
 
-def build_ical_feed(
+def iter_feed_chunks(
     *,
     calendar_name: str,
-    events: Iterable[FeedEvent],
+    festival_ids: Sequence[str] | None = None,
+    category: str | None = None,
+    years: int = 2,
+    start_year: int | None = None,
+    lang: str = "en",
     description: str = "Project Parva Festival Feed",
     source_url: str | None = None,
     timezone_name: str = "Asia/Kathmandu",
     refresh_interval: str = "PT12H",
-) -> str:
-    """Build iCal (.ics) string from event objects."""
-    now_utc = datetime.now(timezone.utc)
+) -> Iterator[bytes]:
+    """A complete .ics body as byte chunks, for streaming responses."""
+    header_lines = _calendar_header(
+        calendar_name=calendar_name,
+        description=description,
+        source_url=source_url,
+        timezone_name=timezone_name,
+        refresh_interval=refresh_interval,
+    )
+    yield ("\r\n".join(header_lines) + "\r\n").encode("utf-8")
 
+    batch: list[bytes] = []
+    for _event, block in iter_feed_events(
+        festival_ids=festival_ids,
+        category=category,
+        years=years,
+        start_year=start_year,
+        lang=lang,
+    ):
+        batch.append(block)
+        if len(batch) >= _STREAM_BATCH:
+            yield b"".join(batch)
+            batch = []
+    if batch:
+        yield b"".join(batch)
+    yield _CALENDAR_FOOTER
+
+
+def clear_feed_cache() -> None:
+    global _owner
+    with _lock:
+        _event_blocks.clear()
+        _feeds.clear()
+        _owner = None
+        for name in _stats:
+            _stats[name] = 0
+
+
+def feed_cache_stats() -> dict[str, Any]:
+    with _lock:
+        return {
+            "event_blocks": len(_event_blocks),
+            "max_event_blocks": _MAX_EVENT_BLOCKS,
+            "feeds": len(_feeds),
+            "max_feeds": _MAX_FEEDS,
+            **_stats,
+        }
+
+
+def collect_feed_events(
+    *,
+    festival_ids: Sequence[str] | None = None,
+    category: str | None = None,
+    years: int = 2,
+    start_year: int | None = None,
+    lang: str = "en",
+) -> list[FeedEvent]:
+    """Collect event objects for iCal feed generation."""
+    return list(
+        materialize_feed(
+            festival_ids=festival_ids,
+            category=category,
+            years=years,
+            start_year=start_year,
+            lang=lang,
+        ).events
+    )
+
+
+def _calendar_header(
+    *,
+    calendar_name: str,
+    description: str,
+    source_url: str | None,
+    timezone_name: str,
+    refresh_interval: str,
+) -> list[str]:
     lines = [
         "BEGIN:VCALENDAR",
         "VERSION:2.0",
@@ -153,7 +397,65 @@ def build_ical_feed(
     ]
     if source_url:
         lines.append(f"URL:{_escape_ics(source_url)}")
+    return lines
 
+
+_CALENDAR_FOOTER = b"END:VCALENDAR\r\n"
+
+
+@dataclass(frozen=True)
+class RenderedFeed:
+    """Header of a materialized feed plus its strong ETag; ``body()`` assembles the bytes."""
+
+    header: bytes
+    feed: MaterializedFeed
+    etag: str
+
+    def body(self) -> bytes:
+        return b"".join((self.header, self.feed.body, _CALENDAR_FOOTER))
+
+
+def render_feed(
+    feed: MaterializedFeed,
+    *,
+    calendar_name: str,
+    description: str = "Project Parva Festival Feed",
+    source_url: str | None = None,
+    timezone_name: str = "Asia/Kathmandu",
+    refresh_interval: str = "PT12H",
+) -> RenderedFeed:
+    """Calendar wrapper and ETag for ``feed``; the event bytes are shared, not copied."""
+    header_lines = _calendar_header(
+        calendar_name=calendar_name,
+        description=description,
+        source_url=source_url,
+        timezone_name=timezone_name,
+        refresh_interval=refresh_interval,
+    )
+    header = ("\r\n".join(header_lines) + "\r\n").encode("utf-8")
+    etag = hashlib.sha256(header + feed.digest.encode("ascii")).hexdigest()[:32]
+    return RenderedFeed(header=header, feed=feed, etag=f'"{etag}"')
+
+
+def build_ical_feed(
+    *,
+    calendar_name: str,
+    events: Iterable[FeedEvent],
+    description: str = "Project Parva Festival Feed",
+    source_url: str | None = None,
+    timezone_name: str = "Asia/Kathmandu",
+    refresh_interval: str = "PT12H",
+) -> str:
+    """Build iCal (.ics) string from event objects."""
+    now_utc = datetime.now(timezone.utc)
+
+    lines = _calendar_header(
+        calendar_name=calendar_name,
+        description=description,
+        source_url=source_url,
+        timezone_name=timezone_name,
+        refresh_interval=refresh_interval,
+    )
     for event in events:
         lines.extend(_event_lines(event, now_utc=now_utc))
 
@@ -10,7 +10,11 @@ from typing import Any
 
 from app.calendar.lunar_calendar import detect_adhik_maas, lunar_month_boundaries, name_lunar_month
 from app.calendar.sankranti import get_sankrantis_in_year
-from app.calendar.tithi.tithi_udaya import detect_ksheepana, detect_vriddhi, get_udaya_tithi
+from app.calendar.tithi.tithi_udaya import (
+    get_sunrise_tithis,
+    is_ksheepana_pair,
+    is_vriddhi_pair,
+)
 
 PROJECT_ROOT = Path(__file__).resolve().parents[3]
 FIXTURES_DIR = PROJECT_ROOT / "tests" / "fixtures"
@@ -36,7 +40,11 @@ def _evaluate_tithi_boundaries() -> dict[str, Any]:
 
     for row in samples:
         target_date = date.fromisoformat(row["date"])
-        actual = get_udaya_tithi(target_date)
+        # Today and tomorrow at sunrise in one batch; vriddhi/ksheepana are
+        # derived from the same pair instead of being recomputed per check.
+        actual, tomorrow = get_sunrise_tithis(target_date, 2)
+        vriddhi = is_vriddhi_pair(actual, tomorrow)
+        ksheepana = is_ksheepana_pair(actual, tomorrow)
         expected_sunrise = datetime.fromisoformat(row["sunrise_utc"])
         sunrise_delta_seconds = abs((actual["sunrise"] - expected_sunrise).total_seconds())
         expected_delta_hours = float(row.get("delta_hours") or 0.0)
@@ -51,8 +59,8 @@ def _evaluate_tithi_boundaries() -> dict[str, Any]:
         failed = (
             actual["tithi"] != row["tithi"]
             or actual["paksha"] != row["paksha"]
-            or detect_vriddhi(target_date) != row["vriddhi"]
-            or detect_ksheepana(target_date) != row["ksheepana"]
+            or vriddhi != row["vriddhi"]
+            or ksheepana != row["ksheepana"]
             or sunrise_delta_seconds > 60
         )
         if failed:
@@ -64,9 +72,9 @@ def _evaluate_tithi_boundaries() -> dict[str, Any]:
                     "expected_paksha": row["paksha"],
                     "actual_paksha": actual["paksha"],
                     "expected_vriddhi": row["vriddhi"],
-                    "actual_vriddhi": detect_vriddhi(target_date),
+                    "actual_vriddhi": vriddhi,
                     "expected_ksheepana": row["ksheepana"],
-                    "actual_ksheepana": detect_ksheepana(target_date),
+                    "actual_ksheepana": ksheepana,
                     "sunrise_delta_seconds": sunrise_delta_seconds,
                 }
             )
@@ -1,35 +1,155 @@
-"""In-memory request and cache metrics."""
+"""In-memory request and cache metrics.
+
+Request latency is kept as a fixed-bucket histogram per route template (for
+example ``/v3/api/festivals/{festival_id}``), so memory stays bounded no
+matter how many distinct URLs are served and percentiles cover every request
+rather than a recent sample. Each thread records into its own shard without
+taking a lock; shards are merged when a snapshot or scrape asks for them.
+"""
 
 from __future__ import annotations
 
-from collections import Counter, defaultdict, deque
-from statistics import quantiles
+import threading
+from bisect import bisect_left
+from collections import Counter, defaultdict
 from threading import Lock
-from typing import Any, DefaultDict
+from typing import Any, DefaultDict, Mapping, Optional, Sequence
 from typing import Counter as CounterType
 
+# Upper bounds (seconds) of the latency buckets; a final +Inf bucket is implied.
+LATENCY_BUCKETS_SECONDS: tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.0075,
+    0.01,
+    0.015,
+    0.025,
+    0.035,
+    0.05,
+    0.075,
+    0.1,
+    0.15,
+    0.25,
+    0.35,
+    0.5,
+    0.75,
+    1.0,
+    1.5,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class _RouteSeries:
+    __slots__ = ("buckets", "sum_seconds", "requests", "errors")
+
+    def __init__(self) -> None:
+        self.buckets = [0] * (len(LATENCY_BUCKETS_SECONDS) + 1)
+        self.sum_seconds = 0.0
+        self.requests = 0
+        self.errors = 0
+
+    def merge(self, other: "_RouteSeries") -> None:
+        for index, count in enumerate(list(other.buckets)):
+            self.buckets[index] += count
+        self.sum_seconds += other.sum_seconds
+        self.requests += other.requests
+        self.errors += other.errors
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate the ``q`` quantile in milliseconds, as Prometheus' ``histogram_quantile`` does."""
+        total = sum(self.buckets)
+        if total == 0:
+            return None
+        rank = q * total
+        cumulative = 0
+        for index, count in enumerate(self.buckets):
+            if cumulative + count >= rank and count:
+                if index == len(LATENCY_BUCKETS_SECONDS):
+                    return LATENCY_BUCKETS_SECONDS[-1] * 1000.0
+                lower = LATENCY_BUCKETS_SECONDS[index - 1] if index else 0.0
+                upper = LATENCY_BUCKETS_SECONDS[index]
+                return (lower + (upper - lower) * (rank - cumulative) / count) * 1000.0
+            cumulative += count
+        return LATENCY_BUCKETS_SECONDS[-1] * 1000.0
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return None if value is None else round(value, 2)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
 
 class MetricsRegistry:
     def __init__(self) -> None:
         self._lock = Lock()
-        self._requests: CounterType[str] = Counter()
-        self._errors: CounterType[str] = Counter()
+        self._local = threading.local()
+        self._shards: list[dict[str, _RouteSeries]] = []
         self._throttles: CounterType[str] = Counter()
-        self._latencies: DefaultDict[str, deque[float]] = defaultdict(lambda: deque(maxlen=256))
         self._cache_hits: CounterType[str] = Counter()
         self._cache_misses: CounterType[str] = Counter()
         self._degraded_states: CounterType[str] = Counter()
+        self._compute_accepted: CounterType[str] = Counter()
+        self._compute_rejected: CounterType[str] = Counter()
+        self._compute_in_flight: dict[str, int] = {}
+        self._compute_peak_in_flight: dict[str, int] = {}
+        self._compute_queue_depth = 0
+        self._compute_peak_queue_depth = 0
+        self._ephemeris_calls: CounterType[tuple[str, str]] = Counter()
+        self._stage_ms: DefaultDict[tuple[str, str], float] = defaultdict(float)
+        self._stage_spans: CounterType[tuple[str, str]] = Counter()
+
+    def _shard(self) -> dict[str, _RouteSeries]:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = {}
+            with self._lock:
+                self._shards.append(shard)
+        return shard
+
+    def record_request(self, route: str, status_code: int, latency_ms: float) -> None:
+        shard = self._shard()
+        series = shard.get(route)
+        if series is None:
+            series = shard[route] = _RouteSeries()
+        seconds = float(latency_ms) / 1000.0
+        series.buckets[bisect_left(LATENCY_BUCKETS_SECONDS, seconds)] += 1
+        series.sum_seconds += seconds
+        series.requests += 1
+        if status_code >= 400:
+            series.errors += 1
 
-    def record_request(self, path: str, status_code: int, latency_ms: float) -> None:
+    def _merged_routes(self) -> dict[str, _RouteSeries]:
         with self._lock:
-            self._requests[path] += 1
-            if status_code >= 400:
-                self._errors[path] += 1
-            self._latencies[path].append(float(latency_ms))
+            shards = list(self._shards)
+        merged: dict[str, _RouteSeries] = {}
+        for shard in shards:
+            for route, series in list(shard.items()):
+                merged.setdefault(route, _RouteSeries()).merge(series)
+        return merged
 
-    def record_throttle(self, path: str) -> None:
+    def record_request_profile(
+        self,
+        route: str,
+        *,
+        ephemeris_calls: Mapping[str, int],
+        stages: Mapping[str, Sequence[float]],
+    ) -> None:
+        """Fold one request's ephemeris call counts and stage timings into the totals."""
         with self._lock:
-            self._throttles[path] += 1
+            for call, count in ephemeris_calls.items():
+                self._ephemeris_calls[(route, call)] += count
+            for name, (total_ms, spans) in stages.items():
+                self._stage_ms[(route, name)] += total_ms
+                self._stage_spans[(route, name)] += int(spans)
+
+    def record_throttle(self, route: str) -> None:
+        with self._lock:
+            self._throttles[route] += 1
 
     def record_cache_lookup(self, cache_name: str, hit: bool) -> None:
         with self._lock:
@@ -42,23 +162,42 @@ class MetricsRegistry:
         with self._lock:
             self._degraded_states[reason] += 1
 
+    def record_compute_admission(
+        self, lane: str, *, accepted: bool, in_flight: int, queue_depth: int
+    ) -> None:
+        with self._lock:
+            if accepted:
+                self._compute_accepted[lane] += 1
+            else:
+                self._compute_rejected[lane] += 1
+            self._set_compute_depth(lane, in_flight=in_flight, queue_depth=queue_depth)
+
+    def record_compute_depth(self, lane: str, *, in_flight: int, queue_depth: int) -> None:
+        with self._lock:
+            self._set_compute_depth(lane, in_flight=in_flight, queue_depth=queue_depth)
+
+    def _set_compute_depth(self, lane: str, *, in_flight: int, queue_depth: int) -> None:
+        self._compute_in_flight[lane] = in_flight
+        self._compute_peak_in_flight[lane] = max(self._compute_peak_in_flight.get(lane, 0), in_flight)
+        self._compute_queue_depth = queue_depth
+        self._compute_peak_queue_depth = max(self._compute_peak_queue_depth, queue_depth)
+
     def snapshot(self) -> dict[str, Any]:
+        routes = self._merged_routes()
         with self._lock:
             endpoints = []
-            for path, count in sorted(self._requests.items()):
-                latencies = list(self._latencies.get(path, ()))
-                p95 = None
-                if len(latencies) >= 2:
-                    p95 = round(quantiles(latencies, n=20)[-1], 2)
-                elif latencies:
-                    p95 = round(latencies[0], 2)
+            for route, series in sorted(routes.items()):
                 endpoints.append(
                     {
-                        "path": path,
-                        "requests": count,
-                        "errors": self._errors.get(path, 0),
-                        "throttles": self._throttles.get(path, 0),
-                        "p95_latency_ms": p95,
+                        "route": route,
+                        # Former key, kept for existing consumers; same value as ``route``.
+                        "path": route,
+                        "requests": series.requests,
+                        "errors": series.errors,
+                        "throttles": self._throttles.get(route, 0),
+                        "p50_latency_ms": _round(series.quantile(0.5)),
+                        "p95_latency_ms": _round(series.quantile(0.95)),
+                        "p99_latency_ms": _round(series.quantile(0.99)),
                     }
                 )
 
@@ -74,25 +213,85 @@ class MetricsRegistry:
                     "hit_ratio": round(hits / total, 4) if total else None,
                 }
 
+            compute_lanes = sorted(
+                set(self._compute_accepted) | set(self._compute_rejected) | set(self._compute_in_flight)
+            )
+            compute = {
+                "queue_depth": self._compute_queue_depth,
+                "peak_queue_depth": self._compute_peak_queue_depth,
+                "lanes": {
+                    lane: {
+                        "accepted": self._compute_accepted.get(lane, 0),
+                        "rejected": self._compute_rejected.get(lane, 0),
+                        "in_flight": self._compute_in_flight.get(lane, 0),
+                        "peak_in_flight": self._compute_peak_in_flight.get(lane, 0),
+                    }
+                    for lane in compute_lanes
+                },
+            }
+
+            ephemeris_calls: dict[str, dict[str, int]] = {}
+            for (route, call), count in sorted(self._ephemeris_calls.items()):
+                ephemeris_calls.setdefault(route, {})[call] = count
+            stages: dict[str, dict[str, dict[str, float]]] = {}
+            for (route, name), total_ms in sorted(self._stage_ms.items()):
+                stages.setdefault(route, {})[name] = {
+                    "total_ms": round(total_ms, 3),
+                    "spans": self._stage_spans.get((route, name), 0),
+                }
+
             return {
                 "endpoints": endpoints,
                 "cache": cache,
+                "compute": compute,
                 "degraded_states": dict(sorted(self._degraded_states.items())),
+                "ephemeris_calls": ephemeris_calls,
+                "stages": stages,
             }
 
     def to_prometheus(self) -> str:
+        routes = self._merged_routes()
         snapshot = self.snapshot()
         lines = [
-            "# HELP parva_requests_total Total API requests by path",
+            "# HELP parva_requests_total Total API requests by route template",
             "# TYPE parva_requests_total counter",
         ]
         for row in snapshot["endpoints"]:
-            path = row["path"].replace("\\", "\\\\").replace('"', '\\"')
-            lines.append(f'parva_requests_total{{path="{path}"}} {row["requests"]}')
-            lines.append(f'parva_request_errors_total{{path="{path}"}} {row["errors"]}')
-            lines.append(f'parva_request_throttles_total{{path="{path}"}} {row["throttles"]}')
+            route = _escape(row["route"])
+            lines.append(f'parva_requests_total{{route="{route}"}} {row["requests"]}')
+            lines.append(f'parva_request_errors_total{{route="{route}"}} {row["errors"]}')
+            lines.append(f'parva_request_throttles_total{{route="{route}"}} {row["throttles"]}')
+        lines.extend(
+            [
+                "# HELP parva_request_duration_seconds Request latency by route template",
+                "# TYPE parva_request_duration_seconds histogram",
+            ]
+        )
+        for route_name, series in sorted(routes.items()):
+            route = _escape(route_name)
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS_SECONDS, series.buckets):
+                cumulative += count
+                lines.append(
+                    f'parva_request_duration_seconds_bucket{{route="{route}",le="{bound:g}"}} {cumulative}'
+                )
+            lines.append(
+                f'parva_request_duration_seconds_bucket{{route="{route}",le="+Inf"}} {series.requests}'
+            )
+            lines.append(
+                f'parva_request_duration_seconds_sum{{route="{route}"}} {round(series.sum_seconds, 6)}'
+            )
+            lines.append(f'parva_request_duration_seconds_count{{route="{route}"}} {series.requests}')
+        lines.extend(
+            [
+                "# HELP parva_request_latency_p95_ms Estimated p95 request latency by route template",
+                "# TYPE parva_request_latency_p95_ms gauge",
+            ]
+        )
+        for row in snapshot["endpoints"]:
             if row["p95_latency_ms"] is not None:
-                lines.append(f'parva_request_latency_p95_ms{{path="{path}"}} {row["p95_latency_ms"]}')
+                route = _escape(row["route"])
+                lines.append(f'parva_request_latency_p95_ms{{route="{route}"}} {row["p95_latency_ms"]}')
         lines.extend(
             [
                 "# HELP parva_cache_hits_total Cache hits by cache name",
@@ -100,11 +299,32 @@ class MetricsRegistry:
             ]
         )
         for name, row in snapshot["cache"].items():
-            escaped = name.replace("\\", "\\\\").replace('"', '\\"')
+            escaped = _escape(name)
             lines.append(f'parva_cache_hits_total{{cache="{escaped}"}} {row["hits"]}')
             lines.append(f'parva_cache_misses_total{{cache="{escaped}"}} {row["misses"]}')
             if row["hit_ratio"] is not None:
                 lines.append(f'parva_cache_hit_ratio{{cache="{escaped}"}} {row["hit_ratio"]}')
+        lines.extend(
+            [
+                "# HELP parva_compute_queue_depth Compute tasks waiting for a free worker",
+                "# TYPE parva_compute_queue_depth gauge",
+                f"parva_compute_queue_depth {snapshot['compute']['queue_depth']}",
+                "# HELP parva_compute_tasks_total Compute pool admissions by lane and outcome",
+                "# TYPE parva_compute_tasks_total counter",
+            ]
+        )
+        for lane, row in snapshot["compute"]["lanes"].items():
+            escaped = _escape(lane)
+            lines.append(f'parva_compute_tasks_total{{lane="{escaped}",outcome="accepted"}} {row["accepted"]}')
+            lines.append(f'parva_compute_tasks_total{{lane="{escaped}",outcome="rejected"}} {row["rejected"]}')
+        lines.extend(
+            [
+                "# HELP parva_compute_in_flight Compute tasks admitted and not yet finished by lane",
+                "# TYPE parva_compute_in_flight gauge",
+            ]
+        )
+        for lane, row in snapshot["compute"]["lanes"].items():
+            lines.append(f'parva_compute_in_flight{{lane="{_escape(lane)}"}} {row["in_flight"]}')
         lines.extend(
             [
                 "# HELP parva_degraded_state_total Degraded runtime states observed",
@@ -112,8 +332,30 @@ class MetricsRegistry:
             ]
         )
         for reason, count in snapshot["degraded_states"].items():
-            escaped = reason.replace("\\", "\\\\").replace('"', '\\"')
+            escaped = _escape(reason)
             lines.append(f'parva_degraded_state_total{{reason="{escaped}"}} {count}')
+        lines.extend(
+            [
+                "# HELP parva_ephemeris_calls_total Swiss Ephemeris calls made while serving requests",
+                "# TYPE parva_ephemeris_calls_total counter",
+            ]
+        )
+        for route, calls in snapshot["ephemeris_calls"].items():
+            escaped = _escape(route)
+            for call, count in calls.items():
+                lines.append(f'parva_ephemeris_calls_total{{route="{escaped}",call="{call}"}} {count}')
+        lines.extend(
+            [
+                "# HELP parva_stage_seconds_total Time spent in named request stages",
+                "# TYPE parva_stage_seconds_total counter",
+            ]
+        )
+        for route, stages in snapshot["stages"].items():
+            escaped = _escape(route)
+            for name, row in stages.items():
+                seconds = round(row["total_ms"] / 1000.0, 6)
+                lines.append(f'parva_stage_seconds_total{{route="{escaped}",stage="{name}"}} {seconds}')
+                lines.append(f'parva_stage_spans_total{{route="{escaped}",stage="{name}"}} {row["spans"]}')
         return "\n".join(lines) + "\n"
 
 
@@ -0,0 +1,118 @@
+"""Opt-in sampling profiler for individual requests.
+
+With ``PARVA_PROFILE_SAMPLE_RATE`` above zero, the request-context middleware
+profiles that fraction of requests. While a sampled request runs, a daemon
+thread snapshots every thread's Python stack each ``interval`` seconds via
+``sys._current_frames`` and keeps only stacks that pass through backend code.
+This covers compute-pool workers as well as the event loop. When the request
+finishes, the stacks are written to ``PARVA_PROFILE_DIR`` in collapsed
+("folded") format, one ``frame;frame;frame count`` line per distinct stack.
+That is the input format of ``flamegraph.pl`` and speedscope.
+
+At most one request is sampled at a time. Other requests that run at the
+same time can show up in the dump; the file name carries the request id of
+the request that triggered it.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+APP_ROOT = str(Path(__file__).resolve().parents[1])
+DEFAULT_INTERVAL_SECONDS = 0.005
+
+_active = threading.Lock()
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+class StackSampler:
+    """Periodically records the Python stacks of every other thread."""
+
+    def __init__(self, *, interval: float = DEFAULT_INTERVAL_SECONDS, root: str = APP_ROOT) -> None:
+        self.interval = interval
+        self.root = root
+        self.samples: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _collapse(self, frame) -> Optional[str]:
+        names: list[str] = []
+        in_app = False
+        while frame is not None:
+            code = frame.f_code
+            if code.co_filename.startswith(self.root):
+                in_app = True
+            module = frame.f_globals.get("__name__", "?")
+            names.append(f"{module}:{code.co_name}")
+            frame = frame.f_back
+        if not in_app:
+            return None
+        return ";".join(reversed(names))
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = self._collapse(frame)
+                if stack is not None:
+                    self.samples[stack] += 1
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="parva-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Counter[str]:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        return self.samples
+
+
+def maybe_start_sampler(sample_rate: float) -> Optional[StackSampler]:
+    """Start a sampler for this request with probability ``sample_rate``."""
+    if sample_rate <= 0.0 or random.random() >= sample_rate:
+        return None
+    if not _active.acquire(blocking=False):
+        return None
+    sampler = StackSampler()
+    sampler.start()
+    return sampler
+
+
+def finish_sampler(sampler: StackSampler, *, output_dir: Path, request_id: str) -> Optional[Path]:
+    """Stop ``sampler`` and write its stacks to ``output_dir``; returns the file path.
+
+    Joins the sampler thread and writes a file, so async callers run it in a
+    worker thread. A directory that cannot be written is logged and yields
+    ``None``; profiling never fails the request it observes.
+    """
+    try:
+        samples = sampler.stop()
+    finally:
+        _active.release()
+
+    stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime())
+    safe_id = _UNSAFE_FILENAME_CHARS.sub("_", request_id)[:64]
+    target = output_dir / f"{stamp}-{safe_id}.folded"
+    try:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        target.write_text(
+            "".join(f"{stack} {count}\n" for stack, count in samples.most_common()),
+            encoding="utf-8",
+        )
+    except OSError as exc:
+        logger.warning("Could not write request profile %s: %s", target, exc)
+        return None
+    return target
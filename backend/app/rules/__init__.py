@@ -1,6 +1,8 @@
 """Rules package exports."""
 
 from .catalog_v4 import (
+    RuleCatalogIndex,
+    get_catalog_index_v4,
     get_rule_v4,
     get_rules_coverage,
     get_rules_scoreboard,
@@ -12,15 +14,20 @@ from .catalog_v4 import (
 from .dsl import is_rule_executable, rule_to_dsl_document
 from .execution import (
     RuleExecutionResult,
+    calculate_catalog_year,
+    calculate_catalog_years,
     calculate_rule_occurrence,
     calculate_rule_occurrence_with_fallback,
     validation_cases_for_rule,
+    validation_cases_for_rules,
 )
 from .service import FestivalRuleService, get_rule_service
 
 __all__ = [
     "FestivalRuleService",
+    "RuleCatalogIndex",
     "RuleExecutionResult",
+    "get_catalog_index_v4",
     "get_rule_service",
     "get_rule_v4",
     "get_rules_coverage",
@@ -31,7 +38,10 @@ __all__ = [
     "rule_quality_band",
     "is_rule_executable",
     "rule_to_dsl_document",
+    "calculate_catalog_year",
+    "calculate_catalog_years",
     "calculate_rule_occurrence",
     "calculate_rule_occurrence_with_fallback",
     "validation_cases_for_rule",
+    "validation_cases_for_rules",
 ]
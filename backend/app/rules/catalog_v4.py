@@ -4,18 +4,29 @@ from __future__ import annotations
 
 import hashlib
 import json
+import sys
+import threading
 from collections import Counter
 from datetime import datetime, timezone
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
+import pydantic
 from pydantic import ValidationError
 
+from app.core.compiled_snapshot import (
+    load_snapshot,
+    snapshot_path,
+    source_fingerprint,
+    write_snapshot,
+)
+from app.engine.ephemeris_config import get_ephemeris_config
+from app.rules import dsl, execution, schema_v4
 from app.rules.schema_v4 import FestivalRuleCatalogV4, FestivalRuleV4
 
 from .dsl import is_rule_executable
-from .execution import calculate_rule_occurrence_with_fallback
+from .execution import calculate_catalog_year
 
 PROJECT_ROOT = Path(__file__).resolve().parents[3]
 CALENDAR_DIR = PROJECT_ROOT / "backend" / "app" / "calendar"
@@ -26,6 +37,12 @@ RULES_LEGACY_PATH = CALENDAR_DIR / "festival_rules.json"
 CATALOG_V4_PATH = PROJECT_ROOT / "data" / "festivals" / "festival_rules_v4.json"
 INGESTION_SEED_PATH = PROJECT_ROOT / "data" / "festivals" / "rule_ingestion_seed.json"
 INGEST_REPORT_DIR = PROJECT_ROOT / "data" / "ingest_reports"
+# Read by app.calendar.overrides, which the V2 fallback consults during promotion.
+OVERRIDE_SOURCE_PATHS = (
+    PROJECT_ROOT / "data" / "ground_truth",
+    PROJECT_ROOT / "data" / "source_archive" / "ratopati" / "event_days_2000_2100.json",
+)
+CATALOG_SNAPSHOT_KIND = "festival_rules_v4"
 
 PAKSHA_TITLE = {
     "shukla": "Shukla",
@@ -424,13 +441,21 @@ def _add_content_only_rules(merged: Dict[str, FestivalRuleV4]) -> None:
         )
 
 
-def _is_rule_validated_for_baseline(rule: FestivalRuleV4) -> bool:
+def _validated_for_baseline(rules: List[FestivalRuleV4]) -> set[str]:
     """Run a light deterministic validation for baseline promotion."""
     # Baseline quality gate: rule should calculate for at least one canonical year.
+    # Each year resolves the rules still pending in one catalog pass.
+    validated: set[str] = set()
+    pending = list(rules)
     for year in (2025, 2026, 2027):
-        if calculate_rule_occurrence_with_fallback(rule, year) is not None:
-            return True
-    return False
+        if not pending:
+            break
+        results = calculate_catalog_year(year, pending)
+        validated.update(
+            festival_id for festival_id, result in results.items() if result is not None
+        )
+        pending = [rule for rule in pending if rule.festival_id not in validated]
+    return validated
 
 
 def _promote_computed_baseline(merged: Dict[str, FestivalRuleV4]) -> None:
@@ -441,6 +466,7 @@ def _promote_computed_baseline(merged: Dict[str, FestivalRuleV4]) -> None:
     - Promote legacy algorithmic rules.
     - Promote selected seed recurring families with deterministic executability.
     """
+    candidates: List[FestivalRuleV4] = []
     for rule in merged.values():
         if rule.status != "provisional":
             continue
@@ -459,7 +485,11 @@ def _promote_computed_baseline(merged: Dict[str, FestivalRuleV4]) -> None:
 
         if not is_rule_executable(rule):
             continue
-        if not _is_rule_validated_for_baseline(rule):
+        candidates.append(rule)
+
+    validated = _validated_for_baseline(candidates)
+    for rule in candidates:
+        if rule.festival_id not in validated:
             continue
 
         rule.status = "computed"
@@ -619,9 +649,7 @@ def build_canonical_catalog() -> FestivalRuleCatalogV4:
     )
 
 
-@lru_cache(maxsize=1)
-def load_catalog_v4() -> FestivalRuleCatalogV4:
-    """Load catalog from disk if present, otherwise build in-memory fallback."""
+def _read_catalog_v4() -> FestivalRuleCatalogV4:
     if CATALOG_V4_PATH.exists():
         payload = _load_json(CATALOG_V4_PATH)
         try:
@@ -631,10 +659,147 @@ def load_catalog_v4() -> FestivalRuleCatalogV4:
     return build_canonical_catalog()
 
 
+def _catalog_fingerprint() -> str:
+    # Every file _read_catalog_v4 may read, plus the code that shapes its rows.
+    # When the JSON catalog is missing or invalid, build_canonical_catalog
+    # decides promotions by executing rules, so the DSL, the executor, the
+    # calendar engine (code and data), the override tables it consults and the
+    # ephemeris configuration all count as sources.
+    sources = [
+        CATALOG_V4_PATH,
+        RULES_V3_PATH,
+        RULES_LEGACY_PATH,
+        DATA_FESTIVALS_PATH,
+        INGESTION_SEED_PATH,
+        REGIONAL_VARIANT_PATH,
+        INGEST_REPORT_DIR,
+        Path(__file__),
+        Path(schema_v4.__file__),
+        Path(dsl.__file__),
+        Path(execution.__file__),
+        CALENDAR_DIR,
+        *OVERRIDE_SOURCE_PATHS,
+    ]
+    runtime = (
+        f"python-{sys.version_info.major}.{sys.version_info.minor}",
+        pydantic.VERSION,
+        get_ephemeris_config().header_value,
+    )
+    return source_fingerprint(sources, extra=runtime)
+
+
+def compile_catalog_v4_snapshot() -> Optional[Path]:
+    """Build the catalog from its sources and write the compiled snapshot."""
+    path = snapshot_path(CATALOG_SNAPSHOT_KIND, CATALOG_V4_PATH)
+    if path is None:
+        return None
+    catalog = _read_catalog_v4()
+    if not write_snapshot(path, CATALOG_SNAPSHOT_KIND, _catalog_fingerprint(), catalog):
+        return None
+    return path
+
+
+@lru_cache(maxsize=1)
+def load_catalog_v4() -> FestivalRuleCatalogV4:
+    """Load catalog from disk if present, otherwise build in-memory fallback.
+
+    The result is kept as a compiled snapshot and reused, without validation,
+    while none of its sources change.
+    """
+    path = snapshot_path(CATALOG_SNAPSHOT_KIND, CATALOG_V4_PATH)
+    if path is None:
+        return _read_catalog_v4()
+    fingerprint = _catalog_fingerprint()
+    catalog = load_snapshot(path, CATALOG_SNAPSHOT_KIND, fingerprint)
+    if isinstance(catalog, FestivalRuleCatalogV4):
+        return catalog
+    catalog = _read_catalog_v4()
+    write_snapshot(path, CATALOG_SNAPSHOT_KIND, fingerprint, catalog)
+    return catalog
+
+
+def _calendar_family(rule: FestivalRuleV4) -> str:
+    """Calendar a rule resolves against: the payload's ``calendar_type`` or its rule type."""
+    return str(rule.rule.get("calendar_type") or rule.rule_type)
+
+
+def _group_rules(
+    rules: tuple[FestivalRuleV4, ...], keys: Callable[[FestivalRuleV4], List[str]]
+) -> Dict[str, tuple[FestivalRuleV4, ...]]:
+    groups: Dict[str, List[FestivalRuleV4]] = {}
+    for rule in rules:
+        for key in keys(rule):
+            groups.setdefault(key, []).append(rule)
+    return {key: tuple(members) for key, members in groups.items()}
+
+
+class RuleCatalogIndex:
+    """Lookup tables over one loaded catalog, built once and never mutated.
+
+    Secondary indexes keep catalog order (sorted by festival id).
+    """
+
+    def __init__(self, catalog: FestivalRuleCatalogV4):
+        self.catalog = catalog
+        self.rules: tuple[FestivalRuleV4, ...] = tuple(catalog.festivals)
+        self.by_id: Dict[str, FestivalRuleV4] = {rule.festival_id: rule for rule in self.rules}
+        self.ids: frozenset[str] = frozenset(self.by_id)
+        self.by_category = _group_rules(self.rules, lambda rule: [rule.category])
+        self.by_rule_family = _group_rules(self.rules, lambda rule: [rule.rule_family])
+        self.by_calendar_family = _group_rules(self.rules, lambda rule: [_calendar_family(rule)])
+        self.by_profile = _group_rules(self.rules, lambda rule: rule.profile_ids)
+
+    def __contains__(self, festival_id: object) -> bool:
+        return festival_id in self.ids
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def get(self, festival_id: str) -> Optional[FestivalRuleV4]:
+        return self.by_id.get(festival_id)
+
+    def in_category(self, category: str) -> tuple[FestivalRuleV4, ...]:
+        return self.by_category.get(category, ())
+
+    def in_rule_family(self, rule_family: str) -> tuple[FestivalRuleV4, ...]:
+        return self.by_rule_family.get(rule_family, ())
+
+    def in_calendar_family(self, calendar_family: str) -> tuple[FestivalRuleV4, ...]:
+        return self.by_calendar_family.get(calendar_family, ())
+
+    def with_profile(self, profile_id: str) -> tuple[FestivalRuleV4, ...]:
+        return self.by_profile.get(profile_id, ())
+
+
+_catalog_index: Optional[RuleCatalogIndex] = None
+_catalog_index_lock = threading.Lock()
+
+
+def get_catalog_index_v4() -> RuleCatalogIndex:
+    """Index of the currently loaded catalog, rebuilt when the catalog is reloaded."""
+    global _catalog_index
+    catalog = load_catalog_v4()
+    index = _catalog_index
+    if index is not None and index.catalog is catalog:
+        return index
+    with _catalog_index_lock:
+        if _catalog_index is None or _catalog_index.catalog is not catalog:
+            _catalog_index = RuleCatalogIndex(catalog)
+        return _catalog_index
+
+
 def reload_catalog_v4() -> FestivalRuleCatalogV4:
-    """Clear cache and reload catalog."""
-    load_catalog_v4.cache_clear()
-    return load_catalog_v4()
+    """Clear cache and reload catalog.
+
+    The index is swapped in one assignment once it is fully built, so readers
+    see either the old catalog's index or the new one, never a partial index.
+    """
+    global _catalog_index
+    with _catalog_index_lock:
+        load_catalog_v4.cache_clear()
+        catalog = load_catalog_v4()
+        _catalog_index = RuleCatalogIndex(catalog)
+    return catalog
 
 
 def list_rules_v4() -> List[FestivalRuleV4]:
@@ -642,10 +807,7 @@ def list_rules_v4() -> List[FestivalRuleV4]:
 
 
 def get_rule_v4(festival_id: str) -> Optional[FestivalRuleV4]:
-    for rule in list_rules_v4():
-        if rule.festival_id == festival_id:
-            return rule
-    return None
+    return get_catalog_index_v4().get(festival_id)
 
 
 def get_rules_coverage(target: int = 300) -> dict:
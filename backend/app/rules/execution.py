@@ -8,16 +8,20 @@ This module provides a lightweight executor used by:
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
-from typing import Any, Optional
+from functools import partial
+from typing import Any, Dict, Iterable, Optional, Sequence
 
 from app.calendar.bikram_sambat import bs_to_gregorian, gregorian_to_bs
 from app.calendar.bs_year import bs_solar_year_for_gregorian_year
-from app.calendar.calculator_v2 import calculate_festival_v2
+from app.calendar.calculator_v2 import calculate_festival_v2, prepare_festival_year_v2
 from app.calendar.lunar_calendar import find_festival_in_lunar_month
 from app.calendar.sankranti import find_makara_sankranti, find_mesh_sankranti
 from app.calendar.tithi.tithi_boundaries import find_next_tithi as find_next_tithi_boundary
+from app.calendar.year_context import year_context
+from app.core.instrumentation import STAGE_FESTIVAL_RULE, stage
 
 from .schema_v4 import FestivalRuleV4
 
@@ -268,13 +272,14 @@ def _compute_override(rule: FestivalRuleV4, year: int) -> RuleExecutionResult |
 
 def calculate_rule_occurrence(rule: FestivalRuleV4, year: int) -> RuleExecutionResult | None:
     """Calculate festival date for a v4 rule in a Gregorian year."""
-    if rule.rule_type == "lunar":
-        return _compute_lunar(rule, year)
-    if rule.rule_type == "solar":
-        return _compute_solar(rule, year)
-    if rule.rule_type == "override":
-        return _compute_override(rule, year)
-    return None
+    with stage(STAGE_FESTIVAL_RULE):
+        if rule.rule_type == "lunar":
+            return _compute_lunar(rule, year)
+        if rule.rule_type == "solar":
+            return _compute_solar(rule, year)
+        if rule.rule_type == "override":
+            return _compute_override(rule, year)
+        return None
 
 
 def calculate_rule_occurrence_with_fallback(
@@ -301,32 +306,91 @@ def calculate_rule_occurrence_with_fallback(
     )
 
 
+def calculate_catalog_year(
+    year: int, rules: Optional[Sequence[FestivalRuleV4]] = None
+) -> Dict[str, RuleExecutionResult | None]:
+    """
+    Resolve every rule (default: the whole v4 catalog) for ``year`` in one pass.
+
+    The lunar years, tithi transitions and sunrise tithis the rules share are
+    computed once (``app.calendar.year_context``) and every rule is resolved
+    against them. Results are identical to calling
+    ``calculate_rule_occurrence_with_fallback`` rule by rule. The V2 festivals
+    of the year are computed in the same pass, so ``calculate_festival_v2``
+    and the V2 upcoming/on-date lookups for ``year`` are served from cache
+    afterwards.
+    """
+    if rules is None:
+        from .catalog_v4 import list_rules_v4
+
+        rules = list_rules_v4()
+
+    with year_context(year):
+        prepare_festival_year_v2(year)
+        return {
+            rule.festival_id: calculate_rule_occurrence_with_fallback(rule, year) for rule in rules
+        }
+
+
+def calculate_catalog_years(
+    years: Iterable[int],
+    rules: Optional[Sequence[FestivalRuleV4]] = None,
+    *,
+    workers: int = 1,
+) -> Dict[int, Dict[str, RuleExecutionResult | None]]:
+    """
+    ``calculate_catalog_year`` for several years, optionally one process per year.
+
+    With ``workers > 1`` the years are spread over a process pool. Worker
+    processes keep their own caches, so only the returned results reach this
+    process; run in-process when the caches here should be warmed.
+    """
+    ordered = list(dict.fromkeys(years))
+    if workers <= 1 or len(ordered) < 2:
+        return {year: calculate_catalog_year(year, rules) for year in ordered}
+
+    worker = partial(calculate_catalog_year, rules=list(rules) if rules is not None else None)
+    with ProcessPoolExecutor(max_workers=min(workers, len(ordered))) as pool:
+        return dict(zip(ordered, pool.map(worker, ordered)))
+
+
+def _validation_case(year: int, result: RuleExecutionResult | None) -> dict[str, Any]:
+    if result is None:
+        return {
+            "year": year,
+            "expected_start_date": None,
+            "expected_end_date": None,
+            "method": None,
+            "status": "pending",
+            "note": "No executable path for this year/rule combination.",
+        }
+    return {
+        "year": year,
+        "expected_start_date": result.start_date.isoformat(),
+        "expected_end_date": result.end_date.isoformat(),
+        "method": result.method,
+        "status": "passed",
+    }
+
+
 def validation_cases_for_rule(
     rule: FestivalRuleV4, years: tuple[int, ...] = (2025, 2026, 2027)
 ) -> list[dict[str, Any]]:
     """Build deterministic validation cases for triad artifacts."""
-    cases: list[dict[str, Any]] = []
-    for year in years:
-        result = calculate_rule_occurrence_with_fallback(rule, year)
-        if result is None:
-            cases.append(
-                {
-                    "year": year,
-                    "expected_start_date": None,
-                    "expected_end_date": None,
-                    "method": None,
-                    "status": "pending",
-                    "note": "No executable path for this year/rule combination.",
-                }
-            )
-            continue
-        cases.append(
-            {
-                "year": year,
-                "expected_start_date": result.start_date.isoformat(),
-                "expected_end_date": result.end_date.isoformat(),
-                "method": result.method,
-                "status": "passed",
-            }
-        )
-    return cases
+    return [
+        _validation_case(year, calculate_rule_occurrence_with_fallback(rule, year))
+        for year in years
+    ]
+
+
+def validation_cases_for_rules(
+    rules: Sequence[FestivalRuleV4], years: tuple[int, ...] = (2025, 2026, 2027)
+) -> Dict[str, list[dict[str, Any]]]:
+    """``validation_cases_for_rule`` for many rules, one catalog pass per year."""
+    by_year = calculate_catalog_years(years, rules)
+    return {
+        rule.festival_id: [
+            _validation_case(year, by_year[year][rule.festival_id]) for year in years
+        ]
+        for rule in rules
+    }
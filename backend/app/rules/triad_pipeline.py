@@ -17,7 +17,7 @@ from typing import Any
 
 from .catalog_v4 import list_rules_v4
 from .dsl import rule_to_dsl_document
-from .execution import validation_cases_for_rule
+from .execution import validation_cases_for_rule, validation_cases_for_rules
 from .schema_v4 import FestivalRuleV4
 
 PROJECT_ROOT = Path(__file__).resolve().parents[3]
@@ -51,8 +51,11 @@ def _json_write(path: Path, payload: dict[str, Any], *, overwrite: bool) -> bool
     return True
 
 
-def _validation_payload(rule: FestivalRuleV4) -> dict[str, Any]:
-    cases = validation_cases_for_rule(rule)
+def _validation_payload(
+    rule: FestivalRuleV4, cases: list[dict[str, Any]] | None = None
+) -> dict[str, Any]:
+    if cases is None:
+        cases = validation_cases_for_rule(rule)
     return {
         "festival_id": rule.festival_id,
         "generated_at": datetime.now(timezone.utc).isoformat(),
@@ -80,7 +83,12 @@ def _evidence_payload(rule: FestivalRuleV4) -> dict[str, Any]:
     }
 
 
-def write_rule_triad(rule: FestivalRuleV4, *, overwrite: bool = True) -> dict[str, bool]:
+def write_rule_triad(
+    rule: FestivalRuleV4,
+    *,
+    overwrite: bool = True,
+    validation_cases: list[dict[str, Any]] | None = None,
+) -> dict[str, bool]:
     dsl_document = rule_to_dsl_document(rule)
     paths = triad_paths(rule.festival_id)
 
@@ -89,7 +97,7 @@ def write_rule_triad(rule: FestivalRuleV4, *, overwrite: bool = True) -> dict[st
     )
     wrote_evidence = _json_write(paths["evidence"], _evidence_payload(rule), overwrite=overwrite)
     wrote_validation = _json_write(
-        paths["validation"], _validation_payload(rule), overwrite=overwrite
+        paths["validation"], _validation_payload(rule, validation_cases), overwrite=overwrite
     )
 
     return {
@@ -113,8 +121,11 @@ def generate_rule_triads(
         "computed_with_cases": 0,
     }
 
+    cases_by_rule = validation_cases_for_rules(rules)
     for rule in rules:
-        result = write_rule_triad(rule, overwrite=overwrite)
+        result = write_rule_triad(
+            rule, overwrite=overwrite, validation_cases=cases_by_rule[rule.festival_id]
+        )
         counts["rule"] += int(result["rule"])
         counts["evidence"] += int(result["evidence"])
         counts["validation"] += int(result["validation"])
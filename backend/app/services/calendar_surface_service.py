@@ -331,11 +331,11 @@ def build_panchanga_payload(target_date: date, *, risk_mode: str = "standard") -
 
 
 def build_panchanga_range_payload(start: date, days: int) -> dict[str, Any]:
-    from app.calendar.panchanga import get_panchanga
+    from app.calendar.panchanga import get_panchanga_many
 
-    results = []
+    results: list[dict[str, Any] | None] = []
+    missing: list[tuple[int, date]] = []
     cache_hits = 0
-    cache_misses = 0
     for offset in range(days):
         current = start + timedelta(days=offset)
         cached = load_precomputed_panchanga(current)
@@ -352,19 +352,22 @@ def build_panchanga_range_payload(start: date, days: int) -> dict[str, Any]:
             cache_hits += 1
             continue
 
-        panchanga = get_panchanga(current)
-        results.append(
-            {
-                "date": panchanga["date"].isoformat()
-                if hasattr(panchanga["date"], "isoformat")
-                else str(panchanga["date"]),
-                "tithi": panchanga["tithi"]["name"],
-                "nakshatra": panchanga["nakshatra"]["name"],
-                "yoga": panchanga["yoga"]["name"],
-                "vaara": panchanga["vaara"]["name_english"],
-            }
-        )
-        cache_misses += 1
+        results.append(None)
+        missing.append((offset, current))
+
+    # Uncached days share one batched ephemeris pass.
+    computed = get_panchanga_many([current for _, current in missing])
+    for (offset, _), panchanga in zip(missing, computed):
+        results[offset] = {
+            "date": panchanga["date"].isoformat()
+            if hasattr(panchanga["date"], "isoformat")
+            else str(panchanga["date"]),
+            "tithi": panchanga["tithi"]["name"],
+            "nakshatra": panchanga["nakshatra"]["name"],
+            "yoga": panchanga["yoga"]["name"],
+            "vaara": panchanga["vaara"]["name_english"],
+        }
+    cache_misses = len(missing)
 
     if cache_hits and cache_misses:
         engine_path = "panchanga_range_mixed"
@@ -1,86 +1,349 @@
-"""Tiny in-process TTL cache for read-heavy free-tier endpoints."""
+"""In-process TTL cache (with optional shared second tier) for read-heavy endpoints.
+
+The first tier is a lock-protected LRU keyed by string, bounded both by entry
+count and by an estimate of payload bytes. Expired entries are dropped lazily
+when touched or when they reach the cold end of the LRU, so a lookup is O(1).
+
+Concurrent misses on the same key are coalesced: one caller computes, the rest
+wait for its result. Entries past their TTL but within the stale window are
+served immediately while a single background refresh recomputes them.
+
+When ``PARVA_RUNTIME_CACHE_BACKEND=redis`` (and ``PARVA_REDIS_URL`` is set),
+computed values are also written to Redis so other workers can reuse them.
+Second-tier failures never fail a request; they are counted and skipped.
+"""
 
 from __future__ import annotations
 
+import logging
 import os
+import pickle
+import struct
+import sys
+import threading
+import time
 from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
-from typing import Any, Callable
+from typing import Any, Callable, Optional, Protocol
+
+logger = logging.getLogger(__name__)
+
+
+def _env_int(name: str, default: int, minimum: int) -> int:
+    return max(minimum, int(os.getenv(name, str(default))))
+
+
+_CACHE_DISABLED = os.getenv("PARVA_RUNTIME_CACHE_ENABLED", "true").strip().lower() in {
+    "0",
+    "false",
+    "no",
+}
+_MAX_ENTRIES = _env_int("PARVA_RUNTIME_CACHE_MAX_ENTRIES", 128, 1)
+_MAX_BYTES = _env_int("PARVA_RUNTIME_CACHE_MAX_BYTES", 64 * 1024 * 1024, 1)
+_STALE_SECONDS = _env_int("PARVA_RUNTIME_CACHE_STALE_SECONDS", 0, 0)
+_BACKEND = os.getenv("PARVA_RUNTIME_CACHE_BACKEND", "memory").strip().lower() or "memory"
+_KEY_PREFIX = "parva:runtime_cache:"
+# Second-tier payloads are the wall-clock freshness deadline followed by the
+# pickled value, so the value is serialized once for both sizing and sharing.
+_L2_HEADER = struct.Struct("!d")
+
+_clock = time.monotonic
 
 
 @dataclass
 class _Entry:
-    expires_at: datetime
     value: Any
+    expires_at: float
+    stale_until: float
+    size: int
+
+
+class _Flight:
+    """A single in-progress computation that concurrent callers can wait on."""
+
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+    def result(self) -> Any:
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+class SecondTier(Protocol):
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the stored payload for ``key`` or None."""
+
+    def set(self, key: str, payload: bytes, ttl_seconds: int) -> None:
+        """Store ``payload`` for ``key`` with an expiry."""
+
+    def delete_prefix(self, prefix: str) -> None:
+        """Remove every key starting with ``prefix``."""
+
+
+class RedisSecondTier:
+    """Shared tier backed by any Redis-compatible server."""
+
+    def __init__(self, redis_url: str = "", *, client: Any = None) -> None:
+        if client is None:
+            if not redis_url.strip():
+                raise ValueError("Redis runtime cache requires PARVA_REDIS_URL.")
+            try:
+                from redis import Redis
+            except ImportError as exc:  # pragma: no cover - only hit when redis tier is selected.
+                raise RuntimeError(
+                    "Redis runtime cache requires the optional 'redis' package."
+                ) from exc
+            client = Redis.from_url(redis_url.strip(), decode_responses=False)
+        self._client = client
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._client.get(_KEY_PREFIX + key)
+
+    def set(self, key: str, payload: bytes, ttl_seconds: int) -> None:
+        self._client.set(_KEY_PREFIX + key, payload, ex=max(1, ttl_seconds))
+
+    def delete_prefix(self, prefix: str) -> None:
+        keys = list(self._client.scan_iter(match=f"{_KEY_PREFIX}{prefix}*"))
+        if keys:
+            self._client.delete(*keys)
+
+
+def _build_second_tier() -> Optional[SecondTier]:
+    if _BACKEND != "redis":
+        return None
+    try:
+        return RedisSecondTier(os.getenv("PARVA_REDIS_URL", ""))
+    except (RuntimeError, ValueError) as exc:
+        logger.warning("Runtime cache second tier disabled: %s", exc)
+        return None
 
 
 _CACHE: "OrderedDict[str, _Entry]" = OrderedDict()
+_INFLIGHT: dict[str, _Flight] = {}
+_LOCK = threading.Lock()
+_SECOND_TIER: Optional[SecondTier] = _build_second_tier()
+_BYTES = 0
 _CACHE_HITS = 0
 _CACHE_MISSES = 0
 _CACHE_EVICTIONS = 0
-_CACHE_DISABLED = os.getenv("PARVA_RUNTIME_CACHE_ENABLED", "true").strip().lower() in {
-    "0",
-    "false",
-    "no",
-}
-_MAX_ENTRIES = max(1, int(os.getenv("PARVA_RUNTIME_CACHE_MAX_ENTRIES", "128")))
+_STALE_HITS = 0
+_COALESCED = 0
+_REFRESHES = 0
+_L2_HITS = 0
+_L2_ERRORS = 0
+
+
+def set_second_tier(tier: Optional[SecondTier]) -> None:
+    """Install (or remove with None) the shared second tier."""
+    global _SECOND_TIER
+    _SECOND_TIER = tier
+
+
+def _estimate_size(value: Any) -> tuple[int, Optional[bytes]]:
+    try:
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return sys.getsizeof(value), None
+    return len(payload), payload
 
 
-def _evict_expired(now: datetime) -> None:
-    expired = [key for key, entry in _CACHE.items() if entry.expires_at <= now]
-    for key in expired:
-        _CACHE.pop(key, None)
+def _drop_locked(key: str) -> None:
+    global _BYTES
+    entry = _CACHE.pop(key, None)
+    if entry is not None:
+        _BYTES -= entry.size
+
+
+def _store_locked(key: str, entry: _Entry) -> None:
+    global _BYTES, _CACHE_EVICTIONS
+    _drop_locked(key)
+    _CACHE[key] = entry
+    _BYTES += entry.size
+    while _CACHE and (len(_CACHE) > _MAX_ENTRIES or _BYTES > _MAX_BYTES):
+        if len(_CACHE) == 1:
+            break
+        oldest_key = next(iter(_CACHE))
+        expired = _CACHE[oldest_key].stale_until <= _clock()
+        _drop_locked(oldest_key)
+        if not expired:
+            _CACHE_EVICTIONS += 1
+
+
+def _second_tier_get(key: str) -> Optional[tuple[float, Any, int]]:
+    global _L2_ERRORS
+    tier = _SECOND_TIER
+    if tier is None:
+        return None
+    try:
+        payload = tier.get(key)
+        if payload is None:
+            return None
+        (fresh_until_epoch,) = _L2_HEADER.unpack_from(payload)
+        value = pickle.loads(payload[_L2_HEADER.size :])
+    except Exception as exc:
+        with _LOCK:
+            _L2_ERRORS += 1
+        logger.debug("Runtime cache second tier read failed for %s: %s", key, exc)
+        return None
+    return fresh_until_epoch, value, len(payload) - _L2_HEADER.size
+
+
+def _second_tier_set(key: str, payload: Optional[bytes], ttl: int) -> None:
+    global _L2_ERRORS
+    tier = _SECOND_TIER
+    if tier is None or payload is None:
+        return
+    try:
+        tier.set(key, _L2_HEADER.pack(time.time() + ttl) + payload, ttl + _STALE_SECONDS)
+    except Exception as exc:
+        with _LOCK:
+            _L2_ERRORS += 1
+        logger.debug("Runtime cache second tier write failed for %s: %s", key, exc)
+
+
+def _compute_and_store(key: str, ttl: int, compute: Callable[[], Any], flight: _Flight) -> None:
+    try:
+        value = compute()
+    except BaseException as exc:
+        flight.error = exc
+        with _LOCK:
+            _INFLIGHT.pop(key, None)
+        flight.done.set()
+        return
+
+    size, payload = _estimate_size(value)
+    now = _clock()
+    with _LOCK:
+        _store_locked(key, _Entry(value, now + ttl, now + ttl + _STALE_SECONDS, size))
+        _INFLIGHT.pop(key, None)
+    flight.value = value
+    flight.done.set()
+    _second_tier_set(key, payload, ttl)
+
+
+def _refresh_in_background(key: str, ttl: int, compute: Callable[[], Any]) -> None:
+    global _REFRESHES
+    with _LOCK:
+        if key in _INFLIGHT:
+            return
+        flight = _INFLIGHT[key] = _Flight()
+        _REFRESHES += 1
+    threading.Thread(
+        target=_compute_and_store,
+        args=(key, ttl, compute, flight),
+        name="parva-cache-refresh",
+        daemon=True,
+    ).start()
 
 
 def clear() -> None:
-    global _CACHE_HITS, _CACHE_MISSES, _CACHE_EVICTIONS
-    _CACHE.clear()
-    _CACHE_HITS = 0
-    _CACHE_MISSES = 0
-    _CACHE_EVICTIONS = 0
+    global _BYTES, _CACHE_HITS, _CACHE_MISSES, _CACHE_EVICTIONS
+    global _STALE_HITS, _COALESCED, _REFRESHES, _L2_HITS, _L2_ERRORS
+    with _LOCK:
+        _CACHE.clear()
+        _BYTES = 0
+        _CACHE_HITS = 0
+        _CACHE_MISSES = 0
+        _CACHE_EVICTIONS = 0
+        _STALE_HITS = 0
+        _COALESCED = 0
+        _REFRESHES = 0
+        _L2_HITS = 0
+        _L2_ERRORS = 0
 
 
 def cached(key: str, ttl_seconds: int, compute: Callable[[], Any]) -> Any:
-    global _CACHE_HITS, _CACHE_MISSES, _CACHE_EVICTIONS
-    now = datetime.now(timezone.utc)
+    global _CACHE_HITS, _CACHE_MISSES, _STALE_HITS, _COALESCED, _L2_HITS
     if _CACHE_DISABLED:
-        _CACHE_MISSES += 1
+        with _LOCK:
+            _CACHE_MISSES += 1
         return compute()
 
-    _evict_expired(now)
-    hit = _CACHE.get(key)
-    if hit and hit.expires_at > now:
-        _CACHE.move_to_end(key)
-        _CACHE_HITS += 1
+    ttl = max(1, ttl_seconds)
+    now = _clock()
+    refresh = False
+    with _LOCK:
+        hit = _CACHE.get(key)
+        if hit is not None:
+            if hit.expires_at > now:
+                _CACHE.move_to_end(key)
+                _CACHE_HITS += 1
+                return hit.value
+            if hit.stale_until > now:
+                _CACHE.move_to_end(key)
+                _STALE_HITS += 1
+                refresh = True
+            else:
+                _drop_locked(key)
+    if refresh:
+        _refresh_in_background(key, ttl, compute)
         return hit.value
 
-    _CACHE_MISSES += 1
-    value = compute()
-    _CACHE[key] = _Entry(expires_at=now + timedelta(seconds=max(1, ttl_seconds)), value=value)
-    _CACHE.move_to_end(key)
-    while len(_CACHE) > _MAX_ENTRIES:
-        _CACHE.popitem(last=False)
-        _CACHE_EVICTIONS += 1
-    return value
+    shared = _second_tier_get(key)
+    if shared is not None:
+        fresh_until_epoch, value, size = shared
+        remaining = fresh_until_epoch - time.time()
+        if remaining > 0:
+            now = _clock()
+            with _LOCK:
+                _store_locked(
+                    key, _Entry(value, now + remaining, now + remaining + _STALE_SECONDS, size)
+                )
+                _L2_HITS += 1
+            return value
+
+    with _LOCK:
+        flight = _INFLIGHT.get(key)
+        leader = flight is None
+        if leader:
+            flight = _INFLIGHT[key] = _Flight()
+            _CACHE_MISSES += 1
+        else:
+            _COALESCED += 1
+
+    if leader:
+        _compute_and_store(key, ttl, compute, flight)
+    return flight.result()
 
 
 def invalidate_prefix(prefix: str) -> None:
-    for key in list(_CACHE.keys()):
-        if key.startswith(prefix):
-            _CACHE.pop(key, None)
+    with _LOCK:
+        for key in [key for key in _CACHE if key.startswith(prefix)]:
+            _drop_locked(key)
+    tier = _SECOND_TIER
+    if tier is not None:
+        try:
+            tier.delete_prefix(prefix)
+        except Exception as exc:
+            logger.debug("Runtime cache second tier invalidation failed: %s", exc)
 
 
 def stats() -> dict[str, Any]:
-    now = datetime.now(timezone.utc)
-    _evict_expired(now)
-    live = {k: v for k, v in _CACHE.items() if v.expires_at > now}
-    return {
-        "enabled": not _CACHE_DISABLED,
-        "max_entries": _MAX_ENTRIES,
-        "entries": len(live),
-        "hits": _CACHE_HITS,
-        "misses": _CACHE_MISSES,
-        "evictions": _CACHE_EVICTIONS,
-        "keys": sorted(live.keys())[:100],
-    }
+    now = _clock()
+    with _LOCK:
+        live = [key for key, entry in _CACHE.items() if entry.expires_at > now]
+        return {
+            "enabled": not _CACHE_DISABLED,
+            "max_entries": _MAX_ENTRIES,
+            "max_bytes": _MAX_BYTES,
+            "stale_seconds": _STALE_SECONDS,
+            "second_tier": type(_SECOND_TIER).__name__ if _SECOND_TIER is not None else None,
+            "entries": len(live),
+            "bytes": _BYTES,
+            "hits": _CACHE_HITS,
+            "misses": _CACHE_MISSES,
+            "evictions": _CACHE_EVICTIONS,
+            "stale_hits": _STALE_HITS,
+            "coalesced": _COALESCED,
+            "refreshes": _REFRESHES,
+            "second_tier_hits": _L2_HITS,
+            "second_tier_errors": _L2_ERRORS,
+            "in_flight": len(_INFLIGHT),
+            "keys": sorted(live)[:100],
+        }
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections import OrderedDict
+from collections.abc import Iterator
 from datetime import date
 
 from app.calendar import get_bs_month_name, gregorian_to_bs
@@ -189,6 +190,68 @@ def _sort_items(items: list[dict], sort: str) -> list[dict]:
     )
 
 
+def _normalize_window(from_date: date, to_date: date, quality_band: str) -> str:
+    if from_date > to_date:
+        raise ValueError("'from' date must be <= 'to' date")
+
+    normalized_band = (quality_band or "computed").strip().lower()
+    if normalized_band not in VALID_BANDS:
+        raise ValueError(f"Invalid quality_band '{quality_band}'")
+    return normalized_band
+
+
+def _window_items(
+    *,
+    from_date: date,
+    to_date: date,
+    band_filter: str,
+    search: str | None,
+    lang: str,
+) -> list[dict]:
+    """Serialized occurrences overlapping the window, before category/region filters."""
+    repo = get_repository()
+    total_days = (to_date - from_date).days + 1
+    upcoming = get_rule_service().upcoming(from_date, days=total_days)
+
+    items: list[dict] = []
+    for festival_id, dates in upcoming:
+        festival = repo.get_by_id(festival_id)
+        if not festival:
+            continue
+        if not _match_search(festival, search):
+            continue
+
+        rule = get_rule_v4(festival_id)
+        band = rule_quality_band(rule) if rule else "inventory"
+        if band_filter != "all" and band != band_filter:
+            continue
+
+        if dates.end_date < from_date or dates.start_date > to_date:
+            continue
+
+        items.append(
+            _serialize_timeline_item(
+                festival=festival,
+                dates=dates,
+                lang=lang,
+                band=band,
+                rule=rule,
+            )
+        )
+    return items
+
+
+def _filter_items(items: list[dict], *, category: str | None, region: str | None) -> list[dict]:
+    return [
+        item for item in items
+        if (not category or item.get("category") == category)
+        and (
+            not region
+            or any(region.strip().lower() in entry.lower() for entry in (item.get("regional_focus") or []))
+        )
+    ]
+
+
 def build_festival_timeline(
     *,
     from_date: date,
@@ -200,12 +263,7 @@ def build_festival_timeline(
     lang: str,
     sort: str = "chronological",
 ) -> dict:
-    if from_date > to_date:
-        raise ValueError("'from' date must be <= 'to' date")
-
-    normalized_band = (quality_band or "computed").strip().lower()
-    if normalized_band not in VALID_BANDS:
-        raise ValueError(f"Invalid quality_band '{quality_band}'")
+    normalized_band = _normalize_window(from_date, to_date, quality_band)
 
     normalized_sort = (sort or "chronological").strip().lower()
     normalized_sort = SORT_ALIASES.get(normalized_sort, normalized_sort)
@@ -219,47 +277,16 @@ def build_festival_timeline(
 
     def _compute() -> dict:
         repo = get_repository()
-        rule_service = get_rule_service()
-
-        total_days = (to_date - from_date).days + 1
-        upcoming = rule_service.upcoming(from_date, days=total_days)
-
-        base_items: list[dict] = []
-        for festival_id, dates in upcoming:
-            festival = repo.get_by_id(festival_id)
-            if not festival:
-                continue
-            if not _match_search(festival, search):
-                continue
-
-            rule = get_rule_v4(festival_id)
-            band = rule_quality_band(rule) if rule else "inventory"
-            if normalized_band != "all" and band != normalized_band:
-                continue
-
-            if dates.end_date < from_date or dates.start_date > to_date:
-                continue
-
-            base_items.append(
-                _serialize_timeline_item(
-                    festival=festival,
-                    dates=dates,
-                    lang=lang,
-                    band=band,
-                    rule=rule,
-                )
-            )
-
+        base_items = _window_items(
+            from_date=from_date,
+            to_date=to_date,
+            band_filter=normalized_band,
+            search=search,
+            lang=lang,
+        )
         facets = _build_facets(base_items)
 
-        filtered_items = [
-            item for item in base_items
-            if (not category or item.get("category") == category)
-            and (
-                not region
-                or any(region.strip().lower() in entry.lower() for entry in (item.get("regional_focus") or []))
-            )
-        ]
+        filtered_items = _filter_items(base_items, category=category, region=region)
         items = _sort_items(filtered_items, normalized_sort)
 
         groups: OrderedDict[str, dict] = OrderedDict()
@@ -322,3 +349,52 @@ def build_festival_timeline(
         }
 
     return cached(cache_key, ttl_seconds=240, compute=_compute)
+
+
+def iter_festival_timeline(
+    *,
+    from_date: date,
+    to_date: date,
+    quality_band: str,
+    category: str | None,
+    region: str | None,
+    search: str | None,
+    lang: str,
+) -> Iterator[dict]:
+    """Timeline items in chronological order, resolved one calendar year at a time.
+
+    Arguments are validated before the iterator is returned, so a bad request
+    fails before streaming starts. Facets, month groups and unresolved matches
+    need the whole window and are left to ``build_festival_timeline``.
+    """
+    normalized_band = _normalize_window(from_date, to_date, quality_band)
+
+    def _items() -> Iterator[dict]:
+        # Occurrences spanning New Year overlap two chunks; the earlier one
+        # already yielded them.
+        carried: set[tuple[str, str]] = set()
+        chunk_start = from_date
+        while chunk_start <= to_date:
+            chunk_end = min(date(chunk_start.year, 12, 31), to_date)
+            items = _filter_items(
+                _window_items(
+                    from_date=chunk_start,
+                    to_date=chunk_end,
+                    band_filter=normalized_band,
+                    search=search,
+                    lang=lang,
+                ),
+                category=category,
+                region=region,
+            )
+            chunk_keys: set[tuple[str, str]] = set()
+            for item in _sort_items(items, "chronological"):
+                key = (item["id"], item["start_date"])
+                if key in carried:
+                    continue
+                chunk_keys.add(key)
+                yield item
+            carried = chunk_keys
+            chunk_start = date(chunk_end.year + 1, 1, 1)
+
+    return _items()
@@ -291,6 +291,14 @@ class TestPanchanga:
         
         assert len(panchangas) == 7
 
+    def test_batched_panchanga_matches_single_day(self):
+        """Batched sunrise positions give the same panchanga as per-day calls."""
+        from app.calendar.panchanga import get_panchanga, get_panchanga_many
+
+        dates = [date(2026, 2, 6), date(2026, 10, 21), date(2025, 1, 1)]
+
+        assert get_panchanga_many(dates) == [get_panchanga(d) for d in dates]
+
 
 # =============================================================================
 # SANKRANTI TESTS
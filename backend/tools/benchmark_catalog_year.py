@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Full v4 catalog evaluation for whole years: per rule vs one batched pass.
+
+Each sample runs in a fresh interpreter, so every year is computed cold:
+
+- per-rule: ``calculate_rule_occurrence_with_fallback`` for every rule, the
+  way validation and promotion code walked the catalog;
+- batch: ``calculate_catalog_year`` (shared year context, V2 year warmed in
+  the same pass);
+- batch xN: ``calculate_catalog_years`` over a process pool (``--workers``).
+
+The catalog and override tables are loaded before the clock starts; both
+modes pay for them once per process. Batch results are compared with the
+per-rule results and any difference fails the run.
+
+Usage:
+    python backend/tools/benchmark_catalog_year.py --years 2031 2032 2033 --runs 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import subprocess
+import sys
+import time
+from pathlib import Path
+from statistics import median
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+def _child(mode: str, years: list[int], workers: int) -> dict:
+    for name in ("parva.request", "parva.security", "httpx"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    from app.calendar.calculator_v2 import list_festivals_v2
+    from app.calendar.overrides import get_festival_override
+    from app.rules.catalog_v4 import list_rules_v4
+    from app.rules.execution import (
+        calculate_catalog_years,
+        calculate_rule_occurrence_with_fallback,
+    )
+
+    rules = list_rules_v4()
+    list_festivals_v2()
+    get_festival_override("dashain", years[0])
+
+    started = time.perf_counter()
+    if mode == "per-rule":
+        results = {
+            year: {
+                rule.festival_id: calculate_rule_occurrence_with_fallback(rule, year)
+                for rule in rules
+            }
+            for year in years
+        }
+    else:
+        results = calculate_catalog_years(years, rules, workers=workers)
+    elapsed_ms = (time.perf_counter() - started) * 1000.0
+
+    rows = {
+        str(year): {
+            festival_id: None
+            if result is None
+            else [result.start_date.isoformat(), result.end_date.isoformat(), result.method]
+            for festival_id, result in by_rule.items()
+        }
+        for year, by_rule in results.items()
+    }
+    return {"elapsed_ms": elapsed_ms, "rules": len(rules), "results": rows}
+
+
+def _sample(mode: str, years: list[int], workers: int) -> dict:
+    command = [sys.executable, __file__, "--child", mode, "--workers", str(workers)]
+    command += ["--years", *map(str, years)]
+    output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--years", type=int, nargs="+", default=[2031])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        workers = args.workers if args.child == "pool" else 1
+        print(json.dumps(_child(args.child, args.years, workers)))
+        return 0
+
+    modes = [("per-rule", "per-rule"), ("batch", "batch")]
+    if args.workers > 1 and len(args.years) > 1:
+        modes.append(("pool", f"batch x{args.workers}"))
+
+    reference = None
+    print(f"{'mode':<12} {'years':>5} {'rules':>6} {'total ms':>10} {'ms/year':>9}")
+    for mode, label in modes:
+        samples = [_sample(mode, args.years, args.workers) for _ in range(max(1, args.runs))]
+        if reference is None:
+            reference = samples[0]["results"]
+        elif any(sample["results"] != reference for sample in samples):
+            raise RuntimeError(f"{label} results differ from per-rule evaluation")
+        total = median(sample["elapsed_ms"] for sample in samples)
+        print(
+            f"{label:<12} {len(args.years):>5} {samples[0]['rules']:>6} "
+            f"{total:10.1f} {total / len(args.years):9.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Measure the Chebyshev position backend against direct pyswisseph calls.
+
+Reports the maximum longitude/speed error of the interpolated Sun and Moon
+over random instants, then times a few boundary-search workloads with each
+backend.
+
+Usage:
+    python backend/tools/benchmark_chebyshev_ephemeris.py --samples 20000 --year 2026
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import swisseph as swe
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.calendar.ephemeris.chebyshev import (  # noqa: E402
+    body_state,
+    chebyshev_cache_stats,
+    clear_chebyshev_cache,
+)
+from app.calendar.ephemeris.swiss_eph import SIDEREAL_FLAGS  # noqa: E402
+from app.calendar.sankranti import get_sankrantis_in_year  # noqa: E402
+from app.calendar.tithi.tithi_boundaries import find_tithi_end  # noqa: E402
+from app.engine.ephemeris_config import (  # noqa: E402
+    get_ephemeris_config,
+    set_ephemeris_config,
+)
+
+JD_1900 = 2415020.5
+JD_2100 = 2488069.5
+
+
+def _max_errors(samples: int, seed: int) -> None:
+    ayanamsa = get_ephemeris_config().ayanamsa_code
+    swe.set_sid_mode(ayanamsa)
+    rng = random.Random(seed)
+    for body, name in ((swe.SUN, "sun"), (swe.MOON, "moon")):
+        worst_arcsec = worst_speed = 0.0
+        for _ in range(samples):
+            jd = rng.uniform(JD_1900, JD_2100)
+            longitude, speed = body_state(body, jd, SIDEREAL_FLAGS, ayanamsa)
+            reference = swe.calc_ut(jd, body, SIDEREAL_FLAGS)[0]
+            delta = (longitude - reference[0] + 180.0) % 360.0 - 180.0
+            worst_arcsec = max(worst_arcsec, abs(delta) * 3600.0)
+            worst_speed = max(worst_speed, abs(speed - reference[3]))
+        print(
+            f"{name:<5} max |dlon| {worst_arcsec:.6f} arcsec   "
+            f"max |dspeed| {worst_speed:.2e} deg/day   ({samples} samples, 1900-2100)"
+        )
+
+
+def _workloads(year: int) -> list[tuple[str, callable]]:
+    origin = datetime(year, 1, 1, tzinfo=timezone.utc)
+    instants = [origin + timedelta(hours=7.3 * i) for i in range(400)]
+    return [
+        ("400 tithi ends", lambda: [find_tithi_end(dt) for dt in instants]),
+        (f"sankrantis {year}", lambda: get_sankrantis_in_year(year)),
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--samples", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--year", type=int, default=2026)
+    args = parser.parse_args()
+
+    _max_errors(args.samples, args.seed)
+
+    original = get_ephemeris_config()
+    try:
+        for label, workload in _workloads(args.year):
+            timings = {}
+            clear_chebyshev_cache()
+            for run, backend in (
+                ("direct", "direct"),
+                ("cold", "chebyshev"),
+                ("warm", "chebyshev"),
+            ):
+                set_ephemeris_config(replace(original, position_backend=backend))
+                started = time.perf_counter()
+                workload()
+                timings[run] = (time.perf_counter() - started) * 1000.0
+            print(
+                f"{label:<18} direct {timings['direct']:7.1f} ms   "
+                f"chebyshev cold {timings['cold']:7.1f} ms "
+                f"({chebyshev_cache_stats()['fits']} fits)   warm {timings['warm']:7.1f} ms"
+            )
+    finally:
+        set_ephemeris_config(original)
+
+
+if __name__ == "__main__":
+    main()
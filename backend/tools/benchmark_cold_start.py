@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Worker cold start with and without compiled catalog snapshots.
+
+Each sample runs in a fresh interpreter and reports:
+
+- catalogs: ``load_catalog_v4()`` plus the festival repository load;
+- ready: importing ``app.main`` and answering a first ``/v3/api/festivals``
+  request, measured from interpreter start-up to the response.
+
+Modes: ``validate`` disables snapshots (JSON parse + Pydantic validation on
+every start); ``snapshot`` loads the snapshots written by
+``scripts/precompute/compile_catalog_snapshots.py`` into a scratch directory.
+``--without-v4-json`` points the rule catalog at a missing file, so the
+validate mode has to rebuild it from the v3/legacy/seed/MoHA sources.
+
+Usage:
+    python backend/tools/benchmark_cold_start.py --runs 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from statistics import median
+
+_STARTED = time.perf_counter()
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+
+def _child(without_v4_json: bool) -> dict:
+    for name in ("parva.request", "parva.security", "httpx"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    from app.rules import catalog_v4
+
+    if without_v4_json:
+        catalog_v4.CATALOG_V4_PATH = catalog_v4.CATALOG_V4_PATH.with_name("missing_rules_v4.json")
+
+    from app.festivals.repository import get_repository
+
+    started = time.perf_counter()
+    catalog_v4.load_catalog_v4()
+    get_repository().get_all()
+    catalogs_ms = (time.perf_counter() - started) * 1000.0
+
+    from app.main import app
+    from fastapi.testclient import TestClient
+
+    response = TestClient(app).get("/v3/api/festivals")
+    if response.status_code != 200:
+        raise RuntimeError(f"/v3/api/festivals answered {response.status_code}")
+    return {
+        "catalogs_ms": catalogs_ms,
+        "ready_ms": (time.perf_counter() - _STARTED) * 1000.0,
+    }
+
+
+def _sample(mode: str, snapshot_dir: str, without_v4_json: bool) -> dict:
+    env = dict(
+        os.environ,
+        PARVA_RATE_LIMIT_ENABLED="false",
+        PARVA_CATALOG_SNAPSHOT_DIR=snapshot_dir,
+        PARVA_CATALOG_SNAPSHOT_ENABLED="true" if mode == "snapshot" else "false",
+    )
+    command = [sys.executable, __file__, "--child"]
+    if without_v4_json:
+        command.append("--without-v4-json")
+    output = subprocess.run(command, check=True, capture_output=True, text=True, env=env).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--without-v4-json", action="store_true")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(_child(args.without_v4_json)))
+        return 0
+
+    with tempfile.TemporaryDirectory() as snapshot_dir:
+        # Writes the snapshots for the snapshot runs.
+        _sample("snapshot", snapshot_dir, args.without_v4_json)
+        print(f"{'mode':<10} {'catalogs ms':>12} {'ready ms':>10}")
+        for mode in ("validate", "snapshot"):
+            samples = [
+                _sample(mode, snapshot_dir, args.without_v4_json) for _ in range(max(1, args.runs))
+            ]
+            print(
+                f"{mode:<10} {median(s['catalogs_ms'] for s in samples):12.1f} "
+                f"{median(s['ready_ms'] for s in samples):10.1f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
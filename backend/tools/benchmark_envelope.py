@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Measure what the v3 data/meta envelope adds to a large JSON response.
+
+Serves a 500-item festival timeline from a minimal app behind
+``ExperimentalEnvelopeMiddleware`` and times three variants:
+
+- plain: no envelope requested;
+- spliced: envelope requested, response rendered by ``TimedJSONResponse``
+  (original body forwarded, only ``meta`` encoded);
+- reparsed: envelope requested, response rendered by a plain ``JSONResponse``
+  (body buffered, decoded and re-encoded; the only path before splicing).
+
+Also checks that the spliced and reparsed bodies are byte-identical.
+
+Usage:
+    python backend/tools/benchmark_envelope.py --items 500 --requests 300
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.bootstrap.middleware import ExperimentalEnvelopeMiddleware  # noqa: E402
+from app.bootstrap.responses import TimedJSONResponse  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+
+def _timeline(items: int) -> dict:
+    entries = [
+        {
+            "id": f"festival-{index}",
+            "name": f"Festival {index}",
+            "name_ne": f"पर्व {index}",
+            "category": ("national", "regional", "newari")[index % 3],
+            "start_date": f"2026-{index % 12 + 1:02d}-{index % 28 + 1:02d}",
+            "end_date": f"2026-{index % 12 + 1:02d}-{index % 28 + 1:02d}",
+            "duration_days": 1 + index % 5,
+            "quality_band": "computed",
+            "regions": ["Kathmandu Valley", "Terai"],
+            "tithi": {"paksha": "shukla", "number": index % 15 + 1, "confidence": "exact"},
+            "importance": round(0.5 + (index % 50) / 100.0, 2),
+        }
+        for index in range(items)
+    ]
+    return {
+        "from": "2026-01-01",
+        "to": "2026-12-31",
+        "total": items,
+        "groups": [{"month": "2026-01", "items": entries}],
+        "method": "festival_timeline",
+        "calculation_trace_id": "tr_bench",
+    }
+
+
+def _app(payload: dict, response_class) -> ExperimentalEnvelopeMiddleware:
+    app = FastAPI()
+
+    @app.get("/v3/api/festivals/timeline")
+    async def timeline():
+        # Returned directly so FastAPI's jsonable_encoder pass, identical for
+        # every variant, does not drown out the envelope cost.
+        return response_class(payload)
+
+    return ExperimentalEnvelopeMiddleware(app, enable_experimental_api=False)
+
+
+async def _request(app, *, envelope: bool) -> bytes:
+    headers = [(b"host", b"bench")]
+    if envelope:
+        headers.append((b"x-parva-envelope", b"data-meta"))
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/v3/api/festivals/timeline",
+        "raw_path": b"/v3/api/festivals/timeline",
+        "root_path": "",
+        "query_string": b"",
+        "headers": headers,
+        "client": ("127.0.0.1", 40000),
+        "server": ("bench", 80),
+    }
+    chunks: list[bytes] = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return b"".join(chunks)
+
+
+async def _measure(app, *, envelope: bool, requests: int, rounds: int) -> float:
+    for _ in range(20):
+        await _request(app, envelope=envelope)
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(requests):
+            await _request(app, envelope=envelope)
+        samples.append((time.perf_counter() - started) / requests * 1e3)
+    return min(samples)
+
+
+async def _main(items: int, requests: int, rounds: int) -> None:
+    payload = _timeline(items)
+    spliced_app = _app(payload, TimedJSONResponse)
+    reparsed_app = _app(payload, JSONResponse)
+
+    spliced_body = await _request(spliced_app, envelope=True)
+    reparsed_body = await _request(reparsed_app, envelope=True)
+    if spliced_body != reparsed_body:
+        raise RuntimeError("spliced envelope differs from the re-encoded envelope")
+
+    plain = await _measure(spliced_app, envelope=False, requests=requests, rounds=rounds)
+    spliced = await _measure(spliced_app, envelope=True, requests=requests, rounds=rounds)
+    reparsed = await _measure(reparsed_app, envelope=True, requests=requests, rounds=rounds)
+    print(f"{items}-item timeline, {len(spliced_body) / 1024:.0f} KiB enveloped")
+    print(f"plain      {plain:7.3f} ms/req")
+    print(f"spliced    {spliced:7.3f} ms/req  (+{spliced - plain:.3f} ms over plain)")
+    print(f"reparsed   {reparsed:7.3f} ms/req  (+{reparsed - plain:.3f} ms over plain)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(_main(args.items, args.requests, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Server time of iCal feed requests: first request, repeat polls, and 304s.
+
+Replays the feed endpoints the way a subscribed calendar client polls them.
+It reports the ``total`` from the ``Server-Timing`` header (the time spent
+inside the app, without the test client) for the first request, the median
+repeat request, and the median conditional request that sends the previous
+``ETag`` back as ``If-None-Match``.
+
+Usage:
+    python backend/tools/benchmark_ical_feed.py --polls 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import re
+import sys
+from pathlib import Path
+from statistics import median
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+FEEDS = (
+    "/v3/api/feeds/all.ics",
+    "/v3/api/feeds/national.ics",
+    "/v3/api/feeds/ical?festivals=dashain,tihar,holi&years=3",
+    "/v3/api/feeds/all.ics?years=5",
+    "/v3/api/feeds/next?days=60",
+)
+_TOTAL = re.compile(r"total;dur=([\d.]+)")
+
+
+def _server_ms(response) -> float:
+    match = _TOTAL.search(response.headers.get("server-timing", ""))
+    return float(match.group(1)) if match else float("nan")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--polls", type=int, default=20)
+    args = parser.parse_args()
+
+    for name in ("parva.request", "parva.security", "httpx"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+    os.environ["PARVA_RATE_LIMIT_ENABLED"] = "false"
+
+    from app.bootstrap.app_factory import create_app
+
+    client = TestClient(create_app())
+    print(f"{'feed':<55} {'bytes':>7} {'first':>9} {'repeat':>8} {'304':>8}  (server ms)")
+    for path in FEEDS:
+        first = client.get(path)
+        if first.status_code != 200:
+            raise RuntimeError(f"{path} answered {first.status_code}")
+        repeat = median(_server_ms(client.get(path)) for _ in range(args.polls))
+        etag = first.headers.get("etag")
+        not_modified = "-"
+        if etag:
+            conditional = [
+                client.get(path, headers={"If-None-Match": etag}) for _ in range(args.polls)
+            ]
+            if any(response.status_code != 304 for response in conditional):
+                raise RuntimeError(f"{path} ignored If-None-Match")
+            not_modified = f"{median(_server_ms(response) for response in conditional):8.2f}"
+        print(
+            f"{path:<55} {len(first.content):>7} {_server_ms(first):9.1f} "
+            f"{repeat:8.2f} {not_modified:>8}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Measure per-request middleware overhead of the Parva app on trivial endpoints.
+
+Drives the ASGI app directly (no sockets, no HTTP client) and compares the
+full application against the same application with its middleware removed,
+so the difference is the cost of the middleware stack. Request logging is silenced
+because it is identical either way and would dominate the numbers.
+
+Usage:
+    python backend/tools/benchmark_middleware_overhead.py --requests 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.bootstrap.app_factory import create_app  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+
+PATHS = ("/health/live", "/v3/api/policy")
+
+
+def _bare_app() -> FastAPI:
+    """The same application with every user middleware removed."""
+    app = create_app()
+    app.user_middleware.clear()
+    app.middleware_stack = None
+    return app
+
+
+async def _request(app, path: str, client_host: str) -> int:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": (client_host, 40000),
+        "server": ("bench", 80),
+    }
+    status = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def _measure(app, path: str, requests: int, rounds: int) -> float:
+    for index in range(200):
+        await _request(app, path, f"10.1.{index >> 8}.{index & 255}")
+    samples = []
+    for round_index in range(rounds):
+        started = time.perf_counter()
+        for index in range(requests):
+            # Distinct clients keep the in-memory rate limiter from throttling.
+            ident = round_index * requests + index
+            status = await _request(
+                app, path, f"10.{ident >> 16 & 255}.{ident >> 8 & 255}.{ident & 255}"
+            )
+            if status != 200:
+                raise RuntimeError(f"{path} answered {status}")
+        samples.append((time.perf_counter() - started) / requests * 1e6)
+    return min(samples)
+
+
+async def _main(requests: int, rounds: int) -> None:
+    for name in ("parva.request", "parva.security", "httpx"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+    full, bare = create_app(), _bare_app()
+    for path in PATHS:
+        full_us = await _measure(full, path, requests, rounds)
+        bare_us = await _measure(bare, path, requests, rounds)
+        print(
+            f"{path:<16} full app {full_us:7.1f} us/req   no middleware {bare_us:7.1f} us/req   "
+            f"middleware overhead {full_us - bare_us:7.1f} us/req"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(_main(args.requests, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Compare cold single-row lookups from JSON vs memory-mapped binary artifacts.
+
+Each measurement runs in a fresh interpreter so peak RSS and first-lookup
+latency reflect a cold worker rather than a warm cache.
+
+Usage:
+    python backend/tools/benchmark_precomputed_artifacts.py --year 2026 --runs 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+from statistics import median
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+PROJECT_ROOT = BACKEND_ROOT.parent
+sys.path.insert(0, str(BACKEND_ROOT))
+
+
+def _current_rss_kb() -> int:
+    try:
+        with open("/proc/self/statm", encoding="ascii") as handle:
+            resident_pages = int(handle.read().split()[1])
+        return resident_pages * resource.getpagesize() // 1024
+    except OSError:  # non-Linux: fall back to the peak
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _child(directory: Path, year: int, use_binary: bool) -> None:
+    from app.infrastructure.precomputed_store import FilePrecomputedArtifactStore
+    from app.reliability.metrics import MetricsRegistry
+
+    store = FilePrecomputedArtifactStore(directory, MetricsRegistry(), use_binary=use_binary)
+    imported_rss = _current_rss_kb()
+
+    started = time.perf_counter()
+    row = store.load_panchanga(date(year, 7, 1))
+    cold_ms = (time.perf_counter() - started) * 1000.0
+
+    started = time.perf_counter()
+    for day in range(1, 29):
+        store.load_panchanga(date(year, 2, day))
+    first_touch_us = (time.perf_counter() - started) * 1e6 / 28
+
+    started = time.perf_counter()
+    for day in range(1, 29):
+        store.load_panchanga(date(year, 2, day))
+    warm_us = (time.perf_counter() - started) * 1e6 / 28
+
+    print(
+        json.dumps(
+            {
+                "hit": row is not None,
+                "cold_ms": cold_ms,
+                "first_touch_us": first_touch_us,
+                "warm_us": warm_us,
+                "rss_delta_kb": _current_rss_kb() - imported_rss,
+            }
+        )
+    )
+
+
+def _generate(directory: Path, year: int) -> Path:
+    sys.path.insert(0, str(PROJECT_ROOT / "scripts" / "precompute"))
+    import precompute_panchanga
+
+    precompute_panchanga.OUT_DIR = directory
+    return precompute_panchanga.precompute_year(year)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--year", type=int, default=date.today().year)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--dir", type=Path, help="Existing artifact dir (default: generate)")
+    parser.add_argument("--child", choices=["json", "binary"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(args.dir, args.year, args.child == "binary")
+        return 0
+
+    with tempfile.TemporaryDirectory() as scratch:
+        directory = args.dir or Path(scratch)
+        source = directory / f"panchanga_{args.year}.json"
+        if not source.exists():
+            _generate(directory, args.year)
+        binary = source.with_suffix(".bin")
+        print(f"JSON   {source.stat().st_size:>10,} bytes")
+        print(f"binary {binary.stat().st_size:>10,} bytes")
+
+        for mode in ("json", "binary"):
+            samples = []
+            for _ in range(max(1, args.runs)):
+                output = subprocess.run(
+                    [
+                        sys.executable,
+                        __file__,
+                        "--child",
+                        mode,
+                        "--dir",
+                        str(directory),
+                        "--year",
+                        str(args.year),
+                    ],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                ).stdout
+                samples.append(json.loads(output))
+            print(
+                f"{mode:<6} cold {median(s['cold_ms'] for s in samples):7.2f} ms  "
+                f"first {median(s['first_touch_us'] for s in samples):6.1f} us/row  "
+                f"warm {median(s['warm_us'] for s in samples):6.1f} us/row  "
+                f"rss +{median(s['rss_delta_kb'] for s in samples):,.0f} KiB"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
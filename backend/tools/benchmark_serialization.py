@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Per-endpoint JSON serialization time, standard library vs orjson.
+
+Builds the app once per ``PARVA_JSON_ENCODER`` value and replays a fixed set
+of v3 endpoints through it. For each endpoint it reports the median
+``serialize`` stage (body encoding, read from the ``Server-Timing`` header)
+and the median total server time.
+
+A second section compares the precomputed panchanga cache route before and
+after pre-encoding: loading the row, running ``jsonable_encoder`` and
+encoding it per request, against serving the cached bytes. It uses a
+panchanga year generated into a temporary directory.
+
+Usage:
+    python backend/tools/benchmark_serialization.py --requests 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import re
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+from statistics import median
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+PROJECT_ROOT = BACKEND_ROOT.parent
+sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.core.json_codec import orjson_available  # noqa: E402
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+ENDPOINTS = (
+    "/v3/api/calendar/today",
+    "/v3/api/festivals",
+    "/v3/api/festivals/dashain",
+    "/v3/api/festivals/timeline?from=2026-01-01&to=2026-12-31",
+    "/v3/api/muhurta/heatmap?date=2026-03-17",
+    "/v3/api/muhurta/calendar?from=2026-01-01&to=2026-01-31",
+)
+_TIMING = re.compile(r"(?P<name>[\w-]+);dur=(?P<ms>[\d.]+)")
+
+
+def _server_timing(header: str) -> dict[str, float]:
+    return {match["name"]: float(match["ms"]) for match in _TIMING.finditer(header)}
+
+
+def _client(encoder: str) -> TestClient:
+    from app.bootstrap.app_factory import create_app
+
+    os.environ["PARVA_JSON_ENCODER"] = encoder
+    os.environ["PARVA_RATE_LIMIT_ENABLED"] = "false"
+    return TestClient(create_app())
+
+
+def _measure_endpoints(client: TestClient, requests: int) -> dict[str, tuple[float, float, int]]:
+    results = {}
+    for path in ENDPOINTS:
+        client.get(path)  # warm caches so only the steady state is measured
+        serialize, total = [], []
+        size = 0
+        for _ in range(requests):
+            response = client.get(path)
+            if response.status_code != 200:
+                raise RuntimeError(f"{path} answered {response.status_code}")
+            timings = _server_timing(response.headers.get("server-timing", ""))
+            serialize.append(timings.get("serialize", 0.0))
+            total.append(timings["total"])
+            size = len(response.content)
+        results[path] = (median(serialize), median(total), size)
+    return results
+
+
+def _measure_precomputed_panchanga(year: int, rounds: int) -> tuple[float, float]:
+    sys.path.insert(0, str(PROJECT_ROOT / "scripts" / "precompute"))
+    import precompute_panchanga
+    from app.bootstrap.responses import json_response_class
+    from app.infrastructure.precomputed_store import FilePrecomputedArtifactStore
+    from app.reliability.metrics import MetricsRegistry
+
+    response_class = json_response_class("auto")
+    with tempfile.TemporaryDirectory() as directory:
+        precompute_panchanga.OUT_DIR = Path(directory)
+        precompute_panchanga.precompute_year(year)
+        store = FilePrecomputedArtifactStore(Path(directory), MetricsRegistry())
+        days = [date(year, month, day) for month in range(1, 13) for day in (1, 8, 15, 22)]
+        for day in days:
+            store.load_panchanga_encoded(day)
+
+        per_request = []
+        for _ in range(rounds):
+            started = time.perf_counter()
+            for day in days:
+                response_class(jsonable_encoder(store.load_panchanga(day))).body
+            per_request.append((time.perf_counter() - started) / len(days))
+        encoded_each_time = min(per_request) * 1e6
+
+        per_request = []
+        for _ in range(rounds):
+            started = time.perf_counter()
+            for day in days:
+                store.load_panchanga_encoded(day)
+            per_request.append((time.perf_counter() - started) / len(days))
+        pre_encoded = min(per_request) * 1e6
+    return encoded_each_time, pre_encoded
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=30)
+    parser.add_argument("--year", type=int, default=2026)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    for name in ("parva.request", "parva.security", "httpx"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    encoders = ["stdlib", "orjson"] if orjson_available() else ["stdlib"]
+    results = {encoder: _measure_endpoints(_client(encoder), args.requests) for encoder in encoders}
+
+    print("serialize stage / total server time, median ms")
+    print(f"{'endpoint':<58} {'bytes':>7} " + " ".join(f"{e:>17}" for e in encoders))
+    for path in ENDPOINTS:
+        size = results[encoders[0]][path][2]
+        cells = " ".join(
+            f"{results[e][path][0]:7.3f} / {results[e][path][1]:7.2f}" for e in encoders
+        )
+        print(f"{path:<58} {size:>7} {cells}")
+
+    encoded_each_time, pre_encoded = _measure_precomputed_panchanga(args.year, args.rounds)
+    print()
+    print("precomputed panchanga row -> response body, us/request")
+    print(f"load + jsonable_encoder + encode   {encoded_each_time:8.1f}")
+    print(f"pre-encoded bytes                  {pre_encoded:8.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
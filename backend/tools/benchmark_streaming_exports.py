@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Time to first byte and memory of large feed, timeline and export responses.
+
+Each endpoint is measured in a fresh interpreter against the full app, called
+directly over ASGI so the first ``http.response.body`` chunk can be timed:
+
+- cold: first request in the process (festival dates resolved on the way),
+  with the peak RSS growth it caused;
+- warm: median of repeat requests once resolver caches are filled, with the
+  peak Python allocation held while the response is produced (tracemalloc).
+
+Usage:
+    python backend/tools/benchmark_streaming_exports.py --runs 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from statistics import median
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+ENDPOINTS = (
+    "/v3/api/feeds/all.ics?years=3&start_year=2026",
+    "/v3/api/feeds/all.ics?years=10&start_year=2026",
+    "/v3/api/feeds/export.ndjson?years=10&start_year=2026",
+    "/v3/api/festivals/timeline?from=2026-01-01&to=2035-12-31&quality_band=all",
+    "/v3/api/festivals/timeline/export.ndjson?from=2026-01-01&to=2035-12-31&quality_band=all",
+)
+
+
+def _peak_rss_kb() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+async def _request(app, target: str) -> tuple[float, float, int, int]:
+    """Milliseconds to the first body chunk and to the end, body bytes, status."""
+    path, _, query = target.partition("?")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query.encode(),
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 40000),
+        "server": ("bench", 80),
+    }
+    disconnected = asyncio.Event()
+    requested = False
+    first_byte = None
+    size = 0
+    status = 0
+
+    async def receive():
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal first_byte, size, status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            body = message.get("body", b"")
+            if body and first_byte is None:
+                first_byte = time.perf_counter()
+            size += len(body)
+
+    started = time.perf_counter()
+    await app(scope, receive, send)
+    finished = time.perf_counter()
+    disconnected.set()
+    return (
+        ((first_byte or finished) - started) * 1000.0,
+        (finished - started) * 1000.0,
+        size,
+        status,
+    )
+
+
+async def _child(target: str, requests: int) -> dict:
+    from app.bootstrap.app_factory import create_app
+
+    app = create_app()
+    await _request(app, "/health/live")
+    rss_before = _peak_rss_kb()
+
+    cold_ttfb, cold_total, size, status = await _request(app, target)
+    if status != 200:
+        raise RuntimeError(f"{target} answered {status}")
+    rss_growth = _peak_rss_kb() - rss_before
+
+    warm = [await _request(app, target) for _ in range(requests)]
+
+    tracemalloc.start()
+    await _request(app, target)
+    _current, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "bytes": size,
+        "cold_ttfb_ms": cold_ttfb,
+        "cold_total_ms": cold_total,
+        "cold_rss_kb": rss_growth,
+        "warm_ttfb_ms": median(sample[0] for sample in warm),
+        "warm_total_ms": median(sample[1] for sample in warm),
+        "warm_peak_kb": traced_peak / 1024,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3, help="fresh processes per endpoint")
+    parser.add_argument("--requests", type=int, default=5, help="warm requests per process")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        for name in ("parva.request", "parva.security", "httpx"):
+            logging.getLogger(name).setLevel(logging.WARNING)
+        print(json.dumps(asyncio.run(_child(args.child, args.requests))))
+        return 0
+
+    env = dict(os.environ, PARVA_RATE_LIMIT_ENABLED="false")
+    print(
+        f"{'endpoint':<88} {'bytes':>8} {'cold ttfb/total ms':>19} {'rss KiB':>8} "
+        f"{'warm ttfb/total ms':>19} {'alloc KiB':>9}"
+    )
+    for target in ENDPOINTS:
+        samples = []
+        for _ in range(max(1, args.runs)):
+            output = subprocess.run(
+                [sys.executable, __file__, "--child", target, "--requests", str(args.requests)],
+                check=True,
+                capture_output=True,
+                text=True,
+                env=env,
+            ).stdout
+            samples.append(json.loads(output.strip().splitlines()[-1]))
+
+        def mid(key: str) -> float:
+            return median(sample[key] for sample in samples)
+
+        print(
+            f"{target:<88} {int(mid('bytes')):>8} "
+            f"{mid('cold_ttfb_ms'):9.1f}/{mid('cold_total_ms'):9.1f} {mid('cold_rss_kb'):8,.0f} "
+            f"{mid('warm_ttfb_ms'):9.2f}/{mid('warm_total_ms'):9.2f} {mid('warm_peak_kb'):9,.0f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Compare the Newton tithi boundary solver against the legacy bisection.
+
+Usage:
+    python backend/tools/benchmark_tithi_boundaries.py --samples 500 --tolerance 0.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from statistics import mean
+
+import swisseph as swe
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.calendar.tithi import tithi_boundaries  # noqa: E402
+from app.calendar.tithi.tithi_boundaries import (  # noqa: E402
+    _bisect_tithi_end,
+    _bisect_tithi_start,
+    find_tithi_end,
+    find_tithi_start,
+)
+
+
+class _CallCounter:
+    """Count ``swe.calc_ut`` calls; two calls make one Sun/Moon evaluation."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self._original = swe.calc_ut
+
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+        return self._original(*args, **kwargs)
+
+    def __enter__(self) -> "_CallCounter":
+        swe.calc_ut = self
+        return self
+
+    def __exit__(self, *exc) -> None:
+        swe.calc_ut = self._original
+
+
+def _run(label: str, fn, instants: list[datetime]) -> tuple[list[datetime], float, float]:
+    with _CallCounter() as counter:
+        t0 = time.perf_counter()
+        results = [fn(dt) for dt in instants]
+        elapsed_ms = (time.perf_counter() - t0) * 1000.0
+    evaluations = counter.calls / 2 / len(instants)
+    print(f"{label:<24} {elapsed_ms:9.1f} ms total  {evaluations:5.2f} evals/call")
+    return results, elapsed_ms, evaluations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--samples", type=int, default=500)
+    parser.add_argument("--tolerance", type=float, default=tithi_boundaries.DEFAULT_TOLERANCE_SECONDS)
+    parser.add_argument("--bisect-tolerance", type=float, default=60.0)
+    args = parser.parse_args()
+
+    origin = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    instants = [origin + timedelta(hours=7.3 * i) for i in range(args.samples)]
+
+    print(f"{args.samples} reference instants from {origin.date()}")
+    newton_end, newton_end_ms, _ = _run(
+        "newton end", lambda dt: find_tithi_end(dt, tolerance_seconds=args.tolerance), instants
+    )
+    bisect_end, bisect_end_ms, _ = _run(
+        "bisection end", lambda dt: _bisect_tithi_end(dt, 50, args.bisect_tolerance), instants
+    )
+    newton_start, newton_start_ms, _ = _run(
+        "newton start", lambda dt: find_tithi_start(dt, tolerance_seconds=args.tolerance), instants
+    )
+    bisect_start, bisect_start_ms, _ = _run(
+        "bisection start", lambda dt: _bisect_tithi_start(dt, 50, args.bisect_tolerance), instants
+    )
+
+    deltas = [
+        abs((a - b).total_seconds())
+        for a, b in zip(newton_end + newton_start, bisect_end + bisect_start)
+    ]
+    print()
+    print(f"speedup (end):   {bisect_end_ms / newton_end_ms:5.2f}x")
+    print(f"speedup (start): {bisect_start_ms / newton_start_ms:5.2f}x")
+    print(f"agreement: mean {mean(deltas):.2f}s, max {max(deltas):.2f}s")
+
+
+if __name__ == "__main__":
+    main()
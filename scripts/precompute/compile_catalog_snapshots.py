@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""Compile the festival and v4 rule catalogs into hash-keyed load snapshots."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+BACKEND_ROOT = PROJECT_ROOT / "backend"
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.festivals.repository import compile_festival_snapshot  # noqa: E402
+from app.rules.catalog_v4 import compile_catalog_v4_snapshot  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.parse_args()
+
+    for name, compile_snapshot in (
+        ("v4 rule catalog", compile_catalog_v4_snapshot),
+        ("festival catalog", compile_festival_snapshot),
+    ):
+        path = compile_snapshot()
+        if path is None:
+            print(f"Skipped {name}: snapshots disabled or directory not writable")
+            continue
+        print(f"Wrote {name} snapshot {path} ({path.stat().st_size} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Convert yearly precomputed JSON artifacts into memory-mapped binary twins."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+BACKEND_ROOT = PROJECT_ROOT / "backend"
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.infrastructure.precomputed_binary import (  # noqa: E402
+    BinaryArtifact,
+    convert_json_artifact,
+)
+
+OUT_DIR = PROJECT_ROOT / "output" / "precomputed"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Convert precomputed JSON artifacts to binary")
+    parser.add_argument("--dir", type=Path, default=OUT_DIR, help="Artifact directory")
+    parser.add_argument(
+        "files",
+        nargs="*",
+        type=Path,
+        help="Specific panchanga_*/festivals_* JSON files. Defaults to every one in --dir.",
+    )
+    args = parser.parse_args()
+
+    sources = args.files or sorted(
+        [*args.dir.glob("panchanga_*.json"), *args.dir.glob("festivals_*.json")]
+    )
+    for source in sources:
+        out = convert_json_artifact(source)
+        artifact = BinaryArtifact(out)
+        print(
+            f"Wrote {out} ({artifact.record_count} slots, "
+            f"{out.stat().st_size} bytes vs {source.stat().st_size} JSON)"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
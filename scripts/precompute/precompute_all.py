@@ -20,28 +20,32 @@ def main() -> int:
     parser = argparse.ArgumentParser(description="Precompute panchanga + festival artifacts")
     parser.add_argument("--start-year", type=int, required=True)
     parser.add_argument("--end-year", type=int, required=True)
-    args = parser.parse_args()
-
-    _run(
-        [
-            sys.executable,
-            "scripts/precompute/precompute_panchanga.py",
-            "--start-year",
-            str(args.start_year),
-            "--end-year",
-            str(args.end_year),
-        ]
-    )
-    _run(
-        [
-            sys.executable,
-            "scripts/precompute/precompute_festivals.py",
-            "--start-year",
-            str(args.start_year),
-            "--end-year",
-            str(args.end_year),
-        ]
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Run panchanga/festival precompute sharded across this many processes.",
     )
+    args = parser.parse_args()
+    years = ["--start-year", str(args.start_year), "--end-year", str(args.end_year)]
+
+    # The transition index goes first: panchanga and festival jobs (serial or
+    # sharded) answer their tithi searches from it once it is on disk.
+    _run([sys.executable, "scripts/precompute/precompute_transitions.py", *years])
+    if args.workers > 1:
+        _run(
+            [
+                sys.executable,
+                "scripts/precompute/precompute_parallel.py",
+                *years,
+                "--workers",
+                str(args.workers),
+            ]
+        )
+    else:
+        _run([sys.executable, "scripts/precompute/precompute_panchanga.py", *years])
+        _run([sys.executable, "scripts/precompute/precompute_festivals.py", *years])
+    _run([sys.executable, "scripts/precompute/compile_catalog_snapshots.py"])
     return 0
 
 
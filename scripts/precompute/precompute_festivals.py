@@ -18,11 +18,12 @@ from app.calendar.calculator_v2 import (  # noqa: E402
     calculate_festival_v2,
     list_festivals_v2,
 )
+from app.infrastructure.precomputed_binary import convert_json_artifact  # noqa: E402
 
 OUT_DIR = PROJECT_ROOT / "output" / "precomputed"
 
 
-def precompute_year(year: int, festival_ids: list[str]) -> Path:
+def compute_rows(year: int, festival_ids: list[str]) -> list[dict]:
     rows = []
     for festival_id in festival_ids:
         result = calculate_festival_v2(festival_id, year)
@@ -39,20 +40,35 @@ def precompute_year(year: int, festival_ids: list[str]) -> Path:
                 "is_adhik_year": result.is_adhik_year,
             }
         )
+    return rows
+
 
-    rows.sort(key=lambda item: item["start"])
-    OUT_DIR.mkdir(parents=True, exist_ok=True)
-    out = OUT_DIR / f"festivals_{year}.json"
+def write_year(
+    year: int,
+    rows: list[dict],
+    *,
+    generated_at: str | None = None,
+    out_dir: Path | None = None,
+) -> Path:
+    rows = sorted(rows, key=lambda item: (item["start"], item["festival_id"]))
+    out_dir = out_dir or OUT_DIR
+    out_dir.mkdir(parents=True, exist_ok=True)
+    out = out_dir / f"festivals_{year}.json"
     payload = {
         "year": year,
-        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "generated_at": generated_at or datetime.now(timezone.utc).isoformat(),
         "count": len(rows),
         "festivals": rows,
     }
     out.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    convert_json_artifact(out)
     return out
 
 
+def precompute_year(year: int, festival_ids: list[str]) -> Path:
+    return write_year(year, compute_rows(year, festival_ids))
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Precompute festival yearly artifacts")
     parser.add_argument("--start-year", type=int, default=date.today().year)
@@ -20,17 +20,24 @@ from app.calendar.bikram_sambat import (  # noqa: E402
     get_bs_month_name,
     get_bs_source_range,
     gregorian_to_bs,
+    gregorian_to_bs_many,
 )
-from app.calendar.panchanga import get_panchanga  # noqa: E402
+from app.calendar.panchanga import get_panchanga, get_panchanga_many  # noqa: E402
+from app.infrastructure.precomputed_binary import convert_json_artifact  # noqa: E402
 from app.provenance import get_provenance_payload  # noqa: E402
 from app.uncertainty import build_bs_uncertainty, build_panchanga_uncertainty  # noqa: E402
 
 OUT_DIR = PROJECT_ROOT / "output" / "precomputed"
 
 
-def _build_panchanga_response(target_date: date) -> dict:
-    panchanga = get_panchanga(target_date)
-    bs_year, bs_month, bs_day = gregorian_to_bs(target_date)
+def _build_panchanga_response(
+    target_date: date,
+    panchanga: dict | None = None,
+    bs_date: tuple[int, int, int] | None = None,
+) -> dict:
+    if panchanga is None:
+        panchanga = get_panchanga(target_date)
+    bs_year, bs_month, bs_day = bs_date or gregorian_to_bs(target_date)
     confidence = get_bs_confidence(target_date)
     estimated_error = get_bs_estimated_error_days(target_date)
 
@@ -89,28 +96,47 @@ def _build_panchanga_response(target_date: date) -> dict:
     }
 
 
-def precompute_year(year: int) -> Path:
-    start = date(year, 1, 1)
-    end = date(year + 1, 1, 1)
+def compute_entries(days: list[date]) -> dict[str, dict]:
+    # Sunrise positions and BS dates for the whole span come from one batched
+    # call each.
+    return {
+        d.isoformat(): _build_panchanga_response(d, panchanga, bs_date)
+        for d, panchanga, bs_date in zip(
+            days, get_panchanga_many(days), gregorian_to_bs_many(days).to_tuples()
+        )
+    }
 
-    entries: dict[str, dict] = {}
-    d = start
-    while d < end:
-        entries[d.isoformat()] = _build_panchanga_response(d)
-        d += timedelta(days=1)
 
-    OUT_DIR.mkdir(parents=True, exist_ok=True)
-    out = OUT_DIR / f"panchanga_{year}.json"
+def write_year(
+    year: int,
+    entries: dict[str, dict],
+    *,
+    generated_at: str | None = None,
+    out_dir: Path | None = None,
+) -> Path:
+    out_dir = out_dir or OUT_DIR
+    out_dir.mkdir(parents=True, exist_ok=True)
+    out = out_dir / f"panchanga_{year}.json"
     payload = {
         "year": year,
-        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "generated_at": generated_at or datetime.now(timezone.utc).isoformat(),
         "count": len(entries),
-        "dates": entries,
+        "dates": dict(sorted(entries.items())),
     }
     out.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+    convert_json_artifact(out)
     return out
 
 
+def year_days(year: int) -> list[date]:
+    start = date(year, 1, 1)
+    return [start + timedelta(days=offset) for offset in range((date(year + 1, 1, 1) - start).days)]
+
+
+def precompute_year(year: int) -> Path:
+    return write_year(year, compute_entries(year_days(year)))
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Precompute panchanga yearly artifacts")
     parser.add_argument("--start-year", type=int, default=date.today().year)
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""Sharded, resumable, multi-process precompute of panchanga + festival artifacts.
+
+The year span is cut into shards (a run of days for panchanga, a year and a
+chunk of festival ids for festivals). Each shard runs in a worker process and
+writes a partial artifact under the work directory; a shard whose partial
+already exists is skipped, so an interrupted run resumes where it stopped.
+Once every shard of a year is present the partials are merged, in a fixed
+order, into the usual ``panchanga_<year>.json`` / ``festivals_<year>.json``
+layout (plus binary twins) in ``output/precomputed``.
+
+Usage:
+    python scripts/precompute/precompute_parallel.py --start-year 1950 --end-year 2150 \\
+        --workers 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Iterable
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPT_DIR.parents[1]
+BACKEND_ROOT = PROJECT_ROOT / "backend"
+for path in (BACKEND_ROOT, SCRIPT_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+import precompute_festivals  # noqa: E402
+import precompute_panchanga  # noqa: E402
+from app.calendar.calculator_v2 import list_festivals_v2  # noqa: E402
+from app.engine.ephemeris_config import get_ephemeris_config  # noqa: E402
+from app.provenance import get_provenance_payload  # noqa: E402
+
+OUT_DIR = PROJECT_ROOT / "output" / "precomputed"
+DEFAULT_WORK_DIR = OUT_DIR / ".partials"
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+KINDS = ("panchanga", "festivals")
+UNIT_NAMES = {"panchanga": "days", "festivals": "festival-years"}
+
+
+@dataclass(frozen=True)
+class Shard:
+    kind: str
+    year: int
+    index: int
+    start: str = ""
+    end: str = ""
+    festival_ids: tuple[str, ...] = ()
+
+    @property
+    def shard_id(self) -> str:
+        return f"{self.kind}_{self.year}_{self.index:03d}"
+
+    @property
+    def spec(self) -> dict[str, Any]:
+        spec = asdict(self)
+        spec["festival_ids"] = list(self.festival_ids)
+        return spec
+
+
+def plan_shards(
+    start_year: int,
+    end_year: int,
+    *,
+    kinds: Iterable[str] = KINDS,
+    days_per_shard: int = 31,
+    festival_ids: Iterable[str] = (),
+    festival_chunk: int = 0,
+) -> list[Shard]:
+    """Deterministic shard list; the same arguments always give the same shards."""
+    kinds = tuple(kinds)
+    ids = tuple(festival_ids)
+    shards: list[Shard] = []
+    for year in range(start_year, end_year + 1):
+        if "panchanga" in kinds:
+            days = precompute_panchanga.year_days(year)
+            for index, offset in enumerate(range(0, len(days), max(1, days_per_shard))):
+                chunk = days[offset : offset + max(1, days_per_shard)]
+                shards.append(
+                    Shard("panchanga", year, index, chunk[0].isoformat(), chunk[-1].isoformat())
+                )
+        if "festivals" in kinds and ids:
+            size = festival_chunk if festival_chunk > 0 else len(ids)
+            for index, offset in enumerate(range(0, len(ids), size)):
+                shards.append(
+                    Shard("festivals", year, index, festival_ids=ids[offset : offset + size])
+                )
+    return shards
+
+
+def _partial_path(work_dir: Path, shard: Shard) -> Path:
+    return work_dir / f"{shard.shard_id}.json"
+
+
+def _write_atomic(path: Path, payload: dict[str, Any]) -> None:
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def _load_partial(work_dir: Path, shard: Shard) -> dict[str, Any] | None:
+    path = _partial_path(work_dir, shard)
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    return payload if payload.get("shard") == shard.spec else None
+
+
+def run_shard(shard: Shard, work_dir: Path) -> dict[str, Any]:
+    """Compute one shard in the current process and checkpoint it to disk."""
+    started = time.perf_counter()
+    if shard.kind == "panchanga":
+        first, last = date.fromisoformat(shard.start), date.fromisoformat(shard.end)
+        days = [first + timedelta(days=offset) for offset in range((last - first).days + 1)]
+        rows: Any = precompute_panchanga.compute_entries(days)
+    else:
+        rows = precompute_festivals.compute_rows(shard.year, list(shard.festival_ids))
+    elapsed = time.perf_counter() - started
+
+    summary = {
+        "shard_id": shard.shard_id,
+        "kind": shard.kind,
+        "pid": os.getpid(),
+        "units": len(days) if shard.kind == "panchanga" else len(shard.festival_ids),
+        "seconds": round(elapsed, 4),
+    }
+    _write_atomic(_partial_path(work_dir, shard), {"shard": shard.spec, "rows": rows, **summary})
+    return summary
+
+
+def merge_year(
+    kind: str,
+    year: int,
+    shards: list[Shard],
+    work_dir: Path,
+    *,
+    generated_at: str,
+    out_dir: Path,
+) -> Path:
+    """Merge a complete year of partials; rows are ordered independently of shard timing."""
+    partials = [_load_partial(work_dir, shard) for shard in sorted(shards, key=lambda s: s.index)]
+    if any(partial is None for partial in partials):
+        raise RuntimeError(f"Cannot merge {kind} {year}: missing partial artifacts")
+    if kind == "panchanga":
+        entries: dict[str, dict] = {}
+        for partial in partials:
+            entries.update(partial["rows"])
+        return precompute_panchanga.write_year(
+            year, entries, generated_at=generated_at, out_dir=out_dir
+        )
+    rows = [row for partial in partials for row in partial["rows"]]
+    return precompute_festivals.write_year(year, rows, generated_at=generated_at, out_dir=out_dir)
+
+
+def _open_manifest(work_dir: Path, settings: dict[str, Any], *, fresh: bool) -> dict[str, Any]:
+    path = work_dir / MANIFEST_NAME
+    if fresh and work_dir.exists():
+        shutil.rmtree(work_dir)
+    if path.exists():
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+        if manifest.get("settings") != settings:
+            raise SystemExit(
+                f"{work_dir} holds partials from a run with different settings; "
+                "pass --fresh to discard them."
+            )
+        return manifest
+    work_dir.mkdir(parents=True, exist_ok=True)
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "settings": settings,
+    }
+    _write_atomic(path, manifest)
+    return manifest
+
+
+def run(
+    start_year: int,
+    end_year: int,
+    *,
+    workers: int,
+    kinds: Iterable[str] = KINDS,
+    festival_ids: Iterable[str] | None = None,
+    days_per_shard: int = 31,
+    festival_chunk: int = 0,
+    work_dir: Path = DEFAULT_WORK_DIR,
+    out_dir: Path = OUT_DIR,
+    fresh: bool = False,
+    keep_partials: bool = False,
+) -> dict[str, Any]:
+    kinds = tuple(kind for kind in KINDS if kind in set(kinds))
+    ids = tuple(festival_ids if festival_ids is not None else list_festivals_v2())
+    settings = {
+        "start_year": start_year,
+        "end_year": end_year,
+        "kinds": list(kinds),
+        "festival_ids": list(ids),
+        "days_per_shard": days_per_shard,
+        "festival_chunk": festival_chunk,
+        "ephemeris": get_ephemeris_config().header_value,
+    }
+    manifest = _open_manifest(work_dir, settings, fresh=fresh)
+    shards = plan_shards(
+        start_year,
+        end_year,
+        kinds=kinds,
+        days_per_shard=days_per_shard,
+        festival_ids=ids,
+        festival_chunk=festival_chunk,
+    )
+    pending = [shard for shard in shards if _load_partial(work_dir, shard) is None]
+    # Festival shards take longest (a full lunar year each); start them first so
+    # the pool does not finish on a tail of them.
+    pending.sort(key=lambda shard: shard.kind != "festivals")
+    resumed = len(shards) - len(pending)
+
+    by_year: dict[tuple[str, int], list[Shard]] = defaultdict(list)
+    for shard in shards:
+        by_year[(shard.kind, shard.year)].append(shard)
+    # Shards still outstanding per (kind, year); a year merges when it hits zero.
+    remaining: dict[tuple[str, int], int] = {key: 0 for key in by_year}
+    for shard in pending:
+        remaining[(shard.kind, shard.year)] += 1
+
+    summaries: list[dict[str, Any]] = []
+    failures: dict[str, str] = {}
+    written: list[Path] = []
+    merged: set[tuple[str, int]] = set()
+
+    def _merge_ready() -> None:
+        for key, count in sorted(remaining.items()):
+            if count == 0 and key not in merged:
+                merged.add(key)
+                written.append(
+                    merge_year(
+                        key[0],
+                        key[1],
+                        by_year[key],
+                        work_dir,
+                        generated_at=manifest["created_at"],
+                        out_dir=out_dir,
+                    )
+                )
+
+    # Materialize provenance once so workers only read it.
+    get_provenance_payload(verify_url="/v3/api/provenance/root", create_if_missing=True)
+    started = time.perf_counter()
+    _merge_ready()
+
+    if workers <= 1:
+        for shard in pending:
+            try:
+                summaries.append(run_shard(shard, work_dir))
+                remaining[(shard.kind, shard.year)] -= 1
+            except Exception as exc:
+                failures[shard.shard_id] = f"{type(exc).__name__}: {exc}"
+            _merge_ready()
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(run_shard, shard, work_dir): shard for shard in pending}
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    shard = futures.pop(future)
+                    try:
+                        summaries.append(future.result())
+                        remaining[(shard.kind, shard.year)] -= 1
+                    except Exception as exc:
+                        failures[shard.shard_id] = f"{type(exc).__name__}: {exc}"
+                _merge_ready()
+
+    wall_seconds = time.perf_counter() - started
+    per_worker: dict[int, dict[str, Any]] = {}
+    for summary in summaries:
+        stats = per_worker.setdefault(
+            summary["pid"], {"shards": 0, "seconds": 0.0, "units": defaultdict(int)}
+        )
+        stats["shards"] += 1
+        stats["seconds"] += summary["seconds"]
+        stats["units"][summary["kind"]] += summary["units"]
+    for stats in per_worker.values():
+        busy = stats["seconds"]
+        stats["units"] = dict(stats["units"])
+        stats["units_per_second"] = {
+            kind: round(units / busy, 2) if busy else 0.0 for kind, units in stats["units"].items()
+        }
+        stats["seconds"] = round(busy, 3)
+
+    if not failures and not keep_partials:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return {
+        "shards": len(shards),
+        "resumed": resumed,
+        "computed": len(summaries),
+        "failed": failures,
+        "written": [str(path) for path in written],
+        "wall_seconds": round(wall_seconds, 3),
+        "workers": per_worker,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Parallel, resumable precompute of artifacts")
+    parser.add_argument("--start-year", type=int, default=date.today().year)
+    parser.add_argument("--end-year", type=int, default=date.today().year + 2)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--kinds", default=",".join(KINDS), help="panchanga,festivals")
+    parser.add_argument(
+        "--festivals",
+        default="",
+        help="Comma-separated festival ids. Defaults to all v2 festivals.",
+    )
+    parser.add_argument("--days-per-shard", type=int, default=31)
+    parser.add_argument(
+        "--festival-chunk",
+        type=int,
+        default=0,
+        help="Festival ids per shard (0 = one shard per year, sharing lunar-year caches).",
+    )
+    parser.add_argument("--work-dir", type=Path, default=DEFAULT_WORK_DIR)
+    parser.add_argument("--out-dir", type=Path, default=OUT_DIR)
+    parser.add_argument("--fresh", action="store_true", help="Discard existing partials first")
+    parser.add_argument("--keep-partials", action="store_true")
+    args = parser.parse_args()
+
+    festival_ids = [f.strip() for f in args.festivals.split(",") if f.strip()] or None
+    report = run(
+        min(args.start_year, args.end_year),
+        max(args.start_year, args.end_year),
+        workers=args.workers,
+        kinds=[kind.strip() for kind in args.kinds.split(",") if kind.strip()],
+        festival_ids=festival_ids,
+        days_per_shard=args.days_per_shard,
+        festival_chunk=args.festival_chunk,
+        work_dir=args.work_dir,
+        out_dir=args.out_dir,
+        fresh=args.fresh,
+        keep_partials=args.keep_partials,
+    )
+
+    print(
+        f"{report['computed']} shards computed, {report['resumed']} resumed, "
+        f"{len(report['written'])} artifacts written in {report['wall_seconds']}s"
+    )
+    for pid, stats in sorted(report["workers"].items()):
+        rates = ", ".join(
+            f"{stats['units'][kind]} {UNIT_NAMES[kind]} @ {rate}/s"
+            for kind, rate in sorted(stats["units_per_second"].items())
+        )
+        print(f"  worker {pid}: {stats['shards']} shards in {stats['seconds']}s busy ({rates})")
+    for shard_id, error in sorted(report["failed"].items()):
+        print(f"  FAILED {shard_id}: {error}")
+    return 1 if report["failed"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Precompute the tithi/nakshatra/yoga/karana transition index."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+BACKEND_ROOT = PROJECT_ROOT / "backend"
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.calendar.transition_index import (  # noqa: E402
+    DEFAULT_TOLERANCE_SECONDS,
+    TRANSITION_KINDS,
+    load_transition_index,
+    resolve_index_path,
+    write_transition_index,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Precompute panchanga transition index")
+    parser.add_argument("--start-year", type=int, default=date.today().year - 5)
+    parser.add_argument("--end-year", type=int, default=date.today().year + 10)
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--tolerance-seconds", type=float, default=DEFAULT_TOLERANCE_SECONDS)
+    args = parser.parse_args()
+
+    start_year = min(args.start_year, args.end_year)
+    end_year = max(args.start_year, args.end_year)
+    out = args.output or resolve_index_path()
+
+    started = time.perf_counter()
+    write_transition_index(out, start_year, end_year, tolerance_seconds=args.tolerance_seconds)
+    elapsed = time.perf_counter() - started
+
+    index = load_transition_index(out)
+    counts = ", ".join(f"{name}={len(index.jds[name])}" for name in TRANSITION_KINDS)
+    print(f"Wrote {out} ({start_year}-{end_year}, {out.stat().st_size} bytes, {elapsed:.1f}s)")
+    print(f"Transitions: {counts}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -64,3 +64,71 @@ def test_integration_feed_alias_catalog_matches_canonical_presets():
     ]
     assert alias_body["platforms"]["google"]["requires_desktop"] is True
     assert alias_body["presets"][0]["feed_url"].startswith("http")
+
+
+def test_feed_etag_answers_if_none_match_with_304():
+    first = client.get("/v3/api/feeds/national.ics")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert etag.startswith('"') and etag.endswith('"')
+
+    repeat = client.get("/v3/api/feeds/national.ics")
+    assert repeat.headers["etag"] == etag
+    assert repeat.content == first.content
+
+    not_modified = client.get("/v3/api/feeds/national.ics", headers={"If-None-Match": f"W/{etag}"})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+
+    other = client.get("/v3/api/feeds/national.ics", params={"lang": "ne"}, headers={"If-None-Match": etag})
+    assert other.status_code == 200
+    assert other.headers["etag"] != etag
+
+
+def test_feed_filter_sets_share_materialized_event_blocks():
+    from app.integrations import clear_feed_cache, feed_cache_stats, materialize_feed
+
+    clear_feed_cache()
+    everything = materialize_feed(years=1, start_year=2026)
+    built = feed_cache_stats()["event_builds"]
+    custom = materialize_feed(festival_ids=["dashain", "tihar"], years=1, start_year=2026)
+    stats = feed_cache_stats()
+
+    assert [event.uid for event in custom.events] == [
+        event.uid for event in everything.events if event.uid.startswith(("dashain-", "tihar-"))
+    ]
+    assert stats["event_builds"] == built
+    assert stats["feed_builds"] == 2
+
+
+def test_long_feed_is_streamed_in_the_materialized_order():
+    from app.integrations import materialize_feed
+
+    response = client.get("/v3/api/feeds/national.ics", params={"years": 5, "start_year": 2026})
+    assert response.status_code == 200
+    assert "etag" not in response.headers
+    assert response.headers["content-type"].startswith("text/calendar")
+    assert response.text.startswith("BEGIN:VCALENDAR\r\n")
+    assert response.text.endswith("END:VCALENDAR\r\n")
+
+    uids = [line[len("UID:") :] for line in response.text.split("\r\n") if line.startswith("UID:")]
+    feed = materialize_feed(category="national", years=5, start_year=2026)
+    assert uids == [event.uid for event in feed.events]
+    assert len(set(uids)) == len(uids)
+
+
+def test_feed_export_streams_one_json_event_per_line():
+    import json
+
+    response = client.get(
+        "/v3/api/integrations/feeds/export.ndjson",
+        params={"festivals": "dashain,tihar", "years": 2, "start_year": 2026},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert {row["uid"].split("-")[0] for row in rows} == {"dashain", "tihar"}
+    assert [row["start_date"] for row in rows] == sorted(row["start_date"] for row in rows)
+    assert set(rows[0]) == {"uid", "summary", "start_date", "end_date", "categories", "location"}
@@ -69,3 +69,26 @@ def test_timeline_search_surfaces_unresolved_matches_when_search_hits_inventory_
     assert payload['unresolved_matches']
     assert payload['unresolved_matches'][0]['id'] == 'lhosar'
     assert payload['unresolved_matches'][0]['date_status'] == 'missing_rule'
+
+
+def test_timeline_export_streams_the_same_items_across_years():
+    import json
+
+    params = {'from': '2026-06-01', 'to': '2028-03-31', 'quality_band': 'all'}
+    timeline = _flatten(_payload(client.get('/v3/api/festivals/timeline', params=params))['groups'])
+    response = client.get('/v3/api/festivals/timeline/export.ndjson', params=params)
+
+    assert response.status_code == 200
+    assert response.headers['content-type'] == 'application/x-ndjson'
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [(row['id'], row['start_date']) for row in rows] == [
+        (row['id'], row['start_date']) for row in timeline
+    ]
+
+
+def test_timeline_export_rejects_inverted_window_before_streaming():
+    response = client.get(
+        '/v3/api/festivals/timeline/export.ndjson',
+        params={'from': '2026-12-01', 'to': '2026-01-01'},
+    )
+    assert response.status_code == 400
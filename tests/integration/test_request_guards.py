@@ -75,3 +75,19 @@ def test_health_reports_source_metadata(monkeypatch: pytest.MonkeyPatch):
     payload = response.json()
     assert payload["license"] == "AGPL-3.0-or-later"
     assert payload["source_code_url"] == "https://example.com/source"
+
+
+def test_saturated_compute_lane_sheds_with_503(monkeypatch: pytest.MonkeyPatch):
+    from app.infrastructure import compute_executor
+
+    async def saturated(lane, fn, *args, **kwargs):
+        raise compute_executor.ComputeSaturatedError(lane, reason="queue_limit")
+
+    client = _client()
+    monkeypatch.setattr(compute_executor.get_compute_executor(), "run", saturated)
+
+    response = client.get("/api/calendar/panchanga?date=2026-02-15")
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert response.json()["detail"] == "Compute capacity exhausted, retry shortly"
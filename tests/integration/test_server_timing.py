@@ -0,0 +1,50 @@
+"""Server-Timing header and opt-in request profiling."""
+
+from __future__ import annotations
+
+from app.bootstrap.app_factory import create_app
+from fastapi.testclient import TestClient
+
+
+def test_panchanga_reports_stages_and_ephemeris_calls():
+    response = TestClient(create_app()).get("/v3/api/calendar/panchanga?date=2033-03-17")
+
+    assert response.status_code == 200
+    entries = {
+        item.split(";")[0].strip(): item for item in response.headers["Server-Timing"].split(",")
+    }
+    assert "total" in entries
+    assert "serialize" in entries
+    assert "swe-calc-ut" in entries
+
+
+def test_server_timing_can_be_disabled(monkeypatch):
+    monkeypatch.setenv("PARVA_SERVER_TIMING", "false")
+    response = TestClient(create_app()).get("/health/live")
+
+    assert response.status_code == 200
+    assert "Server-Timing" not in response.headers
+
+
+def test_sampled_request_writes_profile(monkeypatch, tmp_path):
+    monkeypatch.setenv("PARVA_PROFILE_SAMPLE_RATE", "1")
+    monkeypatch.setenv("PARVA_PROFILE_DIR", str(tmp_path))
+    response = TestClient(create_app()).get(
+        "/v3/api/calendar/panchanga?date=2031-07-09", headers={"X-Request-ID": "profiled-1"}
+    )
+
+    assert response.status_code == 200
+    assert [path.name.split("-", 1)[1] for path in tmp_path.iterdir()] == ["profiled-1.folded"]
+
+
+def test_unwritable_profile_dir_does_not_fail_the_request(monkeypatch, tmp_path, caplog):
+    blocked = tmp_path / "profiles"
+    blocked.write_text("not a directory", encoding="utf-8")
+    monkeypatch.setenv("PARVA_PROFILE_SAMPLE_RATE", "1")
+    monkeypatch.setenv("PARVA_PROFILE_DIR", str(blocked))
+
+    with caplog.at_level("WARNING", logger="app.reliability.profiler"):
+        response = TestClient(create_app()).get("/v3/api/calendar/panchanga?date=2031-07-10")
+
+    assert response.status_code == 200
+    assert "Could not write request profile" in caplog.text
@@ -70,3 +70,108 @@ def test_data_meta_envelope_opt_in_detects_header():
 
 def test_data_meta_envelope_opt_in_detects_query_param():
     assert _wants_data_meta_envelope(_scope("/v3/api/festivals/timeline", query_string=b"envelope=data-meta")) is True
+
+
+def test_route_template_labels_collapse_path_parameters():
+    from app.bootstrap.middleware import UNMATCHED_ROUTE, route_template
+    from fastapi import FastAPI
+
+    app = FastAPI()
+
+    @app.get("/v3/api/festivals/{festival_id}")
+    def festival(festival_id: str):
+        return {}
+
+    def scope(path):
+        return {"type": "http", "method": "GET", "path": path, "app": app, "headers": []}
+
+    assert route_template(scope("/v3/api/festivals/dashain")) == "/v3/api/festivals/{festival_id}"
+    assert route_template(scope("/v3/api/festivals/tihar")) == "/v3/api/festivals/{festival_id}"
+    assert route_template(scope("/wp-login.php")) == UNMATCHED_ROUTE
+
+
+class _FixedRateLimiter:
+    def __init__(self, *, allowed):
+        self.allowed = allowed
+
+    def check(self, *, identifier, bucket, policy, now):
+        from app.bootstrap.rate_limit import RateLimitDecision
+
+        if self.allowed:
+            return RateLimitDecision(allowed=True, remaining=policy.limit - 1)
+        return RateLimitDecision(allowed=False, remaining=0, retry_after=7)
+
+
+def _pipeline_client(*, allowed=True):
+    from app.bootstrap.middleware import RequestPipelineMiddleware
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    app = FastAPI()
+
+    @app.get("/v3/api/policy")
+    def policy():
+        return {"ok": True}
+
+    app.add_middleware(
+        RequestPipelineMiddleware,
+        settings=_settings(),
+        rate_limit_backend=_FixedRateLimiter(allowed=allowed),
+        product_version="test",
+        ephemeris_header_value=lambda: "moshier",
+    )
+    return TestClient(app)
+
+
+def test_request_pipeline_decorates_routed_responses():
+    response = _pipeline_client().get("/v3/api/policy", headers={"X-Request-ID": "req-1"})
+
+    assert response.status_code == 200
+    assert response.json() == {"ok": True}
+    assert response.headers["X-Request-ID"] == "req-1"
+    assert response.headers["X-Parva-Ephemeris"] == "moshier"
+    assert response.headers["X-Content-Type-Options"] == "nosniff"
+    assert response.headers["X-RateLimit-Remaining"].isdigit()
+    assert response.headers["Server-Timing"].startswith("total;dur=")
+
+
+def test_request_pipeline_guard_rejections_skip_engine_headers():
+    throttled = _pipeline_client(allowed=False).get("/v3/api/policy")
+    gated = _pipeline_client().get("/v4/api/anything")
+
+    assert throttled.status_code == 429
+    assert throttled.headers["Retry-After"] == "7"
+    assert throttled.headers["X-RateLimit-Remaining"] == "0"
+    assert gated.status_code == 404
+    assert gated.json()["public_profile"] == "v3"
+    for response in (throttled, gated):
+        assert "X-Request-ID" in response.headers
+        assert "X-Parva-Ephemeris" not in response.headers
+
+
+def test_envelope_splices_timed_json_body_without_changing_bytes():
+    from app.bootstrap.middleware import ExperimentalEnvelopeMiddleware
+    from app.bootstrap.responses import TimedJSONResponse
+    from fastapi import FastAPI
+    from fastapi.responses import JSONResponse
+    from fastapi.testclient import TestClient
+
+    payload = {"items": [{"id": index, "name": f"पर्व {index}"} for index in range(50)]}
+
+    def client(response_class):
+        app = FastAPI()
+
+        @app.get("/v3/api/festivals/timeline")
+        def timeline():
+            return response_class(payload)
+
+        return TestClient(ExperimentalEnvelopeMiddleware(app, enable_experimental_api=False))
+
+    headers = {"X-Parva-Envelope": "data-meta"}
+    spliced = client(TimedJSONResponse).get("/v3/api/festivals/timeline", headers=headers)
+    reparsed = client(JSONResponse).get("/v3/api/festivals/timeline", headers=headers)
+
+    assert spliced.content == reparsed.content
+    assert spliced.headers["content-length"] == str(len(spliced.content))
+    assert spliced.headers["X-Parva-Envelope"] == "data-meta"
+    assert spliced.json()["data"] == payload
@@ -0,0 +1,42 @@
+"""JSON response class tests."""
+
+import math
+
+import pytest
+from app.bootstrap.responses import FastJSONResponse, TimedJSONResponse, json_response_class
+from app.core.json_codec import dumps_orjson, dumps_stdlib, orjson_available
+
+PAYLOAD = {"festival": "दशैं", "days": [1, 2, 3], "score": 0.95, "meta": {"ok": True}}
+
+
+def test_stdlib_response_matches_starlette_encoding():
+    from fastapi.responses import JSONResponse
+
+    assert TimedJSONResponse(PAYLOAD).body == JSONResponse(PAYLOAD).body
+    assert json_response_class("stdlib") is TimedJSONResponse
+
+
+@pytest.mark.skipif(not orjson_available(), reason="orjson not installed")
+def test_orjson_response_is_default_and_byte_compatible():
+    assert json_response_class("auto") is FastJSONResponse
+    assert FastJSONResponse(PAYLOAD).body == dumps_stdlib(PAYLOAD)
+    # Values orjson rejects fall back to the standard library instead of failing.
+    assert dumps_orjson({"big": 2**70}) == b'{"big":1180591620717411303424}'
+    assert dumps_orjson({"nan": math.nan}) == b'{"nan":null}'
+
+
+def test_app_start_installs_the_response_encoder_for_pre_encoded_bodies(monkeypatch):
+    from app.bootstrap.app_factory import create_app
+    from app.core.json_codec import configure_default_json_encoder, default_json_encoder_name
+    from app.infrastructure.precomputed_store import FilePrecomputedArtifactStore
+    from app.reliability.metrics import MetricsRegistry
+
+    previous = default_json_encoder_name()
+    monkeypatch.setenv("PARVA_JSON_ENCODER", "stdlib")
+    try:
+        create_app()
+        assert default_json_encoder_name() == "stdlib"
+        store = FilePrecomputedArtifactStore(None, MetricsRegistry())
+        assert store.json_encoder == "stdlib"
+    finally:
+        configure_default_json_encoder(previous)
@@ -1,7 +1,7 @@
 """Settings validation tests."""
 
 import pytest
-from app.bootstrap.settings import load_settings
+from app.bootstrap.settings import load_settings, validate_settings
 
 
 def test_load_settings_parses_trusted_proxy_ips(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -97,3 +97,26 @@ def test_create_app_requires_precomputed_artifacts_in_production_by_default(
 
     with pytest.raises(RuntimeError, match="requires precomputed artifacts"):
         app_factory.create_app()
+
+
+def test_load_settings_parses_compute_pool_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("PARVA_COMPUTE_EXECUTOR", "process")
+    monkeypatch.setenv("PARVA_COMPUTE_MAX_WORKERS", "2")
+    monkeypatch.setenv("PARVA_COMPUTE_LANE_LIMITS", "kundali:3, muhurta:5")
+
+    settings = load_settings()
+
+    assert settings.compute_executor == "process"
+    assert settings.compute_max_workers == 2
+    assert settings.compute_lane_limits == {"kundali": 3, "muhurta": 5}
+    assert validate_settings(settings) == []
+
+
+def test_load_settings_validates_json_encoder(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("PARVA_JSON_ENCODER", "stdlib")
+    assert validate_settings(load_settings()) == []
+
+    monkeypatch.setenv("PARVA_JSON_ENCODER", "ujson")
+    assert validate_settings(load_settings()) == [
+        "PARVA_JSON_ENCODER must be one of auto, orjson or stdlib."
+    ]
@@ -135,3 +135,30 @@ def test_measure_hotset_latency_reports_cold_and_warm(monkeypatch, tmp_path):
     assert "delta_ms" in probe
     assert probe["panchanga_hit"] is True
     assert probe["festival_years"] == {"2026": True, "2027": True}
+
+
+def test_festival_report_index_is_rebuilt_when_artifact_changes(monkeypatch, tmp_path):
+    import os
+
+    import app.cache.precomputed as precomputed_module
+
+    monkeypatch.setattr(precomputed_module, "PRECOMPUTE_DIR", tmp_path)
+    precomputed_module.clear_precomputed_cache()
+    source = tmp_path / "festivals_2028.json"
+    row = {"festival_id": "first", "start": "2028-03-01", "end": "2028-03-02"}
+    _write_json(source, {"year": 2028, "festivals": [row]})
+
+    report = precomputed_module.load_precomputed_festivals_between_report(
+        date(2028, 3, 2), date(2028, 3, 2)
+    )
+    assert [item["festival_id"] for item in report["rows"]] == ["first"]
+    assert report["rows"][0]["start_date"] == date(2028, 3, 1)
+
+    _write_json(source, {"year": 2028, "festivals": [{**row, "festival_id": "second"}]})
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    report = precomputed_module.load_precomputed_festivals_between_report(
+        date(2028, 3, 2), date(2028, 3, 2)
+    )
+    assert [item["festival_id"] for item in report["rows"]] == ["second"]
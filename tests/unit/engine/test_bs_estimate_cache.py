@@ -0,0 +1,108 @@
+"""Estimated-mode BS layouts persist across process restarts."""
+
+from __future__ import annotations
+
+import json
+from datetime import date
+
+import pytest
+from app.calendar import bikram_sambat
+from app.calendar.bs_estimate_cache import (
+    CACHE_DIR_ENV,
+    get_bs_estimate_cache,
+    reset_bs_estimate_caches,
+)
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+    reset_bs_estimate_caches()
+    yield tmp_path
+    reset_bs_estimate_caches()
+
+
+def test_estimated_conversion_is_served_from_disk_after_restart(cache_dir, monkeypatch):
+    target = date(1960, 8, 15)
+    expected = bikram_sambat.gregorian_to_bs(target)
+    get_bs_estimate_cache().flush()
+
+    files = list(cache_dir.glob("bs_estimates_v1_*.json"))
+    assert len(files) == 1
+    payload = json.loads(files[0].read_text(encoding="utf-8"))
+    assert payload["config"] == "moshier-lahiri-sidereal"
+    assert str(expected[0]) in payload["years"]
+
+    # A fresh worker must not need to solve any sankranti again.
+    reset_bs_estimate_caches()
+
+    def _no_ephemeris(*_args, **_kwargs):
+        raise AssertionError("sankranti should come from the persistent cache")
+
+    monkeypatch.setattr(bikram_sambat, "find_mesh_sankranti", _no_ephemeris)
+    monkeypatch.setattr(bikram_sambat, "get_sankrantis_in_year", _no_ephemeris)
+
+    assert bikram_sambat.gregorian_to_bs(target) == expected
+    year, month, day = expected
+    assert bikram_sambat.bs_to_gregorian(year, month, day) == target
+
+
+def test_cache_ignores_files_for_other_ephemeris_configs(cache_dir):
+    cache = get_bs_estimate_cache()
+    cache.path.write_text(
+        json.dumps(
+            {
+                "version": 1,
+                "config": "moshier-raman-sidereal",
+                "mesh_sankranti": {},
+                "years": {"2017": {"month_starts": [[1, "1960-04-13"]], "year_end": "1961-04-13"}},
+            }
+        ),
+        encoding="utf-8",
+    )
+    reset_bs_estimate_caches()
+
+    assert get_bs_estimate_cache().get_year_layout(2017) is None
+
+
+def _layout(bs_year: int):
+    start = date(bs_year - 57, 4, 14)
+    return [(1, start)], date(bs_year - 56, 4, 14)
+
+
+def test_cold_fill_writes_the_file_once_and_flush_persists_the_rest(cache_dir, monkeypatch):
+    from app.calendar import bs_estimate_cache
+
+    writes = []
+    real_replace = bs_estimate_cache.os.replace
+
+    def _counting_replace(src, dst):
+        writes.append(dst)
+        real_replace(src, dst)
+
+    monkeypatch.setattr(bs_estimate_cache.os, "replace", _counting_replace)
+    cache = get_bs_estimate_cache()
+    for bs_year in range(1900, 1950):
+        cache.put_year_layout(bs_year, *_layout(bs_year))
+
+    assert len(writes) == 1
+    cache.flush()
+    assert len(writes) == 2
+    payload = json.loads(cache.path.read_text(encoding="utf-8"))
+    assert len(payload["years"]) == 50
+
+
+def test_flush_merges_entries_written_by_another_worker(cache_dir):
+    cache = get_bs_estimate_cache()
+    cache.put_year_layout(1900, *_layout(1900))
+
+    payload = json.loads(cache.path.read_text(encoding="utf-8"))
+    payload["years"]["1901"] = {"month_starts": [[1, "1844-04-13"]], "year_end": "1845-04-13"}
+    cache.path.write_text(json.dumps(payload), encoding="utf-8")
+
+    cache.put_year_layout(1902, *_layout(1902))
+    cache.flush()
+
+    reset_bs_estimate_caches()
+    reloaded = get_bs_estimate_cache()
+    assert all(reloaded.get_year_layout(year) is not None for year in (1900, 1901, 1902))
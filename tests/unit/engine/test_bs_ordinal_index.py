@@ -0,0 +1,51 @@
+"""Ordinal-index BS conversion agrees with the official table and overrides."""
+
+from __future__ import annotations
+
+import json
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+from app.calendar.bikram_sambat import (
+    bs_to_gregorian,
+    gregorian_to_bs,
+    gregorian_to_bs_many,
+    gregorian_to_bs_official,
+)
+
+FIXTURE = Path(__file__).resolve().parents[2] / "fixtures" / "bs_overlap_comparison.json"
+
+
+def test_official_conversion_matches_overlap_fixture_both_ways():
+    rows = json.loads(FIXTURE.read_text(encoding="utf-8"))["rows"]
+    overrides = {"2026-02-07"}
+
+    for row in rows:
+        if row["gregorian"] in overrides:
+            continue
+        gregorian = date.fromisoformat(row["gregorian"])
+        year, month, day = (int(part) for part in row["official_bs"].split("-"))
+
+        assert gregorian_to_bs_official(gregorian) == (year, month, day)
+        assert bs_to_gregorian(year, month, day) == gregorian
+
+
+def test_overrides_are_folded_into_index():
+    assert gregorian_to_bs(date(2026, 2, 7)) == (2082, 10, 24)
+    assert bs_to_gregorian(2082, 10, 24) == date(2026, 2, 7)
+
+
+def test_bulk_conversion_matches_scalar_inside_and_outside_official_range():
+    dates = [date(2012, 12, 1) + timedelta(days=offset) for offset in range(0, 9600, 7)]
+    dates += [date(2039, 1, 1), date(2040, 6, 15)]
+
+    result = gregorian_to_bs_many(dates)
+
+    assert len(result) == len(dates)
+    assert result.to_tuples() == [gregorian_to_bs(d) for d in dates]
+
+
+def test_official_lookup_rejects_dates_outside_range():
+    with pytest.raises(ValueError):
+        gregorian_to_bs_official(date(2050, 1, 1))
@@ -0,0 +1,52 @@
+"""Chebyshev position backend vs direct pyswisseph calls."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import swisseph as swe
+from app.calendar.ephemeris.chebyshev import body_state, chebyshev_cache_stats
+from app.calendar.ephemeris.swiss_eph import (
+    SIDEREAL_FLAGS,
+    TROPICAL_FLAGS,
+    get_julian_day,
+    get_sun_moon_state,
+)
+from app.engine.ephemeris_config import EphemerisConfig
+
+MAX_ARCSEC = 0.001
+
+
+def _arcsec(a: float, b: float) -> float:
+    return abs((a - b + 180.0) % 360.0 - 180.0) * 3600.0
+
+
+def test_interpolated_longitudes_match_pyswisseph():
+    ayanamsa = swe.SIDM_LAHIRI
+    # Includes window edges and the Sun's Meena -> Mesha (360 -> 0) crossing.
+    julian_days = [2461136.0 + 0.37 * step for step in range(80)] + [2451536.0, 2451552.0]
+    for flags in (SIDEREAL_FLAGS, TROPICAL_FLAGS):
+        swe.set_sid_mode(ayanamsa)
+        for jd in julian_days:
+            for body in (swe.SUN, swe.MOON):
+                longitude, speed = body_state(body, jd, flags, ayanamsa)
+                reference = swe.calc_ut(jd, body, flags)[0]
+                assert 0.0 <= longitude < 360.0
+                assert _arcsec(longitude, reference[0]) < MAX_ARCSEC
+                assert abs(speed - reference[3]) < 2e-4
+
+
+def test_backend_switch_routes_sun_moon_state():
+    jd = get_julian_day(datetime(2026, 10, 20, 6, 30, tzinfo=timezone.utc))
+    direct = EphemerisConfig()
+    interpolated = EphemerisConfig(position_backend="chebyshev")
+
+    fits_before = chebyshev_cache_stats()["fits"]
+    expected = get_sun_moon_state(jd, config=direct)
+    actual = get_sun_moon_state(jd, config=interpolated)
+    get_sun_moon_state(jd + 0.01, config=interpolated)
+
+    assert _arcsec(actual[0], expected[0]) < MAX_ARCSEC
+    assert _arcsec(actual[2], expected[2]) < MAX_ARCSEC
+    assert chebyshev_cache_stats()["fits"] - fits_before <= 2
+    assert interpolated.header_value == f"{direct.header_value}+chebyshev"
@@ -6,7 +6,12 @@ import json
 from datetime import datetime
 from pathlib import Path
 
-from app.calendar.ephemeris.swiss_eph import get_sun_moon_positions
+import numpy as np
+from app.calendar.ephemeris.swiss_eph import (
+    get_julian_days,
+    get_sun_moon_positions,
+    get_sun_moon_positions_batch,
+)
 
 FIXTURE = Path(__file__).resolve().parents[2] / "fixtures" / "ephemeris_500.json"
 
@@ -30,3 +35,20 @@ def test_sun_moon_positions_against_fixture_tolerance():
 
         assert abs(sun - row["sun_longitude"]) <= sun_tol
         assert abs(moon - row["moon_longitude"]) <= moon_tol
+
+
+def test_batch_positions_match_scalar_positions_on_fixture():
+    data = json.loads(FIXTURE.read_text(encoding="utf-8"))
+    datetimes = [datetime.fromisoformat(row["datetime_utc"]) for row in data["samples"]]
+
+    batch = get_sun_moon_positions_batch(get_julian_days(datetimes))
+
+    assert batch.sun_longitude.dtype == np.float64
+    assert batch.moon_longitude.flags["C_CONTIGUOUS"]
+    assert len(batch) == 500
+    for index, dt in enumerate(datetimes):
+        sun, moon = get_sun_moon_positions(dt)
+        assert batch.sun_longitude[index] == sun
+        assert batch.moon_longitude[index] == moon
+    # Moon runs ~12-15 deg/day ahead of the Sun's ~1 deg/day.
+    assert np.all((batch.elongation_speed > 9.0) & (batch.elongation_speed < 17.0))
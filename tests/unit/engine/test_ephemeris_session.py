@@ -0,0 +1,59 @@
+"""Concurrent requests with different ayanamsas must not leak into each other."""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import swisseph as swe
+from app.calendar.ephemeris.swiss_eph import get_ayanamsa, get_sun_moon_state
+from app.calendar.graha import get_all_graha_positions
+from app.engine.ephemeris_config import EphemerisConfig
+
+CONFIGS = [EphemerisConfig(ayanamsa=name) for name in ("lahiri", "raman", "kp")]
+ORIGIN = datetime(2026, 3, 1, 6, 0, tzinfo=timezone.utc)
+
+
+def _observe(cfg: EphemerisConfig, step: int):
+    dt = ORIGIN + timedelta(hours=step)
+    grahas = get_all_graha_positions(dt, config=cfg)
+    return (
+        get_ayanamsa(dt, config=cfg),
+        get_sun_moon_state(2461100.5 + step / 24, config=cfg)[2],
+        tuple(grahas[graha_id]["longitude"] for graha_id in ("sun", "moon", "saturn", "rahu")),
+    )
+
+
+def test_mixed_ayanamsa_threads_match_serial_results(monkeypatch):
+    steps = 12
+    expected = {cfg.ayanamsa: [_observe(cfg, step) for step in range(steps)] for cfg in CONFIGS}
+
+    # Sleep before every ephemeris call so other threads run between "set the
+    # ayanamsa" and "calculate" on every call, not just on an unlucky switch.
+    def yielding(original):
+        def call(*args, **kwargs):
+            time.sleep(0.0001)
+            return original(*args, **kwargs)
+
+        return call
+
+    monkeypatch.setattr(swe, "calc_ut", yielding(swe.calc_ut))
+    monkeypatch.setattr(swe, "get_ayanamsa_ut", yielding(swe.get_ayanamsa_ut))
+    mismatches: list[tuple[str, int]] = []
+    start = threading.Barrier(len(CONFIGS) * 2)
+
+    def worker(cfg: EphemerisConfig) -> None:
+        start.wait()
+        for _ in range(2):
+            for step in range(steps):
+                if _observe(cfg, step) != expected[cfg.ayanamsa][step]:
+                    mismatches.append((cfg.ayanamsa, step))
+
+    threads = [threading.Thread(target=worker, args=(cfg,)) for cfg in CONFIGS * 2]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert mismatches == []
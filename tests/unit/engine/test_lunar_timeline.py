@@ -0,0 +1,90 @@
+"""Shared lunation timeline behind lunar years and month boundaries."""
+
+from __future__ import annotations
+
+import threading
+from datetime import timedelta
+
+from app.calendar.lunar_calendar import LunarTimeline, compute_lunar_month
+
+
+def test_adjacent_years_reuse_every_solved_month():
+    timeline = LunarTimeline()
+    year_2025 = timeline.lunar_year(2025)
+    year_2026 = timeline.lunar_year(2026)
+
+    stats = timeline.stats()
+    assert stats["solves"]["amavasya"] == stats["new_moons"]
+    assert stats["solves"]["purnima"] == stats["months"]
+
+    shared = {id(m) for m in year_2025.months} & {id(m) for m in year_2026.months}
+    assert shared, "overlapping months should be the same records"
+
+    timeline.lunar_year(2025)
+    timeline.month_boundaries(2026)
+    assert timeline.stats()["solves"] == stats["solves"]
+
+
+def test_timeline_months_match_standalone_computation():
+    timeline = LunarTimeline()
+    months = timeline.lunar_year(2026).months[:4]
+
+    standalone = compute_lunar_month(months[0].start_amavasya)
+    for month in months:
+        assert abs(month.start_amavasya - standalone.start_amavasya) < timedelta(seconds=1)
+        assert abs(month.end_amavasya - standalone.end_amavasya) < timedelta(seconds=1)
+        assert month.full_name == standalone.full_name
+        assert (month.sankranti_date is None) == (standalone.sankranti_date is None)
+        standalone = compute_lunar_month(month.end_amavasya)
+
+
+def test_timeline_grows_backward_within_its_bound():
+    timeline = LunarTimeline(max_lunations=30)
+    timeline.lunar_year(2030)
+    boundaries = timeline.month_boundaries(2027)
+
+    assert timeline.stats()["new_moons"] <= 30
+    assert len(boundaries) >= 12
+    for (_, end), (start, _) in zip(boundaries, boundaries[1:]):
+        assert end == start
+
+
+def test_distant_year_after_warm_year_costs_the_same_as_cold():
+    cold = LunarTimeline()
+    cold_year = cold.lunar_year(2100)
+
+    warm = LunarTimeline()
+    warm.lunar_year(2026)
+    before = warm.stats()["solves"]
+    warm_year = warm.lunar_year(2100)
+    after = warm.stats()["solves"]
+
+    assert after["amavasya"] - before["amavasya"] == cold.stats()["solves"]["amavasya"]
+    assert after["purnima"] - before["purnima"] == cold.stats()["solves"]["purnima"]
+    assert warm.stats()["segments"] == 2
+    assert [m.full_name for m in warm_year.months] == [m.full_name for m in cold_year.months]
+
+    warm.lunar_year(1950)
+    warm.lunar_year(2100)
+    assert warm.stats()["solves"]["amavasya"] - after["amavasya"] == 15
+
+
+def test_concurrent_callers_share_one_solve_per_month():
+    timeline = LunarTimeline()
+    start = threading.Barrier(4)
+    years = []
+
+    def build():
+        start.wait()
+        years.append(timeline.lunar_year(2040))
+
+    threads = [threading.Thread(target=build) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = timeline.stats()
+    assert len({tuple(id(m) for m in year.months) for year in years}) == 1
+    assert stats["solves"]["purnima"] == stats["months"] == len(years[0].months)
+    assert stats["solves"]["amavasya"] == stats["new_moons"]
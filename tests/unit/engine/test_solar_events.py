@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import date
+
+import pytest
+from app.calendar.ephemeris import solar_events
+from app.calendar.ephemeris.swiss_eph import calculate_sunrise, calculate_sunset
+from app.calendar.tithi.tithi_udaya import detect_ksheepana, detect_vriddhi
+from app.engine.ephemeris_config import get_ephemeris_config, set_ephemeris_config
+
+
+@pytest.fixture(autouse=True)
+def _fresh_table():
+    solar_events.clear_solar_event_cache()
+    yield
+    solar_events.clear_solar_event_cache()
+
+
+class _CountingCompute:
+    def __init__(self) -> None:
+        self.calls = 0
+        self._original = solar_events._compute
+
+    def __call__(self, *args):
+        self.calls += 1
+        return self._original(*args)
+
+
+def test_cached_events_match_direct_calculation():
+    target = date(2026, 2, 6)
+    day = solar_events.get_solar_day(target)
+
+    assert day.sunrise == calculate_sunrise(target)
+    assert day.sunset == calculate_sunset(target)
+    assert day.next_sunrise == calculate_sunrise(date(2026, 2, 7))
+    assert solar_events.get_sunrise(date(2026, 2, 7)) == day.next_sunrise
+
+
+def test_vriddhi_and_ksheepana_share_sunrises(monkeypatch):
+    counter = _CountingCompute()
+    monkeypatch.setattr(solar_events, "_compute", counter)
+
+    detect_vriddhi(date(2026, 3, 10))
+    detect_ksheepana(date(2026, 3, 10))
+
+    assert counter.calls == 2
+    assert solar_events.solar_event_cache_stats()["hits"] == 2
+
+
+def test_fill_year_warms_every_day_once(monkeypatch):
+    counter = _CountingCompute()
+    monkeypatch.setattr(solar_events, "_compute", counter)
+    solar_events.get_sunrise(date(2027, 6, 1), 27.71721, 85.32399)
+
+    computed = solar_events.fill_year(2027, 27.7172, 85.324)
+
+    # 366 sunrises (through Jan 1 2028) + 365 sunsets, less the one already cached.
+    assert computed == 730
+    assert solar_events.fill_year(2027, 27.7172, 85.324) == 0
+    solar_events.get_solar_day(date(2027, 12, 31), 27.7172, 85.324)
+    assert counter.calls == 731
+
+
+def test_table_is_bounded(monkeypatch):
+    monkeypatch.setattr(solar_events, "_MAX_EVENTS", 64)
+
+    solar_events.fill_year(2028)
+
+    assert solar_events.solar_event_cache_stats()["entries"] == 64
+
+
+def test_switching_ephemeris_config_does_not_reuse_cached_events(monkeypatch):
+    counter = _CountingCompute()
+    monkeypatch.setattr(solar_events, "_compute", counter)
+    original = get_ephemeris_config()
+    target = date(2028, 4, 14)
+
+    solar_events.get_sunrise(target)
+    try:
+        set_ephemeris_config(replace(original, position_backend="chebyshev"))
+        solar_events.get_sunrise(target)
+        assert counter.calls == 2
+    finally:
+        set_ephemeris_config(original)
+
+    solar_events.get_sunrise(target)
+    assert counter.calls == 2
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from app.calendar.tithi import tithi_udaya
+from app.calendar.tithi.tithi_udaya import (
+    get_sunrise_tithi,
+    get_sunrise_tithis,
+    get_udaya_tithi,
+)
+
+
+def test_sunrise_tithi_matches_udaya_tithi_without_end_solve(monkeypatch):
+    start = date(2026, 3, 1)
+    expected = [get_udaya_tithi(start + timedelta(days=offset)) for offset in range(20)]
+
+    def no_end_solve(*args, **kwargs):
+        raise AssertionError("find_tithi_end must not run on the light path")
+
+    monkeypatch.setattr(tithi_udaya, "find_tithi_end", no_end_solve)
+    batch = get_sunrise_tithis(start, 20)
+    single = [get_sunrise_tithi(start + timedelta(days=offset)) for offset in range(20)]
+
+    for full, batched, one in zip(expected, batch, single):
+        for key in ("tithi", "tithi_absolute", "paksha", "name", "sunrise"):
+            assert batched[key] == full[key] == one[key]
+        assert abs(batched["elongation"] - full["elongation"]) < 1e-9
+
+
+def test_vriddhi_and_ksheepana_match_per_day_sunrise_tithis():
+    start = date(2026, 1, 1)
+    numbers = [
+        tithi_udaya.calculate_tithi_at_sunrise(start + timedelta(days=offset))["number"]
+        for offset in range(61)
+    ]
+    for offset in range(60):
+        target = start + timedelta(days=offset)
+        assert tithi_udaya.detect_vriddhi(target) == (numbers[offset] == numbers[offset + 1])
+        assert tithi_udaya.detect_ksheepana(target) == (
+            (numbers[offset + 1] - numbers[offset]) % 30 == 2
+        )
@@ -33,3 +33,28 @@ def test_boundary_cases_match_expected_tithi_and_flags():
         expected_sunrise = datetime.fromisoformat(row["sunrise_utc"])
         delta = abs((actual["sunrise"] - expected_sunrise).total_seconds())
         assert delta <= 60
+
+
+def test_newton_boundaries_agree_with_bisection():
+    from datetime import timedelta, timezone
+
+    from app.calendar.tithi.tithi_boundaries import (
+        _bisect_tithi_end,
+        _bisect_tithi_start,
+        find_tithi_end,
+        find_tithi_start,
+    )
+    from app.calendar.tithi.tithi_core import calculate_tithi
+
+    origin = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for step in range(40):
+        dt = origin + timedelta(hours=17.5 * step)
+        number = calculate_tithi(dt)["number"]
+
+        end = find_tithi_end(dt, tolerance_seconds=0.1)
+        start = find_tithi_start(dt, tolerance_seconds=0.1)
+
+        assert abs((end - _bisect_tithi_end(dt, 50, 0.1)).total_seconds()) <= 1
+        assert abs((start - _bisect_tithi_start(dt, 50, 0.1)).total_seconds()) <= 1
+        assert calculate_tithi(end)["number"] != number
+        assert calculate_tithi(start)["number"] == number
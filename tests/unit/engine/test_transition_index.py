@@ -0,0 +1,93 @@
+"""Precomputed panchanga transition index agrees with live ephemeris."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from app.calendar.ephemeris.positions import get_nakshatra, get_yoga
+from app.calendar.ephemeris.swiss_eph import get_julian_day
+from app.calendar.tithi import tithi_boundaries
+from app.calendar.tithi.tithi_core import calculate_tithi
+from app.calendar.transition_index import (
+    INDEX_PATH_ENV,
+    build_transition_index,
+    get_transition_index,
+    load_transition_index,
+    use_transition_index,
+    write_transition_index,
+)
+
+ORIGIN = datetime(2026, 1, 3, 6, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(scope="module")
+def index_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("transitions") / "transition_index.npz"
+    return write_transition_index(path, 2026, 2026)
+
+
+def test_indexed_segments_match_live_values(index_path):
+    index = load_transition_index(index_path)
+    assert index is not None
+    assert len(index.jds["tithi"]) > 360
+
+    for step in range(60):
+        dt = ORIGIN + timedelta(hours=29.3 * step)
+        assert index.value_at("tithi", dt) + 1 == calculate_tithi(dt)["number"]
+        assert index.value_at("nakshatra", dt) + 1 == get_nakshatra(dt)[0]
+        assert index.value_at("yoga", dt) + 1 == get_yoga(dt)[0]
+
+        start, end = index.segment_bounds("tithi", dt)
+        assert start <= dt < end
+
+
+def test_tithi_search_uses_index_and_matches_live(index_path, monkeypatch):
+    after = ORIGIN + timedelta(days=40)
+    monkeypatch.setenv(INDEX_PATH_ENV, str(index_path.with_name("absent.npz")))
+    assert get_transition_index() is None
+    live_next = tithi_boundaries.find_next_tithi(11, "shukla", after, within_days=30)
+    live_end = tithi_boundaries.find_tithi_end(after)
+    live_range = tithi_boundaries.get_tithis_in_range(after, after + timedelta(days=10))
+
+    monkeypatch.setenv(INDEX_PATH_ENV, str(index_path))
+    assert get_transition_index() is not None
+    indexed_next = tithi_boundaries.find_next_tithi(11, "shukla", after, within_days=30)
+    indexed_end = tithi_boundaries.find_tithi_end(after)
+    indexed_range = tithi_boundaries.get_tithis_in_range(after, after + timedelta(days=10))
+
+    assert abs((indexed_next - live_next).total_seconds()) < 1
+    assert abs((indexed_end - live_end).total_seconds()) < 1
+    assert [row[:2] for row in indexed_range] == [row[:2] for row in live_range]
+
+
+def test_lookups_outside_span_fall_back_to_live(index_path, monkeypatch):
+    monkeypatch.setenv(INDEX_PATH_ENV, str(index_path))
+    index = get_transition_index()
+    outside = datetime(2030, 6, 1, tzinfo=timezone.utc)
+
+    assert not index.covers(outside)
+    assert index.value_at("tithi", outside) is None
+    end = tithi_boundaries.find_tithi_end(outside)
+    assert calculate_tithi(end)["number"] != calculate_tithi(outside)["number"]
+
+
+def test_active_in_memory_index_takes_precedence_within_its_block(index_path, monkeypatch):
+    monkeypatch.setenv(INDEX_PATH_ENV, str(index_path))
+    start = ORIGIN + timedelta(days=40)
+    index = build_transition_index(
+        get_julian_day(start), get_julian_day(start + timedelta(days=45)), kinds=("tithi",)
+    )
+    file_index = get_transition_index()
+
+    with use_transition_index(index):
+        assert get_transition_index() is index
+        assert tithi_boundaries.find_next_tithi(
+            11, "shukla", start, within_days=30
+        ) == index.next_transition("tithi", 10, start, start + timedelta(days=30))
+
+    assert get_transition_index() is file_index
+    assert list(index.jds) == ["tithi"]
+    assert file_index.next_transition(
+        "tithi", 10, start, start + timedelta(days=30)
+    ) == index.next_transition("tithi", 10, start, start + timedelta(days=30))
@@ -0,0 +1,42 @@
+"""The festival repository reuses validated rows from a compiled snapshot."""
+
+from __future__ import annotations
+
+import json
+
+from app.core.compiled_snapshot import SNAPSHOT_DIR_ENV
+from app.festivals import repository
+from app.festivals.repository import FestivalRepository, compile_festival_snapshot
+
+
+def _write_catalog(directory, names):
+    rows = [
+        {
+            "id": name.lower(),
+            "name": name,
+            "calendar_type": "lunar",
+            "category": "hindu",
+            "tagline": f"{name} tagline",
+            "description": f"{name} description",
+        }
+        for name in names
+    ]
+    (directory / "festivals.json").write_text(json.dumps({"festivals": rows}), encoding="utf-8")
+
+
+def test_repository_reads_snapshot_until_catalog_changes(tmp_path, monkeypatch):
+    monkeypatch.setenv(SNAPSHOT_DIR_ENV, str(tmp_path / "snapshots"))
+    _write_catalog(tmp_path, ["Dashain", "Tihar"])
+    assert compile_festival_snapshot(tmp_path) is not None
+
+    def _no_parse(_path):
+        raise AssertionError("rows should come from the compiled snapshot")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(repository, "_read_festival_catalog", _no_parse)
+        cached = FestivalRepository(data_dir=tmp_path, allow_builtin_fallback=False)
+        assert sorted(f.id for f in cached.get_all()) == ["dashain", "tihar"]
+
+    _write_catalog(tmp_path, ["Holi"])
+    fresh = FestivalRepository(data_dir=tmp_path, allow_builtin_fallback=False)
+    assert [f.id for f in fresh.get_all()] == ["holi"]
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+from app.infrastructure.compute_executor import (
+    ComputeExecutor,
+    ComputeExecutorConfig,
+    ComputeSaturatedError,
+)
+from app.reliability.metrics import MetricsRegistry
+from fastapi import HTTPException
+
+
+def _raise_not_found(festival_id: str) -> None:
+    raise HTTPException(status_code=404, detail=f"Festival '{festival_id}' not found")
+
+
+def _square(value: int) -> int:
+    return value * value
+
+
+def test_compute_executor_runs_work_off_the_event_loop_thread():
+    executor = ComputeExecutor(ComputeExecutorConfig(max_workers=2), metrics=MetricsRegistry())
+    loop_thread = threading.get_ident()
+
+    worker_thread = asyncio.run(executor.run("calendar", threading.get_ident))
+
+    assert worker_thread != loop_thread
+    executor.shutdown()
+
+
+def test_compute_executor_sheds_when_lane_is_saturated():
+    metrics = MetricsRegistry()
+    executor = ComputeExecutor(
+        ComputeExecutorConfig(max_workers=1, queue_limit=8, lane_limit=1),
+        metrics=metrics,
+    )
+    release = threading.Event()
+
+    async def scenario():
+        blocked = asyncio.ensure_future(executor.run("kundali", release.wait, 5))
+        await asyncio.sleep(0.05)
+        with pytest.raises(ComputeSaturatedError) as excinfo:
+            await executor.run("kundali", _square, 3)
+        # Other lanes still have headroom while kundali is saturated.
+        assert await executor.run("calendar", _square, 3) == 9
+        release.set()
+        await blocked
+        return excinfo.value
+
+    error = asyncio.run(scenario())
+
+    assert error.reason == "lane_limit"
+    lanes = metrics.snapshot()["compute"]["lanes"]
+    assert lanes["kundali"] == {"accepted": 1, "rejected": 1, "in_flight": 0, "peak_in_flight": 1}
+    assert executor.stats()["in_flight"] == 0
+    executor.shutdown()
+
+
+def test_cancelled_caller_keeps_lane_slot_until_work_finishes():
+    executor = ComputeExecutor(
+        ComputeExecutorConfig(max_workers=1, queue_limit=8, lane_limit=1),
+        metrics=MetricsRegistry(),
+    )
+    started = threading.Event()
+    release = threading.Event()
+
+    def blocking() -> None:
+        started.set()
+        release.wait(5)
+
+    async def scenario():
+        waiter = asyncio.ensure_future(executor.run("kundali", blocking))
+        await asyncio.to_thread(started.wait, 5)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        # The worker is still busy, so the lane must still be full.
+        assert executor.stats()["in_flight"] == 1
+        with pytest.raises(ComputeSaturatedError):
+            await executor.run("kundali", _square, 3)
+        release.set()
+        for _ in range(100):
+            if executor.stats()["in_flight"] == 0:
+                break
+            await asyncio.sleep(0.01)
+        return await executor.run("kundali", _square, 3)
+
+    assert asyncio.run(scenario()) == 9
+    assert executor.stats()["in_flight"] == 0
+    executor.shutdown()
+
+
+def test_compute_executor_sheds_when_global_queue_is_full():
+    executor = ComputeExecutor(
+        ComputeExecutorConfig(max_workers=1, queue_limit=1, lane_limit=4),
+        metrics=MetricsRegistry(),
+    )
+    release = threading.Event()
+
+    async def scenario():
+        blocked = asyncio.ensure_future(executor.run("muhurta", release.wait, 5))
+        await asyncio.sleep(0.05)
+        with pytest.raises(ComputeSaturatedError) as excinfo:
+            await executor.run("personal", _square, 2)
+        release.set()
+        await blocked
+        return excinfo.value
+
+    assert asyncio.run(scenario()).reason == "queue_limit"
+    executor.shutdown()
+
+
+def test_process_executor_preserves_http_exceptions():
+    executor = ComputeExecutor(
+        ComputeExecutorConfig(mode="process", max_workers=1),
+        metrics=MetricsRegistry(),
+    )
+
+    async def scenario():
+        assert await executor.run("festivals", _square, 4) == 16
+        with pytest.raises(HTTPException) as excinfo:
+            await executor.run("festivals", _raise_not_found, "dashain")
+        return excinfo.value
+
+    error = asyncio.run(scenario())
+
+    assert error.status_code == 404
+    assert error.detail == "Festival 'dashain' not found"
+    executor.shutdown()
+
+
+def test_metrics_prometheus_exposes_compute_lanes():
+    metrics = MetricsRegistry()
+    metrics.record_compute_admission("panchanga", accepted=False, in_flight=3, queue_depth=2)
+
+    text = metrics.to_prometheus()
+
+    assert 'parva_compute_tasks_total{lane="panchanga",outcome="rejected"} 1' in text
+    assert "parva_compute_queue_depth 2" in text
+    assert "# TYPE parva_compute_in_flight gauge" in text
+    assert text.index("# TYPE parva_compute_in_flight") < text.index("parva_compute_in_flight{")
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import random
+from datetime import date, timedelta
+
+from app.infrastructure.interval_index import DateIntervalIndex
+
+
+def test_overlapping_matches_linear_scan():
+    rng = random.Random(7)
+    base = date(2028, 1, 1)
+    ranges = []
+    for _ in range(300):
+        start = base + timedelta(days=rng.randrange(366))
+        ranges.append((start, start + timedelta(days=rng.choice([0, 0, 1, 4, 9, 40]))))
+    index = DateIntervalIndex(ranges, start=lambda item: item[0], end=lambda item: item[1])
+
+    for _ in range(200):
+        lo = base + timedelta(days=rng.randrange(-10, 376))
+        hi = lo + timedelta(days=rng.randrange(0, 45))
+        expected = sorted(
+            (item for item in ranges if item[1] >= lo and item[0] <= hi), key=lambda item: item[0]
+        )
+        assert index.overlapping(lo, hi) == expected
+
+
+def test_covering_includes_long_ranges_started_earlier():
+    index = DateIntervalIndex(
+        [
+            ("long", date(2028, 1, 1), date(2028, 3, 1)),
+            ("short", date(2028, 2, 1), date(2028, 2, 1)),
+        ],
+        start=lambda item: item[1],
+        end=lambda item: item[2],
+    )
+
+    assert [item[0] for item in index.covering(date(2028, 2, 15))] == ["long"]
+    assert [item[0] for item in index.covering(date(2028, 2, 1))] == ["long", "short"]
+    assert index.covering(date(2028, 3, 2)) == []
+    assert len(index) == 2
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import json
+from datetime import date
+
+import pytest
+from app.infrastructure.precomputed_binary import (
+    BinaryArtifact,
+    BinaryArtifactError,
+    binary_path_for,
+    convert_json_artifact,
+)
+from app.infrastructure.precomputed_store import (
+    FilePrecomputedArtifactStore,
+    PrecomputedArtifactCorruptionError,
+)
+from app.reliability.metrics import MetricsRegistry
+
+
+def _write_json(path, payload):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+def _panchanga_payload():
+    return {
+        "year": 2028,
+        "generated_at": "2028-01-01T00:00:00+00:00",
+        "count": 2,
+        "dates": {
+            "2028-01-01": {"panchanga": {"tithi": {"name": "Pratipada"}}},
+            "2028-12-31": {"panchanga": {"tithi": {"name": "Dwitiya"}}},
+        },
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = FilePrecomputedArtifactStore(tmp_path, MetricsRegistry())
+    store.clear()
+    yield store
+    store.clear()
+
+
+def test_converted_panchanga_round_trips_and_indexes_by_day(tmp_path):
+    source = tmp_path / "panchanga_2028.json"
+    _write_json(source, _panchanga_payload())
+
+    artifact = BinaryArtifact(convert_json_artifact(source))
+
+    assert artifact.kind_name == "panchanga"
+    assert artifact.record_count == 366
+    assert artifact.record_for_date(date(2028, 12, 31)) == {
+        "panchanga": {"tithi": {"name": "Dwitiya"}}
+    }
+    assert artifact.record_for_date(date(2028, 6, 1)) is None
+    assert artifact.to_payload() == _panchanga_payload()
+
+
+def test_store_serves_rows_from_binary_without_reading_json(monkeypatch, tmp_path, store):
+    source = tmp_path / "panchanga_2028.json"
+    _write_json(source, _panchanga_payload())
+    convert_json_artifact(source)
+
+    original_read_text = type(source).read_text
+
+    def guarded_read_text(path_obj, *args, **kwargs):
+        assert path_obj != source, "JSON artifact should not be parsed"
+        return original_read_text(path_obj, *args, **kwargs)
+
+    monkeypatch.setattr(type(source), "read_text", guarded_read_text)
+
+    row = store.load_panchanga(date(2028, 1, 1))
+
+    assert row["panchanga"]["tithi"]["name"] == "Pratipada"
+    assert store.load_panchanga(date(2028, 2, 1)) is None
+
+
+def test_store_falls_back_to_json_for_stale_or_corrupt_binary(tmp_path, store):
+    source = tmp_path / "festivals_2028.json"
+    _write_json(source, {"year": 2028, "festivals": [{"festival_id": "old"}]})
+    binary = convert_json_artifact(source)
+    assert store.load_festival_year(2028)["festivals"] == [{"festival_id": "old"}]
+
+    _write_json(source, {"year": 2028, "festivals": [{"festival_id": "new"}]})
+    store.clear()
+    assert store.load_festival_year(2028)["festivals"] == [{"festival_id": "new"}]
+
+    convert_json_artifact(source)
+    raw = bytearray(binary.read_bytes())
+    raw[-2] ^= 0xFF
+    binary.write_bytes(bytes(raw))
+    with pytest.raises(BinaryArtifactError):
+        BinaryArtifact(binary)
+    store.clear()
+    assert store.load_festival_year(2028)["festivals"] == [{"festival_id": "new"}]
+
+    source.unlink()
+    store.clear()
+    with pytest.raises(PrecomputedArtifactCorruptionError):
+        store.load_festival_year(2028)
+
+
+def test_stats_count_binary_twins(tmp_path, store):
+    source = tmp_path / "panchanga_2028.json"
+    _write_json(source, _panchanga_payload())
+    convert_json_artifact(source)
+
+    stats = store.get_stats()
+
+    assert binary_path_for(source).exists()
+    assert stats["file_count"] == 1
+    assert stats["binary_file_count"] == 1
+    assert stats["artifact_classes"]["panchanga"]["binary_file_count"] == 1
+    assert stats["artifact_classes"]["festivals"]["binary_file_count"] == 0
+
+
+def test_store_serves_pre_encoded_rows_and_years(tmp_path, store):
+    _write_json(tmp_path / "panchanga_2028.json", _panchanga_payload())
+    convert_json_artifact(tmp_path / "panchanga_2028.json")
+    _write_json(tmp_path / "festivals_2028.json", {"year": 2028, "festivals": []})
+
+    row = store.load_panchanga_encoded(date(2028, 1, 1))
+
+    assert json.loads(row) == {"panchanga": {"tithi": {"name": "Pratipada"}}}
+    assert store.load_panchanga_encoded(date(2028, 1, 1)) is row
+    assert store.load_panchanga_encoded(date(2028, 6, 1)) is None
+    assert json.loads(store.load_festival_year_encoded(2028)) == {"year": 2028, "festivals": []}
+    assert store.load_festival_year_encoded(2029) is None
+
+
+def test_pre_encoded_bodies_use_the_configured_encoder(tmp_path):
+    _write_json(tmp_path / "festivals_2028.json", {"year": 2028, "score": float("nan")})
+    stdlib_store = FilePrecomputedArtifactStore(tmp_path, MetricsRegistry(), json_encoder="stdlib")
+    stdlib_store.clear()
+
+    # Same failure mode as a stdlib JSON response instead of silently writing null.
+    with pytest.raises(ValueError):
+        stdlib_store.load_festival_year_encoded(2028)
+    stdlib_store.clear()
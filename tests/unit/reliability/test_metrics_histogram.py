@@ -0,0 +1,80 @@
+"""Route-template latency histograms in the metrics registry."""
+
+from __future__ import annotations
+
+import threading
+
+from app.reliability.metrics import LATENCY_BUCKETS_SECONDS, MetricsRegistry
+
+
+def _prometheus_lines(metrics: MetricsRegistry, prefix: str) -> list[str]:
+    return [line for line in metrics.to_prometheus().splitlines() if line.startswith(prefix)]
+
+
+def test_histogram_exposes_cumulative_buckets_sum_and_count():
+    metrics = MetricsRegistry()
+    for latency_ms in (0.5, 4.0, 4.0, 30.0, 20000.0):
+        metrics.record_request("/v3/api/festivals/{festival_id}", 200, latency_ms)
+
+    buckets = _prometheus_lines(metrics, "parva_request_duration_seconds_bucket")
+    assert len(buckets) == len(LATENCY_BUCKETS_SECONDS) + 1
+    counts = {line.split('le="')[1].split('"')[0]: int(line.rsplit(" ", 1)[1]) for line in buckets}
+    assert counts["0.001"] == 1
+    assert counts["0.005"] == 3
+    assert counts["0.035"] == 4
+    assert counts["10"] == 4
+    assert counts["+Inf"] == 5
+    assert _prometheus_lines(metrics, "parva_request_duration_seconds_count") == [
+        'parva_request_duration_seconds_count{route="/v3/api/festivals/{festival_id}"} 5'
+    ]
+    (sum_line,) = _prometheus_lines(metrics, "parva_request_duration_seconds_sum")
+    assert float(sum_line.rsplit(" ", 1)[1]) == 20.0385
+
+
+def test_percentiles_cover_every_request_not_a_recent_window():
+    metrics = MetricsRegistry()
+    for index in range(10000):
+        metrics.record_request(
+            "/r", 500 if index % 100 == 0 else 200, 400.0 if index < 2000 else 8.0
+        )
+
+    (row,) = metrics.snapshot()["endpoints"]
+    assert row["requests"] == 10000
+    assert row["errors"] == 100
+    assert 7.5 <= row["p50_latency_ms"] <= 10.0
+    assert 350.0 <= row["p95_latency_ms"] <= 500.0
+    assert 350.0 <= row["p99_latency_ms"] <= 500.0
+
+
+def test_per_thread_shards_are_merged_on_scrape():
+    metrics = MetricsRegistry()
+    start = threading.Barrier(4)
+
+    def worker() -> None:
+        start.wait()
+        for _ in range(2500):
+            metrics.record_request("/v3/api/calendar/today", 200, 3.0)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    (row,) = metrics.snapshot()["endpoints"]
+    assert row["route"] == "/v3/api/calendar/today"
+    assert row["requests"] == 10000
+
+
+def test_p95_gauge_is_estimated_from_the_buckets():
+    metrics = MetricsRegistry()
+    for index in range(100):
+        metrics.record_request("/v3/api/festivals/{festival_id}", 200, float(index + 1))
+
+    (row,) = metrics.snapshot()["endpoints"]
+    assert row["path"] == row["route"]
+    assert _prometheus_lines(metrics, "parva_request_latency_p95_ms") == [
+        'parva_request_latency_p95_ms{route="/v3/api/festivals/{festival_id}"} '
+        f"{row['p95_latency_ms']}"
+    ]
+    assert 75.0 <= row["p95_latency_ms"] <= 100.0
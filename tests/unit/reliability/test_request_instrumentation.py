@@ -0,0 +1,123 @@
+"""Per-request ephemeris call accounting and stage timing."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import datetime, timezone
+
+from app.calendar.ephemeris.swiss_eph import get_julian_day, get_sun_moon_state
+from app.calendar.tithi.tithi_boundaries import find_tithi_end
+from app.core.instrumentation import (
+    STAGE_TITHI,
+    begin_request_profile,
+    count_ephemeris_calls,
+    end_request_profile,
+    stage,
+)
+from app.infrastructure.compute_executor import ComputeExecutor, ComputeExecutorConfig
+from app.reliability.metrics import MetricsRegistry
+from app.reliability.profiler import StackSampler, finish_sampler, maybe_start_sampler
+
+ORIGIN = datetime(2026, 3, 1, 6, 0, tzinfo=timezone.utc)
+
+
+def test_counts_and_stages_follow_the_request_context():
+    count_ephemeris_calls("calc_ut", 5)  # outside a request: ignored
+
+    profile, token = begin_request_profile()
+    try:
+        get_sun_moon_state(get_julian_day(ORIGIN))
+        with stage(STAGE_TITHI):
+            find_tithi_end(ORIGIN)  # nested tithi stage is not timed twice
+    finally:
+        end_request_profile(token)
+    get_sun_moon_state(get_julian_day(ORIGIN))
+
+    assert profile.ephemeris_calls["calc_ut"] >= 4
+    assert profile.ephemeris_calls["calc_ut"] % 2 == 0
+    total_ms, spans = profile.stages[STAGE_TITHI]
+    assert spans == 1
+    assert total_ms > 0
+    header = profile.server_timing()
+    assert header.startswith("total;dur=")
+    assert "tithi;dur=" in header
+    assert f'swe-calc-ut;desc="{profile.ephemeris_calls["calc_ut"]}"' in header
+
+
+def test_compute_pool_work_lands_in_the_callers_profile():
+    executor = ComputeExecutor(ComputeExecutorConfig(max_workers=2), metrics=MetricsRegistry())
+
+    async def request():
+        profile, token = begin_request_profile()
+        try:
+            await asyncio.gather(
+                executor.run("calendar", find_tithi_end, ORIGIN),
+                executor.run("calendar", count_ephemeris_calls, "houses"),
+            )
+        finally:
+            end_request_profile(token)
+        return profile
+
+    profile = asyncio.run(request())
+    executor.shutdown()
+
+    assert profile.ephemeris_calls["houses"] == 1
+    assert profile.stages[STAGE_TITHI][1] == 1
+
+
+def test_prometheus_export_includes_ephemeris_calls_and_stages():
+    metrics = MetricsRegistry()
+    for _ in range(2):
+        metrics.record_request_profile(
+            "/v3/api/calendar/panchanga",
+            ephemeris_calls={"calc_ut": 8, "rise_trans": 2},
+            stages={"sunrise": (1.5, 2)},
+        )
+
+    text = metrics.to_prometheus()
+
+    assert (
+        'parva_ephemeris_calls_total{route="/v3/api/calendar/panchanga",call="calc_ut"} 16' in text
+    )
+    assert (
+        'parva_stage_seconds_total{route="/v3/api/calendar/panchanga",stage="sunrise"} 0.003' in text
+    )
+    assert 'parva_stage_spans_total{route="/v3/api/calendar/panchanga",stage="sunrise"} 4' in text
+
+
+def test_sampler_writes_folded_stacks_for_app_frames(tmp_path):
+    assert maybe_start_sampler(0.0) is None
+    sampler = maybe_start_sampler(1.0)
+    assert isinstance(sampler, StackSampler)
+    assert maybe_start_sampler(1.0) is None  # one sampled request at a time
+
+    deadline = time.perf_counter() + 0.2
+    while time.perf_counter() < deadline:
+        find_tithi_end(ORIGIN)
+    target = finish_sampler(sampler, output_dir=tmp_path, request_id="../abc")
+
+    assert target.parent == tmp_path
+    lines = target.read_text(encoding="utf-8").splitlines()
+    assert lines
+    stack, count = lines[0].rsplit(" ", 1)
+    assert int(count) >= 1
+    assert "app.calendar.tithi.tithi_boundaries:find_tithi_end" in stack
+    follow_up = maybe_start_sampler(1.0)  # released after finishing
+    assert follow_up is not None
+    finish_sampler(follow_up, output_dir=tmp_path, request_id="follow-up")
+
+
+def test_sampler_write_failure_is_logged_and_releases_the_slot(tmp_path, caplog):
+    blocked = tmp_path / "profiles"
+    blocked.write_text("not a directory", encoding="utf-8")
+    sampler = maybe_start_sampler(1.0)
+    assert sampler is not None
+
+    with caplog.at_level("WARNING", logger="app.reliability.profiler"):
+        assert finish_sampler(sampler, output_dir=blocked, request_id="blocked") is None
+
+    assert "Could not write request profile" in caplog.text
+    follow_up = maybe_start_sampler(1.0)
+    assert follow_up is not None
+    finish_sampler(follow_up, output_dir=tmp_path, request_id="follow-up")
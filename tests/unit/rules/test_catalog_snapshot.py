@@ -0,0 +1,100 @@
+"""Compiled v4 catalog snapshots are reused only while their sources match."""
+
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+from app.core.compiled_snapshot import SNAPSHOT_DIR_ENV, SNAPSHOT_ENABLED_ENV
+from app.rules import catalog_v4, dsl, execution
+from app.rules.schema_v4 import FestivalRuleCatalogV4
+
+
+@pytest.fixture
+def catalog_copy(tmp_path, monkeypatch):
+    source = tmp_path / "festival_rules_v4.json"
+    shutil.copyfile(catalog_v4.CATALOG_V4_PATH, source)
+    monkeypatch.setattr(catalog_v4, "CATALOG_V4_PATH", source)
+    monkeypatch.setenv(SNAPSHOT_DIR_ENV, str(tmp_path / "snapshots"))
+    catalog_v4.load_catalog_v4.cache_clear()
+    yield source
+    catalog_v4.load_catalog_v4.cache_clear()
+
+
+def _fail_validation(*_args, **_kwargs):
+    raise AssertionError("catalog should come from the compiled snapshot")
+
+
+def test_second_worker_loads_catalog_without_validation(catalog_copy, tmp_path, monkeypatch):
+    first = catalog_v4.load_catalog_v4()
+    assert len(list((tmp_path / "snapshots").glob("festival_rules_v4_*.snapshot.pickle"))) == 1
+
+    catalog_v4.load_catalog_v4.cache_clear()
+    monkeypatch.setattr(FestivalRuleCatalogV4, "model_validate", _fail_validation)
+    second = catalog_v4.load_catalog_v4()
+
+    assert second is not first
+    assert second.model_dump() == first.model_dump()
+
+
+def test_editing_a_source_invalidates_the_snapshot(catalog_copy):
+    catalog_v4.load_catalog_v4()
+
+    payload = json.loads(catalog_copy.read_text(encoding="utf-8"))
+    payload["festivals"] = payload["festivals"][:3]
+    payload["total_rules"] = 3
+    catalog_copy.write_text(json.dumps(payload), encoding="utf-8")
+    catalog_v4.load_catalog_v4.cache_clear()
+
+    assert catalog_v4.load_catalog_v4().total_rules == 3
+
+
+def _use_module_copy(module, tmp_path, monkeypatch):
+    copy = tmp_path / Path(module.__file__).name
+    shutil.copyfile(module.__file__, copy)
+    monkeypatch.setattr(module, "__file__", str(copy))
+    return copy
+
+
+@pytest.mark.parametrize("engine_source", ["dsl", "execution", "calendar"])
+def test_editing_promotion_code_invalidates_the_snapshot(
+    catalog_copy, tmp_path, monkeypatch, engine_source
+):
+    # Promotion in the build_canonical_catalog fallback runs the DSL check and
+    # the calendar engine, so their code is part of the fingerprint.
+    if engine_source == "calendar":
+        calendar_copy = tmp_path / "calendar"
+        shutil.copytree(
+            catalog_v4.CALENDAR_DIR, calendar_copy, ignore=shutil.ignore_patterns("__pycache__")
+        )
+        monkeypatch.setattr(catalog_v4, "CALENDAR_DIR", calendar_copy)
+        edited = calendar_copy / "lunar_calendar.py"
+    else:
+        module = {"dsl": dsl, "execution": execution}[engine_source]
+        edited = _use_module_copy(module, tmp_path, monkeypatch)
+    catalog_v4.load_catalog_v4()
+
+    builds = []
+    read_catalog = catalog_v4._read_catalog_v4
+    monkeypatch.setattr(catalog_v4, "_read_catalog_v4", lambda: builds.append(1) or read_catalog())
+    catalog_v4.load_catalog_v4.cache_clear()
+    catalog_v4.load_catalog_v4()
+    assert builds == []
+
+    edited.write_text(edited.read_text(encoding="utf-8") + "\n# edited\n", encoding="utf-8")
+    catalog_v4.load_catalog_v4.cache_clear()
+    catalog_v4.load_catalog_v4()
+    assert builds == [1]
+
+
+def test_corrupt_or_disabled_snapshot_falls_back_to_source(catalog_copy, tmp_path, monkeypatch):
+    path = catalog_v4.compile_catalog_v4_snapshot()
+    assert path is not None and path.exists()
+    path.write_bytes(b"not a pickle")
+    catalog_v4.load_catalog_v4.cache_clear()
+    assert catalog_v4.load_catalog_v4().total_rules >= 300
+
+    monkeypatch.setenv(SNAPSHOT_ENABLED_ENV, "false")
+    assert catalog_v4.compile_catalog_v4_snapshot() is None
@@ -53,6 +53,7 @@ def test_invalid_catalog_payload_falls_back_to_canonical_catalog(monkeypatch, tm
     invalid_catalog.write_text(json.dumps({"version": 4, "festivals": ["bad-row"]}), encoding="utf-8")
 
     monkeypatch.setattr(catalog_v4, "CATALOG_V4_PATH", invalid_catalog)
+    monkeypatch.setenv("PARVA_CATALOG_SNAPSHOT_DIR", str(tmp_path / "snapshots"))
     catalog_v4.load_catalog_v4.cache_clear()
     try:
         catalog = catalog_v4.load_catalog_v4()
@@ -80,3 +81,37 @@ def test_rule_quality_helpers_are_consistent():
     assert inventory is not None
     assert rule_quality_band(inventory) == "inventory"
     assert rule_has_algorithm(inventory) is False
+
+
+def test_catalog_index_matches_catalog_rows():
+    from app.rules.catalog_v4 import get_catalog_index_v4
+
+    catalog = load_catalog_v4()
+    index = get_catalog_index_v4()
+    assert index.catalog is catalog
+    assert len(index) == catalog.total_rules
+    for rule in catalog.festivals:
+        assert index.get(rule.festival_id) is rule
+        assert rule.festival_id in index
+        assert rule in index.in_category(rule.category)
+        assert rule in index.in_rule_family(rule.rule_family)
+        for profile_id in rule.profile_ids:
+            assert rule in index.with_profile(profile_id)
+    assert get_rule_v4("not-a-festival") is None
+    assert index.in_category("not-a-category") == ()
+
+    lunar = index.in_calendar_family("lunar")
+    assert get_rule_v4("dashain") in lunar
+    assert [rule.festival_id for rule in lunar] == sorted(rule.festival_id for rule in lunar)
+
+
+def test_reload_catalog_swaps_in_a_fresh_index():
+    from app.rules.catalog_v4 import get_catalog_index_v4
+
+    before = get_catalog_index_v4()
+    catalog = reload_catalog_v4()
+    after = get_catalog_index_v4()
+
+    assert after is not before
+    assert after.catalog is catalog
+    assert get_rule_v4("dashain") is after.get("dashain")
@@ -0,0 +1,83 @@
+"""Whole-year catalog evaluation against a shared year context."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from app.calendar.calculator_v2 import _calculate_festival_v2_cached
+from app.calendar.tithi.tithi_udaya import get_sunrise_tithi
+from app.calendar.transition_index import get_transition_index
+from app.calendar.year_context import build_year_context, year_context
+from app.rules.catalog_v4 import get_rule_v4, list_rules_v4
+from app.rules.execution import (
+    calculate_catalog_year,
+    calculate_catalog_years,
+    calculate_rule_occurrence_with_fallback,
+    validation_cases_for_rule,
+    validation_cases_for_rules,
+)
+
+YEAR = 2033
+
+
+def test_year_context_covers_both_lunar_years_and_is_scoped():
+    context = build_year_context(YEAR)
+    first_month = context.lunar_years[0].months[0]
+    last_month = context.lunar_years[1].months[-1]
+    assert context.start <= first_month.start_amavasya.date()
+    assert last_month.end_amavasya.date() < context.end
+    assert len(context.sunrise_tithis) == (context.end - context.start).days
+
+    outside = get_transition_index()
+    with year_context(YEAR) as active:
+        assert active is context
+        assert get_transition_index() is context.tithi_index
+        for offset in range(0, 700, 97):
+            day = context.start + timedelta(days=offset)
+            assert get_sunrise_tithi(day) == context.sunrise_tithis[day]
+    assert get_transition_index() is outside
+
+    day = context.start + timedelta(days=97)
+    live = get_sunrise_tithi(day)
+    assert (live["tithi"], live["paksha"]) == (
+        context.sunrise_tithis[day]["tithi"],
+        context.sunrise_tithis[day]["paksha"],
+    )
+
+
+def test_catalog_year_matches_rule_by_rule_evaluation():
+    rules = list_rules_v4()
+    expected = {
+        rule.festival_id: calculate_rule_occurrence_with_fallback(rule, YEAR) for rule in rules
+    }
+
+    batched = calculate_catalog_year(YEAR)
+
+    assert batched == expected
+    assert sum(result is not None for result in batched.values()) > 300
+    assert _calculate_festival_v2_cached.cache_info().currsize > 0
+    assert batched["dashain"].start_date.year == YEAR
+
+
+def test_catalog_years_across_worker_processes():
+    rules = [get_rule_v4(festival_id) for festival_id in ("dashain", "tihar", "holi")]
+
+    in_process = calculate_catalog_years([YEAR + 1, YEAR + 2], rules)
+    pooled = calculate_catalog_years([YEAR + 1, YEAR + 2, YEAR + 1], rules, workers=2)
+
+    assert list(pooled) == [YEAR + 1, YEAR + 2]
+    assert pooled == in_process
+    assert pooled[YEAR + 2]["holi"].start_date > date(YEAR + 2, 1, 1)
+
+
+def test_batched_validation_cases_match_per_rule_cases():
+    rules = [
+        get_rule_v4(festival_id)
+        for festival_id in ("dashain", "amavasya-observance-ashadh", "bisket-jatra")
+    ]
+
+    batched = validation_cases_for_rules(rules)
+
+    assert list(batched) == [rule.festival_id for rule in rules]
+    for rule in rules:
+        assert batched[rule.festival_id] == validation_cases_for_rule(rule)
@@ -27,12 +27,15 @@ def test_rule_service_upcoming_merges_partial_precomputed_with_computed_years(mo
             "full_hit": False,
         },
     )
-    monkeypatch.setattr(service_module, "list_festivals_v2", lambda: ["cached-festival", "computed-festival"])
-
-    def _calculate(festival_id: str, year: int):
-        if festival_id == "computed-festival" and year == 2029:
-            return service_module.FestivalDate(
-                festival_id=festival_id,
+    year_lookups = []
+
+    def _year_festivals(year: int, start: date, end: date):
+        year_lookups.append((year, start, end))
+        if year != 2029:
+            return []
+        return [
+            service_module.FestivalDate(
+                festival_id="computed-festival",
                 start_date=date(2029, 1, 2),
                 end_date=date(2029, 1, 2),
                 year=year,
@@ -40,12 +43,14 @@ def test_rule_service_upcoming_merges_partial_precomputed_with_computed_years(mo
                 lunar_month=None,
                 is_adhik_year=False,
             )
-        return None
+        ]
 
-    monkeypatch.setattr(service_module, "calculate_festival_v2", _calculate)
+    monkeypatch.setattr(service_module, "get_year_festivals_v2", _year_festivals)
 
     results = service_module.FestivalRuleService().upcoming(date(2028, 12, 25), days=15)
 
     assert [festival_id for festival_id, _ in results] == ["cached-festival", "computed-festival"]
     assert results[0][1].method == "precomputed"
     assert results[1][1].method == "calculated"
+    # Missing years are answered from the year index, not a per-festival scan.
+    assert year_lookups == [(2029, date(2028, 12, 25), date(2029, 1, 9))]
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from scripts.precompute import precompute_all
+
+
+@pytest.mark.parametrize("workers", ["1", "4"])
+def test_transition_index_is_built_before_panchanga_and_festivals(monkeypatch, workers):
+    commands = []
+    monkeypatch.setattr(precompute_all, "_run", lambda cmd: commands.append(cmd[1]))
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["precompute_all.py", "--start-year", "2026", "--end-year", "2027", "--workers", workers],
+    )
+
+    assert precompute_all.main() == 0
+
+    scripts = [command.rsplit("/", 1)[-1] for command in commands]
+    assert scripts[0] == "precompute_transitions.py"
+    if workers == "1":
+        assert scripts[1:3] == ["precompute_panchanga.py", "precompute_festivals.py"]
+    else:
+        assert scripts[1] == "precompute_parallel.py"
+    assert scripts[-1] == "compile_catalog_snapshots.py"
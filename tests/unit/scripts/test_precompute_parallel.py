@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import json
+
+from scripts.precompute import precompute_parallel
+
+
+def _install_fakes(monkeypatch, fail_shard_start=None):
+    def compute_entries(days):
+        if fail_shard_start is not None and days[0].isoformat() == fail_shard_start:
+            raise RuntimeError("interrupted")
+        return {day.isoformat(): {"ordinal": day.toordinal()} for day in days}
+
+    def compute_rows(year, festival_ids):
+        return [
+            {
+                "festival_id": festival_id,
+                "start": f"{year}-0{index + 1}-01",
+                "end": f"{year}-0{index + 1}-02",
+            }
+            for index, festival_id in enumerate(festival_ids)
+        ]
+
+    monkeypatch.setattr(
+        precompute_parallel.precompute_panchanga, "compute_entries", compute_entries
+    )
+    monkeypatch.setattr(precompute_parallel.precompute_festivals, "compute_rows", compute_rows)
+    monkeypatch.setattr(precompute_parallel, "get_provenance_payload", lambda **kwargs: {})
+
+
+def _run(out_dir, work_dir):
+    return precompute_parallel.run(
+        2030,
+        2030,
+        workers=1,
+        festival_ids=["b-festival", "a-festival"],
+        days_per_shard=100,
+        festival_chunk=1,
+        work_dir=work_dir,
+        out_dir=out_dir,
+    )
+
+
+def test_plan_shards_is_deterministic_and_covers_the_year():
+    shards = precompute_parallel.plan_shards(2030, 2031, kinds=["panchanga"], days_per_shard=100)
+
+    assert shards == precompute_parallel.plan_shards(
+        2030, 2031, kinds=["panchanga"], days_per_shard=100
+    )
+    assert [shard.shard_id for shard in shards[:4]] == [
+        "panchanga_2030_000",
+        "panchanga_2030_001",
+        "panchanga_2030_002",
+        "panchanga_2030_003",
+    ]
+    assert shards[0].start == "2030-01-01"
+    assert shards[3].end == "2030-12-31"
+
+
+def test_interrupted_run_resumes_and_merges_deterministically(monkeypatch, tmp_path):
+    work_dir = tmp_path / "partials"
+    out_dir = tmp_path / "out"
+
+    _install_fakes(monkeypatch, fail_shard_start="2030-04-11")
+    first = _run(out_dir, work_dir)
+
+    assert list(first["failed"]) == ["panchanga_2030_001"]
+    assert not (out_dir / "panchanga_2030.json").exists()
+    assert (out_dir / "festivals_2030.json").exists()
+    assert work_dir.exists()
+
+    _install_fakes(monkeypatch)
+    second = _run(out_dir, work_dir)
+
+    assert second["failed"] == {}
+    assert second["computed"] == 1
+    assert second["resumed"] == first["shards"] - 1
+    assert not work_dir.exists()
+
+    clean = _run(tmp_path / "clean", tmp_path / "clean-partials")
+    assert clean["resumed"] == 0
+
+    def _artifact(directory, name):
+        payload = json.loads((directory / name).read_text(encoding="utf-8"))
+        payload.pop("generated_at")
+        return payload
+
+    for name in ("panchanga_2030.json", "festivals_2030.json"):
+        assert _artifact(out_dir, name) == _artifact(tmp_path / "clean", name)
+    merged = _artifact(out_dir, "panchanga_2030.json")
+    assert merged["count"] == 365
+    assert list(merged["dates"]) == sorted(merged["dates"])
+    festivals = _artifact(out_dir, "festivals_2030.json")["festivals"]
+    assert [row["festival_id"] for row in festivals] == ["a-festival", "b-festival"]
@@ -1,8 +1,21 @@
 from __future__ import annotations
 
 import importlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import app.services.runtime_cache as runtime_cache
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _reload_with_default_env(monkeypatch):
+    yield
+    # Reloading rebinds module globals that other services share, so restore
+    # the environment first and rebuild with production defaults.
+    monkeypatch.undo()
+    importlib.reload(runtime_cache).clear()
 
 
 def test_runtime_cache_tracks_hits_misses_and_evictions(monkeypatch):
@@ -42,3 +55,108 @@ def test_runtime_cache_can_be_disabled(monkeypatch):
     assert stats["enabled"] is False
     assert stats["hits"] == 0
     assert stats["misses"] == 2
+
+
+def test_runtime_cache_coalesces_concurrent_misses(monkeypatch):
+    monkeypatch.setenv("PARVA_RUNTIME_CACHE_ENABLED", "true")
+    module = importlib.reload(runtime_cache)
+    module.clear()
+
+    started = threading.Event()
+    release = threading.Event()
+    calls = {"count": 0}
+
+    def slow_compute():
+        calls["count"] += 1
+        started.set()
+        release.wait(5)
+        return "value"
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(module.cached, "muhurta:key", 60, slow_compute) for _ in range(8)]
+        started.wait(5)
+        while module.stats()["coalesced"] < 7:
+            time.sleep(0.01)
+        release.set()
+        results = [future.result(timeout=5) for future in futures]
+
+    assert results == ["value"] * 8
+    assert calls["count"] == 1
+    stats = module.stats()
+    assert stats["misses"] == 1
+    assert stats["coalesced"] == 7
+
+
+def test_runtime_cache_serves_stale_while_revalidating(monkeypatch):
+    monkeypatch.setenv("PARVA_RUNTIME_CACHE_ENABLED", "true")
+    monkeypatch.setenv("PARVA_RUNTIME_CACHE_STALE_SECONDS", "30")
+    module = importlib.reload(runtime_cache)
+    module.clear()
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(module, "_clock", lambda: clock["now"])
+
+    assert module.cached("k", 10, lambda: "old") == "old"
+    clock["now"] += 15
+
+    assert module.cached("k", 10, lambda: "new") == "old"
+    deadline = time.monotonic() + 5
+    while module.stats()["in_flight"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert module.cached("k", 10, lambda: "newer") == "new"
+
+    stats = module.stats()
+    assert stats["stale_hits"] == 1
+    assert stats["refreshes"] == 1
+
+
+def test_runtime_cache_bounds_bytes(monkeypatch):
+    monkeypatch.setenv("PARVA_RUNTIME_CACHE_ENABLED", "true")
+    monkeypatch.setenv("PARVA_RUNTIME_CACHE_MAX_BYTES", "3000")
+    module = importlib.reload(runtime_cache)
+    module.clear()
+
+    for index in range(5):
+        module.cached(f"blob:{index}", 60, lambda: "x" * 1000)
+
+    stats = module.stats()
+    assert stats["bytes"] <= 3000
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 3
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.data: dict[str, bytes] = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    def scan_iter(self, match):
+        prefix = match.rstrip("*")
+        return [key for key in self.data if key.startswith(prefix)]
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+
+def test_runtime_cache_shares_results_through_second_tier(monkeypatch):
+    monkeypatch.setenv("PARVA_RUNTIME_CACHE_ENABLED", "true")
+    module = importlib.reload(runtime_cache)
+    module.clear()
+    fake = _FakeRedis()
+    module.set_second_tier(module.RedisSecondTier(client=fake))
+
+    assert module.cached("timeline:2026", 60, lambda: {"items": [1, 2]}) == {"items": [1, 2]}
+    assert "parva:runtime_cache:timeline:2026" in fake.data
+
+    # A second worker starts with an empty first tier.
+    module.clear()
+    assert module.cached("timeline:2026", 60, lambda: {"items": []}) == {"items": [1, 2]}
+    assert module.stats()["second_tier_hits"] == 1
+
+    module.invalidate_prefix("timeline:")
+    assert fake.data == {}